@@ -10,6 +10,7 @@ import java.util.Collection;
 import java.util.List;
 import java.util.Properties;
 import java.util.UUID;
+import java.util.concurrent.atomic.AtomicInteger;
 
 import org.apache.commons.io.FilenameUtils;
 import org.apache.maven.artifact.DependencyResolutionRequiredException;
@@ -45,50 +46,69 @@ public abstract class AbstractSwampMojo extends AbstractMojo {
 
 	static final String ALL_JAVA_PATTERN = "**/*.java";
 	
-	private static int buildArtifactsCount = 0;
-	
+	/* with mvn -T, modules build on several threads at the same time */
+	private static final AtomicInteger buildArtifactsCount = new AtomicInteger(0);
+
+	/* The output file is read, merged and rewritten by every module, that
+	   has to be done by one thread at a time.  The lock is the interned
+	   path of the file, so it is the same object even if the plugin is
+	   loaded by more than one class loader. */
+	private static Object getOutputFileLock(File output_file) {
+		try {
+			return output_file.getCanonicalPath().intern();
+		} catch (IOException e) {
+			return output_file.getAbsolutePath().intern();
+		}
+	}
+
 	protected void writeArtifacts(Xpp3Dom root_element) throws MojoExecutionException{
 		if(root_element.getChildCount() > 0) {
 			File build_monitor_output_file = getBuildMonitorOutputFile();
-			if(build_monitor_output_file.exists() && build_monitor_output_file.isFile()) { 
-				try {
-					FileReader file_reader = new FileReader(build_monitor_output_file);
-					Xpp3Dom existing_artifacts = Xpp3DomBuilder.build(file_reader);
-					for(Xpp3Dom artifact: existing_artifacts.getChildren()) {
-						root_element.addChild(artifact);
-					}
-					file_reader.close();
-				} catch (FileNotFoundException e) {
-					e.printStackTrace();
-				} catch (XmlPullParserException e) {
-					e.printStackTrace();
-				} catch (IOException e) {
-					e.printStackTrace();
-				}
-			}
-
-			String xslUri = getProject().getProperties().getProperty("ant.XmlLogger.stylesheet.uri");
-			if (xslUri == null) {
-				xslUri = "log.xsl";
+			synchronized (getOutputFileLock(build_monitor_output_file)) {
+				writeArtifacts(root_element, build_monitor_output_file);
 			}
+		}
+	}
 
-			PrintWriter out = null;
+	private void writeArtifacts(Xpp3Dom root_element, File build_monitor_output_file) throws MojoExecutionException{
+		if(build_monitor_output_file.exists() && build_monitor_output_file.isFile()) { 
 			try {
-				// specify output in UTF8 otherwise accented characters will blow
-				// up everything
-				out = new PrintWriter(build_monitor_output_file, "UTF8");
-				out.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n");
-				if (xslUri.length() > 0) {
-					out.write("<?xml-stylesheet type=\"text/xsl\" href=\"" + xslUri + "\"?>\n\n");
-				}
-				Xpp3DomWriter.write(out, root_element);
-				out.flush();
-			} catch (IOException exc) {
-				throw new MojoExecutionException("Unable to write to " + build_monitor_output_file.getAbsolutePath());
-			} finally {
-				if (out != null){
-					out.close();
+				FileReader file_reader = new FileReader(build_monitor_output_file);
+				Xpp3Dom existing_artifacts = Xpp3DomBuilder.build(file_reader);
+				for(Xpp3Dom artifact: existing_artifacts.getChildren()) {
+					root_element.addChild(artifact);
 				}
+				file_reader.close();
+			} catch (FileNotFoundException e) {
+				e.printStackTrace();
+			} catch (XmlPullParserException e) {
+				e.printStackTrace();
+			} catch (IOException e) {
+				e.printStackTrace();
+			}
+		}
+
+		String xslUri = getProject().getProperties().getProperty("ant.XmlLogger.stylesheet.uri");
+		if (xslUri == null) {
+			xslUri = "log.xsl";
+		}
+
+		PrintWriter out = null;
+		try {
+			// specify output in UTF8 otherwise accented characters will blow
+			// up everything
+			out = new PrintWriter(build_monitor_output_file, "UTF8");
+			out.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n");
+			if (xslUri.length() > 0) {
+				out.write("<?xml-stylesheet type=\"text/xsl\" href=\"" + xslUri + "\"?>\n\n");
+			}
+			Xpp3DomWriter.write(out, root_element);
+			out.flush();
+		} catch (IOException exc) {
+			throw new MojoExecutionException("Unable to write to " + build_monitor_output_file.getAbsolutePath());
+		} finally {
+			if (out != null){
+				out.close();
 			}
 		}
 	}
@@ -264,7 +284,7 @@ public abstract class AbstractSwampMojo extends AbstractMojo {
 		}
 		
 		Xpp3Dom java_compile_tag = new Xpp3Dom(AbstractSwampMojo.JAVA_COMPILE_TAG);
-		java_compile_tag.setAttribute("id", Integer.toString(++buildArtifactsCount));
+		java_compile_tag.setAttribute("id", Integer.toString(buildArtifactsCount.incrementAndGet()));
 
 		Xpp3Dom src_dir_tag = new Xpp3Dom(AbstractSwampMojo.SRCDIR_TAG);
 		Xpp3Dom src_file_tag = new Xpp3Dom(AbstractSwampMojo.SRCFILE_TAG);
@@ -7,7 +7,7 @@ _lr_method = 'LALR'
 
 _lr_signature = '08695FD527C2502CD17D5F6BC86A46B2'
     
-_lr_action_items = {'$end':([1,3,6,7,8,9,10,13,14,15,16,17,19,23,25,26,27,28,29,31,32,33,35,36,37,38,39,41,43,44,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,69,70,76,77,79,83,84,85,86,92,95,96,99,100,105,107,115,121,125,126,128,129,130,132,134,136,138,142,145,151,152,153,155,156,157,158,159,162,163,164,166,170,171,173,179,181,182,187,188,190,193,195,204,205,206,219,221,223,229,231,244,282,286,288,289,291,297,299,300,301,307,308,328,332,342,355,360,371,372,375,378,379,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,410,412,413,416,418,421,423,424,425,426,427,428,431,437,438,439,453,490,498,500,501,502,503,504,517,574,607,608,612,625,628,629,632,633,651,652,655,658,659,661,663,665,668,672,673,674,678,680,683,684,686,692,696,712,748,749,756,773,778,795,802,812,824,825,828,829,847,851,853,855,858,859,862,865,866,873,881,885,890,893,918,924,931,934,946,947,948,951,961,963,964,967,968,971,972,974,976,977,978,979,980,981,986,987,992,994,1019,1020,1021,1028,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1092,1100,1101,1104,1109,1110,1113,1114,1122,1123,1125,1128,1129,1130,1131,1132,1136,1137,1138,1142,1143,1146,1148,1150,1152,1157,],[0,-624,-128,-35,-58,-20,-4,-345,-107,-25,-119,-138,-139,-144,-122,-63,-129,-622,-346,-1,-77,-127,-40,-108,-96,-140,-348,-343,-142,-3,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-450,-597,-604,-602,-449,-262,-448,-447,-601,-614,-610,-611,-621,-608,-613,-619,-612,-174,-195,-381,-190,-186,-201,-623,-193,-170,-204,-194,-196,-262,-172,-171,-173,-378,-191,-188,-169,-203,-189,-197,-379,-199,-200,-185,-198,-380,-206,-187,-202,-192,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-120,-529,-600,-598,-605,-553,-508,-620,-451,-603,-609,-452,-249,-389,-286,-383,-205,-277,-385,-175,-279,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,-26,-31,-7,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-146,-36,-152,-59,-97,-99,-98,-599,-615,-283,-281,-384,-260,-284,-290,-287,-624,-388,-387,-164,-228,-278,-386,-280,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-162,-331,-151,-533,-559,-516,-617,-466,-390,-288,-285,-289,-296,-393,-419,-420,-405,-402,-404,-401,-21,-337,-624,-163,-159,-536,-534,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-535,-618,-310,-309,-264,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-266,-265,-312,-314,-232,-311,-313,-291,-276,-426,-425,-412,-624,-322,-161,-324,-267,-318,-316,-317,-315,-428,-427,-409,-321,-236,]),'CLASS':([3,4,63,64,69,70,74,76,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,113,115,116,121,125,128,129,130,134,136,138,141,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,194,229,279,286,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,341,355,365,366,368,371,372,378,379,396,401,454,499,513,517,523,524,525,526,528,530,532,533,534,536,537,538,539,540,542,543,544,545,546,547,549,574,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,607,608,625,628,629,632,633,655,656,658,659,663,756,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,828,829,840,890,893,918,924,931,934,946,947,948,951,961,963,964,994,1004,1008,1019,1020,1021,1022,1023,1028,1050,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[-624,-624,-342,-341,-450,-624,-359,-352,-624,-449,-360,-361,-262,-448,-447,-624,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,-351,324,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-352,-194,-196,-351,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,-624,-185,-198,-206,-362,-187,-202,-192,398,-343,500,-529,-624,-624,-351,-605,-624,-553,-624,-508,-620,-451,-624,-609,-588,-354,-624,-452,-249,398,-286,-167,-352,-624,-205,-277,-175,-279,674,-344,398,749,-624,-624,-624,-566,-352,-562,-565,-567,-351,324,-528,-526,-525,-352,-523,-521,-522,-624,-519,-351,324,-527,-524,-615,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,324,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,-563,-564,-484,-624,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,-289,-296,398,-536,-534,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-482,-618,-310,-309,-624,-271,-264,398,-266,-272,-624,-274,-624,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'FLOAT':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[5,5,5,5,5,5,5,5,5,5,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,5,-174,5,5,-195,-190,-186,-201,-193,-170,-204,5,-352,-194,5,-196,5,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,5,5,-199,-200,5,-185,-198,-206,-362,-187,-202,5,-192,5,5,5,5,5,5,5,5,5,5,-9,-13,-17,-15,5,-19,-12,-8,-11,-16,-18,-14,-10,-343,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,-529,-624,-553,-624,-508,-451,5,-588,-354,-624,-452,-249,5,5,5,-286,5,5,5,-167,5,5,5,-205,-277,5,5,5,-175,-279,-344,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,5,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,5,-527,-524,5,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,5,5,5,-283,-281,5,5,-260,5,-284,-290,-287,-624,5,5,-164,-168,-228,-278,-280,5,5,5,5,-400,5,5,5,5,5,5,5,5,5,5,5,5,-533,5,-352,-563,-564,-484,5,-559,5,-516,-520,5,-503,5,-595,-587,5,-441,-470,-483,-466,5,-502,5,5,5,5,5,-288,-285,-624,-289,-296,5,-303,5,5,5,-251,5,-405,-402,-404,-401,5,5,5,5,5,5,5,5,-536,-534,-624,-487,5,-440,-442,-263,5,5,5,-185,-231,5,5,-308,-261,-306,5,-297,5,-307,-234,-282,5,5,-422,-421,5,5,-406,5,5,-535,-500,-486,-570,-482,-506,-443,5,-444,-310,-309,5,-271,5,-264,5,5,5,5,5,5,5,-403,-424,-423,-407,-411,-408,-410,5,5,-569,-505,-446,-445,-266,-272,5,-274,5,-265,-312,-314,-232,-311,-313,-291,5,-276,-426,5,-425,5,5,-412,-273,-267,-318,-316,5,5,5,-317,-315,5,-428,-427,-409,-236,5,5,5,]),'FINAL':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[80,80,-342,-341,-450,80,-359,80,-449,-360,-361,-262,-448,-447,80,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,80,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,80,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,80,-185,-198,-206,-362,-187,-202,-192,-343,-529,80,80,80,80,-605,80,-553,80,-508,-620,-451,80,-609,-588,-354,80,-452,-249,-286,80,80,-167,80,-205,-277,-175,-279,-344,80,80,80,80,80,80,-566,-562,-565,-567,80,-528,80,-526,-525,-523,-521,-522,80,-519,80,-527,-524,-615,-475,-480,80,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,80,80,-164,-168,-228,-278,-280,-533,80,-563,-564,-484,80,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,80,-289,-296,80,-303,-536,-534,80,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,80,-271,-264,80,-569,-505,-266,-272,80,-274,80,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'MINUSMINUS':([0,2,4,6,11,12,13,16,17,19,20,22,23,27,29,33,38,39,41,43,45,46,49,50,51,53,56,57,61,62,63,64,65,118,121,122,123,124,125,127,128,129,130,133,134,135,136,138,140,142,144,145,147,148,151,152,153,155,157,158,159,161,162,163,164,167,168,170,171,172,173,179,182,184,187,188,190,191,196,197,198,199,200,201,202,203,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,232,233,234,235,236,238,239,241,242,243,246,252,254,256,259,269,271,273,276,277,283,284,285,286,297,299,309,328,330,332,335,344,346,353,355,358,363,365,368,369,370,371,372,374,377,378,379,398,399,400,401,402,411,416,417,418,421,422,428,437,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,490,493,494,500,552,555,556,557,558,561,566,604,605,607,608,609,611,614,619,623,624,625,626,627,628,629,632,633,640,642,648,655,656,658,659,663,673,674,675,677,678,680,682,683,684,685,686,688,692,693,695,696,704,740,747,748,749,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,843,844,845,864,866,873,875,877,879,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,958,961,963,964,972,974,975,976,977,978,979,980,981,983,986,992,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1066,1067,1069,1070,1072,1073,1075,1076,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1129,1130,1132,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1152,1157,1158,1159,1162,],[2,11,11,-128,11,11,-345,219,-138,-139,11,11,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,11,11,-136,-130,-143,-349,11,-342,-341,-141,11,-174,11,11,-128,-195,-141,-190,-186,-201,-127,-193,-343,-170,-204,11,-194,11,-196,-130,-143,-262,-172,-171,-173,-191,-188,-169,219,-203,-189,-197,-140,11,-199,-200,11,-185,-198,-206,-129,-187,-202,-192,11,11,11,11,11,11,11,11,11,219,11,-9,-13,-17,-15,11,-19,-12,-8,-11,-16,-18,-135,-14,-134,-10,11,11,11,11,11,11,11,11,11,11,-128,11,11,-129,-127,11,-130,11,11,11,11,11,11,-529,-553,-508,11,-452,-128,-249,11,11,11,-128,-286,11,11,-167,11,11,11,-205,-277,11,11,-175,-279,-149,-147,-343,-344,-148,-128,-335,11,-340,-339,11,-328,-329,11,11,11,11,11,11,11,11,11,-145,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-146,11,11,-152,-128,219,-129,11,-127,-341,-130,11,11,-283,-281,-148,-147,-328,-329,11,11,-260,11,-145,-284,-290,-287,-624,-127,-343,-128,-164,-168,-228,-278,-280,-330,-150,11,11,-145,-338,11,-334,-336,11,-333,11,-221,11,11,-332,-128,11,11,-331,-151,11,-533,11,-559,-516,11,-466,11,11,11,11,11,-288,-285,-289,-296,11,11,11,-251,11,11,-337,-624,11,11,11,11,11,11,-536,-534,11,-263,11,11,11,-185,-231,11,11,-308,-261,-306,-297,11,-128,-307,-234,-282,-225,-216,11,-217,-624,-326,-327,-320,-226,11,-227,-624,-535,-310,-309,11,-271,11,-264,11,11,11,11,11,11,11,-222,-218,-319,-223,-624,-224,-624,-323,11,-266,-272,11,-274,11,-265,-312,-314,-232,-311,-313,-291,-276,-624,-322,-324,-273,-267,-318,-316,11,11,11,-317,-315,11,-321,-236,11,11,11,]),'SWITCH':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[120,120,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,120,-199,-200,120,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,120,120,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,120,-559,-516,-466,120,-288,-285,-289,-296,-251,120,-536,-534,-263,120,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,120,-271,-264,120,120,-266,-272,120,-274,120,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,120,120,-317,-315,120,-236,120,120,]),'STATIC':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,98,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[88,88,-342,-341,-450,88,-359,88,-449,-360,-361,-262,-448,-447,88,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,313,-608,-586,-353,-613,-619,-363,-356,-362,-585,88,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,88,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,88,-185,-198,-206,-362,-187,-202,-192,-343,-529,88,88,88,88,-605,88,-553,88,-508,-620,-451,88,-609,-588,-354,595,-452,-249,-286,88,88,-167,88,-205,-277,-175,-279,-344,88,595,88,88,88,88,-566,-562,-565,-567,88,-528,88,-526,-525,-523,-521,-522,88,-519,88,-527,-524,-615,-475,-480,595,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,88,88,-164,-168,-228,-278,-280,-533,88,-563,-564,-484,88,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,88,-289,-296,88,-303,-536,-534,88,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,88,-271,-264,88,-569,-505,-266,-272,88,-274,88,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'NUM':([2,4,11,12,20,22,50,51,62,118,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,344,346,355,358,363,365,368,369,370,371,372,374,377,378,379,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,623,624,625,626,628,629,632,633,655,656,658,659,663,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,843,844,845,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1157,1158,1159,1162,],[13,13,13,13,13,13,13,13,13,13,-174,13,13,-195,-190,-186,-201,-193,-170,-204,13,-194,13,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,13,-199,-200,13,-185,-198,-206,-187,-202,-192,13,13,13,13,13,13,13,13,13,13,-9,-13,-17,-15,13,-19,-12,-8,-11,-16,-18,-14,-10,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-529,-553,-508,13,-452,-249,13,13,13,-286,13,13,-167,13,13,13,-205,-277,13,13,-175,-279,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-283,-281,13,13,-260,13,-284,-290,-287,-624,-164,-168,-228,-278,-280,13,13,13,13,13,13,13,13,13,13,13,13,-533,13,-559,-516,13,-466,13,13,13,13,13,-288,-285,-289,-296,13,13,13,-251,13,13,13,13,13,13,13,13,13,-536,-534,13,-263,13,13,13,-185,-231,13,13,-308,-261,-306,-297,13,-307,-234,-282,13,13,-535,-310,-309,13,-271,13,-264,13,13,13,13,13,13,13,13,13,-266,-272,13,-274,13,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,13,13,13,-317,-315,13,-236,13,13,13,]),'PACKAGE':([3,63,64,74,80,82,87,88,89,90,91,93,94,102,104,108,109,110,111,112,116,229,316,322,401,789,790,],[78,-342,-341,-359,-360,-361,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,323,-364,-343,-588,-354,-344,-595,-587,]),'THROW':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[122,122,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,122,-199,-200,122,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,122,122,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,122,-559,-516,-466,122,-288,-285,-289,-296,-251,122,-536,-534,-263,122,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,122,-271,-264,122,122,-266,-272,122,-274,122,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,122,122,-317,-315,122,-236,122,122,]),'TRY':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[146,146,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,146,-199,-200,146,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,146,146,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,146,-559,-516,-466,146,-288,-285,-289,-296,-251,146,-536,-534,-263,146,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,146,-271,-264,146,146,-266,-272,146,-274,146,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,146,146,-317,-315,146,-236,146,146,]),'NATIVE':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[82,82,-342,-341,-450,82,-359,82,-449,-360,-361,-262,-448,-447,82,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,82,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,82,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,82,-185,-198,-206,-362,-187,-202,-192,-343,-529,82,82,82,82,-605,82,-553,82,-508,-620,-451,82,-609,-588,-354,82,-452,-249,-286,82,82,-167,82,-205,-277,-175,-279,-344,82,82,82,82,82,82,-566,-562,-565,-567,82,-528,82,-526,-525,-523,-521,-522,82,-519,82,-527,-524,-615,-475,-480,82,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,82,82,-164,-168,-228,-278,-280,-533,82,-563,-564,-484,82,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,82,-289,-296,82,-303,-536,-534,82,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,82,-271,-264,82,-569,-505,-266,-272,82,-274,82,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),';':([3,4,6,7,8,9,10,13,14,15,16,17,19,23,25,26,27,29,31,32,33,35,36,37,38,39,41,43,44,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,69,70,71,77,79,83,84,85,86,89,92,93,95,96,100,102,105,107,111,115,118,121,123,125,126,127,128,129,130,134,136,138,142,143,145,147,148,151,152,153,155,156,157,158,159,160,162,163,164,166,168,170,171,172,173,176,177,179,180,181,182,184,185,186,187,188,190,193,195,204,205,206,219,221,223,224,225,229,231,244,245,247,248,251,253,255,257,258,260,261,262,263,265,267,270,272,274,282,286,287,288,289,291,296,297,298,299,300,301,302,307,308,312,316,327,328,332,336,337,338,339,342,348,349,350,351,352,355,358,360,365,368,370,371,372,373,375,378,379,380,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,410,412,413,416,418,419,421,423,424,425,426,427,428,431,437,438,439,453,470,472,486,490,491,492,498,500,501,502,503,504,505,509,510,513,514,516,517,523,524,526,527,528,530,534,536,537,539,540,542,543,544,547,548,549,552,553,554,556,558,564,566,574,576,581,585,586,587,588,589,590,592,593,594,596,597,598,600,601,603,607,608,612,620,621,625,628,629,632,633,634,636,638,639,641,645,646,647,650,651,652,655,656,658,659,661,663,665,668,672,673,674,678,679,680,683,684,686,692,696,697,699,702,703,705,707,708,709,710,711,712,713,714,715,716,717,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,742,743,744,745,748,749,750,751,752,753,755,756,760,769,770,771,772,773,778,779,782,783,789,790,794,795,800,801,802,804,812,813,818,819,820,821,822,823,824,825,828,829,836,838,842,844,845,847,851,853,855,858,859,862,865,866,873,881,885,890,891,893,896,903,904,905,907,908,910,918,919,921,922,924,929,931,934,946,947,948,951,953,956,957,959,960,961,963,964,967,968,971,972,974,976,977,978,979,980,981,986,987,989,990,992,993,994,997,998,1001,1003,1004,1008,1009,1012,1019,1020,1021,1022,1023,1028,1029,1032,1034,1037,1038,1039,1042,1047,1051,1052,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1078,1079,1081,1082,1083,1084,1086,1092,1093,1094,1097,1098,1100,1101,1102,1103,1104,1108,1109,1110,1111,1112,1113,1114,1117,1122,1123,1125,1128,1129,1130,1131,1132,1133,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1152,1153,1156,1157,1158,1162,],[83,151,-128,-35,-58,-20,-4,-345,-107,-25,-119,-138,-139,-144,-122,-63,-129,-346,-1,-77,-127,-40,-108,-96,-140,-348,-343,-142,-3,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-450,83,291,301,-449,-262,-448,-447,83,-594,-614,-584,-610,-611,-608,-586,-613,-619,-585,-612,151,-174,-624,-195,-381,-213,-190,-186,-201,-193,-170,-204,-194,-209,-196,-211,-212,-262,-172,-171,-173,-378,-191,-188,-169,-208,-203,-189,-197,-379,151,-199,-200,151,-185,371,372,-198,-207,-380,-206,-210,378,379,-187,-202,-192,-155,-156,-119,-118,-117,-135,-134,-121,-383,-381,-343,-109,-110,-60,-91,-32,-112,-27,-126,-53,-68,-37,-113,-100,-81,-22,-42,-123,-116,-47,-120,-529,513,301,83,-605,301,-553,547,-508,-620,-451,-607,301,-609,574,-588,594,-452,-249,607,-244,-245,608,-389,-178,-624,-176,-180,625,-286,-624,-383,-167,151,151,-205,-277,659,-385,-175,-279,663,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,-26,-31,-7,-335,-340,-382,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-125,-114,-154,-146,-115,-124,-36,-152,-59,-97,-99,-98,-540,-624,-537,594,513,513,301,301,-566,-562,770,-565,-567,-528,-526,-525,-523,-521,-522,547,-519,-527,782,-524,-575,-574,-577,-132,-131,-576,-133,-615,795,-606,-475,-480,594,-473,-477,-479,-478,-476,-481,-472,-469,-501,-471,-474,782,-283,-281,-384,-153,-182,-260,-284,-290,-287,-624,832,-301,-238,836,-242,-239,-241,-240,-177,-388,-387,-164,-168,-228,-278,-386,-280,-418,-417,-400,-330,-150,-145,-384,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,-29,-34,-39,-76,-83,-101,-105,-103,-38,-33,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,-28,-48,-56,-54,-331,-151,-539,-542,-541,-544,-543,-533,513,-563,-564,-484,151,-559,-516,-520,-503,-581,-595,-587,918,-617,-470,-483,-466,-502,-390,151,946,-179,-184,-183,-181,947,-288,-285,-289,-296,-624,-624,961,-251,151,-393,-419,-420,-405,-402,-404,-401,-21,-337,-624,-163,-159,-536,-538,-534,-624,-624,1008,-624,-624,-579,-580,-616,1019,1020,1021,-263,151,-185,-231,-308,-261,-306,-297,-302,1049,-182,-243,-624,-307,-234,-282,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-24,-23,-624,-545,-535,-624,-507,-495,-494,-500,-482,-624,-578,-618,-310,-309,151,-271,-264,1101,1104,151,-624,151,1110,1113,-304,-182,1122,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-568,-572,-571,-497,-499,-496,-504,-266,-272,151,-274,151,-265,-312,1137,1138,-314,1141,-232,-311,1142,1143,-313,-291,-305,-276,-426,-425,-412,-624,-322,-161,-324,-573,-273,-267,-318,-316,151,151,-624,-317,-315,151,-428,-427,-409,-321,-498,1159,-236,151,151,]),'RSHIFT_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,211,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,211,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'?':([6,7,8,9,13,14,15,16,17,19,23,25,26,27,29,32,33,35,36,37,38,39,41,43,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,126,156,166,181,189,193,195,204,205,206,219,221,223,229,231,244,245,246,247,248,251,253,255,256,257,258,259,260,261,262,263,265,267,270,271,272,274,282,342,353,360,375,376,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,410,411,412,416,418,421,423,424,425,426,427,428,431,437,438,439,447,453,470,472,490,491,492,498,500,501,502,503,504,552,556,558,561,566,612,651,652,661,664,665,668,671,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,716,717,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,742,743,744,745,748,749,802,812,847,851,853,855,858,859,862,866,873,881,885,965,967,968,970,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1127,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-35,-58,201,-345,-107,-25,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-40,-108,-96,-140,-348,-343,-142,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-378,-379,-380,384,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,460,-91,-32,-112,-27,-126,-132,-53,-68,-131,-37,-113,-100,-81,487,-42,-123,-133,-116,-47,-120,-389,460,-383,-385,384,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,-26,460,-31,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,384,-145,-125,-114,-146,-115,-124,-36,-152,-59,-97,-99,-98,460,-132,-131,-341,-133,-384,-388,-387,-386,384,-418,-417,857,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-128,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,-29,-34,-39,-76,-83,-101,-105,-103,-38,-33,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,-28,-48,-56,-54,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-337,-624,-163,-159,857,-422,-421,1059,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,1059,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'=':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,193,195,219,221,229,246,256,259,271,330,349,351,353,394,397,398,399,400,401,402,411,416,418,421,428,437,453,486,490,500,561,609,611,614,619,620,621,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,834,838,866,873,903,907,911,955,957,958,960,972,974,976,977,978,979,980,981,986,992,1051,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,215,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,215,-140,-129,-155,-156,-135,-134,-343,-128,-129,-127,-130,-128,-624,623,-128,-158,-157,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-154,-146,-152,788,-148,-147,-328,-329,-153,-182,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,954,-624,-337,-624,-624,-624,788,1048,-182,-128,-624,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-182,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'NEQ':([6,8,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,48,49,53,56,57,58,59,61,63,64,65,67,126,156,166,181,193,195,204,205,206,219,221,223,229,231,244,245,246,247,251,255,256,257,258,259,261,262,263,270,271,272,274,282,342,353,360,375,382,385,386,393,394,397,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,431,437,438,439,453,470,472,490,491,492,500,501,502,503,504,552,556,558,561,566,612,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,717,722,723,724,725,726,729,730,731,732,733,734,735,736,738,739,743,744,745,748,749,802,812,847,851,853,855,858,859,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-58,-345,-107,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,241,-137,-136,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-378,-379,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,448,-91,-112,-126,-132,-53,-68,-131,-113,-100,-81,-123,-133,-116,493,-120,-389,448,-383,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-66,-67,-64,-65,448,-335,-340,-339,-78,-79,-80,-90,-89,-328,241,-329,-52,-51,-145,-125,-114,-146,-115,-124,-152,-59,-97,-99,-98,448,-132,-131,-341,-133,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-128,-70,-57,241,-106,-102,-93,-162,-95,-104,-85,-87,-76,-83,-101,-105,-103,-62,-73,-75,-84,-86,-82,-71,-69,-92,-94,241,-56,-54,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'RRSHIFT_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,217,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,217,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'!':([2,11,12,20,22,50,51,62,122,123,140,144,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,363,369,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,788,808,811,814,817,836,843,864,875,877,879,882,884,886,887,909,926,927,943,944,954,975,983,1024,1035,1036,1048,1074,1080,1141,],[20,20,20,20,20,20,252,20,20,20,20,252,20,20,20,20,20,20,20,20,252,20,-9,-13,-17,-15,20,-19,-12,-8,-11,-16,-18,-14,-10,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,252,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,252,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,252,20,20,20,20,20,20,20,20,20,20,20,20,20,20,252,20,20,20,20,20,20,20,20,20,20,20,20,252,20,]),'PRIVATE':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[90,90,-342,-341,-450,90,-359,90,-449,-360,-361,-262,-448,-447,90,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,90,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,90,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,90,-185,-198,-206,-362,-187,-202,-192,-343,-529,90,90,90,90,-605,90,-553,90,-508,-620,-451,90,-609,-588,-354,90,-452,-249,-286,90,90,-167,90,-205,-277,-175,-279,-344,90,90,90,90,90,90,-566,-562,-565,-567,90,-528,90,-526,-525,-523,-521,-522,90,-519,90,-527,-524,-615,-475,-480,90,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,90,90,-164,-168,-228,-278,-280,-533,90,-563,-564,-484,90,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,90,-289,-296,90,-303,-536,-534,90,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,90,-271,-264,90,-569,-505,-266,-272,90,-274,90,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'NEW':([2,4,11,12,20,22,50,51,52,62,118,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,194,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,237,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,341,344,345,346,355,358,363,365,368,369,370,371,372,374,377,378,379,417,422,441,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,623,624,625,626,628,629,632,633,655,656,658,659,663,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,837,839,840,843,844,845,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1050,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1157,1158,1159,1162,],[21,165,21,21,21,21,21,21,275,21,165,-174,21,21,-195,-190,-186,-201,-193,-170,-204,21,-194,21,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,165,-199,-200,165,-185,-198,-206,-187,-202,-192,21,-325,21,21,21,21,21,21,21,21,21,-9,-13,-17,-15,21,-19,-12,-8,-11,-16,-18,-14,-10,21,21,21,21,21,430,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-529,-553,-508,21,-452,-249,21,-325,21,430,21,-286,165,21,-167,165,21,165,-205,-277,21,21,-175,-279,21,21,21,21,21,21,21,21,21,21,21,21,-325,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-283,-281,21,21,-260,21,-284,-290,-287,-624,-164,-168,-228,-278,-280,21,21,21,21,21,21,21,21,21,21,21,21,-533,165,-559,-516,21,-466,21,21,165,21,21,-288,-285,-289,-296,21,430,165,-325,21,-251,165,21,21,21,21,21,21,21,21,-536,-534,21,-263,21,21,165,-185,-231,21,21,-308,-261,-306,-297,21,-307,-234,-282,21,21,-535,-310,-309,165,-271,21,-264,165,21,21,165,165,21,165,-325,21,21,-266,-272,165,-274,165,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,165,165,21,-317,-315,165,-236,165,165,165,]),'%':([6,13,14,16,17,19,23,25,27,29,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,204,205,206,219,221,223,231,244,246,247,251,255,256,259,261,262,270,271,272,282,353,398,399,400,401,402,411,416,418,421,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,673,674,678,680,683,684,686,692,696,704,709,710,711,712,713,714,724,725,726,738,739,748,749,802,866,873,881,885,972,974,976,977,978,979,980,981,986,987,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1131,1132,1152,],[-128,-345,-107,-119,-138,-139,-144,-122,-129,-346,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,284,-119,-118,-117,-135,-134,-121,-109,-110,450,467,-112,-126,-132,-131,-113,-100,-123,-133,-116,-120,450,-149,-147,-343,-344,-148,450,-335,-340,-339,284,284,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,450,-132,-131,-341,-133,-330,-150,-145,-338,-334,-336,-333,-221,-332,-128,-106,-102,284,-162,284,-104,-101,-105,-103,284,284,-331,-151,-466,-337,-624,-163,-159,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-161,-324,-321,]),'+':([2,6,11,12,13,14,16,17,19,20,22,23,25,27,29,32,33,36,37,38,39,41,43,45,46,49,50,51,53,56,57,58,61,62,63,64,65,67,122,123,140,144,191,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,231,232,233,234,235,236,238,239,241,242,243,244,246,247,251,252,254,255,256,259,261,262,263,269,270,271,272,273,276,277,282,283,284,285,309,335,344,346,353,363,369,374,377,398,399,400,401,402,411,416,417,418,421,422,423,424,425,426,427,428,437,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,500,502,503,504,552,556,557,558,561,566,604,605,623,624,626,673,674,675,677,678,680,682,683,684,685,686,688,692,693,695,696,704,709,710,711,712,713,714,715,717,723,724,725,726,732,733,734,738,739,740,747,748,749,754,788,802,808,811,814,817,836,843,864,866,873,875,877,879,881,884,885,886,887,909,926,927,943,944,954,972,974,975,976,977,978,979,980,981,983,986,987,992,1024,1035,1036,1048,1066,1067,1069,1070,1072,1073,1075,1076,1080,1129,1130,1131,1132,1141,1152,],[22,-128,22,22,-345,-107,-119,-138,-139,22,22,-144,-122,-129,-346,236,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,22,254,-136,-130,-143,-111,-349,22,-342,-341,-141,-88,22,22,22,254,22,22,22,22,22,22,22,22,254,-119,-118,-117,22,-9,-13,-17,-15,22,-19,-12,-8,-11,-16,-18,-135,-14,-134,-10,-121,-109,22,22,22,22,22,22,22,22,22,22,-110,452,-91,-112,22,22,-126,-132,-131,-113,-100,482,22,-123,-133,-116,22,22,22,-120,22,22,22,254,22,22,22,452,22,22,22,22,-149,-147,-343,-344,-148,452,-335,22,-340,-339,22,236,236,236,-90,-89,-328,-329,22,22,22,22,22,22,22,22,22,-145,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-125,22,-114,22,22,22,22,22,22,22,22,22,22,22,22,22,-146,-115,-124,22,22,-152,-97,-99,-98,452,-132,254,-131,-341,-133,22,22,22,22,22,-330,-150,22,22,-145,-338,22,-334,-336,22,-333,22,-221,22,22,-332,-128,-106,-102,-93,-162,-95,-104,236,236,236,-101,-105,-103,236,236,236,-92,-94,22,22,-331,-151,22,254,-466,22,22,22,22,22,22,22,-337,-624,22,22,22,-163,22,-159,22,22,254,22,22,22,22,22,-225,-216,22,-217,-624,-326,-327,-320,-226,22,-227,-160,-624,22,22,22,22,-222,-218,-319,-223,-624,-224,-624,-323,254,-624,-322,-161,-324,22,-321,]),'}':([6,7,8,9,10,13,14,15,16,17,19,23,25,26,27,29,31,32,33,35,36,37,38,39,41,43,44,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,69,79,84,85,89,93,102,111,121,125,126,128,129,130,134,136,138,142,145,151,152,153,155,156,157,158,159,162,163,164,166,170,171,172,173,179,181,182,187,188,190,193,195,204,205,206,219,221,223,229,231,244,245,247,248,251,253,255,257,258,260,261,262,263,265,267,270,272,274,282,286,287,296,297,298,299,301,316,327,328,332,342,355,360,365,366,367,368,371,372,375,378,379,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,410,412,413,416,418,421,423,424,425,426,427,428,431,437,438,439,453,470,472,490,491,492,498,500,501,502,503,504,505,508,509,510,511,513,514,515,516,523,524,525,526,528,530,531,534,536,537,538,539,540,541,542,543,544,547,549,552,553,554,556,557,558,564,566,585,586,587,588,589,590,591,592,593,594,596,597,598,599,600,601,607,608,612,625,628,629,632,633,651,652,655,656,658,659,661,663,665,668,672,673,674,678,680,682,683,684,686,692,696,697,699,702,703,705,707,708,709,710,711,712,713,714,715,716,717,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,742,743,744,745,748,749,750,751,752,753,755,756,757,758,759,760,761,769,770,771,772,773,778,779,782,783,784,785,786,789,790,800,801,802,804,812,820,821,824,825,828,829,847,851,853,855,858,859,862,865,866,867,868,869,870,871,873,881,885,890,891,892,893,899,908,909,910,923,924,931,934,946,947,948,951,961,963,964,967,968,971,972,974,975,976,977,978,979,980,981,986,987,989,990,992,993,994,1004,1008,1012,1013,1020,1021,1022,1023,1026,1027,1028,1053,1055,1057,1060,1061,1063,1064,1066,1067,1068,1069,1070,1072,1073,1075,1076,1092,1093,1094,1097,1098,1099,1100,1101,1104,1109,1110,1113,1114,1122,1123,1125,1128,1129,1130,1131,1132,1135,1136,1137,1138,1142,1143,1146,1148,1150,1152,1157,],[-128,-35,-58,-20,-4,-345,-107,-25,-119,-138,-139,-144,-122,-63,-129,-346,-1,-77,-127,-40,-108,-96,-140,-348,-343,-142,-3,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-450,-449,-448,-447,-594,-584,-586,-585,-174,-195,-381,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-378,-191,-188,-169,-203,-189,-197,-379,-199,-200,-624,-185,-198,-380,-206,-187,-202,-192,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,-91,-32,-112,-27,-126,-53,-68,-37,-113,-100,-81,-22,-42,-123,-116,-47,-120,-529,-624,-624,-553,-624,-508,-451,-588,-624,-452,-249,-389,-286,-383,-167,-166,655,-165,-205,-277,-385,-175,-279,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,-26,-31,-7,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-125,-114,-146,-115,-124,-36,-152,-59,-97,-99,-98,-540,-551,-624,-537,756,-624,-624,-550,-624,-560,-566,-561,-562,-565,-567,773,-528,-526,-525,-518,-523,-521,778,-522,-517,-519,-527,-524,-575,-574,-577,-132,783,-131,-576,-133,-475,-480,-467,-473,-477,-479,-468,-478,-476,-481,-472,-469,-501,802,-471,-474,-283,-281,-384,-260,-284,-290,-287,-624,-388,-387,-164,-168,-228,-278,-386,-280,-418,-417,-400,-330,-150,-145,-338,-624,-334,-336,-333,-221,-332,-74,-61,-55,-72,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,-29,-34,-39,-76,-83,-101,-105,-103,-38,-33,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,-28,-48,-56,-54,-331,-151,-539,-542,-541,-544,-543,-533,-552,-551,890,-624,893,-563,-564,-484,-624,-559,-516,-520,-503,-581,908,910,-582,-595,-587,-470,-483,-466,-502,-390,-184,-183,-288,-285,-289,-296,-393,-419,-420,-405,-402,-404,-401,-21,-337,974,-214,-219,-215,976,-624,-163,-159,-536,-538,994,-534,1004,-579,1012,-580,1028,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-422,-421,-406,-225,-216,1067,-217,-624,-326,-327,-320,-226,-227,-160,-24,-23,-624,-545,-535,-500,-482,-578,-583,-310,-309,1092,-271,1100,-268,-264,-403,-424,-423,-407,-411,-408,-410,-222,-218,-220,-319,-223,-624,-224,-624,-323,-266,-272,-270,-274,1136,-269,-265,-312,-314,-232,-311,-313,-291,-276,-426,-425,-412,-624,-322,-161,-324,-273,-267,-318,-316,-317,-315,-428,-427,-409,-321,-236,]),')':([5,6,7,8,9,10,13,14,15,16,17,18,19,23,24,25,26,27,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,45,46,47,48,49,53,54,56,57,58,59,60,61,63,64,65,66,67,89,93,102,111,126,127,143,147,148,156,160,166,180,181,184,193,195,204,205,206,219,221,223,224,225,229,231,239,244,245,246,247,248,249,250,251,253,255,256,257,258,259,260,261,262,263,264,265,266,267,268,270,271,272,274,282,309,316,342,346,349,353,360,363,375,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,410,411,412,413,416,418,421,422,423,424,425,426,427,428,431,432,433,434,435,437,438,439,442,444,453,470,472,484,485,486,490,491,492,498,500,501,502,503,504,521,522,535,552,553,554,556,558,559,560,561,562,563,564,565,566,567,604,605,606,612,613,618,620,621,634,636,641,651,652,653,657,660,661,662,665,668,672,673,674,675,678,679,680,683,684,685,686,687,688,692,695,696,697,699,700,702,703,704,705,707,708,709,710,711,712,713,714,715,716,717,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,742,743,744,745,747,748,749,754,764,765,766,767,768,777,783,789,790,802,805,806,808,811,812,814,817,820,821,830,832,833,847,851,853,855,858,859,862,863,864,865,866,872,873,874,875,877,878,879,880,881,883,885,887,888,889,900,908,910,912,913,925,926,927,928,942,943,944,945,949,953,959,962,967,968,971,972,973,974,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,995,999,1005,1007,1011,1012,1030,1031,1040,1041,1047,1049,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1071,1072,1073,1075,1076,1077,1085,1087,1106,1107,1115,1117,1118,1119,1120,1121,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,1159,1161,],[-376,-128,-35,-58,-20,-4,-345,-107,-25,-119,-138,-370,-139,-144,-372,-122,-63,-129,-346,-374,-1,-77,-127,-373,-40,-108,-96,-140,-348,-375,-343,-142,-3,-347,-350,-377,-45,-137,-136,-30,-130,-143,-111,-50,-369,-349,-342,-341,-141,-371,-88,-594,-584,-586,-585,-381,-213,-209,-211,-212,-378,-208,-379,-207,-380,-210,-155,-156,-119,-118,-117,-135,-134,-121,-383,-381,-343,-109,-624,-110,-60,453,-91,-32,-6,-2,-112,-27,-126,-132,-53,-68,-131,-37,-113,-100,-81,-624,-22,-5,-42,490,-123,-133,-116,-47,-120,-624,-588,-389,-624,-624,627,-383,-624,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,-26,678,-31,-7,-335,-340,-339,-624,-78,-79,-80,-90,-89,-328,-46,692,-546,-548,-547,-329,-52,-51,698,-624,-145,-125,-114,740,-153,-154,-146,-115,-124,-36,-152,-59,-97,-99,-98,-624,-624,-624,-575,-574,-577,-132,-131,-589,-596,-341,-590,789,-576,-591,-133,790,-624,-624,807,-384,813,818,-153,-182,-624,-301,-242,-388,-387,842,844,845,-386,846,-418,-417,-400,-330,-150,-624,-145,-384,-338,-334,-336,-624,-333,873,-624,-221,-624,-332,-74,-61,882,-55,-72,-128,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,-29,-34,-39,-76,-83,-101,-105,-103,-38,-33,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,-28,-48,-56,-54,-624,-331,-151,-624,896,-490,-489,-488,898,905,-581,-595,-587,-466,921,922,-624,-624,-390,-624,-624,-184,-183,952,-299,-300,-393,-419,-420,-405,-402,-404,-401,972,-624,-21,-337,977,-624,981,-624,-624,-549,-624,986,-163,-624,-159,-624,992,993,-487,-579,-580,-592,-593,1029,-624,-624,1032,1039,-624,-624,1042,1043,-302,-243,1052,-422,-421,-406,-225,1066,-216,-217,-624,-326,-327,-320,-226,1070,-624,1072,1073,-227,-160,1074,-24,-23,1075,-624,-492,-491,-486,-570,-506,-578,1102,1103,1111,1112,-304,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,1129,-624,-224,-624,-323,-493,-569,-505,1139,1140,-292,-305,-247,-246,1145,-248,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,-624,1162,]),'/':([6,13,14,16,17,19,23,25,27,29,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,204,205,206,219,221,223,231,244,246,247,251,255,256,259,261,262,270,271,272,282,353,398,399,400,401,402,411,416,418,421,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,673,674,678,680,683,684,686,692,696,704,709,710,711,712,713,714,724,725,726,738,739,748,749,802,866,873,881,885,972,974,976,977,978,979,980,981,986,987,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1131,1132,1152,],[-128,-345,-107,-119,-138,-139,-144,-122,-129,-346,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,285,-119,-118,-117,-135,-134,-121,-109,-110,456,468,-112,-126,-132,-131,-113,-100,-123,-133,-116,-120,456,-149,-147,-343,-344,-148,456,-335,-340,-339,285,285,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,456,-132,-131,-341,-133,-330,-150,-145,-338,-334,-336,-333,-221,-332,-128,-106,-102,285,-162,285,-104,-101,-105,-103,285,285,-331,-151,-466,-337,-624,-163,-159,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-161,-324,-321,]),'DO':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[168,168,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,168,-199,-200,168,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,168,168,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,168,-559,-516,-466,168,-288,-285,-289,-296,-251,168,-536,-534,-263,168,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,168,-271,-264,168,168,-266,-272,168,-274,168,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,168,168,-317,-315,168,-236,168,168,]),'-':([2,6,11,12,13,14,16,17,19,20,22,23,25,27,29,32,33,36,37,38,39,41,43,45,46,49,50,51,53,56,57,58,61,62,63,64,65,67,122,123,140,144,191,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,231,232,233,234,235,236,238,239,241,242,243,244,246,247,251,252,254,255,256,259,261,262,263,269,270,271,272,273,276,277,282,283,284,285,309,335,344,346,353,363,369,374,377,398,399,400,401,402,411,416,417,418,421,422,423,424,425,426,427,428,437,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,474,475,476,477,478,479,480,481,482,483,487,488,489,490,491,492,493,494,500,502,503,504,552,556,557,558,561,566,604,605,623,624,626,673,674,675,677,678,680,682,683,684,685,686,688,692,693,695,696,704,709,710,711,712,713,714,715,717,723,724,725,726,732,733,734,738,739,740,747,748,749,754,788,802,808,811,814,817,836,843,864,866,873,875,877,879,881,884,885,886,887,909,926,927,943,944,954,972,974,975,976,977,978,979,980,981,983,986,987,992,1024,1035,1036,1048,1066,1067,1069,1070,1072,1073,1075,1076,1080,1129,1130,1131,1132,1141,1152,],[50,-128,50,50,-345,-107,-119,-138,-139,50,50,-144,-122,-129,-346,235,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,50,269,-136,-130,-143,-111,-349,50,-342,-341,-141,-88,50,50,50,269,50,50,50,50,50,50,50,50,269,-119,-118,-117,50,-9,-13,-17,-15,50,-19,-12,-8,-11,-16,-18,-135,-14,-134,-10,-121,-109,50,50,50,50,50,50,50,50,50,50,-110,455,-91,-112,50,50,-126,-132,-131,-113,-100,483,50,-123,-133,-116,50,50,50,-120,50,50,50,269,50,50,50,455,50,50,50,50,-149,-147,-343,-344,-148,455,-335,50,-340,-339,50,235,235,235,-90,-89,-328,-329,50,50,50,50,50,50,50,50,50,-145,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-125,50,-114,50,50,50,50,50,50,50,50,50,50,50,50,50,-146,-115,-124,50,50,-152,-97,-99,-98,455,-132,269,-131,-341,-133,50,50,50,50,50,-330,-150,50,50,-145,-338,50,-334,-336,50,-333,50,-221,50,50,-332,-128,-106,-102,-93,-162,-95,-104,235,235,235,-101,-105,-103,235,235,235,-92,-94,50,50,-331,-151,50,269,-466,50,50,50,50,50,50,50,-337,-624,50,50,50,-163,50,-159,50,50,269,50,50,50,50,50,-225,-216,50,-217,-624,-326,-327,-320,-226,50,-227,-160,-624,50,50,50,50,-222,-218,-319,-223,-624,-224,-624,-323,269,-624,-322,-161,-324,50,-321,]),'SHORT':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[24,24,24,24,24,24,24,24,24,24,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,24,-174,24,24,-195,-190,-186,-201,-193,-170,-204,24,-352,-194,24,-196,24,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,24,24,-199,-200,24,-185,-198,-206,-362,-187,-202,24,-192,24,24,24,24,24,24,24,24,24,24,-9,-13,-17,-15,24,-19,-12,-8,-11,-16,-18,-14,-10,-343,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-529,-624,-553,-624,-508,-451,24,-588,-354,-624,-452,-249,24,24,24,-286,24,24,24,-167,24,24,24,-205,-277,24,24,24,-175,-279,-344,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,24,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,24,-527,-524,24,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,24,24,24,-283,-281,24,24,-260,24,-284,-290,-287,-624,24,24,-164,-168,-228,-278,-280,24,24,24,24,-400,24,24,24,24,24,24,24,24,24,24,24,24,-533,24,-352,-563,-564,-484,24,-559,24,-516,-520,24,-503,24,-595,-587,24,-441,-470,-483,-466,24,-502,24,24,24,24,24,-288,-285,-624,-289,-296,24,-303,24,24,24,-251,24,-405,-402,-404,-401,24,24,24,24,24,24,24,24,-536,-534,-624,-487,24,-440,-442,-263,24,24,24,-185,-231,24,24,-308,-261,-306,24,-297,24,-307,-234,-282,24,24,-422,-421,24,24,-406,24,24,-535,-500,-486,-570,-482,-506,-443,24,-444,-310,-309,24,-271,24,-264,24,24,24,24,24,24,24,-403,-424,-423,-407,-411,-408,-410,24,24,-569,-505,-446,-445,-266,-272,24,-274,24,-265,-312,-314,-232,-311,-313,-291,24,-276,-426,24,-425,24,24,-412,-273,-267,-318,-316,24,24,24,-317,-315,24,-428,-427,-409,-236,24,24,24,]),'RSHIFT':([6,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,156,166,193,195,204,205,206,219,221,223,229,231,244,246,247,251,255,256,258,259,261,262,263,270,271,272,282,342,353,375,381,382,385,386,388,393,394,397,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,703,704,705,709,710,711,712,713,714,715,717,722,723,724,725,726,730,731,732,733,734,735,736,738,739,748,749,802,812,847,851,853,854,855,857,858,859,860,861,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1054,1055,1056,1057,1058,1059,1060,1061,1063,1064,1065,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1147,1148,1149,1150,1151,1152,],[-128,-345,-107,-119,-138,-139,-144,-122,233,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,-88,-378,-379,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,457,-91,-112,-126,-132,476,-131,-113,-100,-81,-123,-133,-116,-120,-389,457,-385,-383,-399,-392,-398,-381,-391,-158,-157,-149,-147,-343,-344,-148,233,233,233,233,457,-335,-340,-339,-78,-79,-80,-90,-89,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,457,-132,-131,-341,-133,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,233,233,-128,233,-106,-102,-93,-162,-95,-104,-85,-87,233,-83,-101,-105,-103,233,233,-84,-86,-82,233,233,-92,-94,-331,-151,-466,-390,-393,-419,-420,-384,-405,968,-402,-404,-380,971,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,971,-424,971,-423,971,968,-407,-411,-408,-410,971,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,971,-427,971,-409,971,-321,]),']':([6,7,8,9,10,13,14,15,16,17,19,23,25,26,27,29,31,32,33,35,36,37,38,39,41,43,44,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,126,156,166,181,191,193,195,204,205,206,219,221,223,229,231,244,280,282,342,360,375,382,385,386,393,394,395,397,398,399,400,401,402,404,405,406,407,408,410,412,413,416,417,418,421,423,424,425,426,427,428,431,437,438,439,440,453,490,497,498,500,501,502,503,504,612,651,652,661,665,668,672,673,674,678,680,681,683,684,686,692,696,712,748,749,802,812,847,851,853,855,858,859,862,865,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-35,-58,-20,-4,-345,-107,-25,-119,-138,-139,-144,-122,-63,-129,-346,-1,-77,-127,-40,-108,-96,-140,-348,-343,-142,-3,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-378,-379,-380,394,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,394,-120,-389,-383,-385,-399,-392,-398,-391,-158,673,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,-26,-31,-7,-335,680,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,696,-145,-146,748,-36,-152,-59,-97,-99,-98,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,866,-334,-336,-333,-221,-332,-162,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-21,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'AND':([6,7,8,13,14,15,16,17,19,23,25,26,27,29,32,33,35,36,37,38,39,41,43,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,126,156,166,181,193,195,204,205,206,219,221,223,229,231,244,245,246,247,248,251,253,255,256,257,258,259,260,261,262,263,267,270,271,272,274,282,342,353,360,375,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,410,411,412,416,418,421,423,424,425,426,427,428,431,437,438,439,453,470,472,490,491,492,498,500,501,502,503,504,552,556,558,561,566,612,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,716,717,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,742,743,744,745,748,749,802,812,847,851,853,855,858,859,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-35,-58,-345,-107,207,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-40,-108,-96,-140,-348,-343,-142,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-378,-379,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,462,-91,-32,-112,471,-126,-132,-53,-68,-131,-37,-113,-100,-81,-42,-123,-133,-116,-47,-120,-389,462,-383,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,207,462,-31,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-125,-114,-146,-115,-124,-36,-152,-59,-97,-99,-98,462,-132,-131,-341,-133,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-128,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,207,-34,-39,-76,-83,-101,-105,-103,-38,-33,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,207,-48,-56,-54,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'RRSHIFT':([6,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,156,166,193,195,204,205,206,219,221,223,229,231,244,246,247,251,255,256,258,259,261,262,263,270,271,272,282,342,353,375,381,382,385,386,388,393,394,397,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,703,704,705,709,710,711,712,713,714,715,717,722,723,724,725,726,730,731,732,733,734,735,736,738,739,748,749,802,812,847,851,853,854,855,858,859,860,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1059,1060,1061,1063,1064,1065,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1147,1148,1149,1150,1151,1152,],[-128,-345,-107,-119,-138,-139,-144,-122,234,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,-88,-378,-379,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,459,-91,-112,-126,-132,477,-131,-113,-100,-81,-123,-133,-116,-120,-389,459,-385,-383,-399,-392,-398,-381,-391,-158,-157,-149,-147,-343,-344,-148,234,234,234,234,459,-335,-340,-339,-78,-79,-80,-90,-89,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,459,-132,-131,-341,-133,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,234,234,-128,234,-106,-102,-93,-162,-95,-104,-85,-87,234,-83,-101,-105,-103,234,234,-84,-86,-82,234,234,-92,-94,-331,-151,-466,-390,-393,-419,-420,-384,-405,-402,-404,-380,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,1125,-407,-411,-408,-410,1128,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,1128,-427,1128,-409,1128,-321,]),'ABSTRACT':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[74,74,-342,-341,-450,74,-359,74,-449,-360,-361,-262,-448,-447,74,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,74,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,74,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,74,-185,-198,-206,-362,-187,-202,-192,-343,-529,74,74,74,74,-605,74,-553,74,-508,-620,-451,74,-609,-588,-354,74,-452,-249,-286,74,74,-167,74,-205,-277,-175,-279,-344,74,74,74,74,74,74,-566,-562,-565,-567,74,-528,74,-526,-525,-523,-521,-522,74,-519,74,-527,-524,-615,-475,-480,74,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,74,74,-164,-168,-228,-278,-280,-533,74,-563,-564,-484,74,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,74,-289,-296,74,-303,-536,-534,74,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,74,-271,-264,74,-569,-505,-266,-272,74,-274,74,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'CHAR_LITERAL':([2,4,11,12,20,22,50,51,62,118,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,344,346,355,358,363,365,368,369,370,371,372,374,377,378,379,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,623,624,625,626,628,629,632,633,655,656,658,659,663,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,843,844,845,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1157,1158,1159,1162,],[29,29,29,29,29,29,29,29,29,29,-174,29,29,-195,-190,-186,-201,-193,-170,-204,29,-194,29,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,29,-199,-200,29,-185,-198,-206,-187,-202,-192,29,29,29,29,29,29,29,29,29,29,-9,-13,-17,-15,29,-19,-12,-8,-11,-16,-18,-14,-10,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-529,-553,-508,29,-452,-249,29,29,29,-286,29,29,-167,29,29,29,-205,-277,29,29,-175,-279,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-283,-281,29,29,-260,29,-284,-290,-287,-624,-164,-168,-228,-278,-280,29,29,29,29,29,29,29,29,29,29,29,29,-533,29,-559,-516,29,-466,29,29,29,29,29,-288,-285,-289,-296,29,29,29,-251,29,29,29,29,29,29,29,29,29,-536,-534,29,-263,29,29,29,-185,-231,29,29,-308,-261,-306,-297,29,-307,-234,-282,29,29,-535,-310,-309,29,-271,29,-264,29,29,29,29,29,29,29,29,29,-266,-272,29,-274,29,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,29,29,29,-317,-315,29,-236,29,29,29,]),'IF':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[131,131,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,131,-199,-200,131,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,131,131,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,131,-559,-516,-466,938,-288,-285,-289,-296,-251,131,-536,-534,-263,938,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,131,-271,-264,938,131,-266,-272,131,-274,131,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,938,938,-317,-315,131,-236,938,938,]),'LONG':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[30,30,30,30,30,30,30,30,30,30,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,30,-174,30,30,-195,-190,-186,-201,-193,-170,-204,30,-352,-194,30,-196,30,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,30,30,-199,-200,30,-185,-198,-206,-362,-187,-202,30,-192,30,30,30,30,30,30,30,30,30,30,-9,-13,-17,-15,30,-19,-12,-8,-11,-16,-18,-14,-10,-343,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-529,-624,-553,-624,-508,-451,30,-588,-354,-624,-452,-249,30,30,30,-286,30,30,30,-167,30,30,30,-205,-277,30,30,30,-175,-279,-344,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,30,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,30,-527,-524,30,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,30,30,30,-283,-281,30,30,-260,30,-284,-290,-287,-624,30,30,-164,-168,-228,-278,-280,30,30,30,30,-400,30,30,30,30,30,30,30,30,30,30,30,30,-533,30,-352,-563,-564,-484,30,-559,30,-516,-520,30,-503,30,-595,-587,30,-441,-470,-483,-466,30,-502,30,30,30,30,30,-288,-285,-624,-289,-296,30,-303,30,30,30,-251,30,-405,-402,-404,-401,30,30,30,30,30,30,30,30,-536,-534,-624,-487,30,-440,-442,-263,30,30,30,-185,-231,30,30,-308,-261,-306,30,-297,30,-307,-234,-282,30,30,-422,-421,30,30,-406,30,30,-535,-500,-486,-570,-482,-506,-443,30,-444,-310,-309,30,-271,30,-264,30,30,30,30,30,30,30,-403,-424,-423,-407,-411,-408,-410,30,30,-569,-505,-446,-445,-266,-272,30,-274,30,-265,-312,-314,-232,-311,-313,-291,30,-276,-426,30,-425,30,30,-412,-273,-267,-318,-316,30,30,30,-317,-315,30,-428,-427,-409,-236,30,30,30,]),'THIS':([2,4,11,12,20,22,50,51,62,118,119,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,194,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,341,344,345,346,355,358,363,365,368,369,370,371,372,374,377,378,379,382,385,386,393,417,422,441,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,610,616,623,624,625,626,628,629,632,633,655,656,658,659,663,665,668,672,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,840,843,844,845,847,851,853,855,858,859,862,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,967,968,971,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1050,1053,1055,1057,1060,1061,1063,1064,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1123,1125,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[38,167,38,38,38,38,38,38,38,167,333,-174,38,38,-195,-190,-186,-201,-193,-170,-204,38,-194,38,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,167,-199,-200,167,-185,-198,-206,-187,-202,-192,38,399,38,38,38,38,38,38,38,38,38,-9,-13,-17,-15,38,-19,-12,-8,-11,-16,-18,-14,-10,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-529,-553,-508,38,-452,-249,38,611,38,617,38,-286,38,38,-167,167,38,167,-205,-277,38,38,-175,-279,-399,-392,-398,-391,38,38,38,38,38,38,38,38,38,38,38,38,399,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-283,-281,809,815,38,38,-260,38,-284,-290,-287,-624,-164,-168,-228,-278,-280,-418,-417,-400,38,38,38,38,38,38,38,38,38,38,38,38,-533,167,-559,-516,38,-466,38,38,167,38,38,-288,-285,-289,-296,38,38,399,38,-251,167,-393,-419,-420,-405,-402,-404,-401,38,38,38,38,38,38,38,38,-536,-534,38,-263,38,38,167,-185,-231,38,38,-308,-261,-306,-297,38,-307,-234,-282,-422,-421,-406,38,38,-535,-310,-309,167,-271,38,-264,167,38,38,38,167,38,38,399,-403,-424,-423,-407,-411,-408,-410,38,38,-266,-272,167,-274,167,-265,-312,-314,-232,-311,-313,-291,-276,-426,-425,-412,-273,-267,-318,-316,167,167,38,-317,-315,167,-428,-427,-409,-236,167,38,167,]),'EXTENDS':([81,97,101,106,117,310,329,384,569,570,572,573,578,582,583,672,793,797,798,855,857,858,859,862,914,917,920,967,968,971,1015,1018,1053,1055,1057,1059,1060,1061,1063,1064,1088,1091,1123,1125,1128,1146,1148,1150,],[305,-511,305,320,-455,-510,-454,667,-429,-439,792,-430,-558,-456,-512,-400,-441,-557,-555,-405,969,-402,-404,-401,-440,-442,-556,-422,-421,-406,-443,-444,-403,-424,-423,1126,-407,-411,-408,-410,-446,-445,-426,-425,-412,-428,-427,-409,]),'{':([4,63,64,68,72,73,75,81,97,101,106,114,117,118,121,125,128,129,130,134,136,138,142,145,146,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,181,182,187,188,190,193,195,224,225,229,286,292,293,295,297,299,303,304,306,309,310,314,317,318,319,327,328,329,332,355,356,365,368,370,371,372,375,378,379,382,385,386,393,394,397,401,416,418,419,421,486,505,509,513,518,519,520,529,550,551,557,570,573,577,578,579,582,583,584,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,603,607,608,620,623,625,628,629,632,633,655,656,658,659,661,663,665,668,672,679,680,682,684,751,752,753,755,756,771,772,773,778,782,788,793,797,798,799,800,801,802,804,807,813,824,825,826,828,829,844,845,846,847,851,853,855,858,859,862,866,873,890,893,894,898,905,909,914,917,920,924,929,931,934,946,947,948,951,952,954,961,963,964,967,968,971,975,977,992,993,994,998,1001,1002,1003,1004,1008,1009,1015,1018,1020,1021,1022,1023,1028,1034,1038,1043,1048,1053,1055,1057,1060,1061,1063,1064,1072,1075,1080,1082,1083,1084,1086,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1123,1125,1128,1129,1135,1136,1137,1138,1139,1140,1142,1143,1145,1146,1148,1150,1153,1157,1158,1162,],[172,-342,-341,287,-624,296,298,-624,-511,-624,-624,327,-455,172,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,172,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,172,-199,-200,172,-185,-198,-380,-206,-187,-202,-192,-155,-156,-383,-381,-343,-529,-460,-461,-530,-553,-508,-624,-458,-457,557,-510,-624,-509,-513,-514,172,-452,-454,-249,-286,172,-167,172,172,-205,-277,-385,-175,-279,-399,-392,-398,-391,-158,-157,-344,-335,682,-382,682,-154,327,-624,172,-465,-463,-462,772,-554,-459,557,-439,-430,-453,-558,-515,-456,-512,-531,-475,-480,172,-473,-477,-479,-478,-476,-481,172,-472,-469,-501,-471,-474,772,-283,-281,-153,682,-260,-284,-290,-287,-624,-164,-168,-228,-278,-386,-280,-418,-417,-400,-384,-338,682,-336,-542,-541,-544,-543,-533,-484,172,-559,-516,-503,557,-441,-557,-555,-532,-470,-483,-466,-502,923,172,-288,-285,172,-289,-296,-251,172,172,-393,-419,-420,-405,-402,-404,-401,-337,327,-536,-534,-464,-624,-624,557,-440,-442,-556,-263,172,-185,-231,-308,-261,-306,-297,-298,682,-307,-234,-282,-422,-421,-406,682,327,327,-545,-535,-507,-495,-485,-494,-500,-482,-624,-443,-444,-310,-309,172,-271,-264,172,172,172,682,-403,-424,-423,-407,-411,-408,-410,327,327,557,-497,-499,-496,-504,-446,-445,-266,-272,172,-274,172,-265,-312,-314,-232,-311,-313,-291,-276,-426,-425,-412,327,-273,-267,-318,-316,172,172,-317,-315,172,-428,-427,-409,-498,-236,172,172,]),'INT':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[34,34,34,34,34,34,34,34,34,34,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,34,-174,34,34,-195,-190,-186,-201,-193,-170,-204,34,-352,-194,34,-196,34,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,34,34,-199,-200,34,-185,-198,-206,-362,-187,-202,34,-192,34,34,34,34,34,34,34,34,34,34,-9,-13,-17,-15,34,-19,-12,-8,-11,-16,-18,-14,-10,-343,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-529,-624,-553,-624,-508,-451,34,-588,-354,-624,-452,-249,34,34,34,-286,34,34,34,-167,34,34,34,-205,-277,34,34,34,-175,-279,-344,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,34,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,34,-527,-524,34,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,34,34,34,-283,-281,34,34,-260,34,-284,-290,-287,-624,34,34,-164,-168,-228,-278,-280,34,34,34,34,-400,34,34,34,34,34,34,34,34,34,34,34,34,-533,34,-352,-563,-564,-484,34,-559,34,-516,-520,34,-503,34,-595,-587,34,-441,-470,-483,-466,34,-502,34,34,34,34,34,-288,-285,-624,-289,-296,34,-303,34,34,34,-251,34,-405,-402,-404,-401,34,34,34,34,34,34,34,34,-536,-534,-624,-487,34,-440,-442,-263,34,34,34,-185,-231,34,34,-308,-261,-306,34,-297,34,-307,-234,-282,34,34,-422,-421,34,34,-406,34,34,-535,-500,-486,-570,-482,-506,-443,34,-444,-310,-309,34,-271,34,-264,34,34,34,34,34,34,34,-403,-424,-423,-407,-411,-408,-410,34,34,-569,-505,-446,-445,-266,-272,34,-274,34,-265,-312,-314,-232,-311,-313,-291,34,-276,-426,34,-425,34,34,-412,-273,-267,-318,-316,34,34,34,-317,-315,34,-428,-427,-409,-236,34,34,34,]),'TRANSIENT':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[108,108,-342,-341,-450,108,-359,108,-449,-360,-361,-262,-448,-447,108,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,108,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,108,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,108,-185,-198,-206,-362,-187,-202,-192,-343,-529,108,108,108,108,-605,108,-553,108,-508,-620,-451,108,-609,-588,-354,108,-452,-249,-286,108,108,-167,108,-205,-277,-175,-279,-344,108,108,108,108,108,108,-566,-562,-565,-567,108,-528,108,-526,-525,-523,-521,-522,108,-519,108,-527,-524,-615,-475,-480,108,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,108,108,-164,-168,-228,-278,-280,-533,108,-563,-564,-484,108,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,108,-289,-296,108,-303,-536,-534,108,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,108,-271,-264,108,-569,-505,-266,-272,108,-274,108,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'EQ':([6,8,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,48,49,53,56,57,58,59,61,63,64,65,67,126,156,166,181,193,195,204,205,206,219,221,223,229,231,244,245,246,247,251,255,256,257,258,259,261,262,263,270,271,272,274,282,342,353,360,375,382,385,386,393,394,397,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,431,437,438,439,453,470,472,490,491,492,500,501,502,503,504,552,556,558,561,566,612,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,717,722,723,724,725,726,729,730,731,732,733,734,735,736,738,739,743,744,745,748,749,802,812,847,851,853,855,858,859,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-58,-345,-107,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,242,-137,-136,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-378,-379,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,445,-91,-112,-126,-132,-53,-68,-131,-113,-100,-81,-123,-133,-116,494,-120,-389,445,-383,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-66,-67,-64,-65,445,-335,-340,-339,-78,-79,-80,-90,-89,-328,242,-329,-52,-51,-145,-125,-114,-146,-115,-124,-152,-59,-97,-99,-98,445,-132,-131,-341,-133,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-128,-70,-57,242,-106,-102,-93,-162,-95,-104,-85,-87,-76,-83,-101,-105,-103,-62,-73,-75,-84,-86,-82,-71,-69,-92,-94,242,-56,-54,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'CONTINUE':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[186,186,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,186,-199,-200,186,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,186,186,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,186,-559,-516,-466,186,-288,-285,-289,-296,-251,186,-536,-534,-263,186,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,186,-271,-264,186,186,-266,-272,186,-274,186,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,186,186,-317,-315,186,-236,186,186,]),'TRUE':([2,4,11,12,20,22,50,51,62,118,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,344,346,355,358,363,365,368,369,370,371,372,374,377,378,379,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,623,624,625,626,628,629,632,633,655,656,658,659,663,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,843,844,845,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1157,1158,1159,1162,],[39,39,39,39,39,39,39,39,39,39,-174,39,39,-195,-190,-186,-201,-193,-170,-204,39,-194,39,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,39,-199,-200,39,-185,-198,-206,-187,-202,-192,39,39,39,39,39,39,39,39,39,39,-9,-13,-17,-15,39,-19,-12,-8,-11,-16,-18,-14,-10,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-529,-553,-508,39,-452,-249,39,39,39,-286,39,39,-167,39,39,39,-205,-277,39,39,-175,-279,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-283,-281,39,39,-260,39,-284,-290,-287,-624,-164,-168,-228,-278,-280,39,39,39,39,39,39,39,39,39,39,39,39,-533,39,-559,-516,39,-466,39,39,39,39,39,-288,-285,-289,-296,39,39,39,-251,39,39,39,39,39,39,39,39,39,-536,-534,39,-263,39,39,39,-185,-231,39,39,-308,-261,-306,-297,39,-307,-234,-282,39,39,-535,-310,-309,39,-271,39,-264,39,39,39,39,39,39,39,39,39,-266,-272,39,-274,39,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,39,39,39,-317,-315,39,-236,39,39,39,]),'AND_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,210,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,210,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'CHAR':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[40,40,40,40,40,40,40,40,40,40,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,40,-174,40,40,-195,-190,-186,-201,-193,-170,-204,40,-352,-194,40,-196,40,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,40,40,-199,-200,40,-185,-198,-206,-362,-187,-202,40,-192,40,40,40,40,40,40,40,40,40,40,-9,-13,-17,-15,40,-19,-12,-8,-11,-16,-18,-14,-10,-343,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-529,-624,-553,-624,-508,-451,40,-588,-354,-624,-452,-249,40,40,40,-286,40,40,40,-167,40,40,40,-205,-277,40,40,40,-175,-279,-344,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,40,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,40,-527,-524,40,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,40,40,40,-283,-281,40,40,-260,40,-284,-290,-287,-624,40,40,-164,-168,-228,-278,-280,40,40,40,40,-400,40,40,40,40,40,40,40,40,40,40,40,40,-533,40,-352,-563,-564,-484,40,-559,40,-516,-520,40,-503,40,-595,-587,40,-441,-470,-483,-466,40,-502,40,40,40,40,40,-288,-285,-624,-289,-296,40,-303,40,40,40,-251,40,-405,-402,-404,-401,40,40,40,40,40,40,40,40,-536,-534,-624,-487,40,-440,-442,-263,40,40,40,-185,-231,40,40,-308,-261,-306,40,-297,40,-307,-234,-282,40,40,-422,-421,40,40,-406,40,40,-535,-500,-486,-570,-482,-506,-443,40,-444,-310,-309,40,-271,40,-264,40,40,40,40,40,40,40,-403,-424,-423,-407,-411,-408,-410,40,40,-569,-505,-446,-445,-266,-272,40,-274,40,-265,-312,-314,-232,-311,-313,-291,40,-276,-426,40,-425,40,40,-412,-273,-267,-318,-316,40,40,40,-317,-315,40,-428,-427,-409,-236,40,40,40,]),'GTEQ':([6,8,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,204,205,206,219,221,223,231,244,246,247,251,255,256,258,259,261,262,263,270,271,272,282,353,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,673,674,678,680,683,684,686,692,696,709,710,711,712,713,714,715,717,723,724,725,726,732,733,734,738,739,748,749,802,866,873,881,885,972,974,976,977,978,979,980,981,986,987,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1131,1132,1152,],[-128,197,-345,-107,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,-88,-119,-118,-117,-135,-134,-121,-109,-110,441,-91,-112,-126,-132,474,-131,-113,-100,-81,-123,-133,-116,-120,441,-149,-147,-343,-344,-148,-66,-67,-64,-65,441,-335,-340,-339,-78,-79,-80,-90,-89,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,441,-132,-131,-341,-133,-330,-150,-145,-338,-334,-336,-333,-221,-332,-106,-102,-93,-162,-95,-104,-85,-87,-83,-101,-105,-103,-84,-86,-82,-92,-94,-331,-151,-466,-337,-624,-163,-159,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-161,-324,-321,]),'INSTANCEOF':([6,8,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,49,53,56,57,58,59,61,63,64,65,67,126,156,166,181,193,195,204,205,206,219,221,223,229,231,244,245,246,247,251,255,256,257,258,259,261,262,263,270,271,272,282,342,353,360,375,382,385,386,393,394,397,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,437,438,439,453,470,472,490,491,492,500,501,502,503,504,552,556,558,561,566,612,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,709,710,711,712,713,714,715,717,722,723,724,725,726,729,730,731,732,733,734,735,736,738,739,744,745,748,749,802,812,847,851,853,855,858,859,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-58,-345,-107,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,281,-349,-342,-341,-141,-88,-381,-378,-379,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,443,-91,-112,-126,-132,473,-68,-131,-113,-100,-81,-123,-133,-116,-120,-389,443,-383,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-66,-67,-64,-65,443,-335,-340,-339,-78,-79,-80,-90,-89,-328,-329,281,281,-145,-125,-114,-146,-115,-124,-152,-59,-97,-99,-98,443,-132,-131,-341,-133,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,281,-72,-128,-70,281,-106,-102,-93,-162,-95,-104,-85,-87,-76,-83,-101,-105,-103,-62,-73,-75,-84,-86,-82,-71,-69,-92,-94,281,281,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'NAME':([2,4,5,11,12,18,20,21,22,24,30,34,40,47,50,51,60,62,63,64,66,69,74,78,79,80,82,84,85,87,88,89,90,91,93,94,98,102,103,104,108,109,110,111,116,118,121,122,123,124,125,126,128,129,130,134,135,136,138,139,140,141,142,144,145,150,151,152,153,154,155,156,157,158,159,162,163,164,165,166,168,169,170,171,172,173,177,179,181,182,183,186,187,188,189,190,191,193,194,195,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,227,229,232,233,234,235,236,237,238,239,240,241,242,243,252,254,269,273,275,276,277,281,283,284,285,286,287,294,296,297,298,299,301,305,309,311,313,315,316,320,321,322,323,324,325,326,327,328,332,335,340,341,342,343,344,345,346,347,355,357,358,359,360,361,362,363,365,368,369,370,371,372,374,375,376,377,378,379,382,385,386,393,394,397,400,401,403,414,415,417,422,429,430,436,441,443,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,495,506,507,508,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,575,580,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,610,612,616,622,623,624,625,626,628,629,632,633,635,637,642,644,648,649,651,652,655,656,658,659,661,663,664,665,667,668,669,670,671,672,675,677,678,682,685,688,690,693,695,698,701,740,747,754,756,760,762,763,766,769,770,771,772,773,774,775,776,778,779,780,781,782,787,788,789,790,791,792,793,796,800,801,802,803,804,808,811,812,813,814,817,824,825,827,828,829,831,832,835,836,837,839,840,841,843,844,845,847,851,853,855,858,859,862,864,875,877,879,882,884,886,887,890,893,895,897,900,901,902,906,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,996,1000,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1044,1045,1046,1048,1049,1050,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[41,135,-376,41,41,-370,41,229,41,-372,-374,-373,-375,-377,41,41,-369,41,-342,-341,-371,-450,-359,229,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,229,-586,229,-353,-363,-356,-362,-585,-364,135,-174,41,41,-383,-195,-381,-190,-186,-201,-193,-343,-170,-204,349,41,-352,-194,41,-196,229,-262,-172,-171,-367,-173,-378,-191,-188,-169,-203,-189,-197,229,-379,135,-368,-199,-200,135,-185,373,-198,-380,-206,-362,380,-187,-202,229,-192,41,-155,400,-156,41,41,41,41,41,41,41,41,41,-9,-13,-17,-15,41,-19,-12,-8,-11,-16,-18,-14,-10,229,-343,41,41,41,41,41,428,41,41,437,41,41,41,41,41,41,41,229,41,41,229,41,41,41,-529,-624,229,-624,-553,-624,-508,-451,229,41,569,229,578,-588,229,229,-354,229,582,583,584,-624,-452,-249,41,-388,400,-389,229,41,614,41,619,-286,229,642,349,-383,-367,-387,41,-167,135,41,135,-205,-277,41,-385,229,41,-175,-279,-399,-392,-398,-391,-158,-157,-343,-344,676,229,229,41,41,689,229,694,41,229,41,41,41,41,41,41,41,41,41,400,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,229,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,229,751,229,-352,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,774,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,229,-527,-524,41,-439,-430,229,798,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,774,41,41,-283,-281,676,-384,689,349,41,41,-260,41,-284,-290,-287,-624,349,229,-343,838,-383,229,-388,-387,-164,-168,-228,-278,-386,-280,229,-418,229,-417,229,229,229,-400,41,41,41,41,41,41,229,41,41,41,229,41,41,41,-533,-624,229,229,-352,-563,-564,-484,135,-559,-343,901,903,-516,-520,229,907,-503,229,41,-595,-587,569,229,-441,229,-470,-483,-466,901,-502,41,41,-390,135,41,41,-288,-285,-624,-289,-296,229,-303,349,41,614,642,400,960,41,-251,135,-393,-419,-420,-405,-402,-404,-401,41,41,41,41,41,41,41,41,-536,-534,349,-624,-487,-343,1006,1010,41,-440,-442,-263,41,41,135,-185,-231,41,41,-308,-261,-306,229,-297,41,-307,-234,-282,229,229,-422,-421,229,229,-406,41,41,-535,349,229,-500,-486,-570,-482,-506,-443,229,-444,-310,-309,135,-271,41,-264,135,41,41,642,135,349,-294,-293,41,642,400,-403,-424,-423,-407,-411,-408,-410,41,41,-569,-505,-446,-445,-266,-272,135,-274,135,-265,-312,-314,-232,-311,-313,-291,229,-276,-426,229,-425,229,229,-412,229,-273,-267,-318,-316,135,135,41,-317,-315,-295,135,-428,-427,-409,-236,135,642,135,]),'FINALLY':([354,355,628,629,630,632,633,655,824,828,829,1114,],[-624,-286,-289,-290,826,-287,-624,-164,-288,-289,826,-291,]),'XOR_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,213,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,213,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'SUPER':([2,4,11,12,20,22,50,51,62,118,119,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,194,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,341,344,345,346,355,358,363,365,368,369,370,371,372,374,377,378,379,382,384,385,386,393,417,422,441,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,610,616,623,624,625,626,628,629,632,633,655,656,658,659,663,665,668,672,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,840,843,844,845,847,851,853,855,857,858,859,862,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,967,968,971,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1050,1053,1055,1057,1059,1060,1061,1063,1064,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1123,1125,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[42,137,42,42,42,42,42,42,42,137,334,-174,42,42,-195,-190,-186,-201,-193,-170,-204,42,-194,42,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,137,-199,-200,137,-185,-198,-206,-187,-202,-192,42,402,42,42,42,42,42,42,42,42,42,-9,-13,-17,-15,42,-19,-12,-8,-11,-16,-18,-14,-10,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-529,-553,-508,42,-452,-249,42,609,42,615,42,-286,643,42,-167,137,42,137,-205,-277,42,42,-175,-279,-399,669,-392,-398,-391,42,42,42,42,42,42,42,42,42,42,42,42,402,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-283,-281,810,816,42,42,-260,42,-284,-290,-287,-624,-164,-168,-228,-278,-280,-418,-417,-400,42,42,42,42,42,42,42,42,42,42,42,42,-533,137,-559,-516,42,-466,42,42,137,42,42,-288,-285,-289,-296,42,643,402,42,-251,137,-393,-419,-420,-405,966,-402,-404,-401,42,42,42,42,42,42,42,42,-536,-534,42,-263,42,42,137,-185,-231,42,42,-308,-261,-306,-297,42,-307,-234,-282,-422,-421,-406,42,42,-535,-310,-309,137,-271,42,-264,137,42,42,643,137,42,643,402,-403,-424,-423,1124,-407,-411,-408,-410,42,42,-266,-272,137,-274,137,-265,-312,-314,-232,-311,-313,-291,-276,-426,-425,-412,-273,-267,-318,-316,137,137,42,-317,-315,137,-428,-427,-409,-236,137,643,137,]),'OR_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,218,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,218,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'LSHIFT_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,220,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,220,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'WHILE':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,364,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[178,178,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,178,-199,-200,178,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,654,-167,178,178,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,178,-559,-516,-466,935,-288,-285,-289,-296,-251,178,-536,-534,-263,935,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,178,-271,-264,935,178,-266,-272,178,-274,178,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,935,935,-317,-315,178,-236,935,935,]),'FALSE':([2,4,11,12,20,22,50,51,62,118,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,344,346,355,358,363,365,368,369,370,371,372,374,377,378,379,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,623,624,625,626,628,629,632,633,655,656,658,659,663,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,843,844,845,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1157,1158,1159,1162,],[61,61,61,61,61,61,61,61,61,61,-174,61,61,-195,-190,-186,-201,-193,-170,-204,61,-194,61,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,61,-199,-200,61,-185,-198,-206,-187,-202,-192,61,61,61,61,61,61,61,61,61,61,-9,-13,-17,-15,61,-19,-12,-8,-11,-16,-18,-14,-10,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-529,-553,-508,61,-452,-249,61,61,61,-286,61,61,-167,61,61,61,-205,-277,61,61,-175,-279,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-283,-281,61,61,-260,61,-284,-290,-287,-624,-164,-168,-228,-278,-280,61,61,61,61,61,61,61,61,61,61,61,61,-533,61,-559,-516,61,-466,61,61,61,61,61,-288,-285,-289,-296,61,61,61,-251,61,61,61,61,61,61,61,61,61,-536,-534,61,-263,61,61,61,-185,-231,61,61,-308,-261,-306,-297,61,-307,-234,-282,61,61,-535,-310,-309,61,-271,61,-264,61,61,61,61,61,61,61,61,61,-266,-272,61,-274,61,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,61,61,61,-317,-315,61,-236,61,61,61,]),'REMAINDER_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,216,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,216,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'STRING_LITERAL':([2,4,11,12,20,22,50,51,62,118,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,344,346,355,358,363,365,368,369,370,371,372,374,377,378,379,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,623,624,625,626,628,629,632,633,655,656,658,659,663,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,843,844,845,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1157,1158,1159,1162,],[45,45,45,45,45,45,45,45,45,45,-174,45,45,-195,-190,-186,-201,-193,-170,-204,45,-194,45,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,45,-199,-200,45,-185,-198,-206,-187,-202,-192,45,45,45,45,45,45,45,45,45,45,-9,-13,-17,-15,45,-19,-12,-8,-11,-16,-18,-14,-10,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-529,-553,-508,45,-452,-249,45,45,45,-286,45,45,-167,45,45,45,-205,-277,45,45,-175,-279,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-283,-281,45,45,-260,45,-284,-290,-287,-624,-164,-168,-228,-278,-280,45,45,45,45,45,45,45,45,45,45,45,45,-533,45,-559,-516,45,-466,45,45,45,45,45,-288,-285,-289,-296,45,45,45,-251,45,45,45,45,45,45,45,45,45,-536,-534,45,-263,45,45,45,-185,-231,45,45,-308,-261,-306,-297,45,-307,-234,-282,45,45,-535,-310,-309,45,-271,45,-264,45,45,45,45,45,45,45,45,45,-266,-272,45,-274,45,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,45,45,45,-317,-315,45,-236,45,45,45,]),'LTEQ':([6,8,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,204,205,206,219,221,223,231,244,246,247,251,255,256,258,259,261,262,263,270,271,272,282,353,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,673,674,678,680,683,684,686,692,696,709,710,711,712,713,714,715,717,723,724,725,726,732,733,734,738,739,748,749,802,866,873,881,885,972,974,976,977,978,979,980,981,986,987,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1131,1132,1152,],[-128,198,-345,-107,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,-88,-119,-118,-117,-135,-134,-121,-109,-110,464,-91,-112,-126,-132,475,-131,-113,-100,-81,-123,-133,-116,-120,464,-149,-147,-343,-344,-148,-66,-67,-64,-65,464,-335,-340,-339,-78,-79,-80,-90,-89,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,464,-132,-131,-341,-133,-330,-150,-145,-338,-334,-336,-333,-221,-332,-106,-102,-93,-162,-95,-104,-85,-87,-83,-101,-105,-103,-84,-86,-82,-92,-94,-331,-151,-466,-337,-624,-163,-159,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-161,-324,-321,]),':':([6,7,8,9,10,13,14,15,16,17,19,23,25,26,27,29,31,32,33,35,36,37,38,39,41,43,44,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,126,135,156,166,174,175,181,193,195,204,205,206,219,221,223,229,231,244,282,342,352,360,375,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,409,410,412,413,416,418,421,423,424,425,426,427,428,431,437,438,439,453,486,490,498,500,501,502,503,504,612,620,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,712,718,741,748,749,802,812,838,847,851,853,855,858,859,862,865,866,873,881,885,932,957,960,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1025,1051,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1095,1096,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-35,-58,-20,-4,-345,-107,-25,-119,-138,-139,-144,-122,-63,-129,-346,-1,-77,-127,-40,-108,-96,-140,-348,-343,-142,-3,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-230,-378,-379,369,370,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-120,-389,624,-383,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,677,-26,-31,-7,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-154,-146,-36,-152,-59,-97,-99,-98,-384,-153,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-162,884,886,-331,-151,-466,-390,-624,-393,-419,-420,-405,-402,-404,-401,-21,-337,-624,-163,-159,1034,-252,-624,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,1097,-253,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,1135,-275,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'NULL':([2,4,11,12,20,22,50,51,62,118,121,122,123,125,128,129,130,134,136,138,140,142,144,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,328,332,335,344,346,355,358,363,365,368,369,370,371,372,374,377,378,379,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,607,608,623,624,625,626,628,629,632,633,655,656,658,659,663,675,677,678,682,685,688,693,695,698,740,747,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,843,844,845,864,875,877,879,882,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,961,963,964,975,983,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1157,1158,1159,1162,],[46,46,46,46,46,46,46,46,46,46,-174,46,46,-195,-190,-186,-201,-193,-170,-204,46,-194,46,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,46,-199,-200,46,-185,-198,-206,-187,-202,-192,46,46,46,46,46,46,46,46,46,46,-9,-13,-17,-15,46,-19,-12,-8,-11,-16,-18,-14,-10,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-529,-553,-508,46,-452,-249,46,46,46,-286,46,46,-167,46,46,46,-205,-277,46,46,-175,-279,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-283,-281,46,46,-260,46,-284,-290,-287,-624,-164,-168,-228,-278,-280,46,46,46,46,46,46,46,46,46,46,46,46,-533,46,-559,-516,46,-466,46,46,46,46,46,-288,-285,-289,-296,46,46,46,-251,46,46,46,46,46,46,46,46,46,-536,-534,46,-263,46,46,46,-185,-231,46,46,-308,-261,-306,-297,46,-307,-234,-282,46,46,-535,-310,-309,46,-271,46,-264,46,46,46,46,46,46,46,46,46,-266,-272,46,-274,46,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,46,46,46,-317,-315,46,-236,46,46,46,]),'DOUBLE':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[47,47,47,47,47,47,47,47,47,47,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,47,-174,47,47,-195,-190,-186,-201,-193,-170,-204,47,-352,-194,47,-196,47,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,47,47,-199,-200,47,-185,-198,-206,-362,-187,-202,47,-192,47,47,47,47,47,47,47,47,47,47,-9,-13,-17,-15,47,-19,-12,-8,-11,-16,-18,-14,-10,-343,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-529,-624,-553,-624,-508,-451,47,-588,-354,-624,-452,-249,47,47,47,-286,47,47,47,-167,47,47,47,-205,-277,47,47,47,-175,-279,-344,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,47,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,47,-527,-524,47,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,47,47,47,-283,-281,47,47,-260,47,-284,-290,-287,-624,47,47,-164,-168,-228,-278,-280,47,47,47,47,-400,47,47,47,47,47,47,47,47,47,47,47,47,-533,47,-352,-563,-564,-484,47,-559,47,-516,-520,47,-503,47,-595,-587,47,-441,-470,-483,-466,47,-502,47,47,47,47,47,-288,-285,-624,-289,-296,47,-303,47,47,47,-251,47,-405,-402,-404,-401,47,47,47,47,47,47,47,47,-536,-534,-624,-487,47,-440,-442,-263,47,47,47,-185,-231,47,47,-308,-261,-306,47,-297,47,-307,-234,-282,47,47,-422,-421,47,47,-406,47,47,-535,-500,-486,-570,-482,-506,-443,47,-444,-310,-309,47,-271,47,-264,47,47,47,47,47,47,47,-403,-424,-423,-407,-411,-408,-410,47,47,-569,-505,-446,-445,-266,-272,47,-274,47,-265,-312,-314,-232,-311,-313,-291,47,-276,-426,47,-425,47,47,-412,-273,-267,-318,-316,47,47,47,-317,-315,47,-428,-427,-409,-236,47,47,47,]),'>':([6,8,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,156,166,193,195,204,205,206,219,221,223,229,231,244,246,247,251,255,256,258,259,261,262,263,270,271,272,282,340,342,353,362,375,376,381,382,384,385,386,388,389,390,393,394,397,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,569,572,651,652,661,665,668,671,672,673,674,678,680,683,684,686,692,696,704,709,710,711,712,713,714,715,717,723,724,725,726,732,733,734,738,739,748,749,802,812,847,848,850,851,852,853,854,855,857,858,859,860,861,862,866,873,881,885,916,967,968,970,971,972,974,976,977,978,979,980,981,986,987,992,1053,1054,1055,1056,1057,1058,1059,1060,1061,1063,1064,1065,1066,1067,1069,1070,1072,1073,1075,1076,1089,1123,1125,1128,1129,1130,1131,1132,1146,1147,1148,1149,1150,1151,1152,],[-128,199,-345,-107,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,-88,-378,-379,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,446,-91,-112,-126,-132,479,-131,-113,-100,-81,-123,-133,-116,-120,-388,-389,446,-387,-385,661,-383,-399,668,-392,-398,-381,-380,672,-391,-158,-157,-149,-147,-343,-344,-148,-66,-67,-64,-65,446,-335,-340,-339,-78,-79,-80,-90,-89,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,446,-132,-131,-341,-133,-429,793,-388,-387,-386,-418,-417,661,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-383,-106,-102,-93,-162,-95,-104,-85,-87,-83,-101,-105,-103,-84,-86,-82,-92,-94,-331,-151,-466,-390,-393,672,672,-419,672,-420,-384,-405,668,-402,-404,-380,672,-401,-337,-624,-163,-159,672,-422,-421,661,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,672,-424,672,-423,672,668,-407,-411,-408,-410,672,-222,-218,-319,-223,-624,-224,-624,-323,672,-426,-425,-412,-624,-322,-161,-324,-428,672,-427,672,-409,672,-321,]),'STRICTFP':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[87,87,-342,-341,-450,87,-359,87,-449,-360,-361,-262,-448,-447,87,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,87,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,87,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,87,-185,-198,-206,-362,-187,-202,-192,-343,-529,87,87,87,87,-605,87,-553,87,-508,-620,-451,87,-609,-588,-354,87,-452,-249,-286,87,87,-167,87,-205,-277,-175,-279,-344,87,87,87,87,87,87,-566,-562,-565,-567,87,-528,87,-526,-525,-523,-521,-522,87,-519,87,-527,-524,-615,-475,-480,87,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,87,87,-164,-168,-228,-278,-280,-533,87,-563,-564,-484,87,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,87,-289,-296,87,-303,-536,-534,87,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,87,-271,-264,87,-569,-505,-266,-272,87,-274,87,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'CASE':([121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,170,171,173,179,182,187,188,190,286,297,299,328,332,355,365,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,773,778,802,824,825,828,829,890,893,923,924,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1026,1027,1028,1092,1093,1094,1097,1098,1099,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,-559,-516,-466,-288,-285,-289,-296,-536,-534,1024,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,1024,-271,1024,-268,-264,-266,-272,-270,-274,1024,-269,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'&':([6,8,13,14,16,17,19,23,25,26,27,29,32,33,35,36,37,38,39,41,43,45,46,48,49,53,56,57,58,59,61,63,64,65,67,126,156,166,181,193,195,204,205,206,219,221,223,229,231,244,245,246,247,251,255,256,257,258,259,261,262,263,267,270,271,272,274,282,342,353,360,375,381,382,385,386,388,389,393,394,397,398,399,400,401,402,404,405,406,407,408,411,416,418,421,423,424,425,426,427,428,431,437,438,439,453,470,472,490,491,492,500,501,502,503,504,552,556,558,561,566,612,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,716,717,722,723,724,725,726,729,730,731,732,733,734,735,736,737,738,739,743,744,745,748,749,802,812,847,851,853,854,855,858,859,862,866,873,881,885,916,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1014,1017,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1089,1090,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-58,-345,-107,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,238,-108,-96,-140,-348,-343,-142,-347,-350,-45,-137,-136,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-378,-379,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,449,-91,-112,-126,-132,-53,-68,-131,-113,-100,-81,489,-123,-133,-116,-47,-120,-389,449,-383,-385,-383,-399,-392,-398,-381,-380,-391,-158,-157,-149,-147,-343,-344,-148,238,-66,-67,-64,-65,449,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-125,-114,-146,-115,-124,-152,-59,-97,-99,-98,449,-132,-131,-341,-133,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-128,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,238,-87,-76,-83,-101,-105,-103,-62,-73,-75,-84,-86,-82,-71,-69,238,-92,-94,-48,-56,-54,-331,-151,-466,-390,-393,-419,-420,-384,-405,-402,-404,-401,-337,-624,-163,-159,1016,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-436,1016,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-438,-437,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'PUBLIC':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[91,91,-342,-341,-450,91,-359,91,-449,-360,-361,-262,-448,-447,91,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,91,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,91,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,91,-185,-198,-206,-362,-187,-202,-192,-343,-529,91,91,91,91,-605,91,-553,91,-508,-620,-451,91,-609,-588,-354,91,-452,-249,-286,91,91,-167,91,-205,-277,-175,-279,-344,91,91,91,91,91,91,-566,-562,-565,-567,91,-528,91,-526,-525,-523,-521,-522,91,-519,91,-527,-524,-615,-475,-480,91,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,91,91,-164,-168,-228,-278,-280,-533,91,-563,-564,-484,91,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,91,-289,-296,91,-303,-536,-534,91,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,91,-271,-264,91,-569,-505,-266,-272,91,-274,91,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'[':([5,6,13,18,19,23,24,29,30,34,38,39,40,41,43,45,46,47,49,53,55,57,60,61,63,64,65,66,124,126,127,135,148,154,167,181,193,195,224,225,226,228,229,246,264,330,349,353,360,361,375,381,382,385,386,387,388,393,394,397,398,399,400,401,402,411,416,418,421,428,437,444,453,490,500,552,561,609,611,612,614,619,627,642,648,661,665,668,672,673,674,678,679,680,683,684,686,692,696,704,706,748,749,774,802,838,847,851,853,854,855,858,859,862,866,873,883,896,901,903,905,907,958,960,967,968,971,972,974,976,977,978,979,980,981,986,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1132,1146,1148,1150,1152,],[-376,191,-345,-370,-139,-144,-372,-346,-374,-373,-140,-348,-375,-343,-142,-347,-350,-377,243,276,280,-143,-369,-349,-342,-341,-141,-371,191,280,-141,-343,-143,280,-140,-380,280,-156,-383,-381,417,417,-343,191,280,191,280,191,280,280,-385,280,-399,-392,-398,280,280,-391,-158,-157,-149,-147,-343,-344,-148,191,-335,417,417,-328,-329,280,-145,-146,-152,191,-341,-148,-147,280,-328,-329,-145,-343,191,-386,-418,-417,-400,-330,-150,-145,-384,-338,-334,-336,-333,-221,-332,191,280,-331,-151,-343,-466,280,-393,-419,-420,280,-405,-402,-404,-401,-337,-624,280,280,-343,280,280,280,191,280,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-324,-428,-427,-409,-321,]),'*':([0,6,13,14,16,17,19,23,25,27,29,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,204,205,206,219,221,223,231,244,246,247,251,255,256,259,261,262,270,271,272,282,353,398,399,400,401,402,411,416,418,421,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,575,673,674,678,680,683,684,686,692,696,704,709,710,711,712,713,714,724,725,726,738,739,748,749,796,802,866,873,881,885,972,974,976,977,978,979,980,981,986,987,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1131,1132,1152,],[4,-128,-345,-107,-119,-138,-139,-144,-122,-129,-346,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,283,-119,-118,-117,-135,-134,-121,-109,-110,451,466,-112,-126,-132,-131,-113,-100,-123,-133,-116,-120,451,-149,-147,-343,-344,-148,451,-335,-340,-339,283,283,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,451,-132,-131,-341,-133,794,-330,-150,-145,-338,-334,-336,-333,-221,-332,-128,-106,-102,283,-162,283,-104,-101,-105,-103,283,283,-331,-151,919,-466,-337,-624,-163,-159,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-161,-324,-321,]),'SYNCHRONIZED':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,118,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,370,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,813,824,825,827,828,829,831,832,844,845,890,893,897,900,918,924,929,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1034,1037,1038,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[110,183,-342,-341,-450,110,-359,110,-449,-360,-361,-262,-448,-447,110,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,110,-612,-364,331,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,110,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,331,-199,-200,183,-185,-198,-206,-362,-187,-202,-192,-343,-529,110,110,110,110,-605,110,-553,110,-508,-620,-451,110,-609,-588,-354,110,-452,-249,-286,110,110,-167,183,331,-205,-277,-175,-279,-344,110,110,110,110,110,110,-566,-562,-565,-567,110,-528,110,-526,-525,-523,-521,-522,110,-519,110,-527,-524,-615,-475,-480,110,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,110,110,-164,-168,-228,-278,-280,-533,110,-563,-564,-484,183,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,331,-288,-285,110,-289,-296,110,-303,-251,331,-536,-534,110,-487,-616,-263,331,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,183,-271,-264,331,110,331,-569,-505,-266,-272,183,-274,183,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,331,331,-317,-315,331,-236,331,331,]),'(':([2,4,11,12,20,22,41,50,51,62,63,64,89,118,120,121,122,123,125,128,129,130,131,134,135,136,137,138,140,142,144,145,146,149,151,152,153,155,157,158,159,162,163,164,167,168,170,171,172,173,178,179,181,182,183,187,188,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,224,225,226,229,230,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,286,297,299,309,316,328,331,332,333,334,335,344,346,355,358,363,365,368,369,370,371,372,374,375,377,378,379,382,385,386,393,400,401,417,419,420,422,428,437,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,496,509,557,604,605,607,608,609,611,614,615,617,619,623,624,625,626,628,629,631,632,633,642,654,655,656,658,659,661,663,665,668,672,675,676,677,678,679,682,685,688,689,691,693,694,695,698,740,746,747,751,754,756,772,773,774,778,788,802,808,809,810,811,813,814,815,816,817,824,825,828,829,836,839,843,844,845,847,851,853,855,858,859,862,864,875,876,877,879,882,884,886,887,890,893,901,903,907,909,924,926,927,929,931,934,935,938,940,943,944,946,947,948,951,954,961,963,964,967,968,971,975,983,994,1006,1010,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1123,1125,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[51,144,203,203,203,203,239,203,51,203,-342,-341,309,144,335,-174,51,51,-195,-190,-186,-201,344,-193,239,-170,346,-204,51,-194,51,-196,357,358,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,363,144,-199,-200,144,-185,374,-198,-380,-206,377,-187,-202,-192,51,203,203,203,203,203,51,203,51,203,-9,-13,-17,-15,51,-19,-12,-8,-11,-16,-18,-14,-10,-383,-381,-382,-343,422,203,203,203,203,203,203,51,203,203,51,203,203,203,203,51,203,203,203,203,-529,-553,-508,203,-588,-452,377,-249,604,605,51,51,51,-286,144,51,-167,144,51,144,-205,-277,51,-385,51,-175,-279,-399,-392,-398,-391,675,-344,51,-382,685,51,688,695,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,51,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,203,51,203,203,203,203,747,754,203,51,51,-283,-281,808,811,688,814,817,695,51,51,-260,203,-284,-290,827,-287,-624,239,843,-164,-168,-228,-278,-386,-280,-418,-417,-400,51,864,203,203,-384,51,51,51,875,877,51,879,51,203,203,887,51,-542,51,-533,144,-559,900,-516,203,-466,51,926,927,51,144,51,943,944,51,-288,-285,-289,-296,51,144,51,-251,144,-393,-419,-420,-405,-402,-404,-401,51,51,983,51,51,203,203,203,51,-536,-534,1005,1007,1011,203,-263,51,51,144,-185,-231,1035,1036,1037,51,51,-308,-261,-306,-297,51,-307,-234,-282,-422,-421,-406,51,51,-535,1085,1087,-310,-309,144,-271,51,-264,144,51,51,144,144,51,144,-403,-424,-423,-407,-411,-408,-410,203,203,-266,-272,144,-274,144,-265,-312,-314,-232,-311,-313,-291,-276,-426,-425,-412,-273,-267,-318,-316,144,144,51,-317,-315,144,-428,-427,-409,-236,144,144,144,]),'.':([5,6,13,17,18,19,23,24,29,30,33,34,38,39,40,41,42,43,45,46,47,49,53,55,57,60,61,63,64,65,66,124,126,127,133,135,137,148,154,167,192,193,195,224,225,229,246,259,264,278,302,312,316,330,340,353,360,362,375,381,382,385,386,388,393,394,397,398,399,400,401,402,411,416,418,421,428,437,442,444,453,485,490,500,552,558,561,576,581,609,611,612,614,619,627,640,642,643,648,661,665,668,672,673,674,678,679,680,683,684,686,692,696,704,706,748,749,774,802,847,851,853,854,855,858,859,862,866,873,901,958,967,968,971,972,974,976,977,978,979,980,981,986,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1132,1146,1148,1150,1152,],[-376,194,-345,-138,-370,-139,-144,-372,-346,-374,237,-373,-140,-348,-375,-343,240,-142,-347,-350,-377,-137,-136,279,-143,-369,-349,-342,-341,-141,-371,341,343,-141,345,-343,347,-143,279,-140,396,-155,-156,414,415,-343,454,237,279,499,414,575,414,341,396,454,414,499,-385,414,-399,-392,-398,670,-391,-158,-157,-149,-147,-343,-344,-148,454,-335,-340,-339,-328,-329,396,701,-145,499,-146,-152,454,237,-341,796,414,-148,-147,414,-328,-329,-145,837,-343,347,840,-386,-418,-417,-400,-330,-150,-145,414,-338,-334,-336,-333,-221,-332,454,279,-331,-151,-343,-466,-393,-419,-420,414,-405,-402,-404,-401,-337,-624,-343,1050,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-324,-428,-427,-409,-321,]),',':([6,7,8,9,10,13,14,15,16,17,19,23,25,26,27,29,31,32,33,35,36,37,38,39,41,43,44,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,89,93,102,111,126,127,143,147,148,156,160,166,180,181,184,193,195,204,205,206,219,221,223,224,225,229,231,244,245,247,248,251,253,255,257,258,260,261,262,263,265,267,270,272,274,282,287,316,340,342,348,349,350,351,360,362,375,381,382,383,384,385,386,388,389,390,391,392,393,394,397,398,399,400,401,402,404,405,406,407,408,410,412,413,416,418,419,421,423,424,425,426,427,428,431,433,434,437,438,439,453,470,472,486,490,491,492,498,500,501,502,503,504,505,509,510,514,518,519,520,552,553,554,556,557,558,559,564,565,566,568,569,571,572,579,612,620,621,641,647,650,651,652,661,665,666,668,672,673,674,678,679,680,682,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,716,717,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,742,743,744,745,748,749,750,751,752,753,755,765,767,783,784,786,789,790,802,812,819,820,821,822,838,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,865,866,869,871,873,878,881,885,891,894,903,904,907,908,910,912,913,915,916,957,959,960,967,968,971,972,974,976,977,978,979,980,981,986,987,989,990,992,993,995,999,1012,1013,1014,1017,1051,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1072,1073,1075,1076,1077,1082,1083,1084,1089,1090,1121,1123,1125,1128,1129,1130,1131,1132,1146,1147,1148,1149,1150,1151,1152,1153,],[-128,-35,-58,-20,-4,-345,-107,-25,-119,-138,-139,-144,-122,-63,-129,-346,-1,-77,-127,-40,-108,-96,-140,-348,-343,-142,-3,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-594,-584,-586,-585,-381,-213,-209,-211,-212,-378,-208,-379,-207,-380,-210,-155,-156,-119,-118,-117,-135,-134,-121,-383,-381,-343,-109,-110,-60,-91,-32,-112,-27,-126,-53,-68,-37,-113,-100,-81,-22,-42,-123,-116,-47,-120,516,-588,-388,-389,-178,-624,622,-180,-383,-387,-385,-383,-399,664,-413,-392,-398,-381,-380,-396,-394,-397,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,-26,-31,-7,-335,-340,-382,-339,-78,-79,-80,-90,-89,-328,-46,693,-548,-329,-52,-51,-145,-125,-114,-154,-146,-115,-124,-36,-152,-59,-97,-99,-98,-540,-624,-537,760,-465,-463,762,-575,-574,-577,-132,785,-131,787,-576,-591,-133,791,-429,-431,-433,762,-384,-153,-182,-242,839,622,-388,-387,-386,-418,-414,-417,-400,-330,-150,-145,-384,-338,868,-334,-336,-333,-221,-332,-74,-61,-55,-72,-383,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,-29,-34,-39,-76,-83,-101,-105,-103,-38,-33,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,-28,-48,-56,-54,-331,-151,-539,-542,-541,-544,-543,-490,897,-581,909,-582,-595,-587,-466,-390,-179,-184,-183,-181,-624,-393,-396,-395,-415,-419,-416,-420,-384,-405,965,-413,-402,-404,-380,-396,-401,-21,-337,-219,975,-624,-549,-163,-159,-538,-464,-624,622,-624,-579,-580,-592,-593,-432,-434,-182,-243,-624,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-24,-23,-624,-545,-492,-491,-578,-583,-436,-435,-182,-403,-396,-424,-416,-423,-415,-413,-407,-411,1127,-408,-410,-396,-222,-218,-220,-319,-223,-624,-224,-624,-323,-493,-497,-499,1134,-438,-437,839,-426,-425,-412,-624,-322,-161,-324,-428,-416,-427,-415,-409,-396,-321,-498,]),'ELSE':([125,130,134,138,142,145,151,162,164,170,171,179,182,188,190,355,371,372,379,607,608,625,628,629,632,633,655,659,663,824,825,828,829,924,930,931,933,936,937,939,941,946,947,948,951,961,964,1020,1021,1028,1033,1092,1100,1101,1104,1105,1110,1113,1114,1122,1136,1137,1138,1142,1143,1154,1155,1160,1163,],[-195,-201,-193,-204,-194,-196,-262,-203,-197,-199,-200,-198,-206,-202,-192,-286,-205,-277,-279,-283,-281,-260,-284,-290,-287,-624,-164,-278,-280,-288,-285,-289,-296,-263,-256,-254,-257,-258,-255,-259,1038,-308,-261,-306,-297,-307,-282,-310,-309,-264,-250,-266,-265,-312,-314,-229,-311,-313,-291,-276,-267,-318,-316,-317,-315,-235,1158,-233,-237,]),'ASSERT':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[140,140,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,140,-199,-200,140,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,140,140,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,140,-559,-516,-466,140,-288,-285,-289,-296,-251,140,-536,-534,-263,140,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,140,-271,-264,140,140,-266,-272,140,-274,140,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,140,140,-317,-315,140,-236,140,140,]),'^':([6,7,8,13,14,16,17,19,23,25,26,27,29,32,33,35,36,37,38,39,41,43,45,46,48,49,53,56,57,58,59,61,63,64,65,67,126,156,166,181,193,195,204,205,206,219,221,223,229,231,244,245,246,247,251,255,256,257,258,259,260,261,262,263,267,270,271,272,274,282,342,353,360,375,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,411,416,418,421,423,424,425,426,427,428,431,437,438,439,453,470,472,490,491,492,498,500,501,502,503,504,552,556,558,561,566,612,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,716,717,721,722,723,724,725,726,727,729,730,731,732,733,734,735,736,737,738,739,743,744,745,748,749,802,812,847,851,853,855,858,859,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,196,-58,-345,-107,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-40,-108,-96,-140,-348,-343,-142,-347,-350,-45,-137,-136,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-378,-379,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,458,-91,-112,-126,-132,-53,-68,-131,481,-113,-100,-81,-42,-123,-133,-116,-47,-120,-389,458,-383,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,458,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-125,-114,-146,-115,-124,196,-152,-59,-97,-99,-98,458,-132,-131,-341,-133,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-128,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,196,-76,-83,-101,-105,-103,196,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,-48,-56,-54,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'IMPORT':([3,70,83,86,92,95,96,100,105,115,289,291,308,574,795,918,1019,],[98,98,-262,98,-614,-610,-611,-608,-613,-612,98,-605,-609,-615,-617,-616,-618,]),'IMPLEMENTS':([63,64,72,81,101,117,181,224,225,229,303,304,306,314,329,375,382,385,386,393,401,419,551,570,573,578,582,584,661,665,668,672,679,793,797,798,799,847,851,853,855,858,859,862,914,917,920,967,968,971,1015,1018,1053,1055,1057,1060,1061,1063,1064,1088,1091,1123,1125,1128,1146,1148,1150,],[-342,-341,294,-624,-624,-455,-380,-383,-381,-343,294,-458,-457,294,-454,-385,-399,-392,-398,-391,-344,-382,-459,-439,-430,-558,-456,-531,-386,-418,-417,-400,-384,-441,-557,-555,-532,-393,-419,-420,-405,-402,-404,-401,-440,-442,-556,-422,-421,-406,-443,-444,-403,-424,-423,-407,-411,-408,-410,-446,-445,-426,-425,-412,-428,-427,-409,]),'PLUS_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,214,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,214,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'ELLIPSIS':([5,18,24,30,34,40,47,60,63,64,66,126,156,166,169,181,193,195,229,342,360,361,375,382,385,386,393,394,397,401,612,651,652,661,665,668,672,812,847,851,853,855,858,859,862,895,967,968,971,1053,1055,1057,1060,1061,1063,1064,1123,1125,1128,1146,1148,1150,],[-376,-370,-372,-374,-373,-375,-377,-369,-342,-341,-371,-381,-378,-379,-368,-380,-155,-156,-343,-389,-383,-367,-385,-399,-392,-398,-391,-158,-157,-344,-384,-388,-387,-386,-418,-417,-400,-390,-393,-419,-420,-405,-402,-404,-401,996,-422,-421,-406,-403,-424,-423,-407,-411,-408,-410,-426,-425,-412,-428,-427,-409,]),'RETURN':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[123,123,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,123,-199,-200,123,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,123,123,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,123,-559,-516,-466,123,-288,-285,-289,-296,-251,123,-536,-534,-263,123,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,123,-271,-264,123,123,-266,-272,123,-274,123,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,123,123,-317,-315,123,-236,123,123,]),'@':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,309,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,557,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,788,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,909,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1080,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[103,103,-342,-341,-450,103,-359,103,-449,-360,-361,-262,-448,-447,103,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,321,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,321,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,103,-185,-198,-206,-362,-187,-202,-192,-343,-529,507,103,103,321,-605,103,-553,103,-508,-620,-451,103,-609,507,-588,-354,103,-452,-249,-286,507,507,-167,103,-205,-277,-175,-279,-344,507,103,103,507,507,103,-566,-562,-565,-567,321,-528,507,-526,-525,-523,-521,-522,103,-519,321,-527,-524,507,-615,-475,-480,103,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,507,507,-164,-168,-228,-278,-280,-533,507,-563,-564,-484,103,-559,-516,-520,-503,507,-595,-587,-617,-470,-483,-466,-502,-288,-285,507,-289,-296,507,-303,-536,-534,507,-487,507,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,103,-271,-264,507,507,-569,-505,-266,-272,103,-274,103,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'MINUS_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,209,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,209,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'PLUSPLUS':([0,2,4,6,11,12,13,16,17,19,20,22,23,27,29,33,38,39,41,43,45,46,49,50,51,53,56,57,61,62,63,64,65,118,121,122,123,124,125,127,128,129,130,133,134,135,136,138,140,142,144,145,147,148,151,152,153,155,157,158,159,161,162,163,164,167,168,170,171,172,173,179,182,184,187,188,190,191,196,197,198,199,200,201,202,203,204,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,232,233,234,235,236,238,239,241,242,243,246,252,254,256,259,269,271,273,276,277,283,284,285,286,297,299,309,328,330,332,335,344,346,353,355,358,363,365,368,369,370,371,372,374,377,378,379,398,399,400,401,402,411,416,417,418,421,422,428,437,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,490,493,494,500,552,555,556,557,558,561,566,604,605,607,608,609,611,614,619,623,624,625,626,627,628,629,632,633,640,642,648,655,656,658,659,663,673,674,675,677,678,680,682,683,684,685,686,688,692,693,695,696,704,740,747,748,749,754,756,772,773,778,788,802,808,811,813,814,817,824,825,828,829,836,839,843,844,845,864,866,873,875,877,879,884,886,887,890,893,909,924,926,927,929,931,934,943,944,946,947,948,951,954,958,961,963,964,972,974,975,976,977,978,979,980,981,983,986,992,994,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1066,1067,1069,1070,1072,1073,1075,1076,1080,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1129,1130,1132,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1152,1157,1158,1159,1162,],[3,12,12,-128,12,12,-345,221,-138,-139,12,12,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,12,12,-136,-130,-143,-349,12,-342,-341,-141,12,-174,12,12,-128,-195,-141,-190,-186,-201,-127,-193,-343,-170,-204,12,-194,12,-196,-130,-143,-262,-172,-171,-173,-191,-188,-169,221,-203,-189,-197,-140,12,-199,-200,12,-185,-198,-206,-129,-187,-202,-192,12,12,12,12,12,12,12,12,12,221,12,-9,-13,-17,-15,12,-19,-12,-8,-11,-16,-18,-135,-14,-134,-10,12,12,12,12,12,12,12,12,12,12,-128,12,12,-129,-127,12,-130,12,12,12,12,12,12,-529,-553,-508,12,-452,-128,-249,12,12,12,-128,-286,12,12,-167,12,12,12,-205,-277,12,12,-175,-279,-149,-147,-343,-344,-148,-128,-335,12,-340,-339,12,-328,-329,12,12,12,12,12,12,12,12,12,-145,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,-146,12,12,-152,-128,221,-129,12,-127,-341,-130,12,12,-283,-281,-148,-147,-328,-329,12,12,-260,12,-145,-284,-290,-287,-624,-127,-343,-128,-164,-168,-228,-278,-280,-330,-150,12,12,-145,-338,12,-334,-336,12,-333,12,-221,12,12,-332,-128,12,12,-331,-151,12,-533,12,-559,-516,12,-466,12,12,12,12,12,-288,-285,-289,-296,12,12,12,-251,12,12,-337,-624,12,12,12,12,12,12,-536,-534,12,-263,12,12,12,-185,-231,12,12,-308,-261,-306,-297,12,-128,-307,-234,-282,-225,-216,12,-217,-624,-326,-327,-320,-226,12,-227,-624,-535,-310,-309,12,-271,12,-264,12,12,12,12,12,12,12,-222,-218,-319,-223,-624,-224,-624,-323,12,-266,-272,12,-274,12,-265,-312,-314,-232,-311,-313,-291,-276,-624,-322,-324,-273,-267,-318,-316,12,12,12,-317,-315,12,-321,-236,12,12,12,]),'ENUM':([3,4,63,64,69,70,74,76,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,113,115,116,121,125,128,129,130,134,136,138,141,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,365,366,368,371,372,378,379,401,513,517,523,524,525,526,528,530,532,533,534,536,537,538,539,540,542,543,544,545,546,547,549,574,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,607,608,625,628,629,632,633,655,656,658,659,663,756,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,828,829,890,893,918,924,931,934,946,947,948,951,961,963,964,994,1004,1008,1019,1020,1021,1022,1023,1028,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[-624,-624,-342,-341,-450,-624,-359,-352,-624,-449,-360,-361,-262,-448,-447,-624,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,-351,326,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-352,-194,-196,-351,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,-624,-185,-198,-206,-362,-187,-202,-192,-343,-529,-624,-624,-351,-605,-624,-553,-624,-508,-620,-451,-624,-609,-588,-354,-624,-452,-249,-286,-167,-352,-624,-205,-277,-175,-279,-344,-624,-624,-624,-566,-352,-562,-565,-567,-351,326,-528,-526,-525,-352,-523,-521,-522,-624,-519,-351,326,-527,-524,-615,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,326,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,-563,-564,-484,-624,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,-289,-296,-536,-534,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-482,-618,-310,-309,-624,-271,-264,-266,-272,-624,-274,-624,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'OR':([6,7,8,9,13,14,15,16,17,19,23,25,26,27,29,32,33,35,36,37,38,39,41,43,45,46,48,49,53,54,56,57,58,59,61,63,64,65,67,126,156,166,181,193,195,204,205,206,219,221,223,229,231,244,245,246,247,248,251,253,255,256,257,258,259,260,261,262,263,265,267,270,271,272,274,282,342,353,360,375,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,410,411,412,416,418,421,423,424,425,426,427,428,431,437,438,439,453,470,472,490,491,492,498,500,501,502,503,504,552,556,558,561,566,612,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,716,717,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,742,743,744,745,748,749,802,812,847,851,853,855,858,859,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1146,1148,1150,1152,],[-128,-35,-58,202,-345,-107,-25,-119,-138,-139,-144,-122,-63,-129,-346,-77,-127,-40,-108,-96,-140,-348,-343,-142,-347,-350,-45,-137,-136,-30,-130,-143,-111,-50,-349,-342,-341,-141,-88,-381,-378,-379,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,461,-91,-32,-112,-27,-126,-132,-53,-68,-131,-37,-113,-100,-81,488,-42,-123,-133,-116,-47,-120,-389,461,-383,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,-26,461,-31,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-125,-114,-146,-115,-124,-36,-152,-59,-97,-99,-98,461,-132,-131,-341,-133,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-128,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,-29,-34,-39,-76,-83,-101,-105,-103,-38,-33,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,-28,-48,-56,-54,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-428,-427,-409,-321,]),'TIMES_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,208,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,208,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),'INTERFACE':([3,4,63,64,69,70,74,76,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,103,104,105,107,108,109,110,111,112,113,115,116,121,125,128,129,130,134,136,138,141,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,288,289,290,291,296,297,298,299,300,301,307,308,316,321,322,327,328,332,355,365,366,368,371,372,378,379,401,513,517,523,524,525,526,528,530,532,533,534,536,537,538,539,540,542,543,544,545,546,547,549,574,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,607,608,625,628,629,632,633,655,656,658,659,663,756,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,828,829,890,893,918,924,931,934,946,947,948,951,961,963,964,994,1004,1008,1019,1020,1021,1022,1023,1028,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[-624,-624,-342,-341,-450,-624,-359,-352,-624,-449,-360,-361,-262,-448,-447,-624,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,315,-353,-613,-619,-363,-356,-362,-585,-351,325,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-352,-194,-196,-351,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,-624,-185,-198,-206,-362,-187,-202,-192,-343,-529,-624,-624,-351,-605,-624,-553,-624,-508,-620,-451,-624,-609,-588,580,-354,-624,-452,-249,-286,-167,-352,-624,-205,-277,-175,-279,-344,-624,-624,-624,-566,-352,-562,-565,-567,-351,325,-528,-526,-525,-352,-523,-521,-522,-624,-519,-351,325,-527,-524,-615,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,325,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,-563,-564,-484,-624,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,-289,-296,-536,-534,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-482,-618,-310,-309,-624,-271,-264,-266,-272,-624,-274,-624,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'BREAK':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[177,177,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,177,-199,-200,177,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,177,177,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,177,-559,-516,-466,177,-288,-285,-289,-296,-251,177,-536,-534,-263,177,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,177,-271,-264,177,177,-266,-272,177,-274,177,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,177,177,-317,-315,177,-236,177,177,]),'BOOLEAN':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[60,60,60,60,60,60,60,60,60,60,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,60,-174,60,60,-195,-190,-186,-201,-193,-170,-204,60,-352,-194,60,-196,60,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,60,60,-199,-200,60,-185,-198,-206,-362,-187,-202,60,-192,60,60,60,60,60,60,60,60,60,60,-9,-13,-17,-15,60,-19,-12,-8,-11,-16,-18,-14,-10,-343,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-529,-624,-553,-624,-508,-451,60,-588,-354,-624,-452,-249,60,60,60,-286,60,60,60,-167,60,60,60,-205,-277,60,60,60,-175,-279,-344,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,60,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,60,-527,-524,60,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,60,60,60,-283,-281,60,60,-260,60,-284,-290,-287,-624,60,60,-164,-168,-228,-278,-280,60,60,60,60,-400,60,60,60,60,60,60,60,60,60,60,60,60,-533,60,-352,-563,-564,-484,60,-559,60,-516,-520,60,-503,60,-595,-587,60,-441,-470,-483,-466,60,-502,60,60,60,60,60,-288,-285,-624,-289,-296,60,-303,60,60,60,-251,60,-405,-402,-404,-401,60,60,60,60,60,60,60,60,-536,-534,-624,-487,60,-440,-442,-263,60,60,60,-185,-231,60,60,-308,-261,-306,60,-297,60,-307,-234,-282,60,60,-422,-421,60,60,-406,60,60,-535,-500,-486,-570,-482,-506,-443,60,-444,-310,-309,60,-271,60,-264,60,60,60,60,60,60,60,-403,-424,-423,-407,-411,-408,-410,60,60,-569,-505,-446,-445,-266,-272,60,-274,60,-265,-312,-314,-232,-311,-313,-291,60,-276,-426,60,-425,60,60,-412,-273,-267,-318,-316,60,60,60,-317,-315,60,-428,-427,-409,-236,60,60,60,]),'FOR':([4,118,121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,168,170,171,172,173,179,182,187,188,190,286,297,299,328,332,355,365,368,370,371,372,378,379,607,608,625,628,629,632,633,655,656,658,659,663,756,772,773,778,802,813,824,825,828,829,844,845,890,893,924,929,931,934,946,947,948,951,961,963,964,994,1020,1021,1022,1023,1028,1034,1038,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1139,1140,1142,1143,1145,1157,1158,1162,],[149,149,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,149,-199,-200,149,-185,-198,-206,-187,-202,-192,-529,-553,-508,-452,-249,-286,-167,149,149,-205,-277,-175,-279,-283,-281,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,149,-559,-516,-466,940,-288,-285,-289,-296,-251,149,-536,-534,-263,940,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-310,-309,149,-271,-264,940,149,-266,-272,149,-274,149,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,940,940,-317,-315,149,-236,940,940,]),'~':([2,11,12,20,22,50,51,62,122,123,140,144,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,363,369,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,788,808,811,814,817,836,843,864,875,877,879,882,884,886,887,909,926,927,943,944,954,975,983,1024,1035,1036,1048,1074,1080,1141,],[62,62,62,62,62,62,273,62,62,62,62,273,62,62,62,62,62,62,62,62,273,62,-9,-13,-17,-15,62,-19,-12,-8,-11,-16,-18,-14,-10,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,273,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,273,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,273,62,62,62,62,62,62,62,62,62,62,62,62,62,62,273,62,62,62,62,62,62,62,62,62,62,62,62,273,62,]),'|':([5,6,7,8,13,14,16,17,18,19,23,24,25,26,27,29,30,32,33,34,35,36,37,38,39,40,41,43,45,46,47,48,49,53,54,56,57,58,59,60,61,63,64,65,66,67,126,156,166,169,181,193,195,204,205,206,219,221,223,229,231,244,245,246,247,248,251,255,256,257,258,259,260,261,262,263,267,270,271,272,274,282,342,353,360,361,375,382,385,386,393,394,397,398,399,400,401,402,404,405,406,407,408,411,412,416,418,421,423,424,425,426,427,428,431,437,438,439,453,470,472,490,491,492,498,500,501,502,503,504,552,556,558,561,566,612,651,652,661,665,668,672,673,674,678,680,683,684,686,692,696,697,699,702,703,704,705,707,708,709,710,711,712,713,714,715,716,717,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,743,744,745,748,749,802,812,847,851,853,855,858,859,862,866,873,881,885,967,968,971,972,974,976,977,978,979,980,981,986,987,992,1045,1046,1053,1055,1057,1060,1061,1063,1064,1066,1067,1069,1070,1072,1073,1075,1076,1123,1125,1128,1129,1130,1131,1132,1144,1146,1148,1150,1152,],[-376,-128,-35,-58,-345,-107,-119,-138,-370,-139,-144,-372,-122,-63,-129,-346,-374,-77,-127,-373,-40,-108,-96,-140,-348,-375,-343,-142,-347,-350,-377,-45,-137,-136,277,-130,-143,-111,-50,-369,-349,-342,-341,-141,-371,-88,-381,-378,-379,-368,-380,-155,-156,-119,-118,-117,-135,-134,-121,-343,-109,-110,-60,463,-91,469,-112,-126,-132,-53,-68,-131,-37,-113,-100,-81,-42,-123,-133,-116,-47,-120,-389,463,-383,-367,-385,-399,-392,-398,-391,-158,-157,-149,-147,-343,-344,-148,-41,-66,-67,-64,-65,463,277,-335,-340,-339,-78,-79,-80,-90,-89,-328,-46,-329,-52,-51,-145,-125,-114,-146,-115,-124,-36,-152,-59,-97,-99,-98,463,-132,-131,-341,-133,-384,-388,-387,-386,-418,-417,-400,-330,-150,-145,-338,-334,-336,-333,-221,-332,-74,-61,-55,-72,-128,-70,-57,-49,-106,-102,-93,-162,-95,-104,-85,-44,-87,277,-39,-76,-83,-101,-105,-103,-38,277,-62,-73,-75,-84,-86,-82,-71,-69,-43,-92,-94,-48,-56,-54,-331,-151,-466,-390,-393,-419,-420,-405,-402,-404,-401,-337,-624,-163,-159,-422,-421,-406,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-294,1116,-403,-424,-423,-407,-411,-408,-410,-222,-218,-319,-223,-624,-224,-624,-323,-426,-425,-412,-624,-322,-161,-324,-295,-428,-427,-409,-321,]),'<':([4,6,8,13,14,16,17,19,21,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,69,74,79,80,82,84,85,87,88,89,90,91,93,94,97,102,104,108,109,110,111,116,117,118,121,124,125,128,129,130,134,135,136,138,141,142,145,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,181,182,187,188,190,194,204,205,206,219,221,223,224,229,231,237,240,244,246,247,251,255,256,258,259,261,262,263,270,271,272,275,282,286,296,297,298,299,301,316,322,327,328,332,341,345,347,353,355,360,365,368,370,371,372,378,379,381,389,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,430,437,453,454,470,472,490,491,492,500,502,503,504,513,523,524,525,526,528,530,532,533,534,536,537,538,539,540,542,543,544,545,546,547,549,552,556,558,561,566,578,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,607,608,612,625,628,629,632,633,642,648,655,656,658,659,663,673,674,678,679,680,683,684,686,692,696,704,709,710,711,712,713,714,715,717,723,724,725,726,732,733,734,738,739,748,749,756,769,770,771,772,773,774,778,779,782,789,790,798,800,801,802,804,813,824,825,828,829,837,840,844,845,854,860,866,873,881,885,890,893,901,924,929,931,934,946,947,948,951,961,963,964,972,974,976,977,978,979,980,981,986,987,992,994,1004,1008,1020,1021,1022,1023,1028,1034,1038,1050,1066,1067,1069,1070,1072,1073,1075,1076,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1129,1130,1131,1132,1135,1136,1137,1138,1139,1140,1142,1143,1145,1152,1157,1158,1162,],[189,-128,200,-345,-107,-119,-138,-139,189,-144,-122,-63,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,-88,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,311,-586,-353,-363,-356,-362,-585,-364,311,189,-174,-383,-195,-190,-186,-201,-193,-343,-170,-204,-352,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,189,189,-199,-200,189,-185,-198,376,-206,-187,-202,-192,189,-119,-118,-117,-135,-134,-121,-383,-343,-109,189,189,-110,447,-91,-112,-126,-132,480,-131,-113,-100,-81,-123,-133,-116,189,-120,-529,-624,-553,-624,-508,-451,-588,-354,-624,-452,-249,189,189,189,626,-286,-383,-167,189,189,-205,-277,-175,-279,-383,671,-149,-147,-343,-344,-148,-66,-67,-64,-65,447,-335,-340,-339,-78,-79,-80,-90,-89,-328,189,-329,-145,189,-125,-114,-146,-115,-124,-152,-97,-99,-98,-624,-624,-566,-352,-562,-565,-567,-351,311,-528,-526,-525,-352,-523,-521,-522,-624,-519,-351,311,-527,-524,626,-132,-131,-341,-133,311,-456,-512,311,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,311,-283,-281,-384,-260,-284,-290,-287,-624,-343,-383,-164,-168,-228,-278,-280,-330,-150,-145,-384,-338,-334,-336,-333,-221,-332,-383,-106,-102,-93,-162,-95,-104,-85,-87,-83,-101,-105,-103,-84,-86,-82,-92,-94,-331,-151,-533,-563,-564,-484,189,-559,-343,-516,-520,-503,-595,-587,311,-470,-483,-466,-502,189,-288,-285,-289,-296,189,189,-251,189,-384,970,-337,-624,-163,-159,-536,-534,-343,-263,189,-185,-231,-308,-261,-306,-297,-307,-234,-282,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-535,-500,-482,-310,-309,189,-271,-264,189,189,189,-222,-218,-319,-223,-624,-224,-624,-323,-266,-272,189,-274,189,-265,-312,-314,-232,-311,-313,-291,-276,-624,-322,-161,-324,-273,-267,-318,-316,189,189,-317,-315,189,-321,-236,189,189,]),'PROTECTED':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[109,109,-342,-341,-450,109,-359,109,-449,-360,-361,-262,-448,-447,109,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,109,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,109,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,109,-185,-198,-206,-362,-187,-202,-192,-343,-529,109,109,109,109,-605,109,-553,109,-508,-620,-451,109,-609,-588,-354,109,-452,-249,-286,109,109,-167,109,-205,-277,-175,-279,-344,109,109,109,109,109,109,-566,-562,-565,-567,109,-528,109,-526,-525,-523,-521,-522,109,-519,109,-527,-524,-615,-475,-480,109,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,109,109,-164,-168,-228,-278,-280,-533,109,-563,-564,-484,109,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,109,-289,-296,109,-303,-536,-534,109,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,109,-271,-264,109,-569,-505,-266,-272,109,-274,109,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'CATCH':([354,355,628,632,633,655,824,828,1114,],[631,-286,631,-287,631,-164,-288,631,-291,]),'BYTE':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[66,66,66,66,66,66,66,66,66,66,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,66,-174,66,66,-195,-190,-186,-201,-193,-170,-204,66,-352,-194,66,-196,66,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,66,66,-199,-200,66,-185,-198,-206,-362,-187,-202,66,-192,66,66,66,66,66,66,66,66,66,66,-9,-13,-17,-15,66,-19,-12,-8,-11,-16,-18,-14,-10,-343,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-529,-624,-553,-624,-508,-451,66,-588,-354,-624,-452,-249,66,66,66,-286,66,66,66,-167,66,66,66,-205,-277,66,66,66,-175,-279,-344,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,66,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,66,-527,-524,66,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,66,66,66,-283,-281,66,66,-260,66,-284,-290,-287,-624,66,66,-164,-168,-228,-278,-280,66,66,66,66,-400,66,66,66,66,66,66,66,66,66,66,66,66,-533,66,-352,-563,-564,-484,66,-559,66,-516,-520,66,-503,66,-595,-587,66,-441,-470,-483,-466,66,-502,66,66,66,66,66,-288,-285,-624,-289,-296,66,-303,66,66,66,-251,66,-405,-402,-404,-401,66,66,66,66,66,66,66,66,-536,-534,-624,-487,66,-440,-442,-263,66,66,66,-185,-231,66,66,-308,-261,-306,66,-297,66,-307,-234,-282,66,66,-422,-421,66,66,-406,66,66,-535,-500,-486,-570,-482,-506,-443,66,-444,-310,-309,66,-271,66,-264,66,66,66,66,66,66,66,-403,-424,-423,-407,-411,-408,-410,66,66,-569,-505,-446,-445,-266,-272,66,-274,66,-265,-312,-314,-232,-311,-313,-291,66,-276,-426,66,-425,66,66,-412,-273,-267,-318,-316,66,66,66,-317,-315,66,-428,-427,-409,-236,66,66,66,]),'THROWS':([193,195,394,397,486,620,898,905,998,1009,],[-155,-156,-158,-157,-154,-153,1000,-624,-507,1000,]),'VOID':([2,4,11,12,20,21,22,50,51,62,63,64,69,74,79,80,82,84,85,87,88,89,90,91,93,94,102,104,108,109,110,111,116,118,121,122,123,125,128,129,130,134,136,138,140,141,142,144,145,150,151,152,153,155,157,158,159,162,163,164,165,168,170,171,172,173,179,182,183,187,188,189,190,191,196,197,198,199,200,201,202,203,207,208,209,210,211,212,213,214,215,216,217,218,220,222,229,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,286,296,297,298,299,301,309,316,322,327,328,332,335,344,346,355,357,358,363,365,368,369,370,371,372,374,376,377,378,379,401,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,512,513,521,522,523,524,525,526,528,530,532,533,534,535,536,537,538,539,540,542,543,544,545,546,547,549,557,570,573,585,586,587,588,589,590,591,592,593,594,595,596,597,598,600,601,602,604,605,607,608,623,624,625,626,628,629,632,633,637,649,655,656,658,659,663,664,667,669,671,672,675,677,678,682,685,688,693,695,698,740,747,754,756,763,766,769,770,771,772,773,775,778,779,780,782,788,789,790,792,793,800,801,802,803,804,808,811,813,814,817,824,825,827,828,829,831,832,836,839,843,844,845,855,858,859,862,864,875,877,879,882,884,886,887,890,893,897,900,909,914,917,924,926,927,929,931,934,943,944,946,947,948,950,951,954,961,963,964,965,966,967,968,969,970,971,975,983,994,1004,1005,1007,1008,1011,1015,1016,1018,1020,1021,1022,1023,1024,1028,1034,1035,1036,1037,1038,1048,1049,1053,1055,1057,1060,1061,1063,1064,1074,1080,1085,1087,1088,1091,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1116,1122,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1141,1142,1143,1145,1146,1148,1150,1157,1158,1159,1162,],[18,18,18,18,18,18,18,18,18,18,-342,-341,-450,-359,-449,-360,-361,-448,-447,-365,-358,-594,-357,-355,-584,-366,-586,-353,-363,-356,-362,-585,-364,18,-174,18,18,-195,-190,-186,-201,-193,-170,-204,18,-352,-194,18,-196,18,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,18,18,-199,-200,18,-185,-198,-206,-362,-187,-202,18,-192,18,18,18,18,18,18,18,18,18,18,-9,-13,-17,-15,18,-19,-12,-8,-11,-16,-18,-14,-10,-343,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-529,-624,-553,-624,-508,-451,18,-588,-354,-624,-452,-249,18,18,18,-286,18,18,18,-167,18,18,18,-205,-277,18,18,18,-175,-279,-344,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-351,-624,-624,-624,-624,-566,-352,-562,-565,-567,-351,18,-528,-624,-526,-525,-352,-523,-521,-522,-624,-519,-351,18,-527,-524,18,-439,-430,-475,-480,-624,-473,-477,-479,-352,-478,-476,-481,-358,-472,-469,-501,-471,-474,18,18,18,-283,-281,18,18,-260,18,-284,-290,-287,-624,18,18,-164,-168,-228,-278,-280,18,18,18,18,-400,18,18,18,18,18,18,18,18,18,18,18,18,-533,18,-352,-563,-564,-484,18,-559,18,-516,-520,18,-503,18,-595,-587,18,-441,-470,-483,-466,18,-502,18,18,18,18,18,-288,-285,-624,-289,-296,18,-303,18,18,18,-251,18,-405,-402,-404,-401,18,18,18,18,18,18,18,18,-536,-534,-624,-487,18,-440,-442,-263,18,18,18,-185,-231,18,18,-308,-261,-306,18,-297,18,-307,-234,-282,18,18,-422,-421,18,18,-406,18,18,-535,-500,-486,-570,-482,-506,-443,18,-444,-310,-309,18,-271,18,-264,18,18,18,18,18,18,18,-403,-424,-423,-407,-411,-408,-410,18,18,-569,-505,-446,-445,-266,-272,18,-274,18,-265,-312,-314,-232,-311,-313,-291,18,-276,-426,18,-425,18,18,-412,-273,-267,-318,-316,18,18,18,-317,-315,18,-428,-427,-409,-236,18,18,18,]),'LSHIFT':([6,13,14,16,17,19,23,25,26,27,29,32,33,36,37,38,39,41,43,45,46,49,53,56,57,58,61,63,64,65,67,204,205,206,219,221,223,231,244,246,247,251,255,256,258,259,261,262,263,270,271,272,282,353,398,399,400,401,402,405,406,407,408,411,416,418,421,423,424,425,426,427,428,437,453,470,472,490,491,492,500,502,503,504,552,556,558,561,566,673,674,678,680,683,684,686,692,696,697,703,704,705,709,710,711,712,713,714,715,717,722,723,724,725,726,730,731,732,733,734,735,736,738,739,748,749,802,866,873,881,885,972,974,976,977,978,979,980,981,986,987,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1131,1132,1152,],[-128,-345,-107,-119,-138,-139,-144,-122,232,-129,-346,-77,-127,-108,-96,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-111,-349,-342,-341,-141,-88,-119,-118,-117,-135,-134,-121,-109,-110,465,-91,-112,-126,-132,478,-131,-113,-100,-81,-123,-133,-116,-120,465,-149,-147,-343,-344,-148,232,232,232,232,465,-335,-340,-339,-78,-79,-80,-90,-89,-328,-329,-145,-125,-114,-146,-115,-124,-152,-97,-99,-98,465,-132,-131,-341,-133,-330,-150,-145,-338,-334,-336,-333,-221,-332,232,232,-128,232,-106,-102,-93,-162,-95,-104,-85,-87,232,-83,-101,-105,-103,232,232,-84,-86,-82,232,232,-92,-94,-331,-151,-466,-337,-624,-163,-159,-225,-216,-217,-624,-326,-327,-320,-226,-227,-160,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-161,-324,-321,]),'VOLATILE':([3,4,63,64,69,70,74,77,79,80,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,100,102,104,105,107,108,109,110,111,112,115,116,121,125,128,129,130,134,136,138,142,145,150,151,152,153,155,157,158,159,162,163,164,170,171,172,173,179,182,183,187,188,190,229,286,287,288,289,290,291,296,297,298,299,300,301,307,308,316,322,327,328,332,355,357,358,365,368,371,372,378,379,401,512,513,517,521,522,523,524,526,528,530,532,534,535,536,537,539,540,542,543,544,545,547,549,574,585,586,587,588,589,590,592,593,594,595,596,597,598,600,601,607,608,625,628,629,632,633,637,649,655,656,658,659,663,756,760,769,770,771,772,773,778,779,782,789,790,795,800,801,802,804,824,825,827,828,829,831,832,890,893,897,900,918,924,931,934,946,947,948,951,961,963,964,994,1004,1005,1007,1008,1011,1019,1020,1021,1022,1023,1028,1037,1085,1087,1092,1093,1094,1097,1098,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[116,116,-342,-341,-450,116,-359,116,-449,-360,-361,-262,-448,-447,116,-365,-358,-594,-357,-355,-614,-584,-366,-610,-611,-608,-586,-353,-613,-619,-363,-356,-362,-585,116,-612,-364,-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,116,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,116,-185,-198,-206,-362,-187,-202,-192,-343,-529,116,116,116,116,-605,116,-553,116,-508,-620,-451,116,-609,-588,-354,116,-452,-249,-286,116,116,-167,116,-205,-277,-175,-279,-344,116,116,116,116,116,116,-566,-562,-565,-567,116,-528,116,-526,-525,-523,-521,-522,116,-519,116,-527,-524,-615,-475,-480,116,-473,-477,-479,-478,-476,-481,-358,-472,-469,-501,-471,-474,-283,-281,-260,-284,-290,-287,-624,116,116,-164,-168,-228,-278,-280,-533,116,-563,-564,-484,116,-559,-516,-520,-503,-595,-587,-617,-470,-483,-466,-502,-288,-285,116,-289,-296,116,-303,-536,-534,116,-487,-616,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,-500,-486,-570,-482,-506,-618,-310,-309,116,-271,-264,116,-569,-505,-266,-272,116,-274,116,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'DEFAULT':([121,125,128,129,130,134,136,138,142,145,151,152,153,155,157,158,159,162,163,164,170,171,173,179,182,187,188,190,193,195,286,297,299,328,332,355,365,371,372,378,379,394,397,486,607,608,620,625,628,629,632,633,655,656,658,659,663,756,773,778,802,824,825,828,829,890,893,896,923,924,931,934,946,947,948,951,961,963,964,994,997,998,1020,1021,1022,1023,1026,1027,1028,1092,1093,1094,1097,1098,1099,1100,1101,1104,1109,1110,1113,1114,1122,1135,1136,1137,1138,1142,1143,1157,],[-174,-195,-190,-186,-201,-193,-170,-204,-194,-196,-262,-172,-171,-173,-191,-188,-169,-203,-189,-197,-199,-200,-185,-198,-206,-187,-202,-192,-155,-156,-529,-553,-508,-452,-249,-286,-167,-205,-277,-175,-279,-158,-157,-154,-283,-281,-153,-260,-284,-290,-287,-624,-164,-168,-228,-278,-280,-533,-559,-516,-466,-288,-285,-289,-296,-536,-534,-624,1025,-263,-185,-231,-308,-261,-306,-297,-307,-234,-282,-535,1080,-507,-310,-309,1025,-271,1025,-268,-264,-266,-272,-270,-274,1025,-269,-265,-312,-314,-232,-311,-313,-291,-276,-273,-267,-318,-316,-317,-315,-236,]),'DIVIDE_ASSIGN':([6,13,16,17,19,23,27,29,33,38,39,41,43,45,46,49,53,56,57,61,63,64,65,124,127,133,135,147,148,161,167,184,219,221,246,256,259,271,330,353,398,399,400,401,402,411,416,418,421,428,437,453,490,500,609,611,614,619,627,640,642,648,673,674,680,683,684,686,692,696,748,749,802,866,873,958,972,974,976,977,978,979,980,981,986,992,1066,1067,1069,1070,1072,1073,1075,1076,1129,1130,1132,1152,],[-128,-345,222,-138,-139,-144,-129,-346,-127,-140,-348,-343,-142,-347,-350,-137,-136,-130,-143,-349,-342,-341,-141,-128,-141,-127,-343,-130,-143,222,-140,-129,-135,-134,-128,-129,-127,-130,-128,-128,-149,-147,-343,-344,-148,-128,-335,-340,-339,-328,-329,-145,-146,-152,-148,-147,-328,-329,-145,-127,-343,-128,-330,-150,-338,-334,-336,-333,-221,-332,-331,-151,-466,-337,-624,-128,-225,-216,-217,-624,-326,-327,-320,-226,-227,-624,-222,-218,-319,-223,-624,-224,-624,-323,-624,-322,-324,-321,]),}
+_lr_action_items = {'PLUSPLUS':([0,3,4,55,60,62,63,64,65,67,68,69,70,71,72,74,75,76,77,78,79,80,84,86,87,88,89,90,91,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,164,166,168,176,177,178,179,180,183,184,188,206,208,210,212,235,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,267,274,275,276,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,340,341,342,343,345,348,350,351,353,355,357,362,366,368,369,370,486,489,490,491,492,493,494,495,501,502,503,504,505,507,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,541,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,570,573,574,575,576,577,579,605,611,613,614,618,625,626,628,629,630,631,634,635,636,638,639,641,642,644,652,653,654,658,659,660,677,681,693,696,706,708,723,728,729,733,735,736,737,738,739,753,767,789,791,792,793,794,796,797,798,801,802,803,809,810,811,814,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,905,907,909,915,917,920,922,924,933,934,939,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1002,1004,1009,1011,1012,1013,1014,1015,1016,1017,1018,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1075,1082,1083,1084,1086,1087,1089,1090,1091,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1131,1132,1134,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1153,1157,1158,1159,1162,],[2,72,72,72,240,-127,-128,-129,-130,-136,-137,-138,-341,-342,72,-139,-140,-141,-142,-143,-144,72,-343,-345,-346,-347,-348,-349,-350,72,72,72,72,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,72,72,72,-206,72,72,-343,72,72,-129,-130,-143,-141,-140,-127,-128,240,-452,-508,-529,-553,72,240,72,72,-134,-135,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,72,72,72,72,72,72,72,-128,-127,-129,-130,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-175,72,72,-128,72,72,-249,-128,72,-167,-205,72,-277,-279,72,-286,72,72,72,-128,-341,72,-127,-129,-130,240,-128,-328,-147,-148,-149,-344,-343,-145,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-146,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-329,-152,-339,-335,72,-340,72,72,-228,-145,72,-343,-128,-127,-164,-168,-260,72,-278,-280,-281,-283,-284,-287,-290,-624,-329,72,72,-328,-148,-147,-466,72,-516,-533,72,-559,72,-145,72,72,72,-150,-330,-331,-332,-128,72,72,-151,-333,-336,72,-338,-334,72,-221,72,72,72,72,72,72,72,-288,-285,-296,-289,-251,72,72,72,72,-534,-536,72,72,72,72,72,72,72,-337,-624,72,-231,-185,72,-234,-128,-261,-263,-282,-306,-297,72,-307,-308,72,72,72,72,-535,72,-226,-225,-227,-216,-217,72,-624,-320,-326,-327,-624,72,72,72,72,72,72,-264,72,-271,72,72,-309,-310,72,-624,-223,-222,-224,-218,-319,-323,-624,-232,-265,72,-266,-272,72,-274,-276,-291,-311,-313,-312,-314,-624,-322,-324,72,72,72,72,-267,-273,-315,-317,-316,-318,-321,-236,72,72,72,]),'MINUSMINUS':([0,3,4,55,60,62,63,64,65,67,68,69,70,71,72,74,75,76,77,78,79,80,84,86,87,88,89,90,91,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,164,166,168,176,177,178,179,180,183,184,188,206,208,210,212,235,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,267,274,275,276,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,340,341,342,343,345,348,350,351,353,355,357,362,366,368,369,370,486,489,490,491,492,493,494,495,501,502,503,504,505,507,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,541,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,570,573,574,575,576,577,579,605,611,613,614,618,625,626,628,629,630,631,634,635,636,638,639,641,642,644,652,653,654,658,659,660,677,681,693,696,706,708,723,728,729,733,735,736,737,738,739,753,767,789,791,792,793,794,796,797,798,801,802,803,809,810,811,814,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,905,907,909,915,917,920,922,924,933,934,939,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1002,1004,1009,1011,1012,1013,1014,1015,1016,1017,1018,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1075,1082,1083,1084,1086,1087,1089,1090,1091,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1131,1132,1134,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1153,1157,1158,1159,1162,],[3,55,55,55,241,-127,-128,-129,-130,-136,-137,-138,-341,-342,55,-139,-140,-141,-142,-143,-144,55,-343,-345,-346,-347,-348,-349,-350,55,55,55,55,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,55,55,55,-206,55,55,-343,55,55,-129,-130,-143,-141,-140,-127,-128,241,-452,-508,-529,-553,55,241,55,55,-134,-135,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,55,55,55,55,55,55,55,-128,-127,-129,-130,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-175,55,55,-128,55,55,-249,-128,55,-167,-205,55,-277,-279,55,-286,55,55,55,-128,-341,55,-127,-129,-130,241,-128,-328,-147,-148,-149,-344,-343,-145,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-146,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-329,-152,-339,-335,55,-340,55,55,-228,-145,55,-343,-128,-127,-164,-168,-260,55,-278,-280,-281,-283,-284,-287,-290,-624,-329,55,55,-328,-148,-147,-466,55,-516,-533,55,-559,55,-145,55,55,55,-150,-330,-331,-332,-128,55,55,-151,-333,-336,55,-338,-334,55,-221,55,55,55,55,55,55,55,-288,-285,-296,-289,-251,55,55,55,55,-534,-536,55,55,55,55,55,55,55,-337,-624,55,-231,-185,55,-234,-128,-261,-263,-282,-306,-297,55,-307,-308,55,55,55,55,-535,55,-226,-225,-227,-216,-217,55,-624,-320,-326,-327,-624,55,55,55,55,55,55,-264,55,-271,55,55,-309,-310,55,-624,-223,-222,-224,-218,-319,-323,-624,-232,-265,55,-266,-272,55,-274,-276,-291,-311,-313,-312,-314,-624,-322,-324,55,55,55,55,-267,-273,-315,-317,-316,-318,-321,-236,55,55,55,]),'*':([0,60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,108,111,112,113,114,117,236,237,240,241,265,267,274,275,276,286,289,290,291,292,293,296,326,327,328,329,340,399,486,489,491,492,493,495,501,502,503,504,505,507,516,541,566,567,568,569,570,573,574,575,577,599,600,601,602,603,676,677,728,736,737,738,739,740,753,762,763,764,765,766,784,785,786,787,788,791,792,793,796,797,801,904,906,915,917,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1133,1134,1153,],[4,-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,323,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,538,-131,-132,-133,563,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,538,674,538,-341,-131,-132,-133,538,-328,-147,-148,-149,-344,-343,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,323,323,-97,-98,-99,865,-466,-145,-150,-330,-331,-332,-162,-128,323,323,-102,-104,-106,323,323,-101,-103,-105,-151,-333,-336,-338,-334,-221,-163,-159,-337,-624,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-161,-324,-321,]),'$end':([1,2,5,6,7,8,9,11,12,13,16,17,18,19,20,21,22,23,24,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,118,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,159,171,172,186,187,191,192,194,195,196,197,198,203,206,208,210,212,236,237,240,241,260,261,265,326,327,328,329,330,337,343,351,355,357,366,377,379,381,382,384,385,394,398,496,498,501,502,503,504,505,507,510,511,512,515,516,541,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,611,628,630,634,635,636,638,639,641,642,644,662,663,665,667,668,675,677,693,696,708,728,736,737,738,739,740,791,792,793,796,797,801,821,822,825,826,846,847,851,852,854,855,858,860,864,876,879,895,904,906,915,917,922,924,934,940,941,944,945,948,953,954,967,968,969,972,987,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1029,1043,1044,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1093,1101,1104,1110,1111,1115,1116,1119,1120,1124,1125,1126,1131,1132,1133,1134,1139,1142,1143,1144,1145,1146,1148,1150,1153,1157,],[0,-624,-621,-597,-601,-602,-604,-262,-608,-619,-610,-611,-612,-613,-614,-447,-448,-449,-450,-622,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-623,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-206,-378,-379,-380,-381,-598,-600,-603,-609,-620,-451,-605,-343,-452,-508,-529,-553,-118,-119,-134,-135,-155,-156,-117,-109,-110,-120,-121,-175,-383,-249,-205,-277,-279,-286,-385,-389,-391,-392,-398,-399,-599,-615,-7,-26,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,-146,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-228,-164,-260,-278,-280,-281,-283,-284,-287,-290,-624,-386,-384,-400,-417,-418,-617,-466,-516,-533,-559,-145,-150,-330,-331,-332,-162,-151,-333,-336,-338,-334,-221,-288,-285,-296,-289,-390,-393,-401,-402,-404,-405,-419,-420,-616,-534,-536,-21,-163,-159,-337,-624,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-406,-421,-422,-618,-535,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-264,-309,-310,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-232,-265,-266,-276,-291,-311,-313,-312,-314,-412,-425,-426,-624,-322,-161,-324,-267,-315,-317,-316,-318,-409,-427,-428,-321,-236,]),'ENUM':([2,4,6,7,8,9,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,52,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,185,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,212,213,234,330,343,348,349,350,351,355,357,366,394,398,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,422,425,426,427,428,429,430,431,432,433,434,435,437,438,445,452,453,454,456,457,458,460,505,611,628,629,630,634,635,636,638,639,641,642,644,675,677,678,679,680,681,685,686,693,694,696,708,709,710,720,721,821,822,825,826,864,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,987,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[-624,-624,-624,-624,-624,-352,-262,-608,-619,-351,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,230,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-351,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-624,-206,-362,-352,-624,-624,-351,-624,-609,-620,-451,-605,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,-175,-249,-624,-352,-167,-205,-277,-279,-286,-624,-615,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,230,-501,-351,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,230,-351,-624,-624,-352,-562,-565,-566,-567,230,-344,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-617,-466,-470,-483,-484,-624,-502,-503,-516,-520,-533,-559,-563,-564,-587,-595,-288,-285,-296,-289,-616,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-535,-264,-624,-271,-309,-310,-232,-265,-624,-266,-272,-624,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'CLASS':([2,4,6,7,8,9,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,52,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,185,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,212,213,234,257,299,330,343,348,349,350,351,355,357,366,375,394,398,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,422,425,426,427,428,429,430,431,432,433,434,435,437,438,445,452,453,454,456,457,458,460,505,508,518,572,611,628,629,630,634,635,636,638,639,641,642,644,675,677,678,679,680,681,685,686,693,694,696,708,709,710,720,721,815,821,822,825,826,864,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,987,1028,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[-624,-624,-624,-624,-624,-352,-262,-608,-619,-351,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,231,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-351,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-624,-206,-362,-352,-624,-624,-351,-624,-609,-620,-451,-605,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,504,573,-175,-249,-624,-352,-167,-205,-277,-279,-286,504,-624,-615,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,231,-501,-351,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,231,-351,-624,-624,-352,-562,-565,-566,-567,231,-344,736,504,791,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-617,-466,-470,-483,-484,-624,-502,-503,-516,-520,-533,-559,-563,-564,-587,-595,504,-288,-285,-296,-289,-616,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-535,504,-264,-624,-271,-309,-310,-232,-265,-624,-266,-272,-624,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'INTERFACE':([2,4,6,7,8,9,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,52,53,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,185,191,192,193,194,195,196,197,198,200,201,203,206,207,208,209,210,212,213,234,330,343,348,349,350,351,355,357,366,394,398,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,422,425,426,427,428,429,430,431,432,433,434,435,437,438,445,452,453,454,456,457,458,460,505,611,628,629,630,634,635,636,638,639,641,642,644,675,677,678,679,680,681,685,686,693,694,696,708,709,710,720,721,821,822,825,826,864,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,987,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[-624,-624,-624,-624,-624,-352,-262,-608,-619,-351,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,232,233,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-351,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-624,-206,-362,-352,-624,-624,-351,-624,-609,-620,-451,-605,-354,396,-343,-452,-624,-508,-624,-529,-553,-624,-588,-175,-249,-624,-352,-167,-205,-277,-279,-286,-624,-615,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,232,-501,-351,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,232,-351,-624,-624,-352,-562,-565,-566,-567,232,-344,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-617,-466,-470,-483,-484,-624,-502,-503,-516,-520,-533,-559,-563,-564,-587,-595,-288,-285,-296,-289,-616,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-535,-264,-624,-271,-309,-310,-232,-265,-624,-266,-272,-624,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'PACKAGE':([2,14,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,200,203,234,505,720,721,],[15,199,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-354,-343,-588,-344,-587,-595,]),';':([2,4,6,7,8,10,11,12,13,16,17,18,19,20,21,22,23,24,47,48,49,54,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,158,159,162,163,165,166,171,172,173,174,175,176,177,178,179,186,187,191,192,194,195,196,197,198,202,203,204,206,207,208,209,210,211,212,213,234,236,237,240,241,260,261,265,273,277,278,279,280,281,282,283,284,285,286,289,290,291,292,293,296,305,306,326,327,328,329,330,331,332,333,334,337,338,342,343,348,350,351,352,355,356,357,358,359,360,361,363,366,377,379,381,382,384,385,394,395,398,400,402,404,405,406,407,408,409,410,411,412,413,414,415,419,420,425,427,428,429,430,431,432,433,434,435,436,440,441,444,445,446,447,452,454,455,456,457,458,463,485,486,487,488,491,492,493,496,498,501,502,503,504,505,507,510,511,512,515,516,541,544,566,567,568,569,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,606,607,608,609,610,611,616,620,621,622,623,624,628,629,630,634,635,636,638,639,641,642,644,645,646,662,663,665,667,668,674,675,677,678,679,680,681,685,686,693,694,696,699,702,703,704,705,707,708,709,710,720,721,726,728,736,737,738,739,740,745,746,747,748,749,750,751,752,754,756,757,758,759,760,761,762,763,764,765,766,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,800,801,805,806,807,808,809,810,811,812,817,821,822,825,826,833,834,835,846,847,851,852,854,855,858,860,864,865,867,868,875,876,878,879,881,883,893,894,895,904,906,915,917,922,924,933,934,935,936,937,938,940,941,944,945,948,950,953,954,955,956,967,968,969,972,973,974,979,980,985,986,987,988,989,997,1002,1004,1005,1007,1008,1009,1011,1012,1014,1015,1016,1017,1018,1021,1022,1024,1027,1029,1031,1033,1036,1041,1043,1044,1045,1046,1049,1050,1053,1054,1056,1057,1060,1062,1064,1067,1068,1069,1071,1072,1073,1074,1082,1083,1084,1086,1087,1089,1090,1091,1093,1096,1101,1102,1104,1105,1106,1109,1110,1111,1114,1115,1116,1117,1118,1119,1120,1121,1122,1124,1125,1126,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1152,1153,1156,1157,1158,1162,],[11,126,11,11,197,198,-262,-608,-619,-610,-611,-612,-613,-614,-447,-448,-449,-450,-584,-585,-586,-594,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-169,-170,-171,-172,-173,-174,330,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,126,126,351,-206,126,355,357,-624,-378,-379,-207,-208,-209,-210,-211,-212,-213,-380,-381,11,197,197,-609,-620,-451,-605,-607,-343,398,-452,415,-508,434,-529,445,-553,197,-588,-118,-119,-134,-135,-155,-156,-117,-22,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-381,-383,-109,-110,-120,-121,-175,-176,-178,-180,-624,-383,126,-624,-249,126,-167,-205,630,-277,634,-279,635,636,-244,-245,638,-286,-385,-389,-391,-392,-398,-399,197,-606,-615,675,415,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-501,686,434,-519,-521,-522,-523,-524,-525,-526,-527,-528,686,445,445,-537,415,-540,-624,197,-562,710,-565,-566,-567,-382,-574,-575,-576,-577,-131,-132,-133,-7,-26,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,-146,-154,-114,-115,-124,-125,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-182,-153,-177,-387,-388,-228,811,-238,-239,-240,-241,-242,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,829,-301,-386,-384,-400,-417,-418,864,-617,-466,-470,-483,-484,126,-502,-503,-516,-520,-533,445,-539,-541,-543,-544,-542,-559,-563,-564,-587,-595,-581,-145,-150,-330,-331,-332,-162,-29,-34,-39,-44,-49,-55,-57,-61,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-384,-221,-179,-181,-183,-184,126,126,-624,-624,940,-288,-285,-296,-289,-251,953,954,-390,-393,-401,-402,-404,-405,-419,-420,-616,972,974,-624,-624,-534,-538,-536,-624,-624,-579,-580,-21,-163,-159,-337,-624,-231,-185,126,-234,1026,-182,-624,-243,-261,-263,-282,-306,-297,-302,-307,-308,1043,1044,-406,-421,-422,-618,-500,-482,-494,-495,-624,-507,-535,-545,-624,-578,-226,-225,-160,-24,-23,-227,-216,-217,-624,-320,-326,-327,-624,126,126,-624,-182,-264,126,-271,1110,-304,-309,-310,1115,1116,1119,1120,-407,-408,-410,-411,-403,-423,-424,-496,-497,-499,-504,-568,-571,-572,-624,-223,-222,-224,-218,-319,-323,-624,-232,1137,-265,126,-266,-272,126,-274,-276,-291,-305,-311,-313,1142,1143,-312,-314,1144,1145,-412,-425,-426,-573,-624,-322,-161,-324,126,126,-624,126,-267,-273,-315,-317,-316,-318,-409,-427,-428,-498,-321,1159,-236,126,126,]),'IMPORT':([2,6,7,11,12,16,17,18,19,20,191,195,198,398,675,864,972,],[26,26,26,-262,-608,-610,-611,-612,-613,-614,26,-609,-605,-615,-617,-616,-618,]),'PUBLIC':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[32,32,32,32,32,-262,-608,-619,32,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,32,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,32,-206,-362,32,32,32,32,-609,-620,-451,-605,-354,-343,-452,32,-508,32,-529,32,-553,32,-588,-175,32,-249,32,-167,-205,-277,-279,-286,32,32,-615,32,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,32,32,32,32,-519,-521,-522,-523,-524,-525,-526,-527,-528,32,32,32,32,-562,-565,-566,-567,32,-344,-228,32,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,32,-617,-466,-470,-483,-484,32,-502,-503,-516,-520,-533,32,-559,-563,-564,-587,-595,-288,-285,32,-296,-289,32,-303,-616,-487,32,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,32,-264,32,-271,-309,-310,-505,-569,-232,-265,32,-266,-272,32,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'PROTECTED':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[33,33,33,33,33,-262,-608,-619,33,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,33,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,33,-206,-362,33,33,33,33,-609,-620,-451,-605,-354,-343,-452,33,-508,33,-529,33,-553,33,-588,-175,33,-249,33,-167,-205,-277,-279,-286,33,33,-615,33,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,33,33,33,33,-519,-521,-522,-523,-524,-525,-526,-527,-528,33,33,33,33,-562,-565,-566,-567,33,-344,-228,33,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,33,-617,-466,-470,-483,-484,33,-502,-503,-516,-520,-533,33,-559,-563,-564,-587,-595,-288,-285,33,-296,-289,33,-303,-616,-487,33,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,33,-264,33,-271,-309,-310,-505,-569,-232,-265,33,-266,-272,33,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'PRIVATE':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[34,34,34,34,34,-262,-608,-619,34,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,34,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,34,-206,-362,34,34,34,34,-609,-620,-451,-605,-354,-343,-452,34,-508,34,-529,34,-553,34,-588,-175,34,-249,34,-167,-205,-277,-279,-286,34,34,-615,34,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,34,34,34,34,-519,-521,-522,-523,-524,-525,-526,-527,-528,34,34,34,34,-562,-565,-566,-567,34,-344,-228,34,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,34,-617,-466,-470,-483,-484,34,-502,-503,-516,-520,-533,34,-559,-563,-564,-587,-595,-288,-285,34,-296,-289,34,-303,-616,-487,34,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,34,-264,34,-271,-309,-310,-505,-569,-232,-265,34,-266,-272,34,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'STATIC':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,26,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[27,27,27,27,27,-262,-608,-619,27,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,205,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,27,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,27,-206,-362,27,27,27,27,-609,-620,-451,-605,-354,-343,-452,416,-508,27,-529,27,-553,27,-588,-175,27,-249,27,-167,-205,-277,-279,-286,27,27,-615,416,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,27,27,27,27,-519,-521,-522,-523,-524,-525,-526,-527,-528,27,416,27,27,-562,-565,-566,-567,27,-344,-228,27,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,27,-617,-466,-470,-483,-484,27,-502,-503,-516,-520,-533,27,-559,-563,-564,-587,-595,-288,-285,27,-296,-289,27,-303,-616,-487,27,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,27,-264,27,-271,-309,-310,-505,-569,-232,-265,27,-266,-272,27,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'ABSTRACT':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[35,35,35,35,35,-262,-608,-619,35,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,35,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,35,-206,-362,35,35,35,35,-609,-620,-451,-605,-354,-343,-452,35,-508,35,-529,35,-553,35,-588,-175,35,-249,35,-167,-205,-277,-279,-286,35,35,-615,35,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,35,35,35,35,-519,-521,-522,-523,-524,-525,-526,-527,-528,35,35,35,35,-562,-565,-566,-567,35,-344,-228,35,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,35,-617,-466,-470,-483,-484,35,-502,-503,-516,-520,-533,35,-559,-563,-564,-587,-595,-288,-285,35,-296,-289,35,-303,-616,-487,35,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,35,-264,35,-271,-309,-310,-505,-569,-232,-265,35,-266,-272,35,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'FINAL':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[36,36,36,36,36,-262,-608,-619,36,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,36,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,36,-206,-362,36,36,36,36,-609,-620,-451,-605,-354,-343,-452,36,-508,36,-529,36,-553,36,-588,-175,36,-249,36,-167,-205,-277,-279,-286,36,36,-615,36,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,36,36,36,36,-519,-521,-522,-523,-524,-525,-526,-527,-528,36,36,36,36,-562,-565,-566,-567,36,-344,-228,36,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,36,-617,-466,-470,-483,-484,36,-502,-503,-516,-520,-533,36,-559,-563,-564,-587,-595,-288,-285,36,-296,-289,36,-303,-616,-487,36,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,36,-264,36,-271,-309,-310,-505,-569,-232,-265,36,-266,-272,36,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'NATIVE':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[37,37,37,37,37,-262,-608,-619,37,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,37,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,37,-206,-362,37,37,37,37,-609,-620,-451,-605,-354,-343,-452,37,-508,37,-529,37,-553,37,-588,-175,37,-249,37,-167,-205,-277,-279,-286,37,37,-615,37,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,37,37,37,37,-519,-521,-522,-523,-524,-525,-526,-527,-528,37,37,37,37,-562,-565,-566,-567,37,-344,-228,37,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,37,-617,-466,-470,-483,-484,37,-502,-503,-516,-520,-533,37,-559,-563,-564,-587,-595,-288,-285,37,-296,-289,37,-303,-616,-487,37,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,37,-264,37,-271,-309,-310,-505,-569,-232,-265,37,-266,-272,37,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'SYNCHRONIZED':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,338,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,809,810,821,822,824,825,826,828,829,833,864,871,873,876,879,922,924,933,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1021,1022,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[38,167,38,38,38,-262,-608,-619,38,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,38,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,344,167,-206,344,-362,38,38,38,38,-609,-620,-451,-605,-354,-343,-452,38,-508,38,-529,38,-553,38,-588,-175,344,38,-249,167,-167,-205,-277,-279,-286,38,38,-615,38,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,38,38,38,38,-519,-521,-522,-523,-524,-525,-526,-527,-528,38,38,38,38,-562,-565,-566,-567,38,-344,-228,38,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,38,-617,-466,-470,-483,-484,167,-502,-503,-516,-520,-533,38,-559,-563,-564,-587,-595,344,344,-288,-285,38,-296,-289,38,-303,-251,-616,-487,38,-534,-536,-231,-185,344,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,344,344,38,-264,167,-271,-309,-310,-505,-569,-232,-265,167,-266,-272,167,-274,-276,-291,-311,-313,-312,-314,344,344,344,-267,-273,-315,-317,-316,-318,-236,344,344,]),'TRANSIENT':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[39,39,39,39,39,-262,-608,-619,39,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,39,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,39,-206,-362,39,39,39,39,-609,-620,-451,-605,-354,-343,-452,39,-508,39,-529,39,-553,39,-588,-175,39,-249,39,-167,-205,-277,-279,-286,39,39,-615,39,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,39,39,39,39,-519,-521,-522,-523,-524,-525,-526,-527,-528,39,39,39,39,-562,-565,-566,-567,39,-344,-228,39,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,39,-617,-466,-470,-483,-484,39,-502,-503,-516,-520,-533,39,-559,-563,-564,-587,-595,-288,-285,39,-296,-289,39,-303,-616,-487,39,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,39,-264,39,-271,-309,-310,-505,-569,-232,-265,39,-266,-272,39,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'VOLATILE':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[40,40,40,40,40,-262,-608,-619,40,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,40,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,40,-206,-362,40,40,40,40,-609,-620,-451,-605,-354,-343,-452,40,-508,40,-529,40,-553,40,-588,-175,40,-249,40,-167,-205,-277,-279,-286,40,40,-615,40,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,40,40,40,40,-519,-521,-522,-523,-524,-525,-526,-527,-528,40,40,40,40,-562,-565,-566,-567,40,-344,-228,40,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,40,-617,-466,-470,-483,-484,40,-502,-503,-516,-520,-533,40,-559,-563,-564,-587,-595,-288,-285,40,-296,-289,40,-303,-616,-487,40,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,40,-264,40,-271,-309,-310,-505,-569,-232,-265,40,-266,-272,40,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'STRICTFP':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,821,822,824,825,826,828,829,864,871,873,876,879,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[41,41,41,41,41,-262,-608,-619,41,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,41,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,41,-206,-362,41,41,41,41,-609,-620,-451,-605,-354,-343,-452,41,-508,41,-529,41,-553,41,-588,-175,41,-249,41,-167,-205,-277,-279,-286,41,41,-615,41,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,41,41,41,41,-519,-521,-522,-523,-524,-525,-526,-527,-528,41,41,41,41,-562,-565,-566,-567,41,-344,-228,41,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,41,-617,-466,-470,-483,-484,41,-502,-503,-516,-520,-533,41,-559,-563,-564,-587,-595,-288,-285,41,-296,-289,41,-303,-616,-487,41,-534,-536,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,41,-264,41,-271,-309,-310,-505,-569,-232,-265,41,-266,-272,41,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'@':([2,4,6,7,8,11,12,13,14,16,17,18,19,20,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,167,191,192,193,194,195,196,197,198,200,203,206,207,208,209,210,211,212,213,234,235,330,342,343,348,350,351,355,357,366,367,394,398,402,404,405,406,407,408,409,410,411,412,413,414,415,416,419,421,422,423,425,427,428,429,430,431,432,433,434,435,438,445,449,452,454,456,457,458,459,490,505,611,619,628,629,630,634,635,636,638,639,641,642,644,648,675,677,678,679,680,681,685,686,693,694,696,699,708,709,710,720,721,723,821,822,824,825,826,828,829,864,871,873,876,879,892,922,924,934,940,941,944,945,948,953,954,972,973,974,975,976,987,991,1024,1029,1031,1033,1043,1044,1066,1075,1076,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[53,53,53,53,53,-262,-608,-619,201,-610,-611,-612,-613,-614,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,201,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,53,-206,-362,53,53,201,53,-609,-620,-451,-605,-354,-343,-452,53,-508,53,-529,450,-553,53,-588,450,-175,450,-249,53,-167,-205,-277,-279,-286,450,53,-615,53,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,-501,450,201,450,53,-519,-521,-522,-523,-524,-525,-526,-527,-528,201,53,450,53,-562,-565,-566,-567,450,450,-344,-228,450,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,450,-617,-466,-470,-483,-484,53,-502,-503,-516,-520,-533,450,-559,-563,-564,-587,-595,450,-288,-285,450,-296,-289,450,-303,-616,-487,450,-534,-536,450,-231,-185,-234,-261,-263,-282,-306,-297,-307,-308,-618,-500,-482,-506,-486,-535,-570,450,-264,53,-271,-309,-310,-505,450,-569,-232,-265,53,-266,-272,53,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'THIS':([3,4,55,72,80,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,182,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,257,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,374,375,381,382,384,385,490,516,518,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,657,661,665,667,668,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,815,819,821,822,825,826,833,838,839,842,843,847,851,852,854,855,858,860,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,967,968,969,987,999,1013,1020,1021,1022,1023,1024,1026,1028,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1124,1125,1126,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[75,180,75,75,75,75,75,75,75,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,75,180,180,-206,75,180,75,75,373,-452,-508,-529,-553,75,75,75,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,75,75,502,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-175,180,75,75,75,-249,180,-167,-205,75,-277,-279,75,-286,75,75,75,656,660,-391,-392,-398,-399,75,75,502,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,-228,75,-164,-168,-260,75,-278,-280,-281,-283,-284,-287,-290,-624,75,75,841,845,-400,-417,-418,-466,180,-516,-533,75,-559,75,75,75,75,75,75,75,75,75,75,75,75,180,180,75,75,502,75,-288,-285,-296,-289,-251,75,75,75,75,-393,-401,-402,-404,-405,-419,-420,-534,-536,75,75,75,75,75,75,75,75,75,-231,-185,180,-234,-261,-263,-282,-306,-297,75,-307,-308,75,75,75,75,-406,-421,-422,-535,75,75,75,180,180,75,75,75,502,-264,180,-271,75,75,-309,-310,-407,-408,-410,-411,-403,-423,-424,75,75,-232,-265,180,-266,-272,180,-274,-276,-291,-311,-313,-312,-314,-412,-425,-426,180,180,75,180,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,180,75,180,]),'(':([3,4,54,55,70,71,72,80,84,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,150,151,152,153,154,157,159,160,161,162,164,166,167,168,169,180,181,186,203,206,208,210,212,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,302,304,305,306,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,344,348,350,351,353,355,357,362,366,368,369,370,372,373,377,381,382,384,385,447,463,490,501,505,507,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,570,576,578,579,586,605,611,614,618,628,629,630,631,633,634,635,636,638,639,641,642,643,644,652,653,654,655,656,658,659,660,662,665,667,668,677,681,684,693,696,706,707,708,723,728,729,731,732,733,734,735,743,767,789,790,794,798,800,802,803,804,809,810,811,814,819,821,822,825,826,833,838,839,840,841,842,843,844,845,847,851,852,854,855,858,860,868,869,876,879,883,892,896,897,898,900,902,905,907,909,920,921,922,924,931,932,933,934,940,941,944,945,948,951,953,954,959,960,963,964,967,968,969,977,987,990,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1124,1125,1126,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[80,151,235,238,-341,-342,238,80,307,238,238,238,238,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,339,80,341,342,151,151,-206,80,353,151,307,80,362,80,367,369,370,-380,-343,-452,-508,-529,-553,-588,238,80,80,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,80,238,80,238,80,80,238,238,238,238,238,-382,579,-381,-383,80,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,-175,151,80,80,151,-249,362,151,-167,-205,80,-277,-279,80,-286,80,80,80,653,654,-385,-391,-392,-398,-399,706,-382,238,733,-344,735,238,80,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,80,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,238,789,80,798,80,803,80,-228,238,307,-164,-168,-260,80,819,-278,-280,-281,-283,-284,-287,-290,824,-624,789,80,80,838,839,733,842,843,-386,-400,-417,-418,-466,151,871,-516,-533,80,-542,-559,238,238,238,897,898,80,900,80,238,238,80,909,80,80,-384,80,80,920,151,151,80,151,80,-288,-285,-296,-289,-251,80,80,959,960,80,80,963,964,-393,-401,-402,-404,-405,-419,-420,975,976,-534,-536,991,238,999,80,80,80,238,238,238,80,80,1020,-231,-185,1023,1024,151,-234,-261,-263,-282,-306,-297,80,-307,-308,80,80,80,80,-406,-421,-422,1066,-535,1076,80,80,80,151,151,80,151,151,-264,151,-271,80,80,-309,-310,-407,-408,-410,-411,-403,-423,-424,238,238,-232,-265,151,-266,-272,151,-274,-276,-291,-311,-313,-312,-314,-412,-425,-426,151,151,80,151,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,151,151,151,]),'NEW':([3,4,55,72,80,92,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,374,375,490,516,518,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,815,816,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1013,1020,1021,1022,1023,1024,1026,1028,1029,1031,1033,1034,1042,1043,1044,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1157,1158,1159,1162,],[83,189,83,83,83,309,83,83,83,83,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,83,189,189,-206,83,189,83,83,-452,-508,-529,-553,83,83,83,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,83,83,499,-325,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-175,189,83,83,189,-249,189,-167,-205,83,-277,-279,83,-286,83,83,83,499,-325,83,83,-325,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-228,83,-164,-168,-260,83,-278,-280,-281,-283,-284,-287,-290,-624,83,83,-466,189,-516,-533,83,-559,83,83,83,83,83,83,83,83,83,83,83,83,189,189,83,189,-325,499,83,-288,-285,-296,-289,-251,83,83,83,83,-534,-536,83,83,83,83,83,83,83,83,83,-231,-185,189,-234,-261,-263,-282,-306,-297,83,-307,-308,83,83,83,83,-535,83,83,83,189,189,83,189,189,-325,-264,189,-271,83,83,-309,-310,83,83,-232,-265,189,-266,-272,189,-274,-276,-291,-311,-313,-312,-314,189,189,83,189,-267,-273,-315,-317,-316,-318,-236,189,189,189,]),'NAME':([3,4,15,21,22,23,24,25,26,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,53,54,55,70,71,72,80,83,93,94,95,96,97,98,99,100,101,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,155,156,157,159,160,162,163,164,165,166,167,168,171,172,184,185,186,187,189,190,197,199,200,201,203,205,206,207,208,209,210,211,212,213,217,221,225,228,230,231,232,233,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,259,260,261,262,263,264,266,287,288,294,295,297,303,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,335,336,337,338,339,341,342,343,346,348,350,351,353,355,357,362,366,367,368,369,370,371,374,375,376,377,378,379,380,381,382,384,385,396,397,399,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,443,445,448,449,450,452,453,454,456,457,458,459,460,469,470,490,499,500,505,506,507,510,511,516,518,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,571,576,579,580,587,604,605,609,610,611,614,617,618,619,625,628,629,630,631,634,635,636,638,639,641,642,644,647,648,653,654,657,661,662,663,664,665,666,667,668,670,671,672,676,677,678,679,680,681,682,683,684,685,686,689,691,693,694,695,696,699,706,708,709,710,712,713,714,715,716,717,720,721,722,723,728,729,730,733,735,742,743,767,789,794,798,802,803,809,810,811,813,814,815,816,819,821,822,824,825,826,828,829,832,833,838,839,842,843,846,847,851,852,854,855,858,860,869,870,871,873,874,876,879,882,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,981,984,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1028,1029,1031,1033,1034,1038,1039,1040,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1129,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[84,164,203,-447,-448,-449,-450,-353,203,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,203,-594,84,-341,-342,84,84,203,-369,-370,-371,-372,-373,-374,-375,-376,-377,84,84,84,84,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,334,203,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,84,164,-367,-368,164,-206,84,164,356,-343,358,84,-362,84,-378,-379,-383,-352,-380,-381,203,203,-451,203,-354,203,-343,203,-452,-624,-508,-624,-529,-624,-553,-624,203,203,203,474,475,476,477,478,-588,84,84,84,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,84,84,501,507,84,-155,-156,84,84,84,84,84,84,84,84,570,203,84,84,203,84,84,84,203,84,84,84,84,84,84,84,84,84,84,84,84,-175,334,-367,-383,164,84,84,618,-249,-387,164,-167,-205,84,-277,-279,84,-286,203,84,84,84,652,658,507,-388,-385,203,-389,203,-391,-392,-398,-399,673,203,203,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,684,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,203,-351,-352,-624,707,-351,203,-624,-352,-562,-565,-566,-567,-624,684,-430,-439,84,203,732,-344,734,-343,-158,-157,84,507,84,84,84,84,84,84,84,84,203,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,203,84,84,84,84,84,84,84,84,84,84,84,84,790,84,84,203,203,334,84,-387,-388,-228,84,812,-343,203,-383,-164,-168,-260,84,-278,-280,-281,-283,-284,-287,-290,-624,334,203,84,84,732,734,-386,-384,203,-400,203,-417,-418,203,203,203,203,-466,-470,-483,-484,164,868,869,-343,-502,-503,-352,203,-516,-520,203,-533,-624,84,-559,-563,-564,869,883,203,474,-441,203,-587,-595,203,84,84,84,203,84,84,203,84,84,84,84,84,84,84,164,164,84,937,618,507,658,84,-288,-285,-624,-296,-289,203,-303,334,-251,84,84,84,84,-390,-393,-401,-402,-404,-405,-419,-420,-343,977,-487,-624,334,-534,-536,990,-440,-442,84,84,84,84,84,84,84,84,84,-231,-185,164,-234,-261,-263,-282,-306,203,-297,84,-307,-308,84,84,84,84,203,203,-406,-421,-422,203,203,-500,-482,-506,-486,203,334,-535,-570,-443,-444,203,84,84,84,164,164,84,618,618,507,-264,164,-271,84,334,-293,-294,84,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,84,-569,-445,-446,84,-232,-265,164,-266,-272,164,-274,-276,-291,203,-311,-313,-312,-314,203,-412,-425,-426,203,203,203,164,164,84,164,-267,-273,-295,-315,-317,-316,-318,-409,-427,-428,-236,164,618,164,]),'NUM':([3,4,55,72,80,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1157,1158,1159,1162,],[86,86,86,86,86,86,86,86,86,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,86,86,86,-206,86,86,86,86,-452,-508,-529,-553,86,86,86,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-175,86,86,86,86,-249,86,-167,-205,86,-277,-279,86,-286,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-228,86,-164,-168,-260,86,-278,-280,-281,-283,-284,-287,-290,-624,86,86,-466,86,-516,-533,86,-559,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,-288,-285,-296,-289,-251,86,86,86,86,-534,-536,86,86,86,86,86,86,86,86,86,-231,-185,86,-234,-261,-263,-282,-306,-297,86,-307,-308,86,86,86,86,-535,86,86,86,86,86,86,86,86,-264,86,-271,86,86,-309,-310,86,86,-232,-265,86,-266,-272,86,-274,-276,-291,-311,-313,-312,-314,86,86,86,86,-267,-273,-315,-317,-316,-318,-236,86,86,86,]),'CHAR_LITERAL':([3,4,55,72,80,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1157,1158,1159,1162,],[87,87,87,87,87,87,87,87,87,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,87,87,87,-206,87,87,87,87,-452,-508,-529,-553,87,87,87,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-175,87,87,87,87,-249,87,-167,-205,87,-277,-279,87,-286,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-228,87,-164,-168,-260,87,-278,-280,-281,-283,-284,-287,-290,-624,87,87,-466,87,-516,-533,87,-559,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-288,-285,-296,-289,-251,87,87,87,87,-534,-536,87,87,87,87,87,87,87,87,87,-231,-185,87,-234,-261,-263,-282,-306,-297,87,-307,-308,87,87,87,87,-535,87,87,87,87,87,87,87,87,-264,87,-271,87,87,-309,-310,87,87,-232,-265,87,-266,-272,87,-274,-276,-291,-311,-313,-312,-314,87,87,87,87,-267,-273,-315,-317,-316,-318,-236,87,87,87,]),'STRING_LITERAL':([3,4,55,72,80,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1157,1158,1159,1162,],[88,88,88,88,88,88,88,88,88,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,88,88,88,-206,88,88,88,88,-452,-508,-529,-553,88,88,88,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-175,88,88,88,88,-249,88,-167,-205,88,-277,-279,88,-286,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-228,88,-164,-168,-260,88,-278,-280,-281,-283,-284,-287,-290,-624,88,88,-466,88,-516,-533,88,-559,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-288,-285,-296,-289,-251,88,88,88,88,-534,-536,88,88,88,88,88,88,88,88,88,-231,-185,88,-234,-261,-263,-282,-306,-297,88,-307,-308,88,88,88,88,-535,88,88,88,88,88,88,88,88,-264,88,-271,88,88,-309,-310,88,88,-232,-265,88,-266,-272,88,-274,-276,-291,-311,-313,-312,-314,88,88,88,88,-267,-273,-315,-317,-316,-318,-236,88,88,88,]),'TRUE':([3,4,55,72,80,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1157,1158,1159,1162,],[89,89,89,89,89,89,89,89,89,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,89,89,89,-206,89,89,89,89,-452,-508,-529,-553,89,89,89,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-175,89,89,89,89,-249,89,-167,-205,89,-277,-279,89,-286,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-228,89,-164,-168,-260,89,-278,-280,-281,-283,-284,-287,-290,-624,89,89,-466,89,-516,-533,89,-559,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-288,-285,-296,-289,-251,89,89,89,89,-534,-536,89,89,89,89,89,89,89,89,89,-231,-185,89,-234,-261,-263,-282,-306,-297,89,-307,-308,89,89,89,89,-535,89,89,89,89,89,89,89,89,-264,89,-271,89,89,-309,-310,89,89,-232,-265,89,-266,-272,89,-274,-276,-291,-311,-313,-312,-314,89,89,89,89,-267,-273,-315,-317,-316,-318,-236,89,89,89,]),'FALSE':([3,4,55,72,80,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1157,1158,1159,1162,],[90,90,90,90,90,90,90,90,90,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,90,90,90,-206,90,90,90,90,-452,-508,-529,-553,90,90,90,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-175,90,90,90,90,-249,90,-167,-205,90,-277,-279,90,-286,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-228,90,-164,-168,-260,90,-278,-280,-281,-283,-284,-287,-290,-624,90,90,-466,90,-516,-533,90,-559,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-288,-285,-296,-289,-251,90,90,90,90,-534,-536,90,90,90,90,90,90,90,90,90,-231,-185,90,-234,-261,-263,-282,-306,-297,90,-307,-308,90,90,90,90,-535,90,90,90,90,90,90,90,90,-264,90,-271,90,90,-309,-310,90,90,-232,-265,90,-266,-272,90,-274,-276,-291,-311,-313,-312,-314,90,90,90,90,-267,-273,-315,-317,-316,-318,-236,90,90,90,]),'NULL':([3,4,55,72,80,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,825,826,833,838,839,842,843,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,987,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1157,1158,1159,1162,],[91,91,91,91,91,91,91,91,91,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,91,91,91,-206,91,91,91,91,-452,-508,-529,-553,91,91,91,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-175,91,91,91,91,-249,91,-167,-205,91,-277,-279,91,-286,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-228,91,-164,-168,-260,91,-278,-280,-281,-283,-284,-287,-290,-624,91,91,-466,91,-516,-533,91,-559,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,-288,-285,-296,-289,-251,91,91,91,91,-534,-536,91,91,91,91,91,91,91,91,91,-231,-185,91,-234,-261,-263,-282,-306,-297,91,-307,-308,91,91,91,91,-535,91,91,91,91,91,91,91,91,-264,91,-271,91,91,-309,-310,91,91,-232,-265,91,-266,-272,91,-274,-276,-291,-311,-313,-312,-314,91,91,91,91,-267,-273,-315,-317,-316,-318,-236,91,91,91,]),'SUPER':([3,4,55,72,80,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,168,182,206,208,210,212,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,257,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,368,369,370,374,375,381,382,384,385,389,490,516,518,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,628,629,630,631,634,635,636,638,639,641,642,644,653,654,657,661,665,667,668,677,681,693,696,706,708,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,815,819,821,822,825,826,833,838,839,842,843,847,851,852,854,855,857,858,860,876,879,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,948,951,953,954,959,960,963,964,967,968,969,987,999,1013,1020,1021,1022,1023,1024,1026,1028,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1059,1060,1062,1064,1075,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1124,1125,1126,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[81,181,81,81,81,81,81,81,81,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,81,181,181,-206,81,181,81,81,372,-452,-508,-529,-553,81,81,81,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,81,81,503,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-175,181,81,81,627,-249,181,-167,-205,81,-277,-279,81,-286,81,81,81,655,659,-391,-392,-398,-399,671,81,81,503,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-228,81,-164,-168,-260,81,-278,-280,-281,-283,-284,-287,-290,-624,81,81,840,844,-400,-417,-418,-466,181,-516,-533,81,-559,81,81,81,81,81,81,81,81,81,81,81,81,181,181,81,627,503,81,-288,-285,-296,-289,-251,81,81,81,81,-393,-401,-402,-404,-405,971,-419,-420,-534,-536,81,81,81,81,81,81,81,81,81,-231,-185,181,-234,-261,-263,-282,-306,-297,81,-307,-308,81,81,81,81,-406,-421,-422,-535,81,81,81,181,181,81,627,627,503,-264,181,-271,81,81,-309,-310,-407,-408,-410,-411,1128,-403,-423,-424,81,81,-232,-265,181,-266,-272,181,-274,-276,-291,-311,-313,-312,-314,-412,-425,-426,181,181,81,181,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,181,627,181,]),'BOOLEAN':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[93,93,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,93,-341,-342,93,93,93,93,93,93,93,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,93,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,93,93,93,-206,93,93,93,-362,93,-352,93,93,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,93,93,93,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-175,93,93,93,93,-249,93,-167,-205,93,-277,-279,93,-286,93,93,93,93,93,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,93,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,93,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,93,-430,-439,93,-344,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-228,93,93,-164,-168,-260,93,-278,-280,-281,-283,-284,-287,-290,-624,93,93,93,93,-400,93,93,93,-466,-470,-483,-484,93,93,-502,-503,-352,93,-516,-520,93,-533,93,-559,-563,-564,93,-441,93,-587,-595,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,-288,-285,-624,-296,-289,93,-303,-251,93,93,93,93,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,93,93,93,93,93,93,93,93,93,-231,-185,93,-234,-261,-263,-282,-306,93,-297,93,-307,-308,93,93,93,93,93,93,-406,-421,-422,93,93,-500,-482,-506,-486,-535,-570,-443,-444,93,93,93,93,93,93,93,93,93,-264,93,-271,93,93,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,93,-569,-445,-446,93,-232,-265,93,-266,-272,93,-274,-276,-291,93,-311,-313,-312,-314,93,-412,-425,-426,93,93,93,93,93,93,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,93,93,93,]),'VOID':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[94,94,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,94,-341,-342,94,94,94,94,94,94,94,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,94,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,94,94,94,-206,94,94,94,-362,94,-352,94,94,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,94,94,94,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-175,94,94,94,94,-249,94,-167,-205,94,-277,-279,94,-286,94,94,94,94,94,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,94,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,94,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,94,-430,-439,94,-344,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-228,94,94,-164,-168,-260,94,-278,-280,-281,-283,-284,-287,-290,-624,94,94,94,94,-400,94,94,94,-466,-470,-483,-484,94,94,-502,-503,-352,94,-516,-520,94,-533,94,-559,-563,-564,94,-441,94,-587,-595,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,-288,-285,-624,-296,-289,94,-303,-251,94,94,94,94,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,94,94,94,94,94,94,94,94,94,-231,-185,94,-234,-261,-263,-282,-306,94,-297,94,-307,-308,94,94,94,94,94,94,-406,-421,-422,94,94,-500,-482,-506,-486,-535,-570,-443,-444,94,94,94,94,94,94,94,94,94,-264,94,-271,94,94,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,94,-569,-445,-446,94,-232,-265,94,-266,-272,94,-274,-276,-291,94,-311,-313,-312,-314,94,-412,-425,-426,94,94,94,94,94,94,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,94,94,94,]),'BYTE':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[95,95,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,95,-341,-342,95,95,95,95,95,95,95,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,95,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,95,95,95,-206,95,95,95,-362,95,-352,95,95,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,95,95,95,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-175,95,95,95,95,-249,95,-167,-205,95,-277,-279,95,-286,95,95,95,95,95,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,95,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,95,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,95,-430,-439,95,-344,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-228,95,95,-164,-168,-260,95,-278,-280,-281,-283,-284,-287,-290,-624,95,95,95,95,-400,95,95,95,-466,-470,-483,-484,95,95,-502,-503,-352,95,-516,-520,95,-533,95,-559,-563,-564,95,-441,95,-587,-595,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,95,-288,-285,-624,-296,-289,95,-303,-251,95,95,95,95,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,95,95,95,95,95,95,95,95,95,-231,-185,95,-234,-261,-263,-282,-306,95,-297,95,-307,-308,95,95,95,95,95,95,-406,-421,-422,95,95,-500,-482,-506,-486,-535,-570,-443,-444,95,95,95,95,95,95,95,95,95,-264,95,-271,95,95,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,95,-569,-445,-446,95,-232,-265,95,-266,-272,95,-274,-276,-291,95,-311,-313,-312,-314,95,-412,-425,-426,95,95,95,95,95,95,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,95,95,95,]),'SHORT':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[96,96,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,96,-341,-342,96,96,96,96,96,96,96,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,96,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,96,96,96,-206,96,96,96,-362,96,-352,96,96,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,96,96,96,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-175,96,96,96,96,-249,96,-167,-205,96,-277,-279,96,-286,96,96,96,96,96,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,96,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,96,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,96,-430,-439,96,-344,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-228,96,96,-164,-168,-260,96,-278,-280,-281,-283,-284,-287,-290,-624,96,96,96,96,-400,96,96,96,-466,-470,-483,-484,96,96,-502,-503,-352,96,-516,-520,96,-533,96,-559,-563,-564,96,-441,96,-587,-595,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,-288,-285,-624,-296,-289,96,-303,-251,96,96,96,96,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,96,96,96,96,96,96,96,96,96,-231,-185,96,-234,-261,-263,-282,-306,96,-297,96,-307,-308,96,96,96,96,96,96,-406,-421,-422,96,96,-500,-482,-506,-486,-535,-570,-443,-444,96,96,96,96,96,96,96,96,96,-264,96,-271,96,96,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,96,-569,-445,-446,96,-232,-265,96,-266,-272,96,-274,-276,-291,96,-311,-313,-312,-314,96,-412,-425,-426,96,96,96,96,96,96,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,96,96,96,]),'INT':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[97,97,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,97,-341,-342,97,97,97,97,97,97,97,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,97,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,97,97,97,-206,97,97,97,-362,97,-352,97,97,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,97,97,97,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-175,97,97,97,97,-249,97,-167,-205,97,-277,-279,97,-286,97,97,97,97,97,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,97,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,97,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,97,-430,-439,97,-344,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-228,97,97,-164,-168,-260,97,-278,-280,-281,-283,-284,-287,-290,-624,97,97,97,97,-400,97,97,97,-466,-470,-483,-484,97,97,-502,-503,-352,97,-516,-520,97,-533,97,-559,-563,-564,97,-441,97,-587,-595,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,-288,-285,-624,-296,-289,97,-303,-251,97,97,97,97,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,97,97,97,97,97,97,97,97,97,-231,-185,97,-234,-261,-263,-282,-306,97,-297,97,-307,-308,97,97,97,97,97,97,-406,-421,-422,97,97,-500,-482,-506,-486,-535,-570,-443,-444,97,97,97,97,97,97,97,97,97,-264,97,-271,97,97,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,97,-569,-445,-446,97,-232,-265,97,-266,-272,97,-274,-276,-291,97,-311,-313,-312,-314,97,-412,-425,-426,97,97,97,97,97,97,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,97,97,97,]),'LONG':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[98,98,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,98,-341,-342,98,98,98,98,98,98,98,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,98,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,98,98,98,-206,98,98,98,-362,98,-352,98,98,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,98,98,98,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-175,98,98,98,98,-249,98,-167,-205,98,-277,-279,98,-286,98,98,98,98,98,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,98,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,98,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,98,-430,-439,98,-344,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-228,98,98,-164,-168,-260,98,-278,-280,-281,-283,-284,-287,-290,-624,98,98,98,98,-400,98,98,98,-466,-470,-483,-484,98,98,-502,-503,-352,98,-516,-520,98,-533,98,-559,-563,-564,98,-441,98,-587,-595,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,-288,-285,-624,-296,-289,98,-303,-251,98,98,98,98,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,98,98,98,98,98,98,98,98,98,-231,-185,98,-234,-261,-263,-282,-306,98,-297,98,-307,-308,98,98,98,98,98,98,-406,-421,-422,98,98,-500,-482,-506,-486,-535,-570,-443,-444,98,98,98,98,98,98,98,98,98,-264,98,-271,98,98,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,98,-569,-445,-446,98,-232,-265,98,-266,-272,98,-274,-276,-291,98,-311,-313,-312,-314,98,-412,-425,-426,98,98,98,98,98,98,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,98,98,98,]),'CHAR':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[99,99,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,99,-341,-342,99,99,99,99,99,99,99,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,99,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,99,99,99,-206,99,99,99,-362,99,-352,99,99,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,99,99,99,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-175,99,99,99,99,-249,99,-167,-205,99,-277,-279,99,-286,99,99,99,99,99,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,99,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,99,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,99,-430,-439,99,-344,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-228,99,99,-164,-168,-260,99,-278,-280,-281,-283,-284,-287,-290,-624,99,99,99,99,-400,99,99,99,-466,-470,-483,-484,99,99,-502,-503,-352,99,-516,-520,99,-533,99,-559,-563,-564,99,-441,99,-587,-595,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,99,-288,-285,-624,-296,-289,99,-303,-251,99,99,99,99,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,99,99,99,99,99,99,99,99,99,-231,-185,99,-234,-261,-263,-282,-306,99,-297,99,-307,-308,99,99,99,99,99,99,-406,-421,-422,99,99,-500,-482,-506,-486,-535,-570,-443,-444,99,99,99,99,99,99,99,99,99,-264,99,-271,99,99,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,99,-569,-445,-446,99,-232,-265,99,-266,-272,99,-274,-276,-291,99,-311,-313,-312,-314,99,-412,-425,-426,99,99,99,99,99,99,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,99,99,99,]),'FLOAT':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[100,100,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,100,-341,-342,100,100,100,100,100,100,100,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,100,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,100,100,100,-206,100,100,100,-362,100,-352,100,100,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,100,100,100,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-175,100,100,100,100,-249,100,-167,-205,100,-277,-279,100,-286,100,100,100,100,100,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,100,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,100,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,100,-430,-439,100,-344,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-228,100,100,-164,-168,-260,100,-278,-280,-281,-283,-284,-287,-290,-624,100,100,100,100,-400,100,100,100,-466,-470,-483,-484,100,100,-502,-503,-352,100,-516,-520,100,-533,100,-559,-563,-564,100,-441,100,-587,-595,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,100,-288,-285,-624,-296,-289,100,-303,-251,100,100,100,100,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,100,100,100,100,100,100,100,100,100,-231,-185,100,-234,-261,-263,-282,-306,100,-297,100,-307,-308,100,100,100,100,100,100,-406,-421,-422,100,100,-500,-482,-506,-486,-535,-570,-443,-444,100,100,100,100,100,100,100,100,100,-264,100,-271,100,100,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,100,-569,-445,-446,100,-232,-265,100,-266,-272,100,-274,-276,-291,100,-311,-313,-312,-314,100,-412,-425,-426,100,100,100,100,100,100,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,100,100,100,]),'DOUBLE':([3,4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,54,55,70,71,72,80,83,109,110,115,116,119,120,121,122,123,124,126,127,128,129,130,131,132,133,135,136,137,138,139,140,141,142,143,144,145,146,147,148,151,154,157,159,160,162,166,167,168,185,189,190,197,200,203,206,207,208,209,210,212,213,234,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,330,338,339,341,342,343,348,350,351,353,355,357,362,366,367,368,369,370,378,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,421,422,423,425,426,427,428,429,430,431,432,433,434,435,437,438,445,449,452,453,454,456,457,458,459,460,469,470,490,505,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,611,614,619,628,629,630,631,634,635,636,638,639,641,642,644,648,653,654,664,665,666,670,671,677,678,679,680,681,683,685,686,689,691,693,694,695,696,706,708,709,710,712,716,717,720,721,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,821,822,824,825,826,828,829,833,838,839,842,843,851,852,854,855,871,873,876,879,885,887,892,897,898,900,902,905,907,909,920,922,924,933,934,940,941,944,945,947,948,951,953,954,959,960,963,964,965,966,967,968,969,970,971,973,974,975,976,987,991,992,994,996,999,1013,1020,1021,1022,1023,1024,1026,1029,1031,1033,1034,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1066,1075,1076,1077,1079,1085,1093,1101,1102,1104,1105,1106,1109,1110,1111,1113,1115,1116,1119,1120,1123,1124,1125,1126,1127,1128,1135,1136,1137,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1157,1158,1159,1162,],[101,101,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,-594,101,-341,-342,101,101,101,101,101,101,101,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,101,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,101,101,101,-206,101,101,101,-362,101,-352,101,101,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,101,101,101,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-175,101,101,101,101,-249,101,-167,-205,101,-277,-279,101,-286,101,101,101,101,101,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,101,-501,-624,-351,-624,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,101,-351,-624,-351,-624,-352,-562,-565,-566,-567,-624,101,-430,-439,101,-344,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-228,101,101,-164,-168,-260,101,-278,-280,-281,-283,-284,-287,-290,-624,101,101,101,101,-400,101,101,101,-466,-470,-483,-484,101,101,-502,-503,-352,101,-516,-520,101,-533,101,-559,-563,-564,101,-441,101,-587,-595,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,-288,-285,-624,-296,-289,101,-303,-251,101,101,101,101,-401,-402,-404,-405,-487,-624,-534,-536,-440,-442,101,101,101,101,101,101,101,101,101,-231,-185,101,-234,-261,-263,-282,-306,101,-297,101,-307,-308,101,101,101,101,101,101,-406,-421,-422,101,101,-500,-482,-506,-486,-535,-570,-443,-444,101,101,101,101,101,101,101,101,101,-264,101,-271,101,101,-309,-310,-407,-408,-410,-411,-403,-423,-424,-505,101,-569,-445,-446,101,-232,-265,101,-266,-272,101,-274,-276,-291,101,-311,-313,-312,-314,101,-412,-425,-426,101,101,101,101,101,101,-267,-273,-315,-317,-316,-318,-409,-427,-428,-236,101,101,101,]),'+':([3,55,60,62,63,64,65,67,68,69,70,71,72,74,75,76,77,78,79,80,84,86,87,88,89,90,91,107,108,109,110,111,112,113,114,115,116,117,151,160,166,168,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,265,266,267,274,275,276,285,286,287,288,289,290,291,292,293,294,295,296,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,339,340,341,353,362,368,369,370,486,489,490,491,492,493,495,501,502,503,504,505,507,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,541,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,573,574,575,576,577,579,596,597,598,599,600,601,602,603,605,614,631,653,654,677,706,723,728,729,733,735,736,737,738,739,740,753,759,760,761,762,763,764,765,766,767,781,782,783,784,785,786,787,788,789,791,792,793,794,796,797,798,801,802,803,811,819,838,839,842,843,892,897,898,900,904,905,906,907,909,915,917,920,951,959,960,963,964,999,1002,1004,1005,1009,1011,1012,1013,1014,1015,1016,1017,1018,1020,1023,1034,1042,1075,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1133,1134,1137,1153,],[109,109,-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,109,-139,-140,-141,-142,-143,-144,287,-343,-345,-346,-347,-348,-349,-350,321,-88,109,109,-96,-107,-108,-111,109,109,-122,287,109,109,109,287,-118,-119,287,109,-134,-135,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,109,109,109,109,109,109,-117,109,536,-131,-132,-133,561,-91,109,109,-100,-112,-113,-116,-123,109,109,-126,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-109,-110,-120,-121,109,536,109,109,109,109,109,109,536,-341,287,-131,-132,-133,536,-328,-147,-148,-149,-344,-343,-145,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-146,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-114,-115,-124,-125,-329,-152,-339,-335,109,-340,109,321,321,321,-89,-90,-97,-98,-99,109,109,109,109,109,-466,109,287,-145,109,109,109,-150,-330,-331,-332,-162,-128,321,321,321,-93,-95,-102,-104,-106,109,321,321,321,-92,-94,-101,-103,-105,109,-151,-333,-336,109,-338,-334,109,-221,109,109,109,109,109,109,109,109,287,109,109,109,-163,109,-159,109,109,-337,-624,109,109,109,109,109,109,109,-226,-225,-160,-227,-216,-217,109,-624,-320,-326,-327,-624,109,109,109,109,287,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-161,-324,109,-321,]),'-':([3,55,60,62,63,64,65,67,68,69,70,71,72,74,75,76,77,78,79,80,84,86,87,88,89,90,91,107,108,109,110,111,112,113,114,115,116,117,151,160,166,168,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,265,266,267,274,275,276,285,286,287,288,289,290,291,292,293,294,295,296,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,339,340,341,353,362,368,369,370,486,489,490,491,492,493,495,501,502,503,504,505,507,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,541,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,573,574,575,576,577,579,596,597,598,599,600,601,602,603,605,614,631,653,654,677,706,723,728,729,733,735,736,737,738,739,740,753,759,760,761,762,763,764,765,766,767,781,782,783,784,785,786,787,788,789,791,792,793,794,796,797,798,801,802,803,811,819,838,839,842,843,892,897,898,900,904,905,906,907,909,915,917,920,951,959,960,963,964,999,1002,1004,1005,1009,1011,1012,1013,1014,1015,1016,1017,1018,1020,1023,1034,1042,1075,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1133,1134,1137,1153,],[110,110,-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,110,-139,-140,-141,-142,-143,-144,288,-343,-345,-346,-347,-348,-349,-350,322,-88,110,110,-96,-107,-108,-111,110,110,-122,288,110,110,110,288,-118,-119,288,110,-134,-135,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,110,110,110,110,110,110,-117,110,537,-131,-132,-133,562,-91,110,110,-100,-112,-113,-116,-123,110,110,-126,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-109,-110,-120,-121,110,537,110,110,110,110,110,110,537,-341,288,-131,-132,-133,537,-328,-147,-148,-149,-344,-343,-145,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-146,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-114,-115,-124,-125,-329,-152,-339,-335,110,-340,110,322,322,322,-89,-90,-97,-98,-99,110,110,110,110,110,-466,110,288,-145,110,110,110,-150,-330,-331,-332,-162,-128,322,322,322,-93,-95,-102,-104,-106,110,322,322,322,-92,-94,-101,-103,-105,110,-151,-333,-336,110,-338,-334,110,-221,110,110,110,110,110,110,110,110,288,110,110,110,-163,110,-159,110,110,-337,-624,110,110,110,110,110,110,110,-226,-225,-160,-227,-216,-217,110,-624,-320,-326,-327,-624,110,110,110,110,288,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-161,-324,110,-321,]),'~':([3,55,72,80,109,110,115,116,151,160,166,168,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,339,341,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,706,723,728,729,733,735,743,767,789,794,798,802,803,811,819,838,839,842,843,892,897,898,900,902,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1075,1085,1137,],[115,115,115,294,115,115,115,115,294,115,115,115,294,294,115,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,294,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,294,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,294,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,294,115,115,]),'!':([3,55,72,80,109,110,115,116,151,160,166,168,235,238,239,242,243,244,245,246,247,248,249,250,251,252,253,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,339,341,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,706,723,728,729,733,735,743,767,789,794,798,802,803,811,819,838,839,842,843,892,897,898,900,902,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1075,1085,1137,],[116,116,116,295,116,116,116,116,295,116,116,116,295,295,116,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,295,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,295,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,295,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,295,116,116,]),'IF':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[150,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,150,150,-206,150,-452,-508,-529,-553,-175,150,-249,150,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,150,-516,-533,-559,921,150,-288,-285,-296,-289,-251,-534,-536,-231,-185,921,-234,-261,-263,-282,-306,-297,-307,-308,-535,150,921,-264,150,-271,-309,-310,-232,-265,150,-266,-272,150,-274,-276,-291,-311,-313,-312,-314,921,921,150,-267,-273,-315,-317,-316,-318,-236,921,921,]),'WHILE':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,354,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[152,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,152,152,-206,152,-452,-508,-529,-553,-175,152,-249,152,-167,-205,633,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,152,-516,-533,-559,931,152,-288,-285,-296,-289,-251,-534,-536,-231,-185,931,-234,-261,-263,-282,-306,-297,-307,-308,-535,152,931,-264,152,-271,-309,-310,-232,-265,152,-266,-272,152,-274,-276,-291,-311,-313,-312,-314,931,931,152,-267,-273,-315,-317,-316,-318,-236,931,931,]),'FOR':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[153,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,153,153,-206,153,-452,-508,-529,-553,-175,153,-249,153,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,153,-516,-533,-559,932,153,-288,-285,-296,-289,-251,-534,-536,-231,-185,932,-234,-261,-263,-282,-306,-297,-307,-308,-535,153,932,-264,153,-271,-309,-310,-232,-265,153,-266,-272,153,-274,-276,-291,-311,-313,-312,-314,932,932,153,-267,-273,-315,-317,-316,-318,-236,932,932,]),'{':([4,28,29,30,31,43,44,45,46,50,51,70,71,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,169,186,203,206,207,208,210,212,214,215,216,218,219,220,222,223,224,226,227,229,235,260,261,305,306,330,338,343,348,350,351,355,357,365,366,377,381,382,384,385,402,404,405,406,407,408,409,410,411,412,413,414,415,416,417,419,420,445,446,447,461,462,463,464,465,466,467,468,469,470,475,476,477,478,490,505,510,511,544,574,575,577,605,607,611,628,629,630,634,635,636,638,639,641,642,644,662,665,667,668,673,677,678,679,680,681,685,686,693,696,703,704,705,707,708,716,718,719,723,793,794,796,800,809,810,818,820,821,822,823,825,826,833,847,851,852,854,855,858,860,863,872,875,876,879,884,885,887,892,915,917,922,924,933,934,940,941,944,945,948,949,951,953,954,967,968,969,973,974,978,979,980,985,986,987,988,992,994,1013,1014,1018,1021,1022,1029,1031,1033,1037,1042,1043,1044,1053,1054,1056,1057,1060,1062,1064,1067,1068,1069,1071,1075,1077,1079,1082,1091,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1124,1125,1126,1131,1135,1136,1138,1139,1140,1142,1143,1144,1145,1146,1148,1150,1152,1157,1158,1162,],[157,207,209,211,213,-624,-624,-624,-624,-455,-511,-341,-342,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,157,157,-206,157,157,-380,-343,-452,157,-508,-529,-553,-624,-457,-458,-509,-513,-514,-530,-460,-461,-624,-454,-510,490,-155,-156,-381,-383,-175,157,-249,157,-167,-205,-277,-279,157,-286,-385,-391,-392,-398,-399,157,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,157,681,-501,681,157,207,-624,-453,-459,-382,-515,-463,-465,-462,-554,-430,-439,-531,-456,-512,-558,490,-344,-158,-157,-154,794,-335,794,794,-153,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-386,-400,-417,-418,-555,-466,-470,-483,-484,157,-502,-503,-516,-533,-541,-543,-544,-542,-559,-441,-532,-557,490,-336,794,-338,-384,157,157,942,157,-288,-285,157,-296,-289,-251,-393,-401,-402,-404,-405,-419,-420,-556,-624,-624,-534,-536,-464,-440,-442,490,-337,207,-231,-185,157,-234,-261,-263,-282,-306,-297,-298,794,-307,-308,-406,-421,-422,-500,-482,-485,-494,-495,-624,-507,-535,-545,-443,-444,794,207,207,157,157,-264,157,-271,157,794,-309,-310,-407,-408,-410,-411,-403,-423,-424,-496,-497,-499,-504,490,-445,-446,207,207,-232,-265,157,-266,-272,157,-274,-276,-291,-311,-313,-312,-314,-412,-425,-426,207,157,157,157,-267,-273,-315,-317,-316,-318,-409,-427,-428,-498,-236,157,157,]),'ASSERT':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[160,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,160,160,-206,160,-452,-508,-529,-553,-175,160,-249,160,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,160,-516,-533,-559,160,160,-288,-285,-296,-289,-251,-534,-536,-231,-185,160,-234,-261,-263,-282,-306,-297,-307,-308,-535,160,160,-264,160,-271,-309,-310,-232,-265,160,-266,-272,160,-274,-276,-291,-311,-313,-312,-314,160,160,160,-267,-273,-315,-317,-316,-318,-236,160,160,]),'SWITCH':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[161,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,161,161,-206,161,-452,-508,-529,-553,-175,161,-249,161,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,161,-516,-533,-559,161,161,-288,-285,-296,-289,-251,-534,-536,-231,-185,161,-234,-261,-263,-282,-306,-297,-307,-308,-535,161,161,-264,161,-271,-309,-310,-232,-265,161,-266,-272,161,-274,-276,-291,-311,-313,-312,-314,161,161,161,-267,-273,-315,-317,-316,-318,-236,161,161,]),'DO':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[162,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,162,162,-206,162,-452,-508,-529,-553,-175,162,-249,162,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,162,-516,-533,-559,162,162,-288,-285,-296,-289,-251,-534,-536,-231,-185,162,-234,-261,-263,-282,-306,-297,-307,-308,-535,162,162,-264,162,-271,-309,-310,-232,-265,162,-266,-272,162,-274,-276,-291,-311,-313,-312,-314,162,162,162,-267,-273,-315,-317,-316,-318,-236,162,162,]),'BREAK':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[163,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,163,163,-206,163,-452,-508,-529,-553,-175,163,-249,163,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,163,-516,-533,-559,163,163,-288,-285,-296,-289,-251,-534,-536,-231,-185,163,-234,-261,-263,-282,-306,-297,-307,-308,-535,163,163,-264,163,-271,-309,-310,-232,-265,163,-266,-272,163,-274,-276,-291,-311,-313,-312,-314,163,163,163,-267,-273,-315,-317,-316,-318,-236,163,163,]),'CONTINUE':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[165,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,165,165,-206,165,-452,-508,-529,-553,-175,165,-249,165,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,165,-516,-533,-559,165,165,-288,-285,-296,-289,-251,-534,-536,-231,-185,165,-234,-261,-263,-282,-306,-297,-307,-308,-535,165,165,-264,165,-271,-309,-310,-232,-265,165,-266,-272,165,-274,-276,-291,-311,-313,-312,-314,165,165,165,-267,-273,-315,-317,-316,-318,-236,165,165,]),'RETURN':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[166,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,166,166,-206,166,-452,-508,-529,-553,-175,166,-249,166,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,166,-516,-533,-559,166,166,-288,-285,-296,-289,-251,-534,-536,-231,-185,166,-234,-261,-263,-282,-306,-297,-307,-308,-535,166,166,-264,166,-271,-309,-310,-232,-265,166,-266,-272,166,-274,-276,-291,-311,-313,-312,-314,166,166,166,-267,-273,-315,-317,-316,-318,-236,166,166,]),'THROW':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[168,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,168,168,-206,168,-452,-508,-529,-553,-175,168,-249,168,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,168,-516,-533,-559,168,168,-288,-285,-296,-289,-251,-534,-536,-231,-185,168,-234,-261,-263,-282,-306,-297,-307,-308,-535,168,168,-264,168,-271,-309,-310,-232,-265,168,-266,-272,168,-274,-276,-291,-311,-313,-312,-314,168,168,168,-267,-273,-315,-317,-316,-318,-236,168,168,]),'TRY':([4,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,206,208,210,212,330,338,343,348,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,681,693,696,708,809,810,821,822,825,826,833,876,879,922,924,933,934,940,941,944,945,948,953,954,987,1021,1022,1029,1031,1033,1043,1044,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1135,1136,1138,1139,1140,1142,1143,1144,1145,1157,1158,1162,],[169,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,169,169,-206,169,-452,-508,-529,-553,-175,169,-249,169,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,169,-516,-533,-559,169,169,-288,-285,-296,-289,-251,-534,-536,-231,-185,169,-234,-261,-263,-282,-306,-297,-307,-308,-535,169,169,-264,169,-271,-309,-310,-232,-265,169,-266,-272,169,-274,-276,-291,-311,-313,-312,-314,169,169,169,-267,-273,-315,-317,-316,-318,-236,169,169,]),'<':([4,21,22,23,24,25,27,32,33,34,35,36,37,38,39,40,41,42,47,48,49,50,51,54,60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,83,84,86,87,88,89,90,91,105,106,107,108,111,112,113,114,117,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,154,157,159,162,164,184,185,186,189,197,200,203,206,207,208,209,210,212,213,234,236,237,240,241,256,257,265,267,274,275,276,284,285,286,289,290,291,292,293,296,297,306,309,326,327,328,329,330,337,338,340,343,348,350,351,355,357,366,371,374,375,388,391,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,418,419,422,425,426,427,428,429,430,431,432,433,434,435,437,438,445,452,453,454,456,457,458,460,475,476,477,478,486,489,491,492,493,495,499,501,502,503,504,505,507,516,518,541,566,567,568,569,570,573,574,575,577,592,593,594,595,596,597,598,599,600,601,602,603,611,618,625,628,629,630,634,635,636,638,639,641,642,644,663,673,677,678,679,680,681,684,685,686,693,694,696,708,709,710,720,721,728,736,737,738,739,740,753,759,760,761,762,763,764,765,766,781,782,783,784,785,786,787,788,791,792,793,796,797,800,801,809,810,815,816,821,822,825,826,833,850,862,869,876,879,904,906,915,917,922,924,933,934,940,941,944,945,948,953,954,973,974,987,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1021,1022,1028,1029,1031,1033,1043,1044,1082,1083,1084,1086,1087,1089,1090,1091,1093,1101,1102,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1131,1132,1133,1134,1135,1136,1138,1139,1140,1142,1143,1144,1145,1153,1157,1158,1162,],[190,-447,-448,-449,-450,-353,-358,-355,-356,-357,-359,-360,-361,-362,-363,-364,-365,-366,-584,-585,-586,228,228,-594,-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,190,-343,-345,-346,-347,-348,-349,-350,315,-63,-77,-88,-96,-107,-108,-111,-122,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,190,190,-206,190,-343,-383,-352,378,190,-451,-354,-343,-452,-624,-508,-624,-529,-553,-624,-588,-118,-119,-134,-135,190,190,-117,529,-131,-132,-133,554,-81,-91,-100,-112,-113,-116,-123,-126,190,-383,190,-109,-110,-120,-121,-175,-383,190,614,-249,190,-167,-205,-277,-279,-286,190,190,190,666,-383,-624,-352,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-358,228,-501,-351,-624,-352,-519,-521,-522,-523,-524,-525,-526,-527,-528,228,-351,-624,-624,-352,-562,-565,-566,-567,228,228,-456,-512,228,614,-341,-131,-132,-133,529,190,-328,-147,-148,-149,-344,-343,-145,190,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-228,-343,-383,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-384,228,-466,-470,-483,-484,190,-343,-502,-503,-516,-520,-533,-559,-563,-564,-587,-595,-145,-150,-330,-331,-332,-162,-383,-83,-85,-87,-93,-95,-102,-104,-106,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-384,-221,190,190,190,190,-288,-285,-296,-289,-251,965,-384,-343,-534,-536,-163,-159,-337,-624,-231,-185,190,-234,-261,-263,-282,-306,-297,-307,-308,-500,-482,-535,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,190,190,190,-264,190,-271,-309,-310,-624,-223,-222,-224,-218,-319,-323,-624,-232,-265,190,-266,-272,190,-274,-276,-291,-311,-313,-312,-314,-624,-322,-161,-324,190,190,190,-267,-273,-315,-317,-316,-318,-321,-236,190,190,]),'}':([21,22,23,24,47,48,49,54,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,157,159,171,172,186,187,197,203,206,207,208,209,210,211,212,213,234,236,237,240,241,260,261,265,273,277,278,279,280,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,330,337,343,347,348,349,350,351,355,357,366,377,379,381,382,384,385,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,419,424,425,426,427,428,429,430,431,432,433,434,435,439,440,441,442,443,444,445,446,447,451,452,453,454,456,457,458,485,486,487,488,490,491,492,493,496,498,501,502,503,504,505,507,510,511,512,515,516,541,566,567,568,569,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,611,628,629,630,634,635,636,638,639,641,642,644,662,663,665,667,668,677,678,679,680,681,685,686,693,694,696,697,698,699,700,701,702,703,704,705,707,708,709,710,720,721,724,725,726,727,728,736,737,738,739,740,745,746,747,748,749,750,751,752,754,756,757,758,759,760,761,762,763,764,765,766,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,794,796,797,801,807,808,821,822,825,826,846,847,851,852,854,855,858,860,866,876,877,878,879,892,893,894,895,904,906,910,911,912,913,914,915,917,922,924,934,940,941,942,944,945,948,953,954,967,968,969,973,974,987,988,997,998,1002,1004,1005,1007,1008,1009,1011,1012,1013,1014,1015,1016,1017,1018,1029,1030,1031,1032,1033,1043,1044,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1088,1089,1090,1091,1093,1101,1102,1103,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1124,1125,1126,1131,1132,1133,1134,1139,1140,1142,1143,1144,1145,1146,1148,1150,1153,1157,],[-447,-448,-449,-450,-584,-585,-586,-594,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-624,-206,-378,-379,-380,-381,-451,-343,-452,-624,-508,-624,-529,-624,-553,-624,-588,-118,-119,-134,-135,-155,-156,-117,-22,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-175,-383,-249,628,-165,-166,-167,-205,-277,-279,-286,-385,-389,-391,-392,-398,-399,677,-467,-468,-469,-471,-472,-473,-474,-475,-476,-477,-478,-479,-480,-481,-501,693,-517,-518,-519,-521,-522,-523,-524,-525,-526,-527,-528,696,-624,-624,-550,-551,-537,-624,-540,-624,708,-560,-561,-562,-565,-566,-567,-574,-575,-576,-577,726,-131,-132,-133,-7,-26,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-386,-384,-400,-417,-418,-466,-470,-483,-484,-624,-502,-503,-516,-520,-533,876,-551,-624,879,-552,-539,-541,-543,-544,-542,-559,-563,-564,-587,-595,893,894,-581,-582,-145,-150,-330,-331,-332,-162,-29,-34,-39,-44,-49,-55,-57,-61,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-624,-338,-334,-221,-183,-184,-288,-285,-296,-289,-390,-393,-401,-402,-404,-405,-419,-420,973,-534,987,-538,-536,997,-579,-580,-21,-163,-159,1011,1012,-214,-215,-219,-337,-624,-231,-185,-234,-261,-263,1029,-282,-306,-297,-307,-308,-406,-421,-422,-500,-482,-535,-545,-578,-583,-226,-225,-160,-24,-23,-227,-216,-217,1087,-624,-320,-326,-327,-624,-264,1101,1104,-268,-271,-309,-310,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-220,-319,-323,-624,-232,-265,1139,-269,-266,-272,-270,-274,-276,-291,-311,-313,-312,-314,-412,-425,-426,-624,-322,-161,-324,-267,-273,-315,-317,-316,-318,-409,-427,-428,-321,-236,]),'EXTENDS':([43,44,46,50,51,227,229,389,469,470,472,474,476,477,478,665,673,716,719,851,852,854,855,857,863,885,887,967,968,969,992,994,1053,1054,1056,1057,1059,1060,1062,1064,1077,1079,1124,1125,1126,1146,1148,1150,],[217,221,217,-455,-511,-454,-510,670,-430,-439,717,-429,-456,-512,-558,-400,-555,-441,-557,-401,-402,-404,-405,970,-556,-440,-442,-406,-421,-422,-443,-444,-407,-408,-410,-411,1127,-403,-423,-424,-445,-446,-412,-425,-426,-409,-427,-428,]),'IMPLEMENTS':([43,45,46,50,70,71,186,203,214,215,216,226,227,305,306,377,381,382,384,385,462,463,469,470,475,476,478,505,662,665,667,668,673,716,718,719,800,847,851,852,854,855,858,860,863,885,887,967,968,969,992,994,1053,1054,1056,1057,1060,1062,1064,1077,1079,1124,1125,1126,1146,1148,1150,],[-624,225,-624,-455,-341,-342,-380,-343,225,-457,-458,225,-454,-381,-383,-385,-391,-392,-398,-399,-459,-382,-430,-439,-531,-456,-558,-344,-386,-400,-417,-418,-555,-441,-532,-557,-384,-393,-401,-402,-404,-405,-419,-420,-556,-440,-442,-406,-421,-422,-443,-444,-407,-408,-410,-411,-403,-423,-424,-445,-446,-412,-425,-426,-409,-427,-428,]),')':([47,48,49,54,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,117,171,172,173,174,175,176,177,178,179,186,187,203,234,235,236,237,240,241,260,261,265,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,289,290,291,292,293,296,305,306,307,326,327,328,329,334,337,340,369,370,377,379,381,382,384,385,421,423,459,479,480,481,482,483,484,485,486,487,488,489,491,492,493,495,496,498,501,502,503,504,505,507,510,511,512,515,516,517,519,541,542,543,544,566,567,568,569,570,573,574,575,577,579,581,582,583,584,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,606,607,609,610,612,615,624,632,637,645,646,649,650,651,653,654,662,663,665,667,668,677,687,688,689,690,692,706,711,720,721,726,728,733,735,736,737,738,739,740,741,745,746,747,748,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,791,792,793,796,797,798,799,800,801,803,807,808,827,829,830,836,837,838,839,842,843,846,847,851,852,854,855,858,860,871,880,889,891,893,894,895,897,898,899,900,901,903,904,906,908,909,915,916,917,918,919,920,938,943,946,950,957,958,959,960,961,962,963,964,967,968,969,975,976,982,983,991,997,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1014,1015,1016,1017,1018,1019,1026,1041,1047,1048,1051,1052,1053,1054,1056,1057,1060,1062,1064,1066,1070,1076,1081,1082,1083,1084,1086,1087,1089,1090,1091,1092,1095,1097,1098,1099,1100,1112,1114,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,1159,1161,],[-584,-585,-586,-594,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-369,-370,-371,-372,-373,-374,-375,-376,-377,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-207,-208,-209,-210,-211,-212,-213,-380,-381,-343,-588,-624,-118,-119,-134,-135,-155,-156,-117,516,541,-624,-2,-5,-6,-22,-131,-132,-133,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-381,-383,-624,-109,-110,-120,-121,-624,-383,613,-624,-624,-385,-389,-391,-392,-398,-399,-624,-624,-624,720,721,-589,-590,-596,-591,-574,-575,-576,-577,-341,-131,-132,-133,728,-7,-26,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,-624,743,-146,767,-153,-154,-114,-115,-124,-125,-329,-152,-339,-335,-340,-624,801,-546,-547,-548,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-182,-153,-387,-388,809,810,-242,818,820,-624,-301,833,834,835,-624,-624,-386,-384,-400,-417,-418,-466,872,-488,-489,-490,875,-624,881,-587,-595,-581,-145,-624,-624,-150,-330,-331,-332,-162,902,-29,-34,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-624,-151,-333,-336,-338,-334,-624,917,-384,-221,-624,-183,-184,949,-299,-300,955,956,-624,-624,-624,-624,-390,-393,-401,-402,-404,-405,-419,-420,-487,988,-592,-593,-579,-580,-21,-624,-624,1002,-624,1004,-624,-163,-159,1009,-624,-337,1014,-624,-549,1018,-624,-243,1036,1037,-302,1045,1046,-624,-624,1049,1050,-624,-624,-406,-421,-422,-506,-486,-491,-492,-570,-578,-624,1082,1083,-226,1084,-225,-160,1085,-24,-23,-227,1086,-216,-217,-624,-320,-326,-327,-624,1091,-624,-304,1117,1118,1121,1122,-407,-408,-410,-411,-403,-423,-424,-505,-493,-569,1131,-624,-223,-222,-224,-218,-319,-323,-624,1135,1136,1138,-246,-247,-248,-292,-305,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,-624,1162,]),',':([47,48,49,54,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,171,172,173,174,175,176,177,178,179,186,187,203,211,234,236,237,240,241,260,261,265,273,277,278,279,280,281,282,283,284,285,286,289,290,291,292,293,296,305,306,326,327,328,329,331,332,333,334,337,346,376,377,379,381,382,383,384,385,386,387,388,389,390,391,392,441,444,446,447,463,464,465,466,467,471,472,473,474,481,484,485,486,487,488,490,491,492,493,496,498,501,502,503,504,505,507,510,511,512,515,516,541,544,566,567,568,569,570,573,574,575,577,582,584,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,606,607,608,609,610,622,624,662,663,665,667,668,669,677,688,690,702,703,704,705,707,720,721,724,726,727,728,736,737,738,739,740,745,746,747,748,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,794,796,797,800,801,805,806,807,808,812,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,867,868,878,883,884,886,888,889,891,893,894,895,904,906,911,914,915,917,918,936,937,938,967,968,969,982,983,988,993,995,997,998,1002,1004,1005,1007,1008,1009,1011,1012,1014,1015,1016,1017,1018,1027,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1067,1068,1069,1070,1078,1080,1082,1083,1084,1086,1087,1088,1089,1090,1091,1100,1124,1125,1126,1131,1132,1133,1134,1146,1147,1148,1149,1150,1151,1152,1153,],[-584,-585,-586,-594,-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-207,-208,-209,-210,-211,-212,-213,-380,-381,-343,440,-588,-118,-119,-134,-135,-155,-156,-117,-22,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-381,-383,-109,-110,-120,-121,604,-178,-180,-624,-383,-387,-388,-385,-389,-391,-392,664,-398,-399,-394,-396,-380,-413,-397,-383,-381,699,-537,-540,-624,-382,714,-463,-465,714,715,-433,-431,-429,722,-591,-574,-575,-576,-577,725,-131,-132,-133,-7,-26,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,-146,-154,-114,-115,-124,-125,-329,-152,-339,-335,-340,802,-548,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-182,-153,604,-387,-388,814,-242,-386,-384,-400,-417,-418,-414,-466,873,-490,-539,-541,-543,-544,-542,-587,-595,892,-581,-582,-145,-150,-330,-331,-332,-162,-29,-34,-39,-44,-49,-55,-57,-61,-383,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,912,-338,-334,-384,-221,-179,-181,-183,-184,-624,-390,-393,-395,-396,-380,-401,-402,966,-404,-405,-396,-413,-419,-415,-420,-416,-384,604,-624,-538,-624,-464,-432,-434,-592,-593,-579,-580,-21,-163,-159,1013,-219,-337,-624,-549,-182,-624,-243,-406,-421,-422,-491,-492,-545,-435,-436,-578,-583,-226,-225,-160,-24,-23,-227,-216,-217,-624,-320,-326,-327,-624,-182,-407,-408,1123,-410,-411,-396,-413,-403,-396,-423,-415,-424,-416,1129,-497,-499,-493,-437,-438,-624,-223,-222,-224,-218,-220,-319,-323,-624,814,-412,-425,-426,-624,-322,-161,-324,-409,-396,-427,-415,-428,-416,-498,-321,]),':':([57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,149,164,170,171,172,186,187,203,236,237,240,241,260,261,265,326,327,328,329,337,352,377,379,381,382,384,385,496,497,498,501,502,503,504,505,507,510,511,512,515,516,541,544,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,607,609,610,662,663,665,667,668,677,728,736,737,738,739,740,744,768,791,792,793,796,797,801,812,846,847,851,852,854,855,858,860,895,904,906,915,917,930,936,937,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1027,1035,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1107,1108,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,338,-230,368,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,-109,-110,-120,-121,-383,631,-385,-389,-391,-392,-398,-399,-7,729,-26,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,-146,-154,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-153,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,905,907,-151,-333,-336,-338,-334,-221,-624,-390,-393,-401,-402,-404,-405,-419,-420,-21,-163,-159,-337,-624,1022,-252,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-253,1109,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,1140,-275,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),']':([57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,171,172,186,187,203,236,237,240,241,259,260,261,265,300,326,327,328,329,337,377,379,381,382,384,385,496,498,501,502,503,504,505,507,509,510,511,512,513,514,515,516,541,570,573,574,575,576,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,791,792,793,795,796,797,801,846,847,851,852,854,855,858,860,895,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-1,-3,-4,-119,-20,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,-343,-118,-119,-134,-135,510,-155,-156,-117,510,-109,-110,-120,-121,-383,-385,-389,-391,-392,-398,-399,-7,-26,-328,-147,-148,-149,-344,-343,737,-158,-157,-31,738,739,-36,-145,-146,-329,-152,-339,-335,796,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,-151,-333,-336,915,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-21,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'/':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,108,111,112,113,114,117,236,237,240,241,265,267,274,275,276,286,289,290,291,292,293,296,326,327,328,329,340,486,489,491,492,493,495,501,502,503,504,505,507,516,541,566,567,568,569,570,573,574,575,577,599,600,601,602,603,677,728,736,737,738,739,740,753,762,763,764,765,766,784,785,786,787,788,791,792,793,796,797,801,904,906,915,917,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1133,1134,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,324,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,539,-131,-132,-133,564,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,539,539,-341,-131,-132,-133,539,-328,-147,-148,-149,-344,-343,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,324,324,-97,-98,-99,-466,-145,-150,-330,-331,-332,-162,-128,324,324,-102,-104,-106,324,324,-101,-103,-105,-151,-333,-336,-338,-334,-221,-163,-159,-337,-624,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-161,-324,-321,]),'%':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,108,111,112,113,114,117,236,237,240,241,265,267,274,275,276,286,289,290,291,292,293,296,326,327,328,329,340,486,489,491,492,493,495,501,502,503,504,505,507,516,541,566,567,568,569,570,573,574,575,577,599,600,601,602,603,677,728,736,737,738,739,740,753,762,763,764,765,766,784,785,786,787,788,791,792,793,796,797,801,904,906,915,917,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1133,1134,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,325,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,540,-131,-132,-133,565,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,540,540,-341,-131,-132,-133,540,-328,-147,-148,-149,-344,-343,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,325,325,-97,-98,-99,-466,-145,-150,-330,-331,-332,-162,-128,325,325,-102,-104,-106,325,325,-101,-103,-105,-151,-333,-336,-338,-334,-221,-163,-159,-337,-624,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-161,-324,-321,]),'LSHIFT':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,106,107,108,111,112,113,114,117,236,237,240,241,265,267,274,275,276,284,285,286,289,290,291,292,293,296,326,327,328,329,340,486,489,491,492,493,495,501,502,503,504,505,507,516,541,566,567,568,569,570,573,574,575,577,592,593,594,595,596,597,598,599,600,601,602,603,677,728,736,737,738,739,740,753,754,756,757,758,759,760,761,762,763,764,765,766,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,904,906,915,917,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1133,1134,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,318,-77,-88,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,533,-131,-132,-133,558,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,533,533,-341,-131,-132,-133,533,-328,-147,-148,-149,-344,-343,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,318,318,318,318,-78,-79,-80,-89,-90,-97,-98,-99,-466,-145,-150,-330,-331,-332,-162,-128,318,318,318,318,-83,-85,-87,-93,-95,-102,-104,-106,318,318,318,318,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-163,-159,-337,-624,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-161,-324,-321,]),'RSHIFT':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,106,107,108,111,112,113,114,117,171,172,203,236,237,240,241,260,261,265,267,274,275,276,284,285,286,289,290,291,292,293,296,326,327,328,329,340,377,379,381,382,384,385,391,392,486,489,491,492,493,495,501,502,503,504,505,507,510,511,516,541,566,567,568,569,570,573,574,575,577,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,665,667,668,677,728,736,737,738,739,740,753,754,756,757,758,759,760,761,762,763,764,765,766,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,850,851,852,854,855,856,857,858,860,862,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1147,1148,1149,1150,1151,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,319,-77,-88,-96,-107,-108,-111,-122,-378,-379,-343,-118,-119,-134,-135,-155,-156,-117,534,-131,-132,-133,559,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,534,-385,-389,-391,-392,-398,-399,-383,-381,534,-341,-131,-132,-133,534,-328,-147,-148,-149,-344,-343,-158,-157,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,319,319,319,319,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,-128,319,319,319,319,-83,-85,-87,-93,-95,-102,-104,-106,319,319,319,319,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-380,-401,-402,-404,-405,967,968,-419,-420,-384,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,967,968,-403,967,-423,967,-424,967,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,967,-427,967,-428,967,-321,]),'RRSHIFT':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,106,107,108,111,112,113,114,117,171,172,203,236,237,240,241,260,261,265,267,274,275,276,284,285,286,289,290,291,292,293,296,326,327,328,329,340,377,379,381,382,384,385,391,392,486,489,491,492,493,495,501,502,503,504,505,507,510,511,516,541,566,567,568,569,570,573,574,575,577,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,665,667,668,677,728,736,737,738,739,740,753,754,756,757,758,759,760,761,762,763,764,765,766,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,850,851,852,854,855,858,860,862,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1058,1059,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1147,1148,1149,1150,1151,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,320,-77,-88,-96,-107,-108,-111,-122,-378,-379,-343,-118,-119,-134,-135,-155,-156,-117,535,-131,-132,-133,560,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,535,-385,-389,-391,-392,-398,-399,-383,-381,535,-341,-131,-132,-133,535,-328,-147,-148,-149,-344,-343,-158,-157,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,320,320,320,320,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,-128,320,320,320,320,-83,-85,-87,-93,-95,-102,-104,-106,320,320,320,320,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-380,-401,-402,-404,-405,-419,-420,-384,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,1124,1125,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,1124,-427,1124,-428,1124,-321,]),'>':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,105,106,107,108,111,112,113,114,117,171,172,203,236,237,240,241,260,261,265,267,274,275,276,284,285,286,289,290,291,292,293,296,326,327,328,329,340,346,376,377,378,379,381,382,384,385,387,388,389,391,392,472,474,486,489,491,492,493,495,501,502,503,504,505,507,510,511,516,541,566,567,568,569,570,573,574,575,577,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,665,666,667,668,677,728,736,737,738,739,740,753,759,760,761,762,763,764,765,766,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,849,850,851,852,854,855,856,857,858,859,860,861,862,888,904,906,915,917,965,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1080,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1147,1148,1149,1150,1151,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,314,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-343,-118,-119,-134,-135,-155,-156,-117,530,-131,-132,-133,555,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,530,-387,-388,-385,662,-389,-391,-392,-398,-399,665,-380,667,-383,-381,716,-429,530,-341,-131,-132,-133,530,-328,-147,-148,-149,-344,-343,-158,-157,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-400,662,-417,-418,-466,-145,-150,-330,-331,-332,-162,-383,-83,-85,-87,-93,-95,-102,-104,-106,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,665,-380,-401,-402,-404,-405,665,667,-419,665,-420,665,-384,665,-163,-159,-337,-624,662,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,665,667,-403,665,-423,665,-424,665,665,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,665,-427,665,-428,665,-321,]),'GTEQ':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,105,106,107,108,111,112,113,114,117,236,237,240,241,265,267,274,275,276,284,285,286,289,290,291,292,293,296,326,327,328,329,340,486,489,491,492,493,495,501,502,503,504,505,507,516,541,566,567,568,569,570,573,574,575,577,592,593,594,595,596,597,598,599,600,601,602,603,677,728,736,737,738,739,740,759,760,761,762,763,764,765,766,781,782,783,784,785,786,787,788,791,792,793,796,797,801,904,906,915,917,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1133,1134,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,316,-63,-77,-88,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,531,-131,-132,-133,556,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,531,531,-341,-131,-132,-133,531,-328,-147,-148,-149,-344,-343,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-466,-145,-150,-330,-331,-332,-162,-83,-85,-87,-93,-95,-102,-104,-106,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-163,-159,-337,-624,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-161,-324,-321,]),'LTEQ':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,105,106,107,108,111,112,113,114,117,236,237,240,241,265,267,274,275,276,284,285,286,289,290,291,292,293,296,326,327,328,329,340,486,489,491,492,493,495,501,502,503,504,505,507,516,541,566,567,568,569,570,573,574,575,577,592,593,594,595,596,597,598,599,600,601,602,603,677,728,736,737,738,739,740,759,760,761,762,763,764,765,766,781,782,783,784,785,786,787,788,791,792,793,796,797,801,904,906,915,917,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1133,1134,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,317,-63,-77,-88,-96,-107,-108,-111,-122,-118,-119,-134,-135,-117,532,-131,-132,-133,557,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,532,532,-341,-131,-132,-133,532,-328,-147,-148,-149,-344,-343,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-466,-145,-150,-330,-331,-332,-162,-83,-85,-87,-93,-95,-102,-104,-106,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-163,-159,-337,-624,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-161,-324,-321,]),'INSTANCEOF':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,104,105,106,107,108,111,112,113,114,117,171,172,186,187,203,236,237,240,241,260,261,265,267,274,275,276,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,337,340,377,379,381,382,384,385,486,489,491,492,493,495,501,502,503,504,505,507,510,511,516,541,566,567,568,569,570,573,574,575,577,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,313,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,528,-131,-132,-133,553,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-383,528,-385,-389,-391,-392,-398,-399,528,-341,-131,-132,-133,528,-328,-147,-148,-149,-344,-343,-158,-157,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,313,313,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,313,313,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,313,313,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'EQ':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,103,104,105,106,107,108,111,112,113,114,117,171,172,186,187,203,236,237,240,241,260,261,265,267,274,275,276,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,337,340,377,379,381,382,384,385,486,489,491,492,493,495,501,502,503,504,505,507,510,511,516,541,566,567,568,569,570,573,574,575,577,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,311,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,526,-131,-132,-133,551,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-383,526,-385,-389,-391,-392,-398,-399,526,-341,-131,-132,-133,526,-328,-147,-148,-149,-344,-343,-158,-157,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,311,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,311,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,311,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'NEQ':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,103,104,105,106,107,108,111,112,113,114,117,171,172,186,187,203,236,237,240,241,260,261,265,267,274,275,276,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,337,340,377,379,381,382,384,385,486,489,491,492,493,495,501,502,503,504,505,507,510,511,516,541,566,567,568,569,570,573,574,575,577,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,312,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,527,-131,-132,-133,552,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-383,527,-385,-389,-391,-392,-398,-399,527,-341,-131,-132,-133,527,-328,-147,-148,-149,-344,-343,-158,-157,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,312,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,312,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,312,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'&':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,171,172,186,187,203,236,237,240,241,260,261,265,267,274,275,276,280,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,337,340,377,379,381,382,384,385,388,391,392,486,489,491,492,493,495,501,502,503,504,505,507,510,511,516,541,566,567,568,569,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,748,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,862,888,904,906,915,917,967,968,969,993,995,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1078,1080,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,310,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,525,-131,-132,-133,550,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-383,525,-385,-389,-391,-392,-398,-399,-380,-383,-381,525,-341,-131,-132,-133,525,-328,-147,-148,-149,-344,-343,-158,-157,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,310,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,310,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,310,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-384,996,-163,-159,-337,-624,-406,-421,-422,996,-436,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-437,-438,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'^':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,171,172,186,187,203,236,237,240,241,260,261,265,267,274,275,276,279,280,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,337,340,377,379,381,382,384,385,486,489,491,492,493,495,501,502,503,504,505,507,510,511,515,516,541,566,567,568,569,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,747,748,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,308,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,524,-131,-132,-133,549,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-383,524,-385,-389,-391,-392,-398,-399,524,-341,-131,-132,-133,524,-328,-147,-148,-149,-344,-343,-158,-157,308,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,308,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,308,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'|':([60,62,63,64,65,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,111,112,113,114,117,156,171,172,186,187,203,236,237,240,241,260,261,265,267,274,275,276,278,279,280,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,336,337,340,377,379,381,382,384,385,486,489,491,492,493,495,501,502,503,504,505,507,510,511,512,515,516,541,566,567,568,569,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,746,747,748,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1039,1040,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1141,1146,1148,1150,1153,],[-119,-127,-128,-129,-130,-136,-137,-138,-341,-342,266,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-369,-370,-371,-372,-373,-374,-375,-376,-377,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-368,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,523,-131,-132,-133,548,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-367,-383,523,-385,-389,-391,-392,-398,-399,523,-341,-131,-132,-133,523,-328,-147,-148,-149,-344,-343,-158,-157,266,-36,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,266,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,266,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,1113,-294,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-295,-409,-427,-428,-321,]),'AND':([60,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,171,172,186,187,203,236,237,240,241,260,261,265,267,274,275,276,277,278,279,280,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,337,340,377,379,381,382,384,385,486,489,491,492,493,495,498,501,502,503,504,505,507,510,511,512,515,516,541,566,567,568,569,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,745,746,747,748,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-119,-127,-128,-129,-130,262,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,522,-131,-132,-133,547,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-383,522,-385,-389,-391,-392,-398,-399,522,-341,-131,-132,-133,522,262,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,262,-34,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,262,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'?':([60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,171,172,186,187,190,203,236,237,240,241,260,261,265,267,273,274,275,276,277,278,279,280,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,337,340,377,378,379,381,382,384,385,486,489,491,492,493,495,498,501,502,503,504,505,507,510,511,512,515,516,529,541,566,567,568,569,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,664,665,666,667,668,677,728,736,737,738,739,740,745,746,747,748,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,904,906,915,917,965,966,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1123,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-119,254,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,389,-343,-118,-119,-134,-135,-155,-156,-117,520,545,-131,-132,-133,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-383,520,-385,389,-389,-391,-392,-398,-399,520,-341,-131,-132,-133,520,-26,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,389,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,389,-400,857,-417,-418,-466,-145,-150,-330,-331,-332,-162,-29,-34,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-163,-159,-337,-624,1059,857,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,1059,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'OR':([60,61,62,63,64,65,66,67,68,69,70,71,73,74,75,76,77,78,79,84,85,86,87,88,89,90,91,102,103,104,105,106,107,108,111,112,113,114,117,171,172,186,187,203,236,237,240,241,260,261,265,267,273,274,275,276,277,278,279,280,281,282,283,284,285,286,289,290,291,292,293,296,326,327,328,329,337,340,377,379,381,382,384,385,486,489,491,492,493,495,498,501,502,503,504,505,507,510,511,512,515,516,541,566,567,568,569,570,573,574,575,577,585,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,609,610,662,663,665,667,668,677,728,736,737,738,739,740,745,746,747,748,749,750,751,752,753,754,756,757,758,759,760,761,762,763,764,765,766,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,791,792,793,796,797,801,846,847,851,852,854,855,858,860,904,906,915,917,967,968,969,1002,1004,1005,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1133,1134,1146,1148,1150,1153,],[-119,255,-127,-128,-129,-130,-25,-136,-137,-138,-341,-342,-30,-139,-140,-141,-142,-143,-144,-343,-35,-345,-346,-347,-348,-349,-350,-40,-45,-50,-58,-63,-77,-88,-96,-107,-108,-111,-122,-378,-379,-380,-381,-343,-118,-119,-134,-135,-155,-156,-117,521,546,-131,-132,-133,-27,-32,-37,-42,-47,-53,-60,-68,-81,-91,-100,-112,-113,-116,-123,-126,-109,-110,-120,-121,-383,521,-385,-389,-391,-392,-398,-399,521,-341,-131,-132,-133,521,-26,-328,-147,-148,-149,-344,-343,-158,-157,-31,-36,-145,-146,-114,-115,-124,-125,-329,-152,-339,-335,-340,-41,-46,-51,-52,-59,-64,-65,-66,-67,-78,-79,-80,-89,-90,-97,-98,-99,-387,-388,-386,-384,-400,-417,-418,-466,-145,-150,-330,-331,-332,-162,-29,-34,-39,-44,-49,-55,-57,-61,-128,-70,-72,-74,-76,-83,-85,-87,-93,-95,-102,-104,-106,-28,-33,-38,-43,-48,-54,-56,-62,-69,-71,-73,-75,-82,-84,-86,-92,-94,-101,-103,-105,-151,-333,-336,-338,-334,-221,-390,-393,-401,-402,-404,-405,-419,-420,-163,-159,-337,-624,-406,-421,-422,-226,-225,-160,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-161,-324,-409,-427,-428,-321,]),'=':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,203,240,241,260,261,267,274,275,276,333,334,340,345,489,495,501,502,503,504,505,507,510,511,516,541,544,570,573,574,575,577,606,607,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,812,831,868,883,890,915,917,936,937,939,952,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1027,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[242,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,242,-343,-134,-135,-155,-156,-128,-127,-129,-130,605,-624,-128,-128,723,-128,-328,-147,-148,-149,-344,-343,-158,-157,-145,-146,-154,-329,-152,-339,-335,-340,-182,-153,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-624,951,-624,-624,723,-337,-624,-182,-624,-128,1042,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-182,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'TIMES_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[243,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,243,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'DIVIDE_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[244,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,244,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'REMAINDER_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[245,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,245,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'PLUS_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[246,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,246,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'MINUS_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[247,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,247,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'LSHIFT_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[248,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,248,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'RSHIFT_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[249,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,249,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'RRSHIFT_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[250,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,250,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'AND_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[251,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,251,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'OR_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[252,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,252,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'XOR_ASSIGN':([60,62,63,64,65,67,68,69,70,71,74,75,76,77,78,79,84,86,87,88,89,90,91,164,176,177,178,179,180,183,184,188,240,241,267,274,275,276,340,345,495,501,502,503,504,505,507,516,541,570,573,574,575,577,613,618,625,626,652,658,659,660,677,736,737,738,739,791,792,793,796,797,801,915,917,939,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1082,1083,1084,1086,1087,1089,1090,1091,1131,1132,1134,1153,],[253,-127,-128,-129,-130,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,-343,-345,-346,-347,-348,-349,-350,-343,-129,-130,-143,-141,-140,-127,-128,253,-134,-135,-128,-127,-129,-130,-128,-128,-128,-328,-147,-148,-149,-344,-343,-145,-146,-329,-152,-339,-335,-340,-145,-343,-128,-127,-329,-328,-148,-147,-466,-150,-330,-331,-332,-151,-333,-336,-338,-334,-221,-337,-624,-128,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-624,-223,-222,-224,-218,-319,-323,-624,-624,-322,-324,-321,]),'.':([62,63,67,68,69,70,71,74,75,76,77,78,79,81,82,84,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,155,164,178,179,180,181,183,184,187,202,203,204,234,258,260,261,267,269,274,298,305,306,337,340,345,346,376,377,381,382,384,385,391,392,395,400,486,489,491,495,501,502,503,504,505,507,510,511,516,517,519,541,543,570,573,574,575,577,613,618,625,626,627,652,658,659,660,662,663,665,667,668,677,684,728,736,737,738,739,753,755,791,792,793,796,797,800,801,847,851,852,854,855,858,860,862,869,915,917,939,967,968,969,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1134,1146,1148,1150,1153,],[256,257,-136,-137,-138,-341,-342,-139,-140,-141,-142,-143,-144,297,299,-343,-345,-346,-347,-348,-349,-350,-369,-370,-371,-372,-373,-374,-375,-376,-377,299,-343,-143,-141,-140,371,374,375,380,397,-343,399,397,508,-155,-156,518,299,256,572,580,397,397,518,375,572,508,-385,-391,-392,-398,-399,397,672,397,676,518,-341,256,518,-328,-147,-148,-149,-344,-343,-158,-157,-145,742,508,-146,572,-329,-152,-339,-335,-340,-145,-343,815,816,371,-329,-328,-148,-147,-386,397,-400,-417,-418,-466,-343,-145,-150,-330,-331,-332,518,299,-151,-333,-336,-338,-334,397,-221,-393,-401,-402,-404,-405,-419,-420,397,-343,-337,-624,1028,-406,-421,-422,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-324,-409,-427,-428,-321,]),'[':([63,67,68,70,71,74,75,76,77,78,79,82,84,86,87,88,89,90,91,93,94,95,96,97,98,99,100,101,155,164,178,179,180,184,186,187,203,260,261,267,269,301,302,305,306,334,336,337,340,345,377,381,382,384,385,391,392,393,486,489,495,501,502,503,504,505,507,510,511,516,517,541,570,573,574,575,577,613,618,625,652,658,659,660,662,663,665,667,668,677,684,728,736,737,738,739,753,755,791,792,793,796,797,800,801,812,847,851,852,854,855,858,860,862,868,869,875,881,883,903,915,917,937,939,967,968,969,1002,1004,1009,1011,1012,1014,1015,1016,1017,1018,1053,1054,1056,1057,1060,1062,1064,1082,1083,1084,1086,1087,1089,1090,1091,1124,1125,1126,1131,1132,1134,1146,1148,1150,1153,],[259,263,264,-341,-342,-139,-140,-141,-142,-143,-144,300,-343,-345,-346,-347,-348,-349,-350,-369,-370,-371,-372,-373,-374,-375,-376,-377,300,-343,-143,-141,-140,259,-380,300,-343,300,-156,259,300,576,576,-381,-383,300,300,300,259,259,-385,-391,-392,-398,-399,300,300,300,259,-341,259,-328,-147,-148,-149,-344,-343,-158,-157,-145,300,-146,-329,-152,576,-335,576,-145,-343,259,-329,-328,-148,-147,-386,300,-400,-417,-418,-466,-343,-145,-150,-330,-331,-332,259,300,-151,-333,-336,-338,-334,-384,-221,300,-393,-401,-402,-404,-405,-419,-420,300,300,-343,300,300,300,300,-337,-624,300,259,-406,-421,-422,-226,-225,-227,-216,-217,-624,-320,-326,-327,-624,-407,-408,-410,-411,-403,-423,-424,-624,-223,-222,-224,-218,-319,-323,-624,-412,-425,-426,-624,-322,-324,-409,-427,-428,-321,]),'ELLIPSIS':([70,71,93,94,95,96,97,98,99,100,101,156,171,172,186,187,203,260,261,336,337,377,379,381,382,384,385,505,510,511,609,610,662,663,665,667,668,846,847,851,852,854,855,858,860,874,967,968,969,1053,1054,1056,1057,1060,1062,1064,1124,1125,1126,1146,1148,1150,],[-341,-342,-369,-370,-371,-372,-373,-374,-375,-376,-377,-368,-378,-379,-380,-381,-343,-155,-156,-367,-383,-385,-389,-391,-392,-398,-399,-344,-158,-157,-387,-388,-386,-384,-400,-417,-418,-390,-393,-401,-402,-404,-405,-419,-420,984,-406,-421,-422,-407,-408,-410,-411,-403,-423,-424,-412,-425,-426,-409,-427,-428,]),'CASE':([119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,159,206,208,210,212,330,343,350,351,355,357,366,611,628,629,630,634,635,636,638,639,641,642,644,677,693,696,708,821,822,825,826,876,879,922,924,934,940,941,942,944,945,948,953,954,987,1029,1030,1031,1032,1033,1043,1044,1093,1101,1102,1103,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-206,-452,-508,-529,-553,-175,-249,-167,-205,-277,-279,-286,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,-516,-533,-559,-288,-285,-296,-289,-534,-536,-231,-185,-234,-261,-263,1034,-282,-306,-297,-307,-308,-535,-264,1034,1034,-268,-271,-309,-310,-232,-265,1034,-269,-266,-272,-270,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'DEFAULT':([119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,146,147,148,159,206,208,210,212,260,261,330,343,350,351,355,357,366,510,511,544,607,611,628,629,630,634,635,636,638,639,641,642,644,677,693,696,708,821,822,825,826,876,879,881,922,924,934,940,941,942,944,945,948,953,954,986,987,989,1029,1030,1031,1032,1033,1043,1044,1093,1101,1102,1103,1104,1105,1106,1109,1110,1111,1115,1116,1119,1120,1139,1140,1142,1143,1144,1145,1157,],[-169,-170,-171,-172,-173,-174,-262,-185,-186,-187,-188,-189,-190,-191,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-206,-452,-508,-529,-553,-155,-156,-175,-249,-167,-205,-277,-279,-286,-158,-157,-154,-153,-228,-164,-168,-260,-278,-280,-281,-283,-284,-287,-290,-624,-466,-516,-533,-559,-288,-285,-296,-289,-534,-536,-624,-231,-185,-234,-261,-263,1035,-282,-306,-297,-307,-308,-507,-535,1075,-264,1035,1035,-268,-271,-309,-310,-232,-265,1035,-269,-266,-272,-270,-274,-276,-291,-311,-313,-312,-314,-267,-273,-315,-317,-316,-318,-236,]),'ELSE':([126,136,137,138,139,140,141,142,143,144,145,146,147,148,159,351,355,357,366,628,630,634,635,636,638,639,641,642,644,821,822,825,826,923,924,925,926,927,928,929,940,941,944,945,948,953,954,1025,1029,1043,1044,1094,1101,1104,1110,1111,1115,1116,1119,1120,1139,1142,1143,1144,1145,1154,1155,1160,1163,],[-262,-192,-193,-194,-195,-196,-197,-198,-199,-200,-201,-202,-203,-204,-206,-205,-277,-279,-286,-164,-260,-278,-280,-281,-283,-284,-287,-290,-624,-288,-285,-296,-289,1021,-254,-255,-256,-257,-258,-259,-261,-263,-282,-306,-297,-307,-308,-250,-264,-309,-310,-229,-265,-266,-276,-291,-311,-313,-312,-314,-267,-315,-317,-316,-318,1158,-235,-233,-237,]),'THROWS':([260,261,510,511,544,607,872,875,985,986,],[-155,-156,-158,-157,-154,-153,981,-624,981,-507,]),'CATCH':([364,366,628,639,641,644,821,826,1111,],[643,-286,-164,643,-287,643,-288,643,-291,]),'FINALLY':([364,366,628,639,640,641,642,644,821,825,826,1111,],[-624,-286,-164,-289,823,-287,-290,-624,-288,823,-289,-291,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -16,7 +16,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'enum_body':([68,],[286,]),'name':([2,4,11,12,20,21,22,50,51,62,78,98,103,118,122,123,140,144,150,165,168,172,189,191,196,197,198,199,200,201,202,203,207,212,227,232,233,234,235,236,238,239,241,242,243,252,254,269,273,275,276,277,281,283,284,285,294,305,309,313,320,321,323,335,343,344,346,357,358,363,368,369,370,374,376,377,415,417,422,430,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,495,507,533,546,557,602,604,605,623,624,626,637,649,664,667,669,670,671,675,677,678,682,685,688,690,693,695,698,701,740,747,754,762,763,772,775,780,788,792,803,808,811,813,814,817,831,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,950,954,965,966,969,970,975,983,1000,1016,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1116,1124,1126,1127,1134,1139,1140,1141,1145,1158,1159,1162,],[6,124,6,6,6,224,6,6,246,6,302,312,316,330,6,6,6,353,360,224,330,124,381,6,6,6,6,6,6,6,6,411,6,6,224,6,6,6,6,6,6,6,6,6,6,6,6,6,6,224,6,6,360,6,6,6,224,224,552,576,224,316,581,6,612,6,6,360,648,6,124,6,330,6,381,6,679,6,6,224,6,360,6,6,704,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,360,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,224,316,360,360,552,360,6,6,6,6,6,360,360,381,381,381,854,381,6,6,6,6,6,6,224,6,6,6,224,6,6,6,224,360,124,360,360,552,381,360,6,6,330,6,6,360,6,958,6,330,6,6,6,6,6,6,6,6,552,6,6,330,6,6,360,6,381,381,381,381,6,6,224,381,124,6,330,6,6,648,330,6,958,6,552,124,124,360,381,381,381,224,330,330,6,330,330,958,330,]),'multiplicative_expression_not_name':([51,144,203,309,557,788,909,1080,],[247,247,247,247,247,247,247,247,]),'exclusive_or_expression':([2,122,123,140,191,201,202,207,212,239,243,276,277,335,344,346,363,369,374,377,417,422,460,461,462,463,469,471,487,488,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[7,7,7,7,7,7,7,7,7,7,7,7,498,7,7,7,7,7,7,7,7,7,7,7,7,721,727,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'package_declaration_name':([3,],[71,]),'annotation_type_member_declarations':([296,],[523,]),'conditional_or_expression':([2,122,123,140,191,201,212,239,243,276,335,344,346,363,369,374,377,417,422,460,487,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'type_arguments':([4,21,118,165,168,172,181,194,237,240,246,275,341,345,347,368,370,389,411,430,454,772,813,837,840,845,860,929,1022,1034,1038,1050,1094,1098,1139,1140,1145,1158,1162,],[119,227,119,227,119,119,375,403,429,436,444,495,610,616,436,119,119,375,444,690,403,119,119,429,403,119,375,119,119,119,119,403,119,119,119,119,119,119,119,]),'inclusive_or_expression_not_name':([51,144,203,309,557,788,909,1080,],[248,248,248,248,248,248,248,248,]),'annotation_type_declaration_header':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'constant_expression':([1024,],[1095,]),'static_import_on_demand_declaration':([3,70,86,289,],[105,105,105,105,]),'equality_expression':([2,122,123,140,191,196,201,202,207,212,238,239,243,276,277,335,344,346,363,369,374,377,417,422,449,458,460,461,462,463,469,471,481,487,488,489,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[48,48,48,48,48,48,48,48,48,48,431,48,48,48,48,48,48,48,48,48,48,48,48,48,708,48,48,48,48,48,48,48,48,48,48,743,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'type_declarations':([3,70,86,289,],[77,288,307,517,]),'qualified_name':([2,4,11,12,20,21,22,50,51,62,78,98,103,118,122,123,140,144,150,165,168,172,189,191,196,197,198,199,200,201,202,203,207,212,227,232,233,234,235,236,238,239,241,242,243,252,254,269,273,275,276,277,281,283,284,285,294,305,309,313,320,321,323,335,343,344,346,357,358,363,368,369,370,374,376,377,415,417,422,430,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,495,507,533,546,557,602,604,605,623,624,626,637,649,664,667,669,670,671,675,677,678,682,685,688,690,693,695,698,701,740,747,754,762,763,772,775,780,788,792,803,808,811,813,814,817,831,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,950,954,965,966,969,970,975,983,1000,1016,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1116,1124,1126,1127,1134,1139,1140,1141,1145,1158,1159,1162,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'enum_declaration':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[79,121,79,79,79,121,79,79,79,537,79,590,121,590,79,79,537,590,121,121,121,121,]),'conditional_and_expression':([2,122,123,140,191,201,202,212,239,243,276,335,344,346,363,369,374,377,417,422,460,461,487,488,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[15,15,15,15,15,15,410,15,15,15,15,15,15,15,15,15,15,15,15,15,15,719,15,742,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'argument_list_opt':([239,346,363,422,604,605,675,685,688,695,747,754,808,811,814,817,864,875,877,879,887,926,927,943,944,983,],[432,618,653,687,805,806,863,872,874,880,888,889,925,928,942,945,973,982,984,985,991,1030,1031,1040,1041,1071,]),'enum_constant_header_name':([287,760,],[509,509,]),'type_parameter':([311,791,],[571,915,]),'arguments_opt':([509,],[752,]),'annotation_name':([3,4,70,77,86,112,150,172,287,288,289,290,296,298,307,309,327,357,358,368,512,513,517,521,522,523,532,535,543,545,557,587,637,649,760,772,788,827,831,897,909,1022,1037,1080,1094,1098,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,]),'conditional_and_expression_not_name':([51,144,203,309,557,788,909,1080,],[253,253,253,253,253,253,253,253,]),'interface_type_list':([294,320,],[520,579,]),'empty_statement':([3,4,70,86,118,168,172,289,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[92,125,92,92,125,125,125,92,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,]),'for_update_opt':([1049,1159,],[1120,1161,]),'trailing_semicolon':([634,],[831,]),'enhanced_for_statement_header':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[118,118,118,118,118,118,118,929,118,929,118,929,118,118,118,929,929,118,929,929,]),'catches':([354,633,],[628,828,]),'array_access':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'method_header_throws_clause_opt':([898,1009,],[1002,1086,]),'type_argument_list1':([189,376,447,671,970,],[393,393,393,393,393,]),'constant_declaration':([296,298,523,543,],[528,540,528,540,]),'finally':([630,829,],[825,951,]),'generic_type':([4,21,150,165,172,189,227,275,281,294,305,320,357,358,368,376,430,443,447,473,495,533,546,602,637,649,664,667,669,671,690,701,762,763,772,775,780,792,803,831,950,965,966,969,970,1000,1016,1022,1037,1094,1098,1116,1124,1126,1127,1134,],[126,225,126,225,126,388,225,225,126,225,225,225,126,126,126,388,225,126,388,126,225,126,126,126,126,126,388,388,388,388,225,225,225,126,126,126,126,388,126,126,126,388,388,388,388,225,388,126,126,126,126,126,388,388,388,225,]),'shift_expression':([2,122,123,140,191,196,197,198,199,200,201,202,207,212,238,239,241,242,243,276,277,335,344,346,363,369,374,377,417,422,441,445,446,447,448,449,458,460,461,462,463,464,469,471,474,475,479,480,481,487,488,489,493,494,604,605,623,624,626,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[26,26,26,26,26,26,405,406,407,408,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,697,26,703,705,26,26,26,26,26,26,26,722,26,26,730,731,735,736,26,26,26,26,26,26,26,26,26,26,705,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'additional_bound_list':([916,],[1017,]),'for_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'class_body_declarations_opt':([327,513,],[599,757,]),'array_initializer':([418,421,623,682,954,975,1048,],[683,686,820,820,820,820,820,]),'labeled_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,]),'type_argument1':([189,376,447,664,671,965,970,1127,],[385,385,385,847,385,847,385,847,]),'reference_type2':([671,965,966,969,970,1124,1126,1127,],[859,859,1055,1057,859,1055,1057,859,]),'reference_type3':([970,1124,1126,1127,],[1064,1146,1148,1064,]),'reference_type1':([189,376,447,664,667,669,671,792,965,966,969,970,1016,1124,1126,1127,],[386,386,386,386,851,853,386,917,386,853,851,386,1088,853,851,386,]),'instanceof_expression_not_name':([51,144,203,309,557,788,909,1080,],[257,257,257,257,257,257,257,257,]),'synchronized_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,]),'type_parameter_header':([311,791,],[572,572,]),'annotation_type_member_declarations_opt':([296,],[531,]),'dims_opt':([264,349,444,838,883,896,903,905,907,960,],[484,621,700,957,988,998,621,998,621,1051,]),'method_header_throws_clause':([898,1009,],[1003,1003,]),'variable_declarator':([139,359,622,644,776,781,841,],[348,348,819,348,348,348,348,]),'wildcard_bounds1':([384,857,1059,],[665,665,665,]),'block_statement':([4,172,368,772,1022,1094,1098,],[132,365,656,365,365,656,365,]),'wildcard_bounds3':([1059,],[1123,]),'wildcard_bounds2':([857,1059,],[967,967,]),'try_block':([146,356,],[354,633,]),'additive_expression':([2,122,123,140,191,196,197,198,199,200,201,202,207,212,232,233,234,238,239,241,242,243,276,277,335,344,346,363,369,374,377,417,422,441,445,446,447,448,449,457,458,459,460,461,462,463,464,465,469,471,474,475,476,477,478,479,480,481,487,488,489,493,494,604,605,623,624,626,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,423,424,425,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,715,32,717,32,32,32,32,32,723,32,32,32,32,732,733,734,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'primary':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[33,133,33,33,33,33,33,259,33,133,33,33,33,259,133,133,33,33,33,33,33,33,33,33,259,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,558,33,33,33,640,33,133,33,133,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,558,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,133,558,33,33,133,33,33,33,640,33,133,33,33,33,33,33,33,33,33,558,33,33,133,33,33,33,33,33,133,33,133,33,33,640,133,33,640,33,558,133,133,133,133,33,133,133,640,133,]),'additive_expression_not_name':([51,144,203,309,557,788,909,1080,],[263,263,263,263,263,263,263,263,]),'and_expression':([2,122,123,140,191,196,201,202,207,212,239,243,276,277,335,344,346,363,369,374,377,417,422,458,460,461,462,463,469,471,481,487,488,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[35,35,35,35,35,404,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,716,35,35,35,35,35,35,737,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'switch_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,]),'class_type_elt':([1000,1134,],[1082,1153,]),'member_value_pairs':([309,],[559,]),'modifiers_opt':([3,4,70,77,86,172,287,288,289,296,298,307,327,368,513,517,521,522,523,535,543,587,760,772,827,897,1022,1094,1098,],[113,113,113,113,113,113,506,113,113,533,546,113,602,113,602,113,763,763,533,763,546,602,506,113,950,763,113,113,113,]),'expression_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,134,]),'variable_declarators':([139,359,644,776,781,841,],[350,650,350,904,904,650,]),'enum_declarations':([287,514,516,760,],[515,515,515,515,]),'variable_initializer':([623,682,954,975,1048,],[822,869,1047,1068,1117,]),'unary_expression_not_name':([51,144,203,309,557,788,909,1080,],[262,262,262,262,262,262,262,262,]),'enum_header':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'dims':([6,55,124,126,154,246,264,330,349,353,360,361,381,387,388,411,444,552,612,648,704,706,838,854,883,896,903,905,907,958,960,],[192,278,340,342,362,442,485,192,620,192,651,652,651,652,342,442,620,192,812,340,340,362,620,812,620,620,620,620,620,192,620,]),'class_type_list':([1000,],[1084,]),'exclusive_or_expression_not_name':([51,144,203,309,557,788,909,1080,],[260,260,260,260,260,260,260,260,]),'class_body_declarations':([327,513,],[587,587,]),'class_body_declaration':([327,513,587,],[597,597,800,]),'for_init':([358,1037,],[638,638,]),'switch_block':([807,],[924,]),'try_statement_with_resources':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,]),'catch_type':([950,],[1044,]),'switch_block_statement':([923,1026,],[1027,1099,]),'method_declaration':([327,513,587,],[589,589,589,]),'type':([4,150,172,357,358,368,533,546,602,637,649,763,772,775,780,803,831,950,1022,1037,1094,1098,1116,],[139,359,139,635,644,139,776,781,781,835,841,895,139,902,906,906,635,1045,139,644,139,139,1144,]),'member_value':([309,557,788,909,1080,],[560,786,913,1013,1133,]),'simple_name':([2,4,11,12,20,21,22,50,51,62,78,98,103,118,122,123,140,144,150,165,168,172,189,191,194,196,197,198,199,200,201,202,203,207,212,227,232,233,234,235,236,238,239,241,242,243,252,254,269,273,275,276,277,281,283,284,285,294,305,309,313,320,321,323,335,341,343,344,346,357,358,363,368,369,370,374,376,377,414,415,417,422,430,441,443,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,495,507,533,546,557,575,602,604,605,623,624,626,637,649,664,667,669,670,671,675,677,678,682,685,688,690,693,695,698,701,740,747,754,762,763,772,775,780,787,788,792,796,803,808,811,813,814,817,831,836,839,840,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,950,954,965,966,969,970,975,983,1000,1016,1022,1024,1034,1035,1036,1037,1038,1048,1049,1050,1074,1080,1094,1098,1116,1124,1126,1127,1134,1139,1140,1141,1145,1158,1159,1162,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,401,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,561,64,64,64,64,64,401,64,64,64,64,64,64,64,64,64,64,64,64,401,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,401,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,401,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,911,64,64,401,64,64,64,64,64,64,64,64,64,401,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,401,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'empty':([3,4,70,72,77,81,86,101,106,123,172,239,264,287,288,289,296,298,303,307,309,314,327,346,349,354,358,363,368,422,444,509,513,514,516,517,521,522,523,535,543,587,604,605,633,634,675,682,685,688,695,747,754,760,772,808,811,814,817,827,836,838,864,873,875,877,879,883,887,896,897,898,903,905,907,926,927,943,944,960,977,983,992,997,1009,1022,1037,1049,1072,1075,1094,1098,1129,1141,1159,],[76,141,141,293,141,304,141,304,319,338,366,435,486,508,141,141,525,538,293,141,562,293,591,435,486,629,645,435,141,435,486,753,591,758,758,141,766,766,141,766,141,141,435,435,629,833,435,870,435,435,435,435,435,508,366,435,435,435,435,141,338,486,435,979,435,435,435,486,435,486,141,1001,486,486,486,435,435,435,435,486,979,435,979,1079,1001,141,645,1118,979,979,141,141,979,338,1118,]),'class_header_name1':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'assert_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,]),'comma_opt':([682,],[867,]),'import_declarations':([3,70,],[86,289,]),'arguments':([509,],[755,]),'constructor_declaration':([296,327,513,523,587,],[524,588,588,524,588,]),'expression_opt':([123,836,1141,],[339,956,1156,]),'member_value_array_initializer':([309,557,788,909,1080,],[554,554,554,554,554,]),'expression_not_name':([51,144,203,],[268,268,268,]),'statement_expression_list':([358,1037,1049,1159,],[647,647,1121,1121,]),'single_member_annotation_member_value':([309,],[563,]),'class_instance_creation_expression_name':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'local_variable_declaration':([4,172,358,368,772,1022,1037,1094,1098,],[185,185,646,185,185,185,646,185,185,]),'relational_expression_not_name':([51,144,203,309,557,788,909,1080,],[245,245,245,245,245,245,245,245,]),'primary_no_new_array':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'switch_block_statements':([923,],[1026,]),'interface_body':([75,],[299,]),'pre_increment_expression':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,682,685,688,693,695,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[14,160,14,14,14,14,14,251,14,160,14,14,14,251,160,160,14,14,14,14,14,14,14,14,251,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,251,14,14,14,160,14,160,14,160,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,251,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,160,251,14,14,160,14,14,14,160,14,160,14,14,14,14,14,14,14,251,14,14,160,14,14,14,14,14,160,14,160,14,14,160,160,14,160,251,160,160,160,160,14,160,160,160,160,]),'member_value_pair':([309,787,],[565,912,]),'interface_member_declarations_opt':([298,],[541,]),'inclusive_or_expression':([2,122,123,140,191,201,202,207,212,239,243,276,335,344,346,363,369,374,377,417,422,460,461,462,471,487,488,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[54,54,54,54,54,54,54,412,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,720,728,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'compilation_unit':([3,],[99,]),'interface_header_extends_opt':([106,],[317,]),'additional_bound':([916,1017,],[1014,1090,]),'goal':([0,],[1,]),'switch_labels':([923,1026,],[1022,1098,]),'additional_bound1':([916,1017,],[1018,1091,]),'formal_parameter':([521,522,535,897,],[765,765,765,999,]),'post_decrement_expression':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[56,147,56,56,56,56,56,271,56,147,56,56,56,271,147,147,56,56,56,56,56,56,56,56,271,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,566,56,56,56,147,56,147,56,147,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,566,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,147,566,56,56,147,56,56,56,147,56,147,56,56,56,56,56,56,56,56,566,56,56,147,56,56,56,56,56,147,56,147,56,56,147,147,56,147,56,566,147,147,147,147,56,147,147,147,147,]),'block_statements_opt':([172,772,],[367,899,]),'method_invocation':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[57,148,57,57,57,57,57,57,57,148,57,57,57,57,148,148,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,148,57,148,57,148,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,148,57,57,57,148,57,57,57,148,57,148,57,57,57,57,57,57,57,57,57,57,57,148,57,57,57,57,57,148,57,148,57,57,148,148,57,148,57,57,148,148,148,148,57,148,148,148,148,]),'class_member_declaration':([327,513,587,],[600,600,600,]),'unary_expression_not_plus_minus':([2,11,12,20,22,50,62,122,123,140,191,196,197,198,199,200,201,202,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,335,344,346,363,369,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,808,811,814,817,836,843,864,875,877,879,882,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1074,1141,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,712,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,712,58,58,58,58,58,881,58,58,58,58,58,58,58,58,58,58,58,58,58,987,58,58,58,58,58,58,58,58,58,58,58,58,58,58,1131,58,]),'member_value_pairs_opt':([309,],[567,]),'interface_header_name':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'type_declaration':([3,70,77,86,288,289,296,307,517,523,],[107,107,300,107,300,107,530,300,300,530,]),'unary_expression_not_plus_minus_not_name':([51,144,203,309,557,788,909,1080,],[272,272,272,272,272,272,272,272,]),'variable_initializers':([682,],[871,]),'break_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,179,]),'interface_member_declaration':([298,543,],[544,779,]),'formal_parameter_list':([521,522,535,],[767,767,767,]),'class_instance_creation_expression':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[65,127,65,65,65,65,65,65,65,127,65,65,65,65,127,127,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,127,65,127,65,127,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,127,65,65,65,127,65,65,65,127,65,127,65,65,65,65,65,65,65,65,65,65,65,127,65,65,65,65,65,127,65,127,65,65,127,127,65,127,65,65,127,127,127,127,65,127,127,127,127,]),'interface_type':([294,320,762,],[519,519,894,]),'for_init_opt':([358,1037,],[639,1108,]),'do_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,164,]),'relational_expression':([2,122,123,140,191,196,201,202,207,212,238,239,241,242,243,276,277,335,344,346,363,369,374,377,417,422,445,448,449,458,460,461,462,463,469,471,481,487,488,489,493,494,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'type_parameter_list':([311,],[568,]),'shift_expression_not_name':([51,144,203,309,557,788,909,1080,],[258,258,258,258,258,258,258,258,]),'constructor_header_name':([296,327,513,523,587,],[522,522,522,522,522,]),'annotation_type_declaration':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[69,155,69,69,69,155,69,69,69,536,69,586,155,586,69,69,536,586,155,155,155,155,]),'resources':([357,],[634,]),'package_declaration':([3,],[70,]),'class_or_interface_type':([4,21,150,165,172,189,227,275,281,294,305,320,357,358,368,376,430,443,447,473,495,533,546,602,637,649,664,667,669,671,690,701,762,763,772,775,780,792,803,831,950,965,966,969,970,1000,1016,1022,1037,1094,1098,1116,1124,1126,1127,1134,],[156,226,156,226,156,156,419,419,156,518,419,518,156,156,156,156,419,156,156,156,419,156,156,156,156,156,156,156,156,156,419,883,518,156,156,156,156,156,156,156,156,156,156,156,156,419,156,156,156,156,156,156,156,156,156,419,]),'enhanced_for_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,157,]),'class_header_extends':([81,101,],[306,306,]),'if_then_else_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,158,]),'if_then_else_statement_no_short_if':([813,929,1034,1139,1140,1158,1162,],[930,930,930,930,930,930,930,]),'conditional_expression':([2,122,123,140,191,201,212,239,243,276,335,344,346,363,369,374,377,417,422,460,487,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,865,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,989,990,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'conditional_expression_not_name':([51,144,203,309,557,788,909,1080,],[249,249,249,553,553,553,553,553,]),'interface_header':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'class_header_name':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,]),'assignment_expression_not_name':([51,144,203,],[250,250,250,]),'annotation_type_body':([73,],[297,]),'local_variable_declaration_statement':([4,172,368,772,1022,1094,1098,],[159,159,159,159,159,159,159,]),'class_header_implements':([72,303,314,],[292,292,292,]),'enum_body_declarations_opt':([287,514,516,760,],[511,759,761,892,]),'postfix_expression':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[16,161,204,204,204,204,204,161,204,161,16,16,16,161,161,161,16,204,204,204,204,204,16,204,161,204,16,204,204,204,204,204,204,16,204,204,16,204,204,204,204,16,204,204,204,204,555,16,16,16,161,16,161,16,161,16,16,16,16,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,16,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,204,16,204,204,204,204,555,16,16,16,16,204,16,204,204,16,16,16,16,16,204,204,16,16,161,555,16,16,161,16,16,16,161,16,161,16,16,16,16,204,204,204,16,555,16,16,161,16,16,16,16,16,161,16,161,16,16,161,161,16,161,204,555,161,161,161,161,16,161,161,161,161,]),'try_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,162,]),'array_creation_without_array_initializer':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'while_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,163,]),'interface_declaration':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[84,152,84,84,84,152,84,84,84,549,84,592,152,592,84,84,549,592,152,152,152,152,]),'class_declaration':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[85,153,85,85,85,153,85,85,85,539,85,593,153,593,85,85,539,593,153,153,153,153,]),'enum_constant':([287,760,],[510,891,]),'literal':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'annotation_type_member_declaration':([296,523,],[526,769,]),'type_argument':([189,376,447,664,671,965,970,1127,],[391,391,391,849,391,849,391,849,]),'union_type':([950,],[1046,]),'cast_expression':([2,11,12,20,22,50,51,62,122,123,140,144,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,363,369,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,788,808,811,814,817,836,843,864,875,877,879,882,884,886,887,909,926,927,943,944,954,975,983,1024,1035,1036,1048,1074,1080,1141,],[25,25,25,25,25,25,255,25,25,25,25,255,25,25,25,25,25,25,25,25,255,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,255,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,255,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,255,25,25,25,25,25,25,25,25,25,25,25,25,25,25,255,25,25,25,25,25,25,25,25,25,25,25,25,255,25,]),'statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[136,332,364,136,136,658,136,934,963,332,136,658,1109,136,136,963,934,1157,1109,1157,]),'argument_list':([239,346,363,422,604,605,675,685,688,695,747,754,808,811,814,817,864,875,877,879,887,926,927,943,944,983,],[433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,433,]),'type_parameter_list1':([311,],[573,]),'instanceof_expression':([2,122,123,140,191,196,201,202,207,212,238,239,241,242,243,276,277,335,344,346,363,369,374,377,417,422,445,448,449,458,460,461,462,463,469,471,481,487,488,489,493,494,604,605,623,624,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[59,59,59,59,59,59,59,59,59,59,59,59,438,439,59,59,59,59,59,59,59,59,59,59,59,59,702,707,59,59,59,59,59,59,59,59,59,59,59,59,744,745,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'class_header_implements_opt':([72,303,314,],[295,550,577,]),'normal_annotation':([3,4,70,77,86,112,150,172,287,288,289,290,296,298,307,309,327,357,358,368,512,513,517,521,522,523,532,535,543,545,557,587,637,649,760,772,788,827,831,897,909,1022,1037,1080,1094,1098,],[93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,]),'static_initializer':([327,513,587,],[596,596,596,]),'catch_formal_parameter':([827,],[949,]),'single_type_import_declaration':([3,70,86,289,],[95,95,95,95,]),'annotation_method_header_default_value_opt':([997,],[1078,]),'array_creation_with_array_initializer':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'post_increment_expression':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[27,184,27,27,27,27,27,256,27,184,27,27,27,256,184,184,27,27,27,27,27,27,27,27,256,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,556,27,27,27,184,27,184,27,184,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,556,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,184,556,27,27,184,27,27,27,184,27,184,27,27,27,27,27,27,27,27,556,27,27,184,27,27,27,27,27,184,27,184,27,27,184,184,27,184,27,556,184,184,184,184,27,184,184,184,184,]),'switch_label':([923,1022,1026,1098,],[1023,1093,1023,1093,]),'expression':([2,122,123,140,191,201,239,243,276,335,344,346,363,369,374,377,417,422,460,487,604,605,623,624,675,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[28,336,337,352,395,409,434,440,497,606,613,434,434,657,660,662,681,434,718,741,434,434,821,823,434,821,434,434,878,434,434,434,434,434,434,434,337,962,434,434,434,434,434,434,434,434,434,821,821,434,1096,1106,1107,821,337,]),'modifier':([3,4,70,77,86,112,150,172,287,288,289,290,296,298,307,327,357,358,368,512,513,517,521,522,523,532,535,543,545,587,637,649,760,772,827,831,897,1022,1037,1094,1098,],[104,104,104,104,104,322,322,104,104,104,104,322,104,104,104,104,104,104,104,322,104,104,104,104,104,322,104,104,322,104,322,322,104,104,104,104,104,104,104,104,104,]),'type_argument2':([671,965,970,1127,],[858,1053,858,1053,]),'additional_bound_list1':([916,],[1015,]),'continue_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,]),'abstract_method_declaration':([298,327,513,543,587,],[542,598,598,542,598,]),'formal_parameter_list_opt':([521,522,535,],[764,768,777,]),'statement_no_short_if':([813,929,1034,1139,1140,1158,1162,],[941,1033,1105,1154,1155,1160,1163,]),'class_body':([114,505,873,977,992,1072,1075,1129,],[328,750,978,978,978,978,978,978,]),'assignment_expression':([2,122,123,140,191,201,212,239,243,276,335,344,346,363,369,374,377,417,422,460,487,604,605,623,624,675,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[31,31,31,31,31,31,413,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'single_static_import_declaration':([3,70,86,289,],[115,115,115,115,]),'resource':([357,831,],[636,953,]),'statement_without_trailing_substatement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[173,173,173,173,173,173,173,931,173,931,173,931,173,173,173,931,931,173,931,931,]),'dim_with_or_without_exprs':([226,228,],[418,421,]),'enhanced_for_statement_header_init':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,174,]),'label':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[175,175,175,175,175,175,175,932,175,932,175,932,175,175,175,932,932,175,932,932,]),'unary_expression':([2,11,12,20,22,50,62,122,123,140,191,196,197,198,199,200,201,202,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,335,344,346,363,369,374,377,417,422,441,445,446,447,448,449,450,451,452,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,604,605,623,624,626,675,677,682,685,688,693,695,740,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[37,205,206,223,231,244,282,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,470,472,491,492,37,37,502,503,504,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,709,710,37,37,714,37,37,37,37,37,37,37,37,37,724,725,726,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,885,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'statement_expression':([4,118,168,172,358,368,370,772,813,839,845,929,1022,1034,1037,1038,1049,1094,1098,1139,1140,1145,1158,1159,1162,],[176,176,176,176,641,176,176,176,176,959,176,176,176,176,641,176,641,176,176,176,176,176,176,641,176,]),'default_value':([997,],[1081,]),'class_type':([21,165,227,275,305,430,495,690,1000,1134,],[230,230,420,496,551,691,746,876,1083,1083,]),'variable_declarator_id':([139,359,622,635,644,776,781,835,841,895,996,1044,],[351,351,351,834,351,351,351,955,351,995,1077,1115,]),'method_header_name':([298,327,513,543,587,],[535,535,535,535,535,]),'annotation_method_header_name':([296,523,],[521,521,]),'interface_header_extends':([106,],[318,]),'member_values':([557,],[784,]),'while_statement_no_short_if':([813,929,1034,1139,1140,1158,1162,],[933,933,933,933,933,933,933,]),'wildcard1':([189,376,447,664,671,965,970,1127,],[382,382,382,382,382,382,382,382,]),'wildcard2':([671,965,970,1127,],[855,855,855,855,]),'wildcard3':([970,1127,],[1061,1061,]),'type_parameter1':([311,791,],[570,914,]),'return_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,171,]),'enum_header_name':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'catches_opt':([354,633,],[630,829,]),'conditional_or_expression_not_name':([51,144,203,309,557,788,909,1080,],[265,265,265,265,265,265,265,265,]),'dim_with_or_without_expr':([226,228,418,421,],[416,416,684,684,]),'catch_clause':([354,628,633,828,],[632,824,632,824,]),'assignment':([2,4,51,118,122,123,140,144,168,172,191,201,203,212,239,243,276,335,344,346,358,363,368,369,370,374,377,417,422,460,487,604,605,623,624,675,682,685,688,693,695,747,754,772,808,811,813,814,817,836,839,843,845,864,875,877,879,887,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[44,180,266,180,44,44,44,266,180,180,44,44,266,44,44,44,44,44,44,44,180,44,180,44,180,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,180,44,44,180,44,44,44,180,44,180,44,44,44,44,44,44,44,180,44,44,44,44,44,180,44,180,44,44,180,180,44,180,180,180,180,180,44,180,180,180,180,]),'enum_constant_header':([287,760,],[505,505,]),'and_expression_not_name':([51,144,203,309,557,788,909,1080,],[267,267,267,267,267,267,267,267,]),'type_import_on_demand_declaration':([3,70,86,289,],[96,96,96,96,]),'semi_opt':([634,],[830,]),'wildcard':([189,376,447,664,671,965,970,1127,],[392,392,392,392,392,392,392,392,]),'marker_annotation':([3,4,70,77,86,112,150,172,287,288,289,290,296,298,307,309,327,357,358,368,512,513,517,521,522,523,532,535,543,545,557,587,637,649,760,772,788,827,831,897,909,1022,1037,1080,1094,1098,],[111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,]),'type_argument_list3':([970,],[1060,]),'class_body_opt':([873,977,992,1072,1075,1129,],[980,1069,1076,1130,1132,1152,]),'class_or_interface':([4,21,150,165,172,189,227,275,281,294,305,320,357,358,368,376,430,443,447,473,495,533,546,602,637,649,664,667,669,671,690,701,762,763,772,775,780,792,803,831,950,965,966,969,970,1000,1016,1022,1037,1094,1098,1116,1124,1126,1127,1134,],[181,181,181,181,181,389,181,181,181,181,181,181,181,181,181,389,181,181,389,181,181,181,181,181,181,181,389,389,389,860,181,181,181,181,181,181,181,389,181,181,181,860,860,860,860,181,389,181,181,181,181,181,860,860,860,181,]),'one_dim_loop':([6,55,124,126,154,193,246,264,330,349,353,360,361,381,387,388,411,444,552,612,648,704,706,838,854,883,896,903,905,907,958,960,],[195,195,195,195,195,397,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,]),'for_statement_no_short_if':([813,929,1034,1139,1140,1158,1162,],[936,936,936,936,936,936,936,]),'array_type':([4,150,172,189,281,357,358,368,376,443,447,473,533,546,602,637,649,664,667,669,671,763,772,775,780,792,803,831,950,965,966,969,970,1016,1022,1037,1094,1098,1116,1124,1126,1127,],[166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,]),'block':([4,118,146,168,172,327,356,368,370,513,587,595,772,813,826,845,846,929,1022,1034,1038,1043,1094,1098,1139,1140,1145,1158,1162,],[190,190,355,190,190,601,355,190,190,601,601,801,190,190,948,190,964,190,190,190,190,1114,190,190,190,190,190,190,190,]),'labeled_statement_no_short_if':([813,929,1034,1139,1140,1158,1162,],[937,937,937,937,937,937,937,]),'type_argument_list2':([671,970,],[862,862,]),'explicit_constructor_invocation':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,182,]),'resource_specification':([146,],[356,]),'modifiers':([3,4,70,77,86,172,287,288,289,296,298,307,327,357,358,368,513,517,521,522,523,535,543,587,760,772,827,831,897,1022,1037,1094,1098,],[112,150,290,290,290,150,512,290,290,532,545,290,532,637,649,150,532,290,512,512,532,512,545,532,512,150,512,637,512,150,649,150,150,]),'assignment_operator':([16,161,],[212,212,]),'field_declaration':([296,298,327,513,523,543,587,],[534,534,585,585,534,534,585,]),'annotation':([3,4,70,77,86,112,150,172,287,288,289,290,296,298,307,309,327,357,358,368,512,513,517,521,522,523,532,535,543,545,557,587,637,649,760,772,788,827,831,897,909,1022,1037,1080,1094,1098,],[94,94,94,94,94,94,94,94,94,94,94,94,94,94,94,564,94,94,94,94,94,94,94,94,94,94,94,94,94,94,564,94,94,94,94,94,564,94,94,94,564,94,94,564,94,94,]),'type_parameters':([97,117,533,546,578,584,602,798,],[310,329,775,780,797,799,803,920,]),'annotation_method_header':([296,523,],[527,527,]),'class_header_extends_opt':([81,101,],[303,314,]),'interface_header_name1':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,97,]),'type_argument_list':([189,376,447,671,970,],[383,383,383,856,1062,]),'import_declaration':([3,70,86,289,],[100,100,308,308,]),'interface_member_declarations':([298,],[543,]),'single_member_annotation':([3,4,70,77,86,112,150,172,287,288,289,290,296,298,307,309,327,357,358,368,512,513,517,521,522,523,532,535,543,545,557,587,637,649,760,772,788,827,831,897,909,1022,1037,1080,1094,1098,],[102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'primitive_type':([2,4,11,12,20,21,22,50,51,62,118,122,123,140,144,150,165,168,172,189,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,281,283,284,285,309,335,344,346,357,358,363,368,369,370,374,376,377,417,422,441,443,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,473,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,533,546,557,602,604,605,623,624,626,637,649,664,667,669,671,675,677,678,682,685,688,693,695,698,740,747,754,763,772,775,780,788,792,803,808,811,813,814,817,831,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,950,954,965,966,969,970,975,983,1016,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1116,1124,1126,1127,1139,1140,1141,1145,1158,1159,1162,],[55,154,55,55,55,228,55,55,264,55,55,55,55,55,55,361,228,55,154,387,55,55,55,55,55,55,55,55,264,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,387,55,55,55,55,55,55,55,361,154,55,154,55,55,55,387,55,55,55,55,387,55,55,706,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,387,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,361,361,55,361,55,55,55,55,55,361,361,387,387,387,387,55,55,55,55,55,55,55,55,55,55,55,55,361,154,361,361,55,387,361,55,55,55,55,55,361,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,361,55,387,387,387,387,55,55,387,154,55,55,55,55,154,55,55,55,55,55,154,154,361,387,387,387,55,55,55,55,55,55,55,]),'postfix_expression_not_name':([51,144,203,309,557,788,909,1080,],[270,270,270,270,270,270,270,270,]),'constructor_header':([296,327,513,523,587,],[529,529,529,529,529,]),'method_header_extended_dims':([896,905,],[997,1009,]),'enhanced_for_statement_no_short_if':([813,929,1034,1139,1140,1158,1162,],[939,939,939,939,939,939,939,]),'type_argument3':([970,1127,],[1063,1150,]),'annotation_type_declaration_header_name':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'wildcard_bounds':([384,857,1059,],[666,666,666,]),'block_statements':([172,772,1022,1098,],[368,368,1094,1094,]),'if_then_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,187,]),'throw_statement':([4,118,168,172,368,370,772,813,845,929,1022,1034,1038,1094,1098,1139,1140,1145,1158,1162,],[188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,188,]),'field_access':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,453,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,678,682,685,688,693,695,698,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,882,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1074,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'reference_type':([4,150,172,189,281,357,358,368,376,443,447,473,533,546,602,637,649,664,667,669,671,763,772,775,780,792,803,831,950,965,966,969,970,1016,1022,1037,1094,1098,1116,1124,1126,1127,],[169,169,169,390,501,169,169,169,390,699,390,729,169,169,169,169,169,848,850,852,861,169,169,169,169,916,169,169,169,1054,1056,1058,1065,1089,169,169,169,169,169,1147,1149,1151,]),'equality_expression_not_name':([51,144,203,309,557,788,909,1080,],[274,274,274,274,274,274,274,274,]),'pre_decrement_expression':([2,4,11,12,20,22,50,51,62,118,122,123,140,144,168,172,191,196,197,198,199,200,201,202,203,207,212,232,233,234,235,236,238,239,241,242,243,252,254,269,273,276,277,283,284,285,309,335,344,346,358,363,368,369,370,374,377,417,422,441,445,446,447,448,449,450,451,452,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,557,604,605,623,624,626,675,677,682,685,688,693,695,740,747,754,772,788,808,811,813,814,817,836,839,843,845,864,875,877,879,884,886,887,909,926,927,929,943,944,954,975,983,1022,1024,1034,1035,1036,1037,1038,1048,1049,1080,1094,1098,1139,1140,1141,1145,1158,1159,1162,],[36,143,36,36,36,36,36,261,36,143,36,36,36,261,143,143,36,36,36,36,36,36,36,36,261,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,261,36,36,36,143,36,143,36,143,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,261,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,143,261,36,36,143,36,36,36,143,36,143,36,36,36,36,36,36,36,261,36,36,143,36,36,36,36,36,143,36,143,36,36,143,143,36,143,261,143,143,143,143,36,143,143,143,143,]),'for_update':([1049,1159,],[1119,1119,]),'method_body':([529,603,],[771,804,]),'class_header':([3,4,70,77,86,172,288,289,296,298,307,327,368,513,517,523,543,587,772,1022,1094,1098,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,]),'enum_constants':([287,],[514,]),'method_header':([298,327,513,543,587,],[548,603,603,548,603,]),'dims_loop':([6,55,124,126,154,246,264,330,349,353,360,361,381,387,388,411,444,552,612,648,704,706,838,854,883,896,903,905,907,958,960,],[193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,193,]),'multiplicative_expression':([2,122,123,140,191,196,197,198,199,200,201,202,207,212,232,233,234,235,236,238,239,241,242,243,276,277,335,344,346,363,369,374,377,417,422,441,445,446,447,448,449,452,455,457,458,459,460,461,462,463,464,465,469,471,474,475,476,477,478,479,480,481,482,483,487,488,489,493,494,604,605,623,624,626,675,677,682,685,688,693,695,747,754,808,811,814,817,836,843,864,875,877,879,884,886,887,926,927,943,944,954,975,983,1024,1035,1036,1048,1141,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,426,427,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,711,713,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,738,739,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),}
+_lr_goto_items = {'goal':([0,],[1,]),'compilation_unit':([2,],[5,]),'package_declaration':([2,],[6,]),'import_declarations':([2,6,],[7,191,]),'type_declarations':([2,6,7,191,],[8,192,194,394,]),'empty':([2,4,6,7,8,43,44,45,46,157,166,191,192,194,207,209,211,213,214,226,235,269,307,334,342,348,364,369,370,394,402,421,423,425,440,441,445,447,452,459,517,579,644,645,653,654,681,699,706,733,735,789,794,798,803,811,812,824,838,839,842,843,868,872,873,875,881,883,897,898,900,903,909,917,920,937,959,960,963,964,985,989,999,1014,1018,1024,1026,1031,1082,1091,1102,1106,1131,1137,1159,],[9,185,185,185,185,216,220,224,216,349,361,185,185,185,403,426,443,453,224,224,482,544,583,544,621,185,642,583,583,185,185,689,689,185,698,698,403,705,185,689,544,583,642,830,583,583,349,443,583,583,583,583,913,583,583,361,544,185,583,583,583,583,544,980,185,544,544,544,583,583,583,544,583,1017,583,544,583,583,583,583,980,1074,583,1017,1017,621,1099,185,1017,1017,185,185,1017,361,1099,]),'package_declaration_name':([2,],[10,]),'import_declaration':([2,6,7,191,],[12,12,195,195,]),'type_declaration':([2,6,7,8,191,192,194,213,394,452,],[13,13,13,196,13,196,196,458,196,458,]),'modifiers':([2,4,6,7,8,157,191,192,194,207,209,211,213,342,348,367,394,402,421,423,425,445,452,459,681,699,824,828,873,1024,1031,1102,1106,],[14,135,193,193,193,135,193,193,193,422,438,449,422,619,135,648,193,422,449,449,438,422,422,449,135,449,449,648,449,619,135,135,135,]),'single_type_import_declaration':([2,6,7,191,],[16,16,16,16,]),'type_import_on_demand_declaration':([2,6,7,191,],[17,17,17,17,]),'single_static_import_declaration':([2,6,7,191,],[18,18,18,18,]),'static_import_on_demand_declaration':([2,6,7,191,],[19,19,19,19,]),'empty_statement':([2,4,6,7,154,157,162,191,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[20,139,20,20,139,139,139,20,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,139,]),'class_declaration':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[21,121,21,21,21,121,21,21,21,410,430,21,121,21,410,430,410,21,121,121,121,121,]),'interface_declaration':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[22,122,22,22,22,122,22,22,22,412,431,22,122,22,412,431,412,22,122,122,122,122,]),'enum_declaration':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[23,124,23,23,23,124,23,23,23,413,432,23,124,23,413,432,413,23,124,124,124,124,]),'annotation_type_declaration':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[24,123,24,24,24,123,24,24,24,414,433,24,123,24,414,433,414,24,123,123,123,123,]),'modifier':([2,4,6,7,8,14,135,157,191,192,193,194,207,209,211,213,342,348,367,394,402,421,422,423,425,438,445,449,452,459,619,648,681,699,824,828,873,1024,1031,1102,1106,],[25,25,25,25,25,200,200,25,25,25,200,25,25,25,25,25,25,25,25,25,25,25,200,25,25,200,25,200,25,25,200,200,25,25,25,25,25,25,25,25,25,]),'class_header':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'interface_header':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'enum_header':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'annotation_type_declaration_header':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'annotation':([2,4,6,7,8,14,135,157,191,192,193,194,207,209,211,213,235,342,348,367,394,402,421,422,423,425,438,445,449,452,459,490,619,648,681,699,723,824,828,873,892,1024,1031,1075,1102,1106,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,487,42,42,42,42,42,42,42,42,42,42,42,42,42,42,487,42,42,42,42,487,42,42,42,487,42,42,487,42,42,]),'class_header_name':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,]),'interface_header_name':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'enum_header_name':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'annotation_type_declaration_header_name':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'normal_annotation':([2,4,6,7,8,14,135,157,191,192,193,194,207,209,211,213,235,342,348,367,394,402,421,422,423,425,438,445,449,452,459,490,619,648,681,699,723,824,828,873,892,1024,1031,1075,1102,1106,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'marker_annotation':([2,4,6,7,8,14,135,157,191,192,193,194,207,209,211,213,235,342,348,367,394,402,421,422,423,425,438,445,449,452,459,490,619,648,681,699,723,824,828,873,892,1024,1031,1075,1102,1106,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'single_member_annotation':([2,4,6,7,8,14,135,157,191,192,193,194,207,209,211,213,235,342,348,367,394,402,421,422,423,425,438,445,449,452,459,490,619,648,681,699,723,824,828,873,892,1024,1031,1075,1102,1106,],[49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'class_header_name1':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'interface_header_name1':([2,4,6,7,8,157,191,192,194,207,209,213,348,394,402,425,445,452,681,1031,1102,1106,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'modifiers_opt':([2,4,6,7,8,157,191,192,194,207,209,211,213,348,394,402,421,423,425,445,452,459,681,699,824,873,1031,1102,1106,],[52,52,52,52,52,52,52,52,52,418,437,448,460,52,52,418,691,691,437,418,460,691,52,448,947,691,52,52,52,]),'annotation_name':([2,4,6,7,8,14,135,157,191,192,193,194,207,209,211,213,235,342,348,367,394,402,421,422,423,425,438,445,449,452,459,490,619,648,681,699,723,824,828,873,892,1024,1031,1075,1102,1106,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'expression':([3,160,166,168,254,259,263,264,307,339,341,353,362,368,369,370,520,545,576,579,605,631,653,654,706,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[56,352,360,363,497,509,513,514,584,612,615,632,637,649,584,584,744,768,795,584,807,817,584,584,584,584,584,584,807,584,918,584,360,943,584,584,584,584,584,584,584,584,584,807,584,584,584,584,584,807,1092,1095,1108,807,360,]),'assignment_expression':([3,160,166,168,239,254,259,263,264,307,339,341,353,362,368,369,370,520,545,576,579,605,631,653,654,706,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[57,57,57,57,496,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'assignment':([3,4,80,151,154,157,160,162,166,168,238,239,254,259,263,264,307,338,339,341,342,348,353,362,368,369,370,520,545,576,579,605,631,653,654,681,706,733,735,789,794,798,802,803,809,810,811,814,819,838,839,842,843,897,898,900,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[58,173,271,271,173,173,58,173,58,58,271,58,58,58,58,58,58,173,58,58,173,173,58,58,58,58,58,58,58,58,58,58,58,58,58,173,58,58,58,58,58,58,58,58,173,173,58,173,58,58,58,58,58,58,58,58,58,58,173,58,58,58,58,58,58,58,58,173,173,58,173,173,173,58,58,173,173,173,173,58,173,173,173,173,]),'conditional_expression':([3,160,166,168,239,254,259,263,264,307,339,341,353,362,368,369,370,520,545,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,895,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,1007,1008,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'postfix_expression':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[60,188,237,237,188,237,237,237,237,188,188,188,60,188,60,60,494,188,60,60,237,60,237,60,60,237,237,237,237,237,60,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,188,60,60,188,188,60,60,60,60,60,494,237,60,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,60,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,237,60,60,60,237,60,60,60,188,60,494,237,237,60,60,237,237,60,60,60,60,60,188,188,60,188,60,60,60,60,60,494,60,60,60,237,237,237,60,60,188,60,60,60,60,60,60,60,60,188,188,60,188,188,188,60,60,494,237,188,188,188,188,60,188,188,188,188,]),'conditional_or_expression':([3,160,166,168,239,254,259,263,264,307,339,341,353,362,368,369,370,520,545,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'primary':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[62,183,62,62,274,62,62,62,62,274,183,183,62,183,62,62,491,274,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,183,62,62,626,183,62,62,62,62,62,491,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,183,62,491,62,62,62,62,62,62,62,62,62,62,62,183,183,62,626,62,62,62,62,62,491,62,62,62,62,62,62,62,62,183,62,62,62,62,62,62,62,62,183,183,62,626,626,183,62,62,491,62,183,183,183,183,62,183,183,626,183,]),'name':([3,4,15,26,53,55,72,80,83,109,110,115,116,135,151,154,157,160,162,166,168,189,190,199,201,205,217,221,225,235,238,239,254,255,259,262,263,264,266,287,288,294,295,303,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,367,368,369,370,378,380,418,437,450,460,490,499,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,580,587,605,614,619,631,648,653,654,664,666,670,671,672,681,683,691,695,706,712,714,717,723,728,729,730,733,735,742,743,767,789,794,798,802,803,809,810,811,814,819,828,838,839,842,843,892,897,898,900,902,905,907,909,920,933,947,951,959,960,963,964,965,966,970,971,981,996,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1113,1123,1127,1128,1129,1135,1136,1137,1138,1158,1159,1162,],[63,184,202,204,234,63,63,267,306,63,63,63,63,337,340,345,184,63,345,63,63,306,391,395,234,400,306,306,306,486,495,63,63,63,63,63,63,63,63,63,63,63,63,306,63,63,306,63,63,63,337,63,63,63,63,63,63,63,63,63,63,63,63,345,63,63,625,184,63,63,337,63,63,63,391,663,337,337,234,337,486,306,63,63,63,63,63,63,63,63,63,337,753,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,337,63,63,63,63,63,63,63,63,63,63,63,63,63,63,800,306,63,63,337,63,337,63,63,391,391,391,391,862,184,337,337,337,63,337,306,391,486,63,63,306,63,63,306,63,63,63,63,63,63,63,345,345,63,939,63,337,63,63,63,63,486,63,63,63,63,63,63,63,63,345,337,63,63,63,63,63,391,391,391,391,306,391,63,63,63,345,345,63,625,939,184,63,63,486,63,184,184,337,391,391,391,306,345,345,63,345,345,939,345,]),'post_increment_expression':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[64,176,64,64,275,64,64,64,64,275,176,176,64,176,64,64,492,275,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,176,64,64,176,176,64,64,64,64,64,492,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,176,64,492,64,64,64,64,64,64,64,64,64,64,64,176,176,64,176,64,64,64,64,64,492,64,64,64,64,64,64,64,64,176,64,64,64,64,64,64,64,64,176,176,64,176,176,176,64,64,492,64,176,176,176,176,64,176,176,176,176,]),'post_decrement_expression':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[65,177,65,65,276,65,65,65,65,276,177,177,65,177,65,65,493,276,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,177,65,65,177,177,65,65,65,65,65,493,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,177,65,493,65,65,65,65,65,65,65,65,65,65,65,177,177,65,177,65,65,65,65,65,493,65,65,65,65,65,65,65,65,177,65,65,65,65,65,65,65,65,177,177,65,177,177,177,65,65,493,65,177,177,177,177,65,177,177,177,177,]),'conditional_and_expression':([3,160,166,168,239,254,255,259,263,264,307,339,341,353,362,368,369,370,520,521,545,546,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[66,66,66,66,66,66,498,66,66,66,66,66,66,66,66,66,66,66,66,745,66,769,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'primary_no_new_array':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'array_creation_with_array_initializer':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'array_creation_without_array_initializer':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'simple_name':([3,4,15,26,53,55,72,80,83,109,110,115,116,135,151,154,157,160,162,166,168,189,190,199,201,205,217,221,225,235,238,239,254,255,257,259,262,263,264,266,287,288,294,295,303,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,367,368,369,370,375,378,380,397,399,418,437,450,460,490,499,516,518,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,580,587,605,614,619,631,648,653,654,664,666,670,671,672,676,681,683,691,695,706,712,714,717,722,723,728,729,730,733,735,742,743,767,789,794,798,802,803,809,810,811,814,815,819,828,838,839,842,843,892,897,898,900,902,905,907,909,920,933,947,951,959,960,963,964,965,966,970,971,981,996,999,1013,1020,1021,1022,1023,1024,1026,1028,1031,1034,1042,1075,1085,1102,1106,1113,1123,1127,1128,1129,1135,1136,1137,1138,1158,1159,1162,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,489,70,70,70,70,505,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,505,70,70,505,505,70,70,70,70,70,70,70,505,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,505,70,70,70,70,70,70,70,70,890,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,505,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,505,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'qualified_name':([3,4,15,26,53,55,72,80,83,109,110,115,116,135,151,154,157,160,162,166,168,189,190,199,201,205,217,221,225,235,238,239,254,255,259,262,263,264,266,287,288,294,295,303,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,367,368,369,370,378,380,418,437,450,460,490,499,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,580,587,605,614,619,631,648,653,654,664,666,670,671,672,681,683,691,695,706,712,714,717,723,728,729,730,733,735,742,743,767,789,794,798,802,803,809,810,811,814,819,828,838,839,842,843,892,897,898,900,902,905,907,909,920,933,947,951,959,960,963,964,965,966,970,971,981,996,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1113,1123,1127,1128,1129,1135,1136,1137,1138,1158,1159,1162,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'inclusive_or_expression':([3,160,166,168,239,254,255,259,262,263,264,307,339,341,353,362,368,369,370,520,521,522,545,546,547,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[73,73,73,73,73,73,73,73,512,73,73,73,73,73,73,73,73,73,73,73,73,746,73,73,770,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'literal':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'class_instance_creation_expression':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[76,179,76,76,76,76,76,76,76,76,179,179,76,179,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,179,76,76,179,179,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,179,76,76,76,76,76,76,76,76,76,76,76,76,76,179,179,76,179,76,76,76,76,76,76,76,76,76,76,76,76,76,76,179,76,76,76,76,76,76,76,76,179,179,76,179,179,179,76,76,76,76,179,179,179,179,76,179,179,179,179,]),'field_access':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'method_invocation':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[78,178,78,78,78,78,78,78,78,78,178,178,78,178,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,178,78,78,178,178,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,178,78,78,78,78,78,78,78,78,78,78,78,78,78,178,178,78,178,78,78,78,78,78,78,78,78,78,78,78,78,78,78,178,78,78,78,78,78,78,78,78,178,178,78,178,178,178,78,78,78,78,178,178,178,178,78,178,178,178,178,]),'array_access':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'primitive_type':([3,4,55,72,80,83,109,110,115,116,135,151,154,157,160,162,166,168,189,190,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,367,368,369,370,378,418,437,460,490,516,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,619,631,648,653,654,664,666,670,671,681,683,691,695,706,712,717,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,828,838,839,842,843,892,897,898,900,902,905,907,909,920,933,947,951,959,960,963,964,965,966,970,971,996,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1113,1123,1127,1128,1135,1136,1137,1138,1158,1159,1162,],[82,155,82,82,269,301,82,82,82,82,336,82,82,155,82,82,82,82,301,393,82,269,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,393,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,155,155,82,82,336,82,82,82,393,336,336,336,82,82,82,82,82,82,82,82,82,82,393,755,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,393,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,336,82,336,82,82,393,393,393,393,155,336,336,336,82,336,393,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,336,82,82,82,82,82,82,82,82,82,82,82,82,82,82,336,82,82,82,82,82,393,393,393,393,393,82,82,82,82,82,82,155,82,155,82,82,82,82,155,155,336,393,393,393,82,82,82,82,82,82,82,]),'exclusive_or_expression':([3,160,166,168,239,254,255,259,262,263,264,266,307,339,341,353,362,368,369,370,520,521,522,523,545,546,547,548,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[85,85,85,85,85,85,85,85,85,85,85,515,85,85,85,85,85,85,85,85,85,85,85,747,85,85,85,771,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,]),'class_instance_creation_expression_name':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,728,729,733,735,743,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,902,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1085,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,]),'and_expression':([3,160,166,168,239,254,255,259,262,263,264,266,307,308,339,341,353,362,368,369,370,520,521,522,523,524,545,546,547,548,549,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[102,102,102,102,102,102,102,102,102,102,102,102,102,585,102,102,102,102,102,102,102,102,102,102,102,748,102,102,102,102,772,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,102,]),'equality_expression':([3,160,166,168,239,254,255,259,262,263,264,266,307,308,310,339,341,353,362,368,369,370,520,521,522,523,524,525,545,546,547,548,549,550,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[103,103,103,103,103,103,103,103,103,103,103,103,103,103,588,103,103,103,103,103,103,103,103,103,103,103,103,749,103,103,103,103,103,773,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,]),'instanceof_expression':([3,160,166,168,239,254,255,259,262,263,264,266,307,308,310,311,312,339,341,353,362,368,369,370,520,521,522,523,524,525,526,527,545,546,547,548,549,550,551,552,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,589,590,104,104,104,104,104,104,104,104,104,104,104,104,104,750,751,104,104,104,104,104,104,774,775,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,104,]),'relational_expression':([3,160,166,168,239,254,255,259,262,263,264,266,307,308,310,311,312,339,341,353,362,368,369,370,520,521,522,523,524,525,526,527,545,546,547,548,549,550,551,552,576,579,605,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,105,]),'shift_expression':([3,160,166,168,239,254,255,259,262,263,264,266,307,308,310,311,312,314,315,316,317,339,341,353,362,368,369,370,520,521,522,523,524,525,526,527,529,530,531,532,545,546,547,548,549,550,551,552,554,555,556,557,576,579,605,614,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,592,593,594,595,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,754,756,757,758,106,106,106,106,106,106,106,106,777,778,779,780,106,106,106,754,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,106,]),'additive_expression':([3,160,166,168,239,254,255,259,262,263,264,266,307,308,310,311,312,314,315,316,317,318,319,320,339,341,353,362,368,369,370,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,576,579,605,614,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,596,597,598,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,759,760,761,107,107,107,107,107,107,107,107,107,107,107,107,781,782,783,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,107,]),'multiplicative_expression':([3,160,166,168,239,254,255,259,262,263,264,266,307,308,310,311,312,314,315,316,317,318,319,320,321,322,339,341,353,362,368,369,370,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,576,579,605,614,631,653,654,706,729,733,735,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,599,600,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,762,763,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,784,785,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,108,]),'unary_expression':([3,55,72,109,110,115,116,160,166,168,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,339,341,353,362,368,369,370,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,706,729,733,735,767,789,794,798,802,803,811,819,838,839,842,843,897,898,900,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1137,],[111,236,265,326,327,328,329,111,111,111,111,111,111,111,111,111,111,111,566,567,568,569,111,111,111,111,111,111,111,111,111,111,111,111,111,111,601,602,603,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,764,765,766,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,786,787,788,111,111,111,111,111,111,111,111,111,111,111,906,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,111,]),'pre_increment_expression':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,729,733,735,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[112,174,112,112,290,112,112,112,112,290,174,174,112,174,112,112,290,290,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,174,112,112,174,174,112,112,112,112,112,290,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,112,174,112,290,112,112,112,112,112,112,112,112,112,174,174,112,174,112,112,112,112,112,290,112,112,112,112,112,112,112,174,112,112,112,112,112,112,112,112,174,174,112,174,174,174,112,112,290,174,174,174,174,112,174,174,174,174,]),'pre_decrement_expression':([3,4,55,72,80,109,110,115,116,151,154,157,160,162,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,338,339,341,342,348,353,362,368,369,370,490,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,681,706,723,729,733,735,767,789,794,798,802,803,809,810,811,814,819,838,839,842,843,892,897,898,900,905,907,909,920,933,951,959,960,963,964,999,1013,1020,1021,1022,1023,1024,1026,1031,1034,1042,1075,1102,1106,1135,1136,1137,1138,1158,1159,1162,],[113,175,113,113,291,113,113,113,113,291,175,175,113,175,113,113,291,291,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,175,113,113,175,175,113,113,113,113,113,291,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,113,175,113,291,113,113,113,113,113,113,113,113,113,175,175,113,175,113,113,113,113,113,291,113,113,113,113,113,113,113,175,113,113,113,113,113,113,113,113,175,175,113,175,175,175,113,113,291,175,175,175,175,113,175,175,175,175,]),'unary_expression_not_plus_minus':([3,55,72,109,110,115,116,160,166,168,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,339,341,353,362,368,369,370,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,706,728,729,733,735,743,767,789,794,798,802,803,811,819,838,839,842,843,897,898,900,902,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1085,1137,],[114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,740,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,740,114,114,114,904,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,1005,114,114,114,114,114,114,114,114,114,114,114,114,114,114,114,1133,114,]),'cast_expression':([3,55,72,80,109,110,115,116,151,160,166,168,235,238,239,254,255,259,262,263,264,266,287,288,294,295,307,308,310,311,312,314,315,316,317,318,319,320,321,322,323,324,325,339,341,353,362,368,369,370,490,516,520,521,522,523,524,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,545,546,547,548,549,550,551,552,554,555,556,557,558,559,560,561,562,563,564,565,576,579,605,614,631,653,654,706,723,728,729,733,735,743,767,789,794,798,802,803,811,819,838,839,842,843,892,897,898,900,902,905,907,909,920,951,959,960,963,964,999,1013,1020,1023,1034,1042,1075,1085,1137,],[117,117,117,296,117,117,117,117,296,117,117,117,296,296,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,296,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,296,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,296,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,296,117,117,]),'block_statement':([4,157,348,681,1031,1102,1106,],[118,350,629,350,350,350,629,]),'local_variable_declaration_statement':([4,157,348,681,1031,1102,1106,],[119,119,119,119,119,119,119,]),'statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[120,343,120,354,611,120,120,922,934,343,1093,611,120,120,120,922,934,1157,1093,1157,]),'local_variable_declaration':([4,157,342,348,681,1024,1031,1102,1106,],[125,125,623,125,125,623,125,125,125,]),'statement_without_trailing_substatement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[127,127,127,127,127,127,127,924,127,924,127,924,127,127,127,924,924,127,924,924,]),'labeled_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,128,]),'if_then_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,]),'if_then_else_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,130,]),'while_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,131,]),'for_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,132,]),'enhanced_for_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,133,]),'type':([4,135,157,342,348,367,418,437,460,619,648,681,683,691,695,712,828,947,1024,1031,1102,1106,1113,],[134,335,134,617,134,647,682,682,713,813,832,134,870,874,870,882,647,1040,617,134,134,134,1141,]),'block':([4,154,157,162,169,207,338,348,365,402,416,445,681,809,810,820,823,933,1021,1022,1031,1037,1102,1106,1135,1136,1138,1158,1162,],[136,136,136,136,366,408,136,136,366,408,679,408,136,136,136,944,945,136,136,136,136,1111,136,136,136,136,136,136,136,]),'expression_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,137,]),'assert_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,138,]),'switch_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,140,]),'do_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,141,]),'break_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,142,]),'continue_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,143,]),'return_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,144,]),'synchronized_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,145,]),'throw_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,146,]),'try_statement':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,147,]),'try_statement_with_resources':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,148,]),'label':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[149,149,149,149,149,149,149,930,149,930,149,930,149,149,149,930,930,149,930,930,]),'enhanced_for_statement_header':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[154,154,154,154,154,154,154,933,154,933,154,933,154,154,154,933,933,154,933,933,]),'reference_type':([4,135,157,190,313,342,348,367,378,418,437,460,528,529,553,619,648,664,666,670,671,681,683,691,695,712,717,828,947,965,966,970,971,996,1024,1031,1102,1106,1113,1123,1127,1128,],[156,156,156,387,591,156,156,156,387,156,156,156,752,387,776,156,156,849,856,859,861,156,156,156,156,156,888,156,156,1058,1061,1063,1065,1080,156,156,156,156,156,1147,1149,1151,]),'statement_expression':([4,154,157,162,338,342,348,681,809,810,814,933,1021,1022,1024,1026,1031,1102,1106,1135,1136,1138,1158,1159,1162,],[158,158,158,158,158,624,158,158,158,158,938,158,158,158,624,624,158,158,158,158,158,158,158,624,158,]),'explicit_constructor_invocation':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,159,]),'enhanced_for_statement_header_init':([4,154,157,162,338,348,681,809,810,933,1021,1022,1031,1102,1106,1135,1136,1138,1158,1162,],[170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,170,]),'class_or_interface_type':([4,83,135,157,189,190,217,221,225,303,309,313,342,348,367,378,418,437,460,499,528,529,553,587,619,648,664,666,670,671,681,683,691,695,712,714,717,730,742,828,947,965,966,970,971,981,996,1024,1031,1102,1106,1113,1123,1127,1128,1129,],[171,302,171,171,302,171,463,466,466,463,463,171,171,171,171,171,171,171,171,463,171,171,171,463,171,171,171,171,171,171,171,171,171,171,171,466,171,463,903,171,171,171,171,171,171,463,171,171,171,171,171,171,171,171,171,463,]),'array_type':([4,135,157,190,313,342,348,367,378,418,437,460,528,529,553,619,648,664,666,670,671,681,683,691,695,712,717,828,947,965,966,970,971,996,1024,1031,1102,1106,1113,1123,1127,1128,],[172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,172,]),'type_arguments':([4,83,154,157,162,186,189,256,257,267,297,309,338,348,371,374,375,388,495,499,518,681,809,810,815,816,850,933,1021,1022,1028,1031,1102,1106,1135,1136,1138,1158,1162,],[182,303,182,182,182,377,303,500,506,517,571,587,182,182,571,657,661,377,517,730,506,182,182,182,506,500,377,182,182,182,506,182,182,182,182,182,182,182,182,]),'class_or_interface':([4,83,135,157,189,190,217,221,225,303,309,313,342,348,367,378,418,437,460,499,528,529,553,587,619,648,664,666,670,671,681,683,691,695,712,714,717,730,742,828,947,965,966,970,971,981,996,1024,1031,1102,1106,1113,1123,1127,1128,1129,],[186,186,186,186,186,388,186,186,186,186,186,186,186,186,186,388,186,186,186,186,186,388,186,186,186,186,388,850,388,388,186,186,186,186,186,186,388,186,186,186,186,850,850,850,850,186,388,186,186,186,186,186,850,850,850,186,]),'generic_type':([4,83,135,157,189,190,217,221,225,303,309,313,342,348,367,378,418,437,460,499,528,529,553,587,619,648,664,666,670,671,681,683,691,695,712,714,717,730,742,828,947,965,966,970,971,981,996,1024,1031,1102,1106,1113,1123,1127,1128,1129,],[187,305,187,187,305,392,305,305,305,305,305,187,187,187,187,392,187,187,187,305,187,392,187,305,187,187,392,392,392,392,187,187,187,187,187,305,392,305,305,187,187,392,392,392,392,305,392,187,187,187,187,187,392,392,392,305,]),'class_body':([28,446,917,1014,1018,1082,1091,1131,],[206,702,1016,1016,1016,1016,1016,1016,]),'interface_body':([29,],[208,]),'enum_body':([30,],[210,]),'annotation_type_body':([31,],[212,]),'class_header_extends_opt':([43,46,],[214,226,]),'class_header_extends':([43,46,],[215,215,]),'interface_header_extends_opt':([44,],[218,]),'interface_header_extends':([44,],[219,]),'class_header_implements_opt':([45,214,226,],[222,461,468,]),'class_header_implements':([45,214,226,],[223,223,223,]),'type_parameters':([50,51,418,437,460,475,478,673,],[227,229,683,695,712,718,719,863,]),'assignment_operator':([60,188,],[239,239,]),'dims':([63,82,155,184,187,267,269,334,336,337,340,345,391,392,393,486,495,517,625,663,753,755,812,862,868,875,881,883,903,937,939,],[258,298,346,376,379,519,543,607,609,610,258,258,610,379,609,258,519,607,376,846,376,346,607,846,607,607,607,607,607,607,258,]),'dims_loop':([63,82,155,184,187,267,269,334,336,337,340,345,391,392,393,486,495,517,625,663,753,755,812,862,868,875,881,883,903,937,939,],[260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,260,]),'one_dim_loop':([63,82,155,184,187,260,267,269,334,336,337,340,345,391,392,393,486,495,517,625,663,753,755,812,862,868,875,881,883,903,937,939,],[261,261,261,261,261,511,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,261,]),'expression_not_name':([80,151,238,],[268,268,268,]),'assignment_expression_not_name':([80,151,238,],[270,270,270,]),'conditional_expression_not_name':([80,151,235,238,490,723,892,1075,],[272,272,485,272,485,485,485,485,]),'conditional_or_expression_not_name':([80,151,235,238,490,723,892,1075,],[273,273,273,273,273,273,273,273,]),'conditional_and_expression_not_name':([80,151,235,238,490,723,892,1075,],[277,277,277,277,277,277,277,277,]),'inclusive_or_expression_not_name':([80,151,235,238,490,723,892,1075,],[278,278,278,278,278,278,278,278,]),'exclusive_or_expression_not_name':([80,151,235,238,490,723,892,1075,],[279,279,279,279,279,279,279,279,]),'and_expression_not_name':([80,151,235,238,490,723,892,1075,],[280,280,280,280,280,280,280,280,]),'equality_expression_not_name':([80,151,235,238,490,723,892,1075,],[281,281,281,281,281,281,281,281,]),'instanceof_expression_not_name':([80,151,235,238,490,723,892,1075,],[282,282,282,282,282,282,282,282,]),'relational_expression_not_name':([80,151,235,238,490,723,892,1075,],[283,283,283,283,283,283,283,283,]),'shift_expression_not_name':([80,151,235,238,490,723,892,1075,],[284,284,284,284,284,284,284,284,]),'additive_expression_not_name':([80,151,235,238,490,723,892,1075,],[285,285,285,285,285,285,285,285,]),'multiplicative_expression_not_name':([80,151,235,238,490,723,892,1075,],[286,286,286,286,286,286,286,286,]),'unary_expression_not_name':([80,151,235,238,490,723,892,1075,],[289,289,289,289,289,289,289,289,]),'unary_expression_not_plus_minus_not_name':([80,151,235,238,490,723,892,1075,],[292,292,292,292,292,292,292,292,]),'postfix_expression_not_name':([80,151,235,238,490,723,892,1075,],[293,293,293,293,293,293,293,293,]),'class_type':([83,189,217,303,309,499,587,730,981,1129,],[304,304,462,578,586,731,804,896,1069,1069,]),'variable_declarators':([134,335,617,682,713,813,],[331,608,331,867,867,608,]),'variable_declarator':([134,335,604,617,682,713,813,],[332,332,805,332,332,332,332,]),'variable_declarator_id':([134,335,604,617,647,682,713,813,832,874,984,1038,],[333,333,333,333,831,333,333,333,952,983,1070,1112,]),'block_statements_opt':([157,681,],[347,866,]),'block_statements':([157,681,1031,1102,],[348,348,1106,1106,]),'expression_opt':([166,811,1137,],[359,935,1156,]),'try_block':([169,365,],[364,644,]),'resource_specification':([169,],[365,]),'type_argument_list1':([190,378,529,666,965,],[381,381,381,381,381,]),'type_argument1':([190,378,529,664,666,965,966,1123,],[382,382,382,847,382,382,847,847,]),'type_argument_list':([190,378,529,666,965,],[383,383,383,853,1055,]),'reference_type1':([190,378,529,664,666,670,671,717,965,966,970,971,996,1123,1127,1128,],[384,384,384,384,384,858,860,887,384,384,858,860,1079,384,858,860,]),'wildcard1':([190,378,529,664,666,965,966,1123,],[385,385,385,385,385,385,385,385,]),'type_argument':([190,378,529,664,666,965,966,1123,],[386,386,386,848,386,386,848,848,]),'wildcard':([190,378,529,664,666,965,966,1123,],[390,390,390,390,390,390,390,390,]),'class_body_declarations_opt':([207,445,],[401,701,]),'class_body_declarations':([207,445,],[402,402,]),'class_body_declaration':([207,402,445,],[404,678,404,]),'class_member_declaration':([207,402,445,],[405,405,405,]),'static_initializer':([207,402,445,],[406,406,406,]),'constructor_declaration':([207,213,402,445,452,],[407,457,407,407,457,]),'field_declaration':([207,209,213,402,425,445,452,],[409,435,435,409,435,409,435,]),'method_declaration':([207,402,445,],[411,411,411,]),'constructor_header':([207,213,402,445,452,],[417,417,417,417,417,]),'abstract_method_declaration':([207,209,402,425,445,],[419,429,419,429,419,]),'method_header':([207,209,402,425,445,],[420,436,420,436,420,]),'constructor_header_name':([207,213,402,445,452,],[421,421,421,421,421,]),'method_header_name':([207,209,402,425,445,],[423,423,423,423,423,]),'interface_member_declarations_opt':([209,],[424,]),'interface_member_declarations':([209,],[425,]),'interface_member_declaration':([209,425,],[427,694,]),'constant_declaration':([209,213,425,452,],[428,456,428,456,]),'enum_body_declarations_opt':([211,440,441,699,],[439,697,700,877,]),'enum_constants':([211,],[441,]),'enum_declarations':([211,440,441,699,],[442,442,442,442,]),'enum_constant':([211,699,],[444,878,]),'enum_constant_header':([211,699,],[446,446,]),'enum_constant_header_name':([211,699,],[447,447,]),'annotation_type_member_declarations_opt':([213,],[451,]),'annotation_type_member_declarations':([213,],[452,]),'annotation_type_member_declaration':([213,452,],[454,709,]),'annotation_method_header':([213,452,],[455,455,]),'annotation_method_header_name':([213,452,],[459,459,]),'interface_type_list':([221,225,],[464,467,]),'interface_type':([221,225,714,],[465,465,884,]),'type_parameter_list1':([228,],[469,]),'type_parameter1':([228,715,],[470,885,]),'type_parameter_list':([228,],[471,]),'type_parameter_header':([228,715,],[472,472,]),'type_parameter':([228,715,],[473,886,]),'member_value_pairs_opt':([235,],[479,]),'single_member_annotation_member_value':([235,],[480,]),'member_value_pairs':([235,],[481,]),'member_value':([235,490,723,892,1075,],[483,727,891,998,1130,]),'member_value_pair':([235,722,],[484,889,]),'member_value_array_initializer':([235,490,723,892,1075,],[488,488,488,488,488,]),'dims_opt':([269,334,517,812,868,875,881,883,903,937,],[542,606,741,936,606,986,986,606,1006,1027,]),'dim_with_or_without_exprs':([301,302,],[574,577,]),'dim_with_or_without_expr':([301,302,574,577,],[575,575,793,793,]),'argument_list_opt':([307,369,370,579,653,654,706,733,735,789,798,803,838,839,842,843,897,898,900,909,920,959,960,963,964,999,],[581,650,651,799,836,837,880,899,901,908,916,919,957,958,961,962,1000,1001,1003,1010,1019,1047,1048,1051,1052,1081,]),'argument_list':([307,369,370,579,653,654,706,733,735,789,798,803,838,839,842,843,897,898,900,909,920,959,960,963,964,999,],[582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,582,]),'for_init_opt':([342,1024,],[616,1096,]),'for_init':([342,1024,],[620,620,]),'statement_expression_list':([342,1024,1026,1159,],[622,622,1100,1100,]),'catches':([364,644,],[639,826,]),'catches_opt':([364,644,],[640,825,]),'catch_clause':([364,639,644,826,],[641,821,641,821,]),'resources':([367,],[645,]),'resource':([367,828,],[646,950,]),'wildcard_bounds1':([389,857,1059,],[668,668,668,]),'wildcard_bounds':([389,857,1059,],[669,669,669,]),'method_body':([417,420,],[680,685,]),'formal_parameter_list_opt':([421,423,459,],[687,692,711,]),'formal_parameter_list':([421,423,459,],[688,688,688,]),'formal_parameter':([421,423,459,873,],[690,690,690,982,]),'arguments_opt':([447,],[703,]),'arguments':([447,],[704,]),'member_values':([490,],[724,]),'array_initializer':([574,577,605,794,951,1013,1042,],[792,797,808,808,808,808,808,]),'variable_initializer':([605,794,951,1013,1042,],[806,914,1041,1088,1114,]),'finally':([640,825,],[822,948,]),'semi_opt':([645,],[827,]),'trailing_semicolon':([645,],[828,]),'type_argument_list2':([666,965,],[851,851,]),'type_argument2':([666,965,966,1123,],[852,852,1060,1060,]),'reference_type2':([666,965,966,970,971,1123,1127,1128,],[854,854,854,1062,1064,854,1062,1064,]),'wildcard2':([666,965,966,1123,],[855,855,855,855,]),'comma_opt':([794,],[910,]),'variable_initializers':([794,],[911,]),'statement_no_short_if':([809,933,1022,1135,1136,1158,1162,],[923,1025,1094,1154,1155,1160,1163,]),'labeled_statement_no_short_if':([809,933,1022,1135,1136,1158,1162,],[925,925,925,925,925,925,925,]),'if_then_else_statement_no_short_if':([809,933,1022,1135,1136,1158,1162,],[926,926,926,926,926,926,926,]),'while_statement_no_short_if':([809,933,1022,1135,1136,1158,1162,],[927,927,927,927,927,927,927,]),'for_statement_no_short_if':([809,933,1022,1135,1136,1158,1162,],[928,928,928,928,928,928,928,]),'enhanced_for_statement_no_short_if':([809,933,1022,1135,1136,1158,1162,],[929,929,929,929,929,929,929,]),'switch_block':([818,],[941,]),'catch_formal_parameter':([824,],[946,]),'wildcard_bounds2':([857,1059,],[969,969,]),'method_header_throws_clause_opt':([872,985,],[978,1071,]),'method_header_throws_clause':([872,985,],[979,979,]),'method_header_extended_dims':([875,881,],[985,989,]),'additional_bound_list1':([888,],[992,]),'additional_bound_list':([888,],[993,]),'additional_bound1':([888,993,],[994,1077,]),'additional_bound':([888,993,],[995,1078,]),'class_body_opt':([917,1014,1018,1082,1091,1131,],[1015,1089,1090,1132,1134,1153,]),'switch_block_statements':([942,],[1030,]),'switch_labels':([942,1030,],[1031,1102,]),'switch_block_statement':([942,1030,],[1032,1103,]),'switch_label':([942,1030,1031,1102,],[1033,1033,1105,1105,]),'catch_type':([947,],[1038,]),'union_type':([947,],[1039,]),'type_argument_list3':([965,],[1053,]),'type_argument3':([965,1123,],[1054,1146,]),'reference_type3':([965,1123,1127,1128,],[1056,1056,1148,1150,]),'wildcard3':([965,1123,],[1057,1057,]),'class_type_list':([981,],[1067,]),'class_type_elt':([981,1129,],[1068,1152,]),'annotation_method_header_default_value_opt':([989,],[1072,]),'default_value':([989,],[1073,]),'for_update_opt':([1026,1159,],[1097,1161,]),'for_update':([1026,1159,],[1098,1098,]),'constant_expression':([1034,],[1107,]),'wildcard_bounds3':([1059,],[1126,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -9,12 +9,15 @@ from abc import ABCMeta
 import zipfile
 import copy
 import glob
+import threading
 
 from ..logger import LogTaskStatus
 from .. import utillib
 from .. import confreader
 from .. import gencmd
 from .. import directory_scanner
+from .. import trace
+from .. import metrics
 
 from ..utillib import FileNotFoundException
 from ..utillib import UnpackArchiveError
@@ -24,6 +27,10 @@ from .assess_helper import JavaBuildArtifactsError
 from .assess_helper import JavaInvalidBuildError
 from .assess_helper import JavaBuildSummaryError
 from .assess_summary import AssessmentSummary
+from .assess_runner import AssessmentRunner
+from .assess_runner import artifact_id_key
+from .tool_cds import ToolCDSArchive
+from ..resource_plan import ResourcePlanner
 
 
 class ToolInstallFailedError(Exception):
@@ -40,6 +47,12 @@ class SwaTool(metaclass=ABCMeta):
 
     TOOL_DOT_CONF = 'tool.conf'
 
+    # tool_root_dirs already set up by SwaTool.setup_tool, updated from the
+    # tool-setup stage thread and read from the assess stage, under _tools_lock
+    _tools_unarchived = set()
+    _tools_installed = set()
+    _tools_lock = threading.Lock()
+
     @classmethod
     def get_services_conf(cls, tool_type, input_root_dir):
 
@@ -76,6 +89,19 @@ class SwaTool(metaclass=ABCMeta):
                         for key in updated_conf}
         return updated_conf
 
+    @classmethod
+    def _get_planner_conf(cls, input_root_dir, tool_conf):
+        '''run.conf, with tool.conf taking precedence'''
+
+        planner_conf = dict()
+        run_conf_file = osp.join(input_root_dir, 'run.conf')
+
+        if osp.isfile(run_conf_file):
+            planner_conf.update(confreader.read_conf_into_dict(run_conf_file))
+
+        planner_conf.update(tool_conf)
+        return planner_conf
+
     @classmethod
     def _read_err_msg(cls, errfile, errmsg):
         msg = ''
@@ -147,54 +173,39 @@ class SwaTool(metaclass=ABCMeta):
         if 'tool-target-artifacts' not in self._tool_conf:
             self._tool_conf['tool-target-artifacts'] = 'java-compile'
 
-        ## XXX this is copied code and it doesn't have all
-        ## the comments.  Once everything is rolled together
-        ## the copied code will go away and all the knowledge is
-        ## in one place.   please see src/build/build_java.py for comments
-
-        ## PLEASE SEE BOLO'S NOTES ON JAVA MEMORY
-        ## This is a cheap seats version of doing this for real
-        ## as I describe.  This does not deal with garbage collection
-        ## and java versions, which could help out tools quite a bit.
-
-        sys_mem = utillib.sys_mem_size()
-        logging.info("as sys_mem_size == %d", sys_mem);
-
-        ## old 32 bit default, fallback to avoid warnings.
-        max_heap = 1024
-
-        ## XXX wait for bolo's scaling stuff, this is a stupid version
-        ## XXX with this value, we are already into swap space due
-        ## to other java memory allocations.  It seems to work OK
-        ## for now, so this is actually a tuned number!
-
-        ## XXX may want to choose mem_size "NEAR" the thresholds since
-        ## the system steals some memory and we don't get sizing as
-        ## aggressive as this looks.  However, we are into swap as
-        ## it is, so these numbers aren't totally bad.
-
-        if utillib.get_cpu_type() == 64:
-            if (sys_mem >= 30 * 1024):
-                max_heap = int(sys_mem * 10 / 11)
-            elif (sys_mem >= 10 * 1024):
-                max_heap = int(sys_mem * 9 / 10)
-            elif (sys_mem >= 8 * 1024):
-                max_heap = int(sys_mem * 7 / 8)
-            elif (sys_mem >= 4 * 1024):
-                max_heap = int(sys_mem * 5 / 6)
-            elif (sys_mem >= 3 * 1024):
-                max_heap = int(sys_mem * 3 / 4)
-            else:
-                max_heap = int(sys_mem * 2 / 3)
-        elif utillib.get_cpu_type() == 32:
-            if (sys_mem > 3 * 1024):
-                sys_mem = 3 * 1024
-                logging.info("as sys_mem_size LIMIT 32 bit proc to %d", sys_mem);
-            max_heap = int(sys_mem * 3 / 4)
-
-        logging.info("as max-heap == %d", max_heap);
-
-        self._tool_conf['max-heap'] = '-Xmx{0}M'.format(max_heap)
+        ## The heap is sized by the resource planner shared with the
+        ## builds, see src/resource_plan.py.  This is the heap for a tool
+        ## running by itself, assess() re-plans for concurrent tools.
+        planner_conf = SwaTool._get_planner_conf(input_root_dir, self._tool_conf)
+        self._resource_planner = ResourcePlanner(planner_conf)
+        self._resource_plan = self._resource_planner.plan(self._tool_conf.get('tool-language-version',
+                                                                              'java-7'),
+                                                          java_home=os.environ.get('JAVA_HOME'))
+        logging.info("as max-heap == %d", self._resource_plan.heap)
+
+        self._tool_conf['max-heap'] = '-Xmx{0}M'.format(self._resource_plan.heap)
+
+        ## metaspace, GC and container options for the JVM version,
+        ## tool-invoke can use them as <jvm-opts% >
+        self._tool_conf['jvm-opts'] = self._resource_plan.jvm_opts()
+
+        ## assessment-timeout, assessment-cpu-timeout (seconds) of a
+        ## tool invocation, tool.conf taking precedence over run.conf
+        self._timeouts = utillib.get_timeouts(planner_conf, 'assessment')
+
+        ## oom-retries: times a tool invocation that ran out of memory is
+        ## run again, alone with all of the memory budget, then on halves
+        ## of its file list, tool.conf taking precedence over run.conf
+        ## (default 0, off)
+        try:
+            self._oom_retries = int(planner_conf.get('oom-retries', '0'))
+        except ValueError:
+            logging.warning('Invalid oom-retries: %s', planner_conf['oom-retries'])
+            self._oom_retries = 0
+
+        self._cds_archive = ToolCDSArchive(self._tool_conf, tool_root_dir,
+                                           self._resource_plan.java_home)
+        self._tool_conf['cds-opts'] = []
 
         ## ps-jtest uses jvm-max-heap , which is really a parasoft -J option
         ## may be better to just have a "max heap" number which can then
@@ -207,16 +218,15 @@ class SwaTool(metaclass=ABCMeta):
         ## -J-Xmx<max-heap-val>
         ## XXX option should be renamed jtest-max-heap since tool specific
 
-        self._tool_conf['jvm-max-heap'] = '-J-Xmx{0}M'.format(max_heap)
-
-        ## XXX not addressing garbage collection and other optimizations
-        ## at this time
+        self._tool_conf['jvm-max-heap'] = '-J-Xmx{0}M'.format(self._resource_plan.heap)
 
         logging.info('TOOL CONF: %s', self._tool_conf)
 
         # For Exit Status and Summary
         self.passed = 0
         self.failed = 0
+        self.timed_out = 0
+        self._chunk_heap = None
         self.error_msgs = ''
         self.summary_file = None
         
@@ -227,49 +237,93 @@ class SwaTool(metaclass=ABCMeta):
         '''
         return report
 
-    def _cleanup(self):
-        pass
-
-    def _get_stdin(self):
+    def _get_stdin(self, build_artifacts):
         return None
 
-    def _get_env(self):
+    def _get_env(self, build_artifacts):
         return dict(os.environ)
 
-    def _unarchive(self, input_root_dir, tool_root_dir):
+    @classmethod
+    def _unarchive_tool(cls, tool_conf, input_root_dir, tool_root_dir):
 
         with LogTaskStatus('tool-unarchive') as status_dot_out:
 
-            if 'tool-archive' not in self._tool_conf:
+            if 'tool-archive' not in tool_conf:
                 status_dot_out.skip_task()
                 return
 
-            tool_archive = osp.join(input_root_dir, self._tool_conf['tool-archive'])
+            tool_archive = osp.join(input_root_dir, tool_conf['tool-archive'])
             status = utillib.unpack_archive(tool_archive, tool_root_dir)
 
             if status != 0:
-                raise UnpackArchiveError(self._tool_conf['tool-archive'])
+                raise UnpackArchiveError(tool_conf['tool-archive'])
 
-    def _install(self, input_root_dir, tool_root_dir):
+    @classmethod
+    def _install_tool(cls, tool_conf, tool_root_dir, env=None):
 
         with LogTaskStatus('tool-install') as status_dot_out:
 
-            if 'tool-install-cmd' not in self._tool_conf:
+            if 'tool-install-cmd' not in tool_conf:
                 status_dot_out.skip_task()
             else:
-                install_cmd = self._tool_conf['tool-install-cmd']
+                install_cmd = tool_conf['tool-install-cmd']
 
                 logging.info('TOOL INSTALL COMMAND: %s', install_cmd)
 
                 exit_code, _ = utillib.run_cmd(install_cmd,
                                                shell=True,
-                                               cwd=tool_root_dir)
+                                               cwd=tool_root_dir,
+                                               env=env)
 
                 if exit_code != 0:
                     raise ToolInstallFailedError("Install Tool Failed, "
                                                  "Command '{0}' return {1}".format(install_cmd,
                                                                                    exit_code))
 
+    @classmethod
+    def setup_tool(cls, input_root_dir, tool_root_dir, environ):
+        '''Unarchives and installs the tool ahead of creating the SwaTool
+        object, so that it can run while the package is being built.
+        The package build changes os.environ at the same time, the install
+        command runs in environ (taken before the stages started) with the
+        tool's JAVA_HOME.  Tools that override _install are installed by
+        the constructor.
+        '''
+
+        tool_conf = SwaTool._get_tool_conf(input_root_dir)
+        SwaTool._unarchive_tool(tool_conf, input_root_dir, tool_root_dir)
+
+        if cls._install is SwaTool._install:
+            env = dict(environ)
+            utillib.setup_java_home(tool_conf.get('tool-language-version', 'java-7'),
+                                    'JAVA_HOME', env)
+            if env.get('JAVA_HOME') and env.get('JAVA_HOME') != environ.get('JAVA_HOME'):
+                env['PATH'] = '{0}/bin:{1}'.format(env['JAVA_HOME'], env['PATH'])
+
+            SwaTool._install_tool(tool_conf, tool_root_dir, env)
+
+            with SwaTool._tools_lock:
+                SwaTool._tools_installed.add(tool_root_dir)
+
+        with SwaTool._tools_lock:
+            SwaTool._tools_unarchived.add(tool_root_dir)
+
+    def _unarchive(self, input_root_dir, tool_root_dir):
+
+        with SwaTool._tools_lock:
+            unarchived = tool_root_dir in SwaTool._tools_unarchived
+
+        if not unarchived:
+            SwaTool._unarchive_tool(self._tool_conf, input_root_dir, tool_root_dir)
+
+    def _install(self, input_root_dir, tool_root_dir):
+
+        with SwaTool._tools_lock:
+            installed = tool_root_dir in SwaTool._tools_installed
+
+        if not installed:
+            SwaTool._install_tool(self._tool_conf, tool_root_dir)
+
     def _install_license(self, input_root_dir, tool_root_dir):
 
         # spelling mistake, and this is to make it backwards compatible
@@ -304,6 +358,182 @@ class SwaTool(metaclass=ABCMeta):
         return sum([not self._validate_exit_code(exit_code)
                     for exit_code in exit_code_list])
 
+    def _cap_workers(self, requested):
+        '''Caps the number of concurrent tool invocations by the number
+        of CPUs, and by the number of JVMs with a heap of
+        assessment-min-heap (MB) that fit in the memory budget'''
+
+        cpus = os.cpu_count() or 1
+
+        if requested == 'auto':
+            requested = cpus
+
+        try:
+            min_heap = int(self._tool_conf.get('assessment-min-heap', '1024'))
+        except ValueError:
+            logging.warning('Invalid assessment-min-heap: %s',
+                            self._tool_conf['assessment-min-heap'])
+            min_heap = 1024
+
+        mem_workers = self._resource_planner.max_concurrency(max(1, min_heap))
+
+        workers = max(1, min(requested, cpus, mem_workers))
+        logging.info('as workers requested %d, cpus %d, memory %d: %d',
+                     requested, cpus, mem_workers, workers)
+        return workers
+
+    def _get_assessment_workers(self):
+        '''Number of build artifacts that can be assessed at the same time.
+
+        Opt-in through tool.conf max-concurrent-assessments (a number or
+        auto), since not every tool can run side by side with itself.
+        '''
+
+        requested = self._tool_conf.get('max-concurrent-assessments', '1')
+
+        if requested != 'auto':
+            try:
+                requested = int(requested)
+            except ValueError:
+                logging.warning('Invalid max-concurrent-assessments: %s', requested)
+                requested = 1
+
+        return self._cap_workers(requested)
+
+    def _get_chunk_workers(self):
+        '''Number of chunks of a split build artifact that can be
+        assessed at the same time'''
+        return 1
+
+    def _set_resource_plan(self, build_artifacts, resource_plan):
+        build_artifacts['max-heap'] = '-Xmx{0}M'.format(resource_plan.heap)
+        build_artifacts['jvm-max-heap'] = '-J-Xmx{0}M'.format(resource_plan.heap)
+        build_artifacts['jvm-opts'] = resource_plan.jvm_opts()
+
+    def _get_tool_cmd(self, build_artifacts, results_root_dir, resource_plan):
+        '''Adds tool.conf and the per invocation files to build_artifacts,
+        returns the command.  gencmd is not thread safe, this runs in
+        the thread that calls assess'''
+
+        if 'report-on-stdout' in self._tool_conf \
+           and self._tool_conf['report-on-stdout'] == 'true':
+            outfile = build_artifacts['assessment-report']
+        else:
+            outfile = osp.join(results_root_dir,
+                               'swa_tool_stdout{0}.out'.format(build_artifacts['build-artifact-id']))
+
+        if 'report-on-stderr' in self._tool_conf \
+           and self._tool_conf['report-on-stderr'] == 'true':
+            errfile = build_artifacts['assessment-report']
+        else:
+            errfile = osp.join(results_root_dir,
+                               'swa_tool_stderr{0}.out'.format(build_artifacts['build-artifact-id']))
+
+        build_artifacts.update(self._tool_conf)
+        build_artifacts['swa-tool-stdout'] = outfile
+        build_artifacts['swa-tool-stderr'] = errfile
+        self._set_resource_plan(build_artifacts, resource_plan)
+        build_artifacts['cds-opts'] = self._cds_archive.get_opts()
+
+        cmd = gencmd.gencmd(self._tool_conf['tool-invoke'], build_artifacts)
+        logging.info('ASSESSMENT COMMAND: %s', cmd)
+        return cmd
+
+    def _run_tool(self, build_artifacts, cmd, cwd, resource_plan=None):
+
+        with trace.Span('tool-invocation',
+                        parent=build_artifacts.get('trace-span'),
+                        attrs=SwaTool._get_trace_attrs(build_artifacts)) as span:
+            result = self._run_tool_cmd(build_artifacts, cmd, cwd, resource_plan)
+            span.set_attrs({'exit-code': result['exit-code'],
+                            'max-heap': resource_plan.heap if resource_plan else None,
+                            'usage': result['usage']})
+            return result
+
+    @classmethod
+    def _get_trace_attrs(cls, build_artifacts):
+        attrs = {'build-artifact-id': str(build_artifacts['build-artifact-id']),
+                 'split-chunk': bool(build_artifacts.get('split-chunk')),
+                 'oom-attempts': len(build_artifacts.get('oom-attempts', []))}
+
+        for file_type in ['classfile', 'srcfile', 'auxclasspath', 'classpath']:
+            if isinstance(build_artifacts.get(file_type), list):
+                attrs['{0}-count'.format(file_type)] = len(build_artifacts[file_type])
+
+        return attrs
+
+    def _run_tool_cmd(self, build_artifacts, cmd, cwd, resource_plan):
+
+        starttime = utillib.posix_epoch()
+        usage = dict()
+
+        exit_code, environ = utillib.run_cmd(cmd,
+                                             cwd=cwd,
+                                             outfile=build_artifacts['swa-tool-stdout'],
+                                             errfile=build_artifacts['swa-tool-stderr'],
+                                             infile=self._get_stdin(build_artifacts),
+                                             env=self._get_env(build_artifacts),
+                                             usage=usage,
+                                             timeout=self._timeouts[0],
+                                             cpu_timeout=self._timeouts[1],
+                                             resource_plan=resource_plan)
+
+        self._cds_archive.invocation_done(build_artifacts['cds-opts'],
+                                          self._validate_exit_code(exit_code))
+
+        return {
+            'build-artifacts': build_artifacts,
+            'cmd': cmd,
+            'exit-code': exit_code,
+            'environ': environ,
+            'start-ts': starttime,
+            'stop-ts': utillib.posix_epoch(),
+            'usage': usage,
+            'resource-plan': resource_plan,
+        }
+
+    def _get_assessment_exit_code(self, build_artifacts, exit_code):
+        '''Returns exit code to count the assessment with,
+        collects tool-package incompatibility messages'''
+
+        outfile = build_artifacts['swa-tool-stdout']
+        errfile = build_artifacts['swa-tool-stderr']
+
+        if not self._validate_exit_code(exit_code) and \
+           ('tool-report-exit-code' in self._tool_conf) and \
+           (exit_code == int(self._tool_conf['tool-report-exit-code'])):
+
+            if self._tool_conf['tool-type'] == 'error-prone':
+                self.error_msgs += SwaTool._read_err_msg(build_artifacts['assessment-report'],
+                                                         self._tool_conf['tool-report-exit-code-msg'])
+            elif self._tool_conf['tool-type'] == 'dependency-check':
+                self.error_msgs += SwaTool._read_err_msg(outfile,
+                                                         self._tool_conf['tool-report-exit-code-msg'])
+            elif self._tool_conf['tool-type'] == 'ps-jtest' and \
+                (self._tool_conf['tool-version'].startswith('10.3') or \
+                 self._tool_conf['tool-version'].startswith('10.4')):
+                self.error_msgs += SwaTool._read_err_msg(outfile,
+                                                         self._tool_conf['tool-report-exit-code-msg'])
+            else:
+                self.error_msgs += SwaTool._read_err_msg(errfile,
+                                                         self._tool_conf['tool-report-exit-code-msg'])
+            return exit_code
+
+        elif self._tool_conf['tool-type'] == 'error-prone' and \
+             self._tool_conf['tool-version'] not in ['2.0.15', '2.0.9', '1.1.1']:
+            # error-prone 2.0.21 does not return different exit code for tool-pkg-incompatiblity
+            error_msg = SwaTool._read_err_msg(build_artifacts['assessment-report'],
+                                              self._tool_conf['tool-report-exit-code-msg'])
+
+            if error_msg:
+                self.error_msgs += error_msg
+                # Differnet exit code
+                return int(self._tool_conf['tool-report-exit-code'])
+            else:
+                return exit_code
+        else:
+            return exit_code
+
     def assess(self, build_summary_file, results_root_dir):
 
         JavaBuildArtifacts.validate(build_summary_file)
@@ -313,105 +543,331 @@ class SwaTool(metaclass=ABCMeta):
         self.summary_file = osp.join(results_root_dir, 'assessment_summary.xml')
 
         exit_codes_list = list()
+        artifact_workers = self._get_assessment_workers()
+        workers = max(artifact_workers, self._get_chunk_workers())
+
+        # A build artifact takes as many worker slots (and as big a share
+        # of the memory) as keeps at most artifact_workers of them running,
+        # a chunk of a split build artifact takes one
+        artifact_slots = -(-workers // artifact_workers)
+        resource_plans = dict()
+        artifact_spans = dict()
+
+        # the heap of a chunk, build artifacts too big for it are split
+        self._chunk_heap = self._resource_planner.plan(self._resource_plan.java_ver,
+                                                       workers, 1,
+                                                       java_home=self._resource_plan.java_home).heap
 
         with AssessmentSummary(self.summary_file,
                                build_summary_obj,
                                self._tool_conf) as assessment_summary:
 
-            for build_artifacts in self._get_build_artifacts(build_summary_obj, results_root_dir):
+            with AssessmentRunner(workers) as runner:
 
-                if 'report-on-stdout' in self._tool_conf \
-                   and self._tool_conf['report-on-stdout'] == 'true':
-                    outfile = build_artifacts['assessment-report']
-                else:
-                    outfile = osp.join(results_root_dir,
-                                       'swa_tool_stdout{0}.out'.format(build_artifacts['build-artifact-id']))
+                for build_artifacts in self._get_build_artifacts(build_summary_obj, results_root_dir):
 
-                if 'report-on-stderr' in self._tool_conf \
-                   and self._tool_conf['report-on-stderr'] == 'true':
-                    errfile = build_artifacts['assessment-report']
-                else:
-                    errfile = osp.join(results_root_dir,
-                                       'swa_tool_stderr{0}.out'.format(build_artifacts['build-artifact-id']))
+                    slots = 1 if build_artifacts.get('split-chunk') else artifact_slots
+
+                    # the chunks of a build artifact are children of its span
+                    artifact_id = str(build_artifacts.get('id', build_artifacts['build-artifact-id']))
+                    if artifact_id not in artifact_spans:
+                        artifact_spans[artifact_id] = trace.Span('artifact',
+                                                                 attrs={'build-artifact-id': artifact_id})
+                    build_artifacts['trace-span'] = artifact_spans[artifact_id]
+
+                    if slots not in resource_plans:
+                        resource_plans[slots] = self._resource_planner.plan(self._resource_plan.java_ver,
+                                                                            workers, slots,
+                                                                            java_home=self._resource_plan.java_home)
+                        assessment_summary.add_resource_plan(resource_plans[slots])
+
+                    # each concurrent JVM gets its share of the memory
+                    cmd = self._get_tool_cmd(build_artifacts, results_root_dir,
+                                             resource_plans[slots])
+
+                    runner.submit(build_artifacts['build-artifact-id'],
+                                  self._run_tool,
+                                  build_artifacts,
+                                  cmd,
+                                  build_summary_obj.get_pkg_dir(),
+                                  resource_plans[slots],
+                                  slots=slots)
 
-                self._tool_conf['swa-tool-stdout'] = outfile
-                self._tool_conf['swa-tool-stderr'] = errfile
+                results = runner.results()
 
-                build_artifacts.update(self._tool_conf)
-                cmd = gencmd.gencmd(self._tool_conf['tool-invoke'], build_artifacts)
-                logging.info('ASSESSMENT COMMAND: %s', cmd)
+            results = self._retry_out_of_memory(results,
+                                                build_summary_obj,
+                                                results_root_dir,
+                                                workers,
+                                                assessment_summary)
 
-                starttime = utillib.posix_epoch()
+            for span in artifact_spans.values():
+                span.finish(span.last_child_end)
 
-                exit_code, environ = utillib.run_cmd(cmd,
-                                                     cwd=build_summary_obj.get_pkg_dir(),
-                                                     outfile=outfile,
-                                                     errfile=errfile,
-                                                     infile=self._get_stdin(),
-                                                     env=self._get_env())
+            for result in results:
+
+                build_artifacts = result['build-artifacts']
+                exit_code = result['exit-code']
 
                 build_artifacts['assessment-report'] = self._get_report(results_root_dir,
                                                                         build_artifacts['assessment-report'],
-                                                                        outfile)
+                                                                        build_artifacts['swa-tool-stdout'])
+
+                timed_out = 'timeout' in result['usage']
 
-                if self._validate_exit_code(exit_code):
+                if self._validate_exit_code(exit_code) and not timed_out:
                     execution_successful = True
                 else:
                     execution_successful = False
 
                 assessment_summary.add_report(build_artifacts['build-artifact-id'],
-                                              cmd,
+                                              result['cmd'],
                                               exit_code,
                                               execution_successful,
-                                              environ,
+                                              result['environ'],
                                               build_summary_obj.get_pkg_dir(),
                                               build_artifacts['assessment-report'],
-                                              outfile,
-                                              errfile,
+                                              build_artifacts['swa-tool-stdout'],
+                                              build_artifacts['swa-tool-stderr'],
                                               self._tool_conf['tool-type'],
-                                              starttime,
-                                              utillib.posix_epoch(),
-                                              results_root_dir)
-
-                if not self._validate_exit_code(exit_code) and \
-                   ('tool-report-exit-code' in self._tool_conf) and \
-                   (exit_code == int(self._tool_conf['tool-report-exit-code'])):
-
-                    exit_codes_list.append(exit_code)
-
-                    if self._tool_conf['tool-type'] == 'error-prone':
-                        self.error_msgs += SwaTool._read_err_msg(build_artifacts['assessment-report'],
-                                                                 self._tool_conf['tool-report-exit-code-msg'])
-                    elif self._tool_conf['tool-type'] == 'dependency-check':
-                        self.error_msgs += SwaTool._read_err_msg(outfile,
-                                                                 self._tool_conf['tool-report-exit-code-msg'])
-                    elif self._tool_conf['tool-type'] == 'ps-jtest' and \
-                        (self._tool_conf['tool-version'].startswith('10.3') or \
-                         self._tool_conf['tool-version'].startswith('10.4')):
-                        self.error_msgs += SwaTool._read_err_msg(outfile,
-                                                                 self._tool_conf['tool-report-exit-code-msg'])
-                    else:
-                        self.error_msgs += SwaTool._read_err_msg(errfile,
-                                                                 self._tool_conf['tool-report-exit-code-msg'])
-                elif self._tool_conf['tool-type'] == 'error-prone' and \
-                     self._tool_conf['tool-version'] not in ['2.0.15', '2.0.9', '1.1.1']:
-                    # error-prone 2.0.21 does not return different exit code for tool-pkg-incompatiblity
-                    error_msg = SwaTool._read_err_msg(build_artifacts['assessment-report'],
-                                                      self._tool_conf['tool-report-exit-code-msg'])
-
-                    if error_msg:
-                        self.error_msgs += error_msg
-                        # Differnet exit code
-                        exit_codes_list.append(int(self._tool_conf['tool-report-exit-code']))
-                    else:
-                        exit_codes_list.append(exit_code)
+                                              result['start-ts'],
+                                              result['stop-ts'],
+                                              results_root_dir,
+                                              result['usage'],
+                                              build_artifacts.get('oom-attempts'))
+
+                if timed_out:
+                    self.timed_out += 1
+                    LogTaskStatus.log_timeout('tool-invocation', exit_code,
+                                              '{0}, {1}'.format(build_artifacts['build-artifact-id'],
+                                                                result['usage']['timeout']))
+                else:
+                    exit_codes_list.append(self._get_assessment_exit_code(build_artifacts,
+                                                                          exit_code))
+
+        usages = [result['usage'] for result in results if result['usage']]
+
+        if usages:
+            LogTaskStatus.log_note('assess: {0} invocations, user {1:.1f}s, sys {2:.1f}s, '
+                                   'peak max-rss {3}MB, blocks in/out {4}/{5}'.format(
+                                       len(usages),
+                                       sum(float(usage['user-time']) for usage in usages),
+                                       sum(float(usage['system-time']) for usage in usages),
+                                       max(int(usage['max-rss-kb']) for usage in usages) // 1024,
+                                       sum(int(usage['block-input']) for usage in usages),
+                                       sum(int(usage['block-output']) for usage in usages)))
+
+        failed = self._get_num_failed_assessments(exit_codes_list)
+        self.passed = len(exit_codes_list) - failed
+        self.failed = failed + self.timed_out
+
+    ## java.lang.OutOfMemoryError: Java heap space, GC overhead limit
+    ## exceeded, Metaspace, unable to create new native thread, ...
+    OOM_PATTERNS = [
+        r'java\.lang\.OutOfMemoryError.*',
+        r'GC overhead limit exceeded',
+    ]
+
+    ## the end of stdout and stderr is scanned, bytes
+    OOM_SCAN_SIZE = 256 * 1024
+
+    def _get_out_of_memory(self, result):
+        '''Why the tool invocation of result ran out of memory,
+        None if it did not fail or failed for another reason'''
+
+        if self._validate_exit_code(result['exit-code']) or \
+           'timeout' in result['usage']:
+            return None
+
+        cgroup = result['usage'].get('cgroup', dict())
+        if int(cgroup.get('oom-kill', '0')):
+            return 'cgroup oom-kill'
+
+        build_artifacts = result['build-artifacts']
+        regex = re.compile('|'.join(SwaTool.OOM_PATTERNS))
+
+        for filename in {build_artifacts['swa-tool-stdout'], build_artifacts['swa-tool-stderr']}:
+            if osp.isfile(filename):
+                with open(filename, 'rb') as fobj:
+                    fobj.seek(max(0, osp.getsize(filename) - SwaTool.OOM_SCAN_SIZE))
+                    match = regex.search(fobj.read().decode('utf-8', errors='replace'))
+
+                if match:
+                    return match.group(0).strip()[:200]
+
+        # the kernel OOM killer
+        if result['exit-code'] in [-9, 137]:
+            return 'killed (SIGKILL)'
+
+        return None
+
+    def _get_split_file_type(self, build_artifacts):
+        '''Name of the file list parameter of tool-invoke that can be
+        split, None if the invocation can not be split'''
+
+        tokens = gencmd.get_param_list(self._tool_conf['tool-invoke'])
+
+        for file_type in ['classfile', 'srcfile']:
+            if file_type in tokens and len(build_artifacts.get(file_type, [])) > 1:
+                return file_type
+
+        return None
+
+    @classmethod
+    def _get_artifact_id(cls, build_artifacts):
+        return str(build_artifacts.get('id', build_artifacts['build-artifact-id']))
+
+    @classmethod
+    def _get_chunk_number(cls, build_artifacts):
+        '''N of a chunk <id>-N of a split build artifact, 0 if it is not one'''
+
+        prefix = '{0}-'.format(SwaTool._get_artifact_id(build_artifacts))
+        build_artifact_id = str(build_artifacts['build-artifact-id'])
+
+        if build_artifact_id.startswith(prefix) and build_artifact_id[len(prefix):].isdigit():
+            return int(build_artifact_id[len(prefix):])
+        return 0
+
+    def _get_retry_artifacts(self, result, full_plan, results_root_dir, chunk_numbers):
+        '''build artifacts to assess again after result ran out of memory:
+        the same with full_plan if that is a bigger heap, else the two
+        halves of its file list.  [] if neither helps.
+
+        The halves are chunks <id>-N of the build artifact, numbered after
+        the last one in chunk_numbers (build artifact id: N), which is
+        updated.  The report, stdout and stderr of result are renamed
+        <file>.oom-<attempt>, the retry writes its own'''
+
+        build_artifacts = result['build-artifacts']
+        plan = result['resource-plan']
+        attempts = build_artifacts.get('oom-attempts', list())
+
+        if plan is not None and plan.heap < full_plan.heap and \
+           not any(attempt['retry'] == 'heap' for attempt in attempts):
+            retry = 'heap'
+            retry_artifacts = [dict(build_artifacts)]
+        else:
+            file_type = self._get_split_file_type(build_artifacts)
+
+            if file_type is None:
+                return list()
+
+            retry = 'split'
+            artifact_id = SwaTool._get_artifact_id(build_artifacts)
+            filelist = build_artifacts[file_type]
+            half = len(filelist) // 2
+            retry_artifacts = list()
+            metrics.counter('java_assess_split_chunks_total',
+                            'Chunks build artifacts were split into').inc(2)
+
+            for chunk in [filelist[:half], filelist[half:]]:
+                chunk_numbers[artifact_id] = chunk_numbers.get(artifact_id, 0) + 1
+                new_attrs = dict(build_artifacts)
+                new_attrs[file_type] = chunk
+                new_attrs['build-artifact-id'] = '{0}-{1}'.format(artifact_id,
+                                                                  chunk_numbers[artifact_id])
+                new_attrs['split-chunk'] = True
+                new_attrs['assessment-report'] = osp.join(results_root_dir,
+                                                          self._tool_conf['assessment-report-template'].format(new_attrs['build-artifact-id']))
+                retry_artifacts.append(new_attrs)
+
+        # the report is stdout or stderr for report-on-stdout/stderr tools
+        superseded = dict()
+        for key in ['assessment-report', 'swa-tool-stdout', 'swa-tool-stderr']:
+            filepath = build_artifacts.get(key)
+            if filepath and filepath not in superseded and osp.exists(filepath):
+                superseded[filepath] = '{0}.oom-{1}'.format(filepath, len(attempts) + 1)
+                os.replace(filepath, superseded[filepath])
+
+        attempt = {
+            'build-artifact-id': str(build_artifacts['build-artifact-id']),
+            'exit-code': str(result['exit-code']),
+            'max-heap': str(plan.heap) if plan else '',
+            'out-of-memory': result['out-of-memory'],
+            'start-ts': result['start-ts'],
+            'stop-ts': result['stop-ts'],
+            'retry': retry,
+        }
+
+        for key in ['swa-tool-stdout', 'swa-tool-stderr']:
+            if build_artifacts.get(key) in superseded:
+                attempt[key] = osp.basename(superseded[build_artifacts[key]])
+
+        for new_attrs in retry_artifacts:
+            new_attrs['oom-attempts'] = attempts + [attempt]
+
+        LogTaskStatus.log_note('oom-retry: {0} ({1}), {2}'.format(attempt['build-artifact-id'],
+                                                                  attempt['out-of-memory'],
+                                                                  retry))
+        return retry_artifacts
+
+    def _retry_out_of_memory(self, results, build_summary_obj, results_root_dir,
+                             workers, assessment_summary):
+        '''Assesses again, up to oom-retries times, the build artifacts
+        whose tool invocation ran out of memory.  A retry runs by itself,
+        with the whole memory budget.  Returns the results, with those of
+        the retries in place of the ones that ran out of memory'''
+
+        final_results = list()
+        full_plan = None
+
+        # split retries number their chunks after the last <id>-N
+        chunk_numbers = dict()
+        for result in results:
+            artifact_id = SwaTool._get_artifact_id(result['build-artifacts'])
+            chunk_numbers[artifact_id] = max(chunk_numbers.get(artifact_id, 0),
+                                             SwaTool._get_chunk_number(result['build-artifacts']))
+
+        while results:
+            retry_results = list()
+
+            for result in results:
+                attempts = result['build-artifacts'].get('oom-attempts', list())
+
+                if len(attempts) < self._oom_retries:
+                    result['out-of-memory'] = self._get_out_of_memory(result)
+
+                if result.get('out-of-memory'):
+                    retry_results.append(result)
                 else:
-                    exit_codes_list.append(exit_code)
+                    final_results.append(result)
+
+            if not retry_results:
+                break
+
+            metrics.counter('java_assess_oom_retries_total',
+                            'Tool invocations run again for running out of memory').inc(len(retry_results))
+
+            if full_plan is None:
+                full_plan = self._resource_planner.plan(self._resource_plan.java_ver,
+                                                        workers, workers,
+                                                        java_home=self._resource_plan.java_home)
+                assessment_summary.add_resource_plan(full_plan)
+
+            with AssessmentRunner(workers) as runner:
 
-                self._cleanup()
+                for result in retry_results:
 
-        self.failed = self._get_num_failed_assessments(exit_codes_list)
-        self.passed = len(exit_codes_list) - self.failed
+                    retry_artifacts = self._get_retry_artifacts(result, full_plan,
+                                                                results_root_dir, chunk_numbers)
+
+                    if not retry_artifacts:
+                        final_results.append(result)
+
+                    for build_artifacts in retry_artifacts:
+                        cmd = self._get_tool_cmd(build_artifacts, results_root_dir, full_plan)
+                        runner.submit(build_artifacts['build-artifact-id'],
+                                      self._run_tool,
+                                      build_artifacts,
+                                      cmd,
+                                      build_summary_obj.get_pkg_dir(),
+                                      full_plan,
+                                      slots=workers)
+
+                results = runner.results()
+
+        return sorted(final_results,
+                      key=lambda result: artifact_id_key(result['build-artifacts']['build-artifact-id']))
     
     def post_assess(self, results_root_dir):
         pass
@@ -446,6 +902,16 @@ class JavaSwaTool(SwaTool):
     def __init__(self, input_root_dir, tool_root_dir):
         SwaTool.__init__(self, input_root_dir, tool_root_dir)
 
+    def _get_chunk_workers(self):
+        '''Chunks run concurrently if tool.conf concurrent-split-chunks is
+        true (opt-in, for tools whose invocations share no output directory
+        or cache), the heap is divided among the concurrent JVMs'''
+
+        if utillib.string_to_bool(self._tool_conf.get('concurrent-split-chunks', 'false')):
+            return self._cap_workers('auto')
+        else:
+            return 1
+
     def _get_build_artifacts(self, build_summary_obj, results_root_dir):
         '''yeilds dictionary objects that has all the information to run
         a swa tool'''
@@ -461,24 +927,38 @@ class JavaSwaTool(SwaTool):
                 yield new_build_artifacts
 
     def _split_build_artifact(self, build_artifacts, results_root_dir):
-        '''Splits only if required'''
+        '''Splits only if required, the command is too long or the
+        estimated work size of the artifact does not fit a chunk's heap'''
 
         # returns list of list
         file_type, max_allowed_size = self._split_artifacts_required(build_artifacts)
+        shard_type, shards = self._get_work_size_shards(build_artifacts)
+
+        if shards:
+            file_type = shard_type
+        elif file_type:
+            shards = [build_artifacts[file_type]]
+
         if file_type:
             filelists = list()
-            self._split_list(filelists,
-                             build_artifacts[file_type],
-                             max_allowed_size)
+            for shard in shards:
+                if max_allowed_size:
+                    self._split_list(filelists, shard, max_allowed_size)
+                else:
+                    filelists.append(shard)
 
             build_artifacts.pop(file_type)
             build_artifacts_list = list()
 
+            metrics.counter('java_assess_split_chunks_total',
+                            'Chunks build artifacts were split into').inc(len(filelists))
+
             id_count = 1
             for filelist in filelists:
                 new_attrs = dict(build_artifacts)
                 new_attrs[file_type] = filelist
                 new_attrs['build-artifact-id'] = '{0}-{1}'.format(new_attrs['id'], str(id_count))
+                new_attrs['split-chunk'] = True
                 new_attrs['assessment-report'] = osp.join(results_root_dir,
                                                           self._tool_conf['assessment-report-template'].format(new_attrs['build-artifact-id']))
                 id_count += 1
@@ -488,6 +968,86 @@ class JavaSwaTool(SwaTool):
         else:
             return [build_artifacts]
 
+    def _get_conf_float(self, key, default):
+        try:
+            return float(self._tool_conf.get(key, default))
+        except ValueError:
+            logging.warning('Invalid %s: %s', key, self._tool_conf[key])
+            return default
+
+    def _get_work_size_shards(self, build_artifacts):
+        '''(file type, file lists) of the balanced shards the file list of
+        the artifact is split into so that the estimated heap (and time)
+        of a shard fits, (None, None) if the artifact fits.
+
+        The estimate uses coefficients from tool.conf:
+          shard-memory-base      MB of heap of the tool itself (default 256)
+          shard-memory-per-file  MB of heap per class or source file
+          shard-memory-per-mb    MB of heap per MB of class or source files
+          shard-seconds-per-file, shard-seconds-per-mb, shard-max-seconds
+                                 the same for time, if shard-max-seconds is set
+        The tool's heap is the one planned for a chunk.'''
+
+        per_file = self._get_conf_float('shard-memory-per-file', 0)
+        per_mb = self._get_conf_float('shard-memory-per-mb', 0)
+
+        if (per_file <= 0 and per_mb <= 0) or not self._chunk_heap:
+            return (None, None)
+
+        file_type = JavaSwaTool._get_assess_artifact_type(self._tool_conf['tool-invoke'],
+                                                          'classfile',
+                                                          'srcfile')
+        filelist = build_artifacts.get(file_type) if file_type else None
+
+        if not filelist or len(filelist) < 2:
+            return (None, None)
+
+        sizes = dict()
+        for _file in filelist:
+            try:
+                sizes[_file] = osp.getsize(_file) / (1024 * 1024)
+            except OSError:
+                sizes[_file] = 0
+
+        base = self._get_conf_float('shard-memory-base', 256)
+        memory = per_file * len(filelist) + per_mb * sum(sizes.values())
+
+        if self._chunk_heap <= base:
+            logging.warning('shard-memory-base %s MB does not fit the chunk heap %s MB',
+                            base, self._chunk_heap)
+            return (None, None)
+
+        num_shards = int(-(-memory // (self._chunk_heap - base)))
+
+        max_seconds = self._get_conf_float('shard-max-seconds', 0)
+        if max_seconds > 0:
+            seconds = self._get_conf_float('shard-seconds-per-file', 0) * len(filelist) + \
+                      self._get_conf_float('shard-seconds-per-mb', 0) * sum(sizes.values())
+            num_shards = max(num_shards, int(-(-seconds // max_seconds)))
+
+        num_shards = min(num_shards, len(filelist))
+
+        logging.info('WORK SIZE %s: %d files, %.1f MB, estimated heap %.0f MB + %s MB, '
+                     'chunk heap %s MB, %d shards',
+                     build_artifacts['build-artifact-id'], len(filelist),
+                     sum(sizes.values()), memory, base, self._chunk_heap, num_shards)
+
+        if num_shards < 2:
+            return (None, None)
+
+        # the biggest file to the lightest shard, in the order of the list
+        cost = lambda _file: per_file + per_mb * sizes[_file]
+        shards = [list() for _ in range(num_shards)]
+        loads = [0.0] * num_shards
+
+        for _file in sorted(filelist, key=cost, reverse=True):
+            lightest = loads.index(min(loads))
+            shards[lightest].append(_file)
+            loads[lightest] += cost(_file)
+
+        order = {_file: index for index, _file in enumerate(filelist)}
+        return (file_type, [sorted(shard, key=order.get) for shard in shards])
+
     def _split_artifacts_required(self, build_artifacts):
         '''returns a tuple with key in attribute and an integer corresponding
         to the size '''
@@ -532,7 +1092,6 @@ class Findbugs(SwaTool):
     def __init__(self, input_root_dir, tool_root_dir):
         SwaTool.__init__(self, input_root_dir, tool_root_dir)
         self._tool_conf['tool-target-artifacts'] = 'java-compile java-bytecode'
-        self.stdin_file_path = None
 
     def _modify_build_artifacts(self, build_artifacts, results_root_dir):
 
@@ -546,16 +1105,13 @@ class Findbugs(SwaTool):
             class_files_list = osp.join(results_root_dir,
                                         'class_files{0}.txt'.format(build_artifacts['build-artifact-id']))
             utillib.write_to_file(class_files_list, build_artifacts['classfile'])
-            self.stdin_file_path = class_files_list
+            build_artifacts['class-files-list'] = class_files_list
             return True
         else:
             return False
         
-    def _get_stdin(self):
-        return self.stdin_file_path
-
-    def _cleanup(self):
-        self.stdin_file_path = None
+    def _get_stdin(self, build_artifacts):
+        return build_artifacts.get('class-files-list')
 
 
 ## OK, so really classpath is "expensive to generate", and we should
@@ -574,7 +1130,7 @@ class CryptoGuard(SwaTool):
         SwaTool.__init__(self, input_root_dir, tool_root_dir)
 #        self._tool_conf['tool-target-artifacts'] = 'java-compile java-bytecode'
 
-    def _get_env(self):
+    def _get_env(self, build_artifacts):
         ## Cryptoguard always needs a correct JAVA7_HOME available
         new_env = dict(os.environ)
         java7_home = 'JAVA7_HOME'
@@ -676,24 +1232,13 @@ class Lizard(JavaSwaTool):
 
     def __init__(self, input_root_dir, tool_root_dir):
         SwaTool.__init__(self, input_root_dir, tool_root_dir)
-        self.build_artifacts_encoding = None
 
-    def _get_env(self):
+    def _get_env(self, build_artifacts):
         new_env = dict(os.environ)
-        if self.build_artifacts_encoding is not None:
-            new_env['LANG'] = 'en_US.%s' % (self.build_artifacts_encoding)
-        return new_env
-
-    def _modify_build_artifacts(self, build_artifacts, results_root_dir):
-
         encoding = build_artifacts.get('encoding', None)
         if encoding and encoding != BuildArtifacts.UTF_8:
-            self.build_artifacts_encoding = encoding
-
-        return True
-
-    def _cleanup(self):
-        self.build_artifacts_encoding = None
+            new_env['LANG'] = 'en_US.%s' % (encoding)
+        return new_env
 
 
 class AppHealthCheck(SwaTool):
@@ -1006,37 +1551,49 @@ class Jtest10(SwaTool):
         return report
 
 
-def assess(input_root_dir,
-           output_root_dir,
-           tool_root_dir,
-           results_root_dir,
-           build_summary_file):
-
-    tool_conf_file = osp.join(input_root_dir, SwaTool.TOOL_DOT_CONF)
-    tool_conf = confreader.read_conf_into_dict(tool_conf_file)
-
-    swatool = None
+def get_swatool_class(tool_conf):
 
     if tool_conf['tool-type'] in ['findbugs', 'spotbugs']:
-        swatool = Findbugs(input_root_dir, tool_root_dir)
+        return Findbugs
     elif tool_conf['tool-type'] == 'ps-jtest':
         if tool_conf['tool-version'].startswith('10'):
-            swatool = Jtest10(input_root_dir, tool_root_dir)
+            return Jtest10
         else:
-            swatool = Jtest(input_root_dir, tool_root_dir)
-
+            return Jtest
     elif tool_conf['tool-type'] == 'error-prone':
-        swatool = Errorprone(input_root_dir, tool_root_dir)
+        return Errorprone
     elif tool_conf['tool-type'] == 'lizard':
-        swatool = Lizard(input_root_dir, tool_root_dir)
+        return Lizard
     elif tool_conf['tool-type'] == 'sonatype-ahc':
-        swatool = AppHealthCheck(input_root_dir, tool_root_dir)
+        return AppHealthCheck
     elif tool_conf['tool-type'] == 'dependency-check':
-        swatool = OwaspDependencyCheck(input_root_dir, tool_root_dir)
+        return OwaspDependencyCheck
     elif tool_conf['tool-type'] == 'cryptoguard':
-        swatool = CryptoGuard(input_root_dir, tool_root_dir)
+        return CryptoGuard
     else:
-        swatool = JavaSwaTool(input_root_dir, tool_root_dir)
+        return JavaSwaTool
+
+
+def setup_tool(input_root_dir, tool_root_dir, environ):
+    '''Unarchive and install the tool, does not depend on the build,
+    environ is the environment of the run before the build changes it'''
+
+    tool_conf_file = osp.join(input_root_dir, SwaTool.TOOL_DOT_CONF)
+    tool_conf = confreader.read_conf_into_dict(tool_conf_file)
+    get_swatool_class(tool_conf).setup_tool(input_root_dir, tool_root_dir, environ)
+    return 0
+
+
+def assess(input_root_dir,
+           output_root_dir,
+           tool_root_dir,
+           results_root_dir,
+           build_summary_file):
+
+    tool_conf_file = osp.join(input_root_dir, SwaTool.TOOL_DOT_CONF)
+    tool_conf = confreader.read_conf_into_dict(tool_conf_file)
+
+    swatool = get_swatool_class(tool_conf)(input_root_dir, tool_root_dir)
 
     try:
         with LogTaskStatus('assess') as status_dot_out:
@@ -1063,10 +1620,22 @@ def assess(input_root_dir,
                                                swatool.error_msgs)
                     swatool.error_msgs = None
 
-                status_dot_out.update_task_status(exit_code,
-                                                  'pass: {0}, fail: {1}'.format(swatool.passed,
-                                                                                swatool.failed),
-                                                  swatool.error_msgs)
+                if swatool.timed_out:
+                    # every failure is a timeout: not the tool's failure
+                    if swatool.timed_out == swatool.failed:
+                        exit_code = utillib.TIMEOUT_EXIT_CODE
+                        status_dot_out.timeout = True
+
+                    status_dot_out.update_task_status(exit_code,
+                                                      'pass: {0}, fail: {1}, timeout: {2}'.format(swatool.passed,
+                                                                                                  swatool.failed,
+                                                                                                  swatool.timed_out),
+                                                      swatool.error_msgs)
+                else:
+                    status_dot_out.update_task_status(exit_code,
+                                                      'pass: {0}, fail: {1}'.format(swatool.passed,
+                                                                                    swatool.failed),
+                                                      swatool.error_msgs)
 
             except JavaBuildArtifactsError as err:
                 status_dot_out.skip_task('no files')
@@ -1095,6 +1664,7 @@ def assess(input_root_dir,
                                                       'gztar',
                                                       osp.dirname(results_root_dir),
                                                       osp.basename(results_root_dir))
+                utillib.count_archive(results_archive)
 
                 results_conf['results-archive'] = osp.basename(results_archive)
                 results_conf['results-dir'] = osp.basename(results_root_dir)
@@ -5,6 +5,7 @@ import glob
 
 from .. import directory_scanner
 from .. import utillib
+from .. import profiling
 from ..utillib import FileNotFoundException
 
 
@@ -128,12 +129,14 @@ class JavaBuildArtifacts:
 
         for elem in self._build_artifacts:
             if elem.tag in args:
-                if elem.tag == 'java-compile':
-                    build_artifacts = JavaCompileArtifact(self._build_summary['build-root-dir'], elem).artifacts
-                elif elem.tag == 'java-bytecode':
-                    build_artifacts = JavaBytecodeArtifact(self._build_summary['build-root-dir'], elem).artifacts
-                else:  # elif elem.tag == 'java-android-apk':
-                    build_artifacts = AndroidApkArtifact(self._build_summary['build-root-dir'], elem).artifacts
+                # not around the yield, the caller's work is not part of it
+                with profiling.profile('get-build-artifacts'):
+                    if elem.tag == 'java-compile':
+                        build_artifacts = JavaCompileArtifact(self._build_summary['build-root-dir'], elem).artifacts
+                    elif elem.tag == 'java-bytecode':
+                        build_artifacts = JavaBytecodeArtifact(self._build_summary['build-root-dir'], elem).artifacts
+                    else:  # elif elem.tag == 'java-android-apk':
+                        build_artifacts = AndroidApkArtifact(self._build_summary['build-root-dir'], elem).artifacts
 
                 build_artifacts['build-artifact-id'] = build_artifacts['id']
                 build_artifacts['package-name-version'] = self.get_pkg_name_version()
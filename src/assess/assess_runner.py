@@ -0,0 +1,77 @@
+import re
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import trace
+
+
+def artifact_id_key(build_artifact_id):
+    '''Sort key for build-artifact-ids like 2, 10, 10-3'''
+    return tuple((0, int(tok), '') if tok.isdigit() else (1, 0, tok)
+                 for tok in re.split(r'[-.]', str(build_artifact_id)))
+
+
+class AssessmentRunner():
+    '''Runs tool invocations on a bounded pool of worker threads.
+
+    Each invocation takes one or more of the max_workers slots, for an
+    invocation that needs a bigger share of memory than the others.
+    submit() blocks until enough slots are free, so artifacts are
+    prepared no faster than they can be assessed.  results() returns the
+    values of all the invocations, ordered by build-artifact-id
+    irrespective of the order they finished.
+
+    With max_workers=1 invocations run in the calling thread.
+    '''
+
+    def __init__(self, max_workers=1):
+        self.max_workers = max(1, max_workers)
+        self._executor = None
+        self._futures = list()
+        self._results = list()
+        self._running = 0
+        self._cond = threading.Condition()
+
+        if self.max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        logging.info('ASSESSMENT WORKERS: %d', self.max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+    def _release(self, slots):
+        with self._cond:
+            self._running -= slots
+            self._cond.notify_all()
+
+    def submit(self, build_artifact_id, func, *args, slots=1):
+
+        if self._executor is None:
+            self._results.append((artifact_id_key(build_artifact_id), func(*args)))
+            return
+
+        slots = min(max(1, slots), self.max_workers)
+
+        with self._cond:
+            self._cond.wait_for(lambda: self._running + slots <= self.max_workers)
+            self._running += slots
+
+        # in the context (trace span) of the caller
+        future = self._executor.submit(trace.run_in_context(func), *args)
+        future.add_done_callback(lambda _: self._release(slots))
+
+        self._futures.append((artifact_id_key(build_artifact_id), future))
+
+    def results(self):
+        '''Waits for all the invocations, re-raises the first exception'''
+
+        results = list(self._results)
+        results.extend((key, future.result()) for key, future in self._futures)
+
+        return [result for _, result in sorted(results, key=lambda item: item[0])]
@@ -63,9 +63,14 @@ class AssessmentSummary:
         tree = ET.ElementTree(self._root)
         tree.write(self._filename, encoding='UTF-8', xml_declaration=True)
 
+    def add_resource_plan(self, resource_plan):
+        plan_elem = AssessmentSummary._add(self._root, 'resource-plan')
+        for key, value in resource_plan.as_dict().items():
+            AssessmentSummary._add(plan_elem, key, value)
+
     def add_non_assessment(self, build_artifact_id, cmd, exit_code,
                            execution_successful, environ, cwd, report, stdout, 
-                           stderr, starttime, endtime):
+                           stderr, starttime, endtime, usage=None):
         non_assess_elem = AssessmentSummary._add(self._assessment_artifacts, 'non-assessment')
 
         if build_artifact_id:
@@ -79,6 +84,9 @@ class AssessmentSummary:
         AssessmentSummary._add(non_assess_elem, 'exit-code', str(exit_code))
         AssessmentSummary._add(non_assess_elem, 'execution-successful',
                 utillib.bool_to_string(execution_successful))
+        if usage and 'timeout' in usage:
+            # 'wall-clock' or 'cpu', the tool was ended
+            AssessmentSummary._add(non_assess_elem, 'timeout', usage['timeout'])
         AssessmentSummary._add(non_assess_elem, 'start-ts', starttime)
         AssessmentSummary._add(non_assess_elem, 'stop-ts', endtime)
 
@@ -94,10 +102,20 @@ class AssessmentSummary:
         for arg in cmd:
             AssessmentSummary._add(args_elem, 'arg', arg)
 
+        if usage:
+            usage_elem = AssessmentSummary._add(cmd_elem, 'resource-usage')
+            for key, value in usage.items():
+                if isinstance(value, dict):
+                    values_elem = AssessmentSummary._add(usage_elem, key)
+                    for name in value:
+                        AssessmentSummary._add(values_elem, name, value[name])
+                elif key != 'timeout':
+                    AssessmentSummary._add(usage_elem, key, value)
+
     def add_report(self, build_artifact_id, cmd, exit_code,
                    execution_successful, environ, cwd, report, stdout,
                    stderr, tool_type, starttime, endtime,
-                   results_root_dir):
+                   results_root_dir, usage=None, attempts=None):
 
         #logging.info('ASSESS COMMAND: {0}'.format(' '.join(cmd)))
         logging.info('ASSESSMENT WORKING DIR: %s', cwd)
@@ -116,9 +134,20 @@ class AssessmentSummary:
         AssessmentSummary._add(assess_elem, 'exit-code', str(exit_code))
         AssessmentSummary._add(assess_elem, 'execution-successful',
                 utillib.bool_to_string(execution_successful))
+        if usage and 'timeout' in usage:
+            # 'wall-clock' or 'cpu', the tool was ended
+            AssessmentSummary._add(assess_elem, 'timeout', usage['timeout'])
         AssessmentSummary._add(assess_elem, 'start-ts', starttime)
         AssessmentSummary._add(assess_elem, 'stop-ts', endtime)
 
+        # earlier invocations that ran out of memory, see SwaTool._retry_out_of_memory
+        if attempts:
+            attempts_elem = AssessmentSummary._add(assess_elem, 'oom-attempts')
+            for attempt in attempts:
+                attempt_elem = AssessmentSummary._add(attempts_elem, 'attempt')
+                for key, value in attempt.items():
+                    AssessmentSummary._add(attempt_elem, key, value)
+
         cmd_elem = AssessmentSummary._add(assess_elem, 'command')
 
         AssessmentSummary._add(cmd_elem, 'cwd', cwd)
@@ -131,6 +160,16 @@ class AssessmentSummary:
         for arg in cmd:
             AssessmentSummary._add(args_elem, 'arg', arg)
 
+        if usage:
+            usage_elem = AssessmentSummary._add(cmd_elem, 'resource-usage')
+            for key, value in usage.items():
+                if isinstance(value, dict):
+                    values_elem = AssessmentSummary._add(usage_elem, key)
+                    for name in value:
+                        AssessmentSummary._add(values_elem, name, value[name])
+                elif key != 'timeout':
+                    AssessmentSummary._add(usage_elem, key, value)
+
         if tool_type == 'ps-jtest':
             srcdirs = AssessmentSummary.get_srcdirs(cmd)
             if srcdirs:
@@ -0,0 +1,98 @@
+import os
+import os.path as osp
+import hashlib
+import logging
+import threading
+
+from .. import utillib
+from .. import gencmd
+from .. import jvm_profile
+
+
+class ToolCDSArchive():
+    '''Class data sharing archive of a tool's classes.
+
+    A tool is launched once per build artifact and once per split chunk,
+    and loads thousands of classes each time.  The first invocation dumps
+    the classes it loaded into an archive (-XX:ArchiveClassesAtExit,
+    java 13 and later), the invocations after it map the archive
+    (-XX:SharedArchiveFile) instead of loading and verifying the classes.
+
+    There is an archive per tool, tool version and JDK, in tool.conf
+    tool-cache-dir if set, else in the tool root directory.  tool.conf
+    tool-cds=false turns it off.  The options are the cds-opts gencmd
+    parameter, tool-invoke uses them as <cds-opts% >.
+    '''
+
+    MIN_JAVA_VERSION = 13
+
+    def __init__(self, tool_conf, tool_root_dir, java_home):
+
+        self._lock = threading.Lock()
+        self._dumping = False
+        self.archive = None
+
+        java_ver = jvm_profile.get_java_home_version(java_home)
+
+        if not utillib.string_to_bool(tool_conf.get('tool-cds', 'true')):
+            logging.info('TOOL CDS: disabled in tool.conf')
+        elif 'cds-opts' not in gencmd.get_param_list(tool_conf['tool-invoke']):
+            logging.info('TOOL CDS: cds-opts not used in tool-invoke')
+        elif java_ver is None or java_ver < ToolCDSArchive.MIN_JAVA_VERSION:
+            logging.info('TOOL CDS: not supported by java %s', java_ver)
+        else:
+            cache_dir = osp.join(tool_conf.get('tool-cache-dir', tool_root_dir), 'cds')
+            os.makedirs(cache_dir, exist_ok=True)
+
+            release = jvm_profile.read_release(java_home)
+            jdk_id = hashlib.sha1('{0} {1} {2}'.format(osp.realpath(java_home),
+                                                       release.get('IMPLEMENTOR', ''),
+                                                       release.get('JAVA_VERSION', '')).encode('utf-8')).hexdigest()[:12]
+
+            self.archive = osp.join(cache_dir,
+                                    '{0}-{1}-java{2}-{3}.jsa'.format(tool_conf['tool-type'],
+                                                                     tool_conf['tool-version'],
+                                                                     java_ver,
+                                                                     jdk_id))
+            logging.info('TOOL CDS ARCHIVE: %s (%s)', self.archive,
+                         'found' if osp.isfile(self.archive) else 'not found')
+
+    def _get_dump_file(self):
+        return '{0}.{1}.tmp'.format(self.archive, os.getpid())
+
+    def get_opts(self):
+        '''Options for the next invocation: use the archive if it is
+        there, else dump it if no other invocation is already doing so'''
+
+        if self.archive is None:
+            return []
+
+        # keep CDS warnings (classpath mismatch) out of tool output
+        quiet = '-Xlog:cds*=off'
+
+        with self._lock:
+            if osp.isfile(self.archive):
+                return ['-XX:SharedArchiveFile={0}'.format(self.archive), quiet]
+            elif not self._dumping:
+                self._dumping = True
+                return ['-XX:ArchiveClassesAtExit={0}'.format(self._get_dump_file()), quiet]
+            else:
+                return []
+
+    def invocation_done(self, cds_opts, successful):
+        '''Keeps the archive dumped by the invocation if it succeeded'''
+
+        if not any(opt.startswith('-XX:ArchiveClassesAtExit=') for opt in cds_opts):
+            return
+
+        with self._lock:
+            dump_file = self._get_dump_file()
+
+            if successful and osp.isfile(dump_file):
+                os.replace(dump_file, self.archive)
+                logging.info('TOOL CDS ARCHIVE CREATED: %s', self.archive)
+            else:
+                if osp.isfile(dump_file):
+                    os.remove(dump_file)
+                # let the next invocation try
+                self._dumping = False
@@ -0,0 +1,261 @@
+import os
+import os.path as osp
+import re
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+import xml.etree.ElementTree as ET
+
+from .. import utillib
+from .. import jvm_profile
+from .. import trace
+from ..logger import LogTaskStatus
+
+
+class BuildCache():
+    '''Cache of successful builds, so a package submitted against several
+    tools is built once.
+
+    A build is keyed by the hash of the package archive, package.conf,
+    the run.conf settings that change the build (RUN_CONF_KEYS), the JDK
+    ($JAVA_HOME/release), the platform and the java-assess version.  An
+    entry has the build archive, the build.conf attributes of the build
+    and the files outside of build-root-dir the build artifacts need.
+    Restoring an entry puts the build tree in build-root-dir and rewrites
+    the build-root-dir paths in build_summary.xml.
+    '''
+
+    ENTRY_FILE = 'build-cache.json'
+    ARCHIVE_FILE = 'build.tar.gz'
+
+    ## run.conf settings that change the build command or its output
+    RUN_CONF_KEYS = ('parallel-build', 'parallel-build-threads',
+                     'dependency-mirror-url', 'gradle-build-cache-dir',
+                     'build-daemon')
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_conf(cls, run_conf):
+        '''BuildCache from run.conf build-cache-dir, None if not enabled'''
+
+        cache_dir = run_conf.get('build-cache-dir', '')
+        return BuildCache(cache_dir) if cache_dir else None
+
+    @classmethod
+    def _get_framework_version(cls):
+        try:
+            return utillib.get_framework_version()
+        except Exception:
+            return 'unknown'
+
+    @classmethod
+    def get_key(cls, input_root_dir, pkg_conf, run_conf):
+        '''Key of the build, JAVA_HOME has to be set up for the package'''
+
+        sha256 = hashlib.sha256()
+
+        with open(osp.join(input_root_dir, pkg_conf['package-archive']), 'rb') as fobj:
+            for chunk in iter(lambda: fobj.read(1024 * 1024), b''):
+                sha256.update(chunk)
+
+        release = jvm_profile.read_release(os.getenv('JAVA_HOME'))
+
+        key_attrs = {
+            'package-conf': sorted(pkg_conf.items()),
+            'run-conf': sorted((key, run_conf[key]) for key in cls.RUN_CONF_KEYS
+                               if key in run_conf),
+            'java-version': release.get('JAVA_VERSION', os.getenv('JAVA_HOME', '')),
+            'java-implementor': release.get('IMPLEMENTOR', ''),
+            'platform': utillib.platform(),
+            'java-assess-version': cls._get_framework_version(),
+        }
+
+        logging.info('BUILD CACHE KEY ATTRIBUTES: %s', key_attrs)
+        sha256.update(json.dumps(key_attrs, sort_keys=True).encode('utf-8'))
+        return sha256.hexdigest()
+
+    def _get_entry_dir(self, key):
+        return osp.join(self.cache_dir, key)
+
+    def has_entry(self, key):
+        return osp.isfile(osp.join(self._get_entry_dir(key), BuildCache.ENTRY_FILE))
+
+    def restore(self, key, build_root_dir):
+        '''Returns (build-summary-file, build.conf attributes) of the
+        restored build, None if the build is not in the cache.
+
+        A bad entry (truncated archive or entry file) is removed and is a
+        miss, and so is a build that needs files outside of build-root-dir
+        (the dependencies in the local repositories) that are not there
+        any more.
+        build-root-dir is emptied on a miss after restoring'''
+
+        if not self.has_entry(key):
+            logging.info('BUILD CACHE MISS: %s', key)
+            trace.set_attrs({'build-cache': 'miss'})
+            return None
+
+        try:
+            with LogTaskStatus('build-cache-restore', msg_inline=key[:12]):
+                restored = self._restore(key, build_root_dir)
+        except Exception as err:
+            logging.warning('BUILD CACHE ENTRY REMOVED: %s: %s', key, err)
+            trace.set_attrs({'build-cache': 'bad-entry'})
+            self._remove_entry(key)
+            BuildCache._clear_dir(build_root_dir)
+            return None
+
+        missing = [filepath for filepath in restored[2] if not osp.exists(filepath)]
+        if missing:
+            logging.warning('BUILD CACHE MISSING FILES: %s: %s', key, missing)
+            trace.set_attrs({'build-cache': 'missing-files'})
+            BuildCache._clear_dir(build_root_dir)
+            return None
+
+        logging.info('BUILD CACHE RESTORED: %s', key)
+        trace.set_attrs({'build-cache': 'hit'})
+        return restored[:2]
+
+    def _restore(self, key, build_root_dir):
+
+        entry_dir = self._get_entry_dir(key)
+
+        with open(osp.join(entry_dir, BuildCache.ENTRY_FILE)) as fobj:
+            entry = json.load(fobj)
+
+        # unpacked next to build_root_dir, so that it can be renamed
+        unpack_dir = tempfile.mkdtemp(dir=osp.dirname(osp.abspath(build_root_dir)))
+
+        try:
+            status = utillib.unpack_archive(osp.join(entry_dir, BuildCache.ARCHIVE_FILE),
+                                            unpack_dir, True)
+            if status != 0:
+                raise utillib.UnpackArchiveError(BuildCache.ARCHIVE_FILE)
+
+            if osp.isdir(build_root_dir):
+                shutil.rmtree(build_root_dir)
+
+            os.rename(osp.join(unpack_dir, entry['build-dir']), build_root_dir)
+        finally:
+            shutil.rmtree(unpack_dir, ignore_errors=True)
+
+        BuildCache._rewrite_build_summary(osp.join(build_root_dir,
+                                                   entry['build-summary-file']),
+                                          entry['build-root-dir'],
+                                          build_root_dir,
+                                          key)
+
+        logging.info('BUILD CACHE ENTRY: %s from %s', key, entry['build-root-dir'])
+        return (entry['build-summary-file'], entry['build-conf'],
+                entry.get('external-files', []))
+
+    def _remove_entry(self, key):
+        # renamed first, a concurrent run never sees half of it
+        removed_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix='.removed-')
+
+        try:
+            os.rename(self._get_entry_dir(key), removed_dir)
+        except OSError as err:
+            logging.warning('BUILD CACHE ENTRY NOT REMOVED: %s: %s', key, err)
+
+        shutil.rmtree(removed_dir, ignore_errors=True)
+
+    @classmethod
+    def _clear_dir(cls, dirpath):
+        shutil.rmtree(dirpath, ignore_errors=True)
+        os.makedirs(dirpath, exist_ok=True)
+
+    @classmethod
+    def _get_external_files(cls, build_summary_file, build_root_dir):
+        '''Files of the build artifacts outside of build-root-dir (the
+        classpath jars in the local repositories), they are not in the
+        entry, a restored build needs them'''
+
+        external_files = set()
+        build_artifacts = ET.parse(build_summary_file).getroot().find('build-artifacts')
+
+        if build_artifacts is not None:
+            for fileset in build_artifacts.iter():
+                if fileset.tag in ['classpath', 'auxclasspath', 'bootclasspath']:
+                    for _file in fileset:
+                        filepath = osp.normpath(osp.join(build_root_dir, _file.text or ''))
+                        if not filepath.startswith(osp.join(build_root_dir, '')) and \
+                           osp.exists(filepath):
+                            external_files.add(filepath)
+
+        return sorted(external_files)
+
+    @classmethod
+    def _rewrite_build_summary(cls, build_summary_file, old_root_dir, new_root_dir, key):
+
+        tree = ET.parse(build_summary_file)
+        root = tree.getroot()
+
+        if old_root_dir != new_root_dir:
+            # whole paths only, not /build2 or /x/build for /build
+            old_path = re.compile(r'(?<![\w./-]){0}(?![\w.-])'.format(re.escape(old_root_dir)))
+
+            for elem in root.iter():
+                if elem.text and old_root_dir in elem.text:
+                    elem.text = old_path.sub(lambda _: new_root_dir, elem.text)
+
+        cache_xml = ET.SubElement(root, 'build-cache')
+        ET.SubElement(cache_xml, 'key').text = key
+        ET.SubElement(cache_xml, 'restored-from-build-root-dir').text = old_root_dir
+        ET.SubElement(cache_xml, 'restored-ts').text = utillib.posix_epoch()
+
+        tree.write(build_summary_file, encoding='UTF-8', xml_declaration=True)
+
+    def store(self, key, build_archive, build_root_dir,
+              build_summary_file, build_conf):
+        '''Adds a successful build to the cache'''
+
+        entry_dir = self._get_entry_dir(key)
+
+        if osp.isdir(entry_dir):
+            return
+
+        tmp_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix='.tmp-')
+
+        try:
+            shutil.copyfile(build_archive, osp.join(tmp_dir, BuildCache.ARCHIVE_FILE))
+
+            with open(osp.join(tmp_dir, BuildCache.ENTRY_FILE), 'w') as fobj:
+                json.dump({
+                    'build-root-dir': osp.abspath(build_root_dir),
+                    'build-dir': osp.basename(build_root_dir),
+                    'build-summary-file': build_summary_file,
+                    'build-conf': build_conf,
+                    'external-files': BuildCache._get_external_files(
+                        osp.join(build_root_dir, build_summary_file),
+                        osp.abspath(build_root_dir)),
+                }, fobj)
+
+            # a concurrent run may have stored the same build
+            try:
+                os.rename(tmp_dir, entry_dir)
+                logging.info('BUILD CACHE STORED: %s', key)
+            except OSError:
+                logging.info('BUILD CACHE ALREADY STORED: %s', key)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def write_gradle_build_cache_init_script(init_script, cache_dir):
+    '''init script that turns on gradle's local build cache in cache_dir,
+    a directory on the host shared by the builds'''
+
+    with open(init_script, 'w') as fobj:
+        print('''gradle.settingsEvaluated {{ settings ->
+    settings.buildCache {{
+        local {{
+            enabled = true
+            directory = new File('{0}')
+        }}
+    }}
+}}'''.format(cache_dir), file=fobj)
@@ -5,6 +5,8 @@ import glob
 import xml.etree.ElementTree as ET
 import logging
 import shutil
+import shlex
+import threading
 from abc import ABCMeta
 
 from .. import confreader
@@ -13,12 +15,21 @@ from . import nobuild
 from .nobuild import CompilationFailedError
 from .nobuild import NoSourceFilesFoundError
 from .nobuild import NoBuildHelperError
+from .. import logger
 from ..logger import LogTaskStatus
 from ..utillib import UnpackArchiveError
 from ..utillib import NotADirectoryException
 from ..utillib import FileNotFoundException
 from ..utillib import PermissionException
 from .. import gencmd
+from .. import output_analyzer
+from .. import trace
+from ..resource_plan import ResourcePlanner
+from . import dependency_cache
+from . import maven_plugin
+from . import build_cache
+from .dependency_cache import DependencyCache
+from .build_cache import BuildCache
 
 
 class InvalidBuildSystem(NotImplementedError):
@@ -117,7 +128,7 @@ class BuildSummary(metaclass=ABCMeta):
 
     def add_command(self, tag, executable, args,
                     exit_code, environ, working_dir,
-                    stdout_file, stderr_file):
+                    stdout_file, stderr_file, usage=None):
 
         cmd_root_xml = BuildSummary._add(self._root, tag)
 
@@ -137,6 +148,37 @@ class BuildSummary(metaclass=ABCMeta):
         BuildSummary._add(cmd_root_xml, 'stdout-file', stdout_file)
         BuildSummary._add(cmd_root_xml, 'stderr-file', stderr_file)
 
+        if usage:
+            usage_xml = BuildSummary._add(cmd_root_xml, 'resource-usage')
+            for key, value in usage.items():
+                if isinstance(value, dict):
+                    values_xml = BuildSummary._add(usage_xml, key)
+                    for name in value:
+                        BuildSummary._add(values_xml, name, value[name])
+                elif key != 'timeout':
+                    BuildSummary._add(usage_xml, key, value)
+
+            # 'wall-clock' or 'cpu', the command was ended
+            if 'timeout' in usage:
+                BuildSummary._add(cmd_root_xml, 'timeout', usage['timeout'])
+
+    def add_resource_plan(self, resource_plan):
+        plan_xml = BuildSummary._add(self._root, 'resource-plan')
+        for key, value in resource_plan.as_dict().items():
+            BuildSummary._add(plan_xml, key, value)
+
+    def add_dependency_cache(self, cache_stats):
+        cache_xml = BuildSummary._add(self._root, 'dependency-cache')
+        for namespace, stats in cache_stats.items():
+            namespace_xml = BuildSummary._add(cache_xml, namespace)
+            for key, value in stats.items():
+                BuildSummary._add(namespace_xml, key, value)
+
+    def add_build_daemon(self, executable, idle_timeout):
+        daemon_xml = BuildSummary._add(self._root, 'build-daemon')
+        BuildSummary._add(daemon_xml, 'executable', executable)
+        BuildSummary._add(daemon_xml, 'idle-timeout', str(idle_timeout))
+
     def add_exit_code(self, exit_code):
         if exit_code >= 0:
             BuildSummary._add(self._root, 'exit-code', str(exit_code))
@@ -193,14 +235,12 @@ class BuildSummaryJavaSrc(BuildSummary):
             return
 
         build_artifacts = ET.parse(build_artifacts_file).getroot()
-        _id = 1
+        merged = dict()
 
-        for artifacts in build_artifacts:
+        for artifacts in list(build_artifacts):
 
             if (artifacts.tag in ['java-compile', 'java-bytecode']) and \
                ('id' in artifacts.attrib):
-                artifacts.attrib['id'] = str(_id)
-                _id += 1
 
                 for fileset in artifacts:
                     if fileset.tag in ['srcdir', 'srcfile',
@@ -211,8 +251,32 @@ class BuildSummaryJavaSrc(BuildSummary):
                             if _file.text.startswith(build_root_dir):
                                 _file.text = osp.relpath(_file.text, build_root_dir)
 
+                build_artifacts.remove(artifacts)
+                merged.setdefault(BuildSummaryJavaSrc._get_artifact_key(artifacts),
+                                  artifacts)
+
+        ## Build monitors record artifacts in the order compiles finish,
+        ## that changes from run to run in a parallel build.  Artifacts
+        ## recorded twice are merged, ids follow the destdir/srcdir order.
+        for _id, key in enumerate(sorted(merged), 1):
+            merged[key].attrib['id'] = str(_id)
+            build_artifacts.append(merged[key])
+
         self._root.append(build_artifacts)
 
+    @classmethod
+    def _get_artifact_key(cls, artifacts):
+
+        def _get_files(tag):
+            return tuple(sorted(_file.text or '' for fileset in artifacts.findall(tag)
+                                for _file in fileset))
+
+        return (_get_files('destdir'), _get_files('srcdir'),
+                artifacts.tag, _get_files('srcfile'))
+
+    def add_parallel_build(self, threads):
+        BuildSummary._add(self._root, 'build-threads', str(threads))
+
 
 class BuildSummaryJavaAndroidApk(BuildSummary):
 
@@ -251,6 +315,12 @@ class JavaPkg(metaclass=ABCMeta):
 
         logging.info('PACKAGE CONF: %s', self._pkg_conf)
 
+        run_conf = read_run_conf(input_root_dir)
+
+        self._run_conf = run_conf
+        self._resource_planner = ResourcePlanner(run_conf)
+        self._resource_plan = None
+
         with LogTaskStatus('package-unarchive'):
             pkg_archive = osp.join(input_root_dir, pkg_conf['package-archive'])
             pkg_root_dir = osp.join(build_root_dir, JavaPkg.PKG_ROOT_DIR)
@@ -277,205 +347,22 @@ class JavaPkg(metaclass=ABCMeta):
     ## for the type of build sytem being used.
     ## The version of java used needs to be known, because Java has changed
     ## options through its lifetime for the "same" things.
-    ## XXX This is not perfect, but by putting the non-perfect stuff
-    ## in one place, we can work on making it better in the future.
 
     ## THe issue here is that java chooses bad default sizes for many of these
     ## things.  In the SWAMP, we want a java thing to have access to most
-    ## of a VM's resources, so that it can complete it's task.  Without
-    ## this, you can create a large resource intensive machine which is
-    ## incapable of running java compilations or assessment tools, because
-    ## java is limiting the resources available to far less than the
-    ## VM has been assigned.
-
-    ## The commented-out code in this has been copied from the 3 different
-    ## versions in java-assess, so that what it used to be is documented 
-    ## here for reference.
-    ## The documentation here also explains what is being changed, and why
-    ## it is being changed to help out modifcations in the future.
-
-    ## XXX python inheritance and static methods are stupid.
+    ## of a VM's resources, so that it can complete it's task.
+    ## The sizing (heap, metaspace, thread stack, GC) is shared with the
+    ## tools, see src/resource_plan.py for the notes on how and why.
     def common_java_opts( self, java_ver ):
-        env_str = ''
-        if utillib.get_cpu_type() == 64:
-            # new_env['MAVEN_OPTS'] = "-Xmx2048m -XX:MaxPermSize=1024m -Xms512m"
-            # new_env['MAVEN_OPTS'] = '-Xmx{0}M -Xss128M -XX:MaxPermSize=2048M -XX:+CMSClassUnloadingEnabled -XX:+UseConcMarkSweepGC'.format(two_thrids_sys_memory)
-            # new_env['MAVEN_OPTS'] = '-Xmx2048M -Xss128M -XX:MaxPermSize=2048M -XX:+CMSClassUnloadingEnabled -XX:+UseConcMarkSweepGC'
-
-            ## This is sub-optimal; for now we will keep on guessing
-            ## this amount.  As memory grows larger, you actually want
-            ## to use more and more of it for the assessment, and just keep
-            ## a small amount for the system and its buffers.
-
-            ## returns size in MB
-            sys_mem = utillib.sys_mem_size() 
-            logging.info("sys_mem_size == %d", sys_mem);
-
-
-            # This example is why the ratio system falls down with
-            # large memory machines.  The model is wrong:
-            #   MEM      JAVA     SYS      WHAT'S-UP
-            #  -----    -------  -------   ---------
-            #   2 GB ->  1.3 GB   0.7 GB   OK?
-            #   3 GB ->  2   GB   1   GB   OK?
-            #   6 GB ->  4   GB   2   GB   SO-SO
-            #  60 GB -> 40   GB  20   GB   ARE-YOU-KIDDING
-            # To fix it, some % of memory should be left for the system,
-            # in some log fashion (to allow for page tables & buffer cache)
-            # and then most of the rest of the system given to the app.
-            # As long as the memory allocation pool isn't pre-allocated,
-            # it just limits the size of java, not sets the szie.
-
-            ## cheap seats version 
-            #   2 GB ->  1.3 GB   0.7 GB
-            #   3 GB ->  2   GB   1   GB
-            #   4 GB ->  3.4 GB   0.6 GB
-            #   6 GB ->  5   GB   1   GB
-            #   8 GB ->  7.1 GB   0.9 GB
-            #  10 GB ->  9.2 GB   0.8 GB   SO-SO (should be scaling system)
-            #  30 GB -> 27   GB   2.7 GB
-            #  60 GB -> 55   GB   5   GB   BETTER
-            #  90 GB -> 83.7 GB   6.3 GB
-
-            ## XXX may want to choose mem_size "NEAR" the thresholds since
-            ## the system steals some memory and we don't get sizing as
-            ## aggressive as this looks.  However, we are into swap as
-            ## it is, so these numbers aren't totally bad.
-
-
-            if (sys_mem >= 30 * 1024):
-                memory_for_java = int(sys_mem * 10 / 11)
-            elif (sys_mem >= 10 * 1024):
-                memory_for_java = int(sys_mem * 9 / 10)
-            elif (sys_mem >= 8 * 1024):
-                memory_for_java = int(sys_mem * 7 / 8)
-            elif (sys_mem >= 4 * 1024):
-                memory_for_java = int(sys_mem * 5 / 6)
-            elif (sys_mem >= 3 * 1024):
-                memory_for_java = int(sys_mem * 3 / 4)
-            else:
-                memory_for_java = int(sys_mem * 2 / 3)
-
-            ## This controls the max amount of "long lived memory" in
-            ## the java process.   This is NOT the memory pool, but rather
-            ## the space available for long term items which will no longer
-            ## be regulraily garbage collected.
-            ## Think of it as 'static data size" for long term java apps
-            ##
-            ## java <= 7 has MaxPermSize        -- which is usually too low
-            ## java >= 8 has MaxMetaspaceSize   -- which is unlimited, but 
-            ##                                  recommendation is to make
-            ##                                  it limited for perf. reasons.
-            ## turn it off for now, it is broken
-            ## XXX the 2048 should be sized to the machine; it is complex,
-            ## and prevents tools that need a lot of memory from working
-            if java_ver >= 8:
-               extra = '-XX:MaxMetaspaceSize=2048M'
-            else:
-               extra = '-XX:MaxPermSize=2048M'
-
-            ## -Xmx####S == maximum size of memory pool
-            xmx = '-Xmx{0}m'.format(memory_for_java)
-            
-            ## XXX see notes in ant about GC options not good for servers
-            ## basically server grade machines don't want that kind of GC
-            ## going on, because it causes too much memory thrashing
-            ## and GCs way too early.   I will need to re-find the reference
-            ## for it.  Some idea of why we are doing these things should
-            ## be documented here.
-
-            env_str += ' ' + xmx
-            env_str += ' ' + extra
-
-            # The default 64bit java thread stack size is 512k.
-            # That was small for some builds, I suppose.
-            # Our VMs are typically 4GB in size, so this allows for
-            # only 32 threads in a 4GB machine!
-            env_str += ' ' + '-Xss128m'               ## thread stack size
-
-        elif utillib.get_cpu_type() == 32:
-            ## seperate calculation since 32 bit is a different beast
-            ## same for now until I think about this.
-            ## 3/4 memory allows 3GB on a 4GB machine, and 768K on a 1M machine
-            sys_mem = utillib.sys_mem_size() 
-            logging.info("sys_mem_size == %d", sys_mem);
-            ## 2^32 / 2^8 / 2^8 == 
-            ## still doing 3/4 of memory ... 3/4 process address space!
-            ## need to save room for java long term and stack.
-            if (sys_mem > 4 * 1024):
-                sys_mem = 4 * 1024
-                logging.info("sys_mem_size LIMIT 32 bit sys to %d", sys_mem);
-            ## XXX linux uses one address space for user+kernel, unlike BSD
-            ## solaris is like the BSD model, where the proc has full
-            ## address space.
-            ## We are only running SWAMP on linux, so need
-            ## to live with only having 1/2 of the address space.
-            ## Actually, we get 3 GB of 4 GB, but we'll do 2/4 for now,
-            ## since that doubles what java was previously doing on 32 bit!
-            if (sys_mem > 3 * 1024):
-                sys_mem = 3 * 1024
-                logging.info("sys_mem_size LIMIT 32 bit proc to %d", sys_mem);
-
-            ## However, for small memory machines, may just want to let
-            ## Java do it's default limits (too small for swamp, though)
-
-            memory_for_java = int(sys_mem * 3 / 4)
-
-            extra = ""
-
-            xmx = '-Xmx{0}m'.format(memory_for_java)
-
-            ## Xms increased from default because most of the tools
-            ## need a lot and it made performance better ??
-
-            env_str += ' ' + xmx              ## max size memory alloc pool
-            env_str += ' ' + "-Xms512m"       ## initial size memory alloc pool
-
-            # OK, try doing this on 32 bit VMs as well
-            # Since java on linux onnly has 3GB max adrress space,
-            # Our VMs are typically 4GB in size, so this allows for
-            # only 24 threads in a 4GB machine!
-            # XXX half the size on 32 bit, see how that works!?
-            # env_str += ' ' + '-Xss128m'       ## 64 thread stack size
-            # OK, so the default is 320k for 32 bit, this is 6x as large
-            # but still allows for many stacks
-            # THis was a big failure issue on scientific-32
-            # For now, don't touch this, too memory sensitive on 32 bit
-            # ... which begs why is it so large on 64 bit???
-            # env_str += ' ' + '-Xss2m'         ## 32 thread stack size
-
-        # Our VMs are categorized as server class machines by java.
-        # That uses the "parallel mark sweep collector'.  UNFORTUNATELY,
-        # or FORTUNATELY, that collector will error out and complain if
-        # too much time is spent in garbage collection -- which means that
-        # the heap size parameters are set wrongly for the application.
-        # We could use another collector, but there is another issue
-        # intertwined here ...
-        # Yet another inter-twined issue is that if we gave more memory
-        # to java to use, the garbage collection type and need to unload
-        # classes may not be needed....
-
-        # As a work-around, another collector is used to avoid the
-        # GC timeout errors.  The flip side is that we are not getting any
-        # feedback on POORLY CONFIGURED ASSESSMENTs and perhaps spending a
-        # lot of resources (wall-time, memory and CPU) running assessments
-        # which should be reconfigured to run more efficiently.
-        #
-        # This is required to support CMS Class Unloading.   It has the
-        # affect of helping out GC as mentioned above.
-        env_str += ' ' + '-XX:+UseConcMarkSweepGC'
-
-        # Groovy (in gradle) causes problems because it generates on the fly
-        # a huge number of classes used only for setup.  Even though they
-        # are never used again they take up memory and resources which could
-        # be used by an actual build.  This options tells java that such
-        # classes can be unloaded from the image memory, instead of hung onto
-        # for forever.
-        # CMS == Concentric Mark Sweep -- this configures the CMS collector!
-        env_str += ' ' + '-XX:+CMSClassUnloadingEnabled'
 
+        if self._resource_plan is None:
+            self._resource_plan = self._resource_planner.plan(java_ver,
+                                                              thread_stack=True,
+                                                              java_home=os.environ.get('JAVA_HOME'))
+
+        env_str = ' ' + ' '.join(self._resource_plan.java_opts())
         logging.info('java_opts java_ver %d  env %s', java_ver, env_str)
-        
+
         return env_str
 
     ## Determine the actual java version used for a java build
@@ -515,6 +402,12 @@ class JavaPkg(metaclass=ABCMeta):
 
         return java_ver_num
 
+    @classmethod
+    def get_dependency_repos(cls):
+        '''List of (namespace, directory) of the local repositories the
+        build system downloads dependencies to'''
+        return []
+
     def add_build_conf_attr(self, name, value):
         self._build_conf_extras[name] = value
 
@@ -603,9 +496,22 @@ class JavaByteCodePkg(JavaPkg):
 # TODO: This should also be an abstract class
 class JavaSrcPkg(JavaPkg):
 
+    ## (what, regex) of the build output lines counted as progress
+    BUILD_PROGRESS = None
+
+    ## build output that means the build cannot succeed, with
+    ## run.conf build-fail-fast the build is ended when it shows up
+    BUILD_FATAL_PATTERNS = []
+
+    ## gencmd template (in SCRIPTS_DIR) of the command that downloads
+    ## the dependencies of the package, None if there is none
+    PREFETCH_INVOKE_FILE = None
+
     def __init__(self, pkg_conf, input_root_dir, build_root_dir):
         JavaPkg.__init__(self, pkg_conf, input_root_dir, build_root_dir)
         self._build_conf = None
+        self._prepared = False
+        self._prefetch = None
 
     def _setup(self, build_root_dir):
         raise NotImplementedError()
@@ -649,22 +555,31 @@ class JavaSrcPkg(JavaPkg):
                 self.add_build_conf_attr('config-stdout-file', config_stdout)
                 self.add_build_conf_attr('config-stderr-file', config_stderr)
 
+                usage = dict()
+                timeout, cpu_timeout = utillib.get_timeouts(self._run_conf, 'configure')
                 exit_code, environ = utillib.run_cmd(config_cmd,
                                                      outfile=outfile,
                                                      errfile=errfile,
                                                      cwd=pkg_config_dir,
-                                                     env=self.get_env(pkg_config_dir))
+                                                     env=self.get_env(pkg_config_dir),
+                                                     usage=usage,
+                                                     timeout=timeout,
+                                                     cpu_timeout=cpu_timeout)
 
                 logging.info('CONFIGURE ERROR CODE: %d', exit_code)
                 logging.info('CONFIGURE ENVIRONMENT: %s', environ)
 
+                if 'timeout' in usage:
+                    status_dot_out.timeout_task(exit_code, usage['timeout'])
+
                 # the command doesn't have arguments, it is a "magic cookie"
                 build_summary.add_command('configure-command',
                                           config_cmd, [],
                                           exit_code, environ,
                                           osp.relpath(pkg_config_dir, build_root_dir),
                                           osp.relpath(outfile, build_root_dir),
-                                          osp.relpath(errfile, build_root_dir))
+                                          osp.relpath(errfile, build_root_dir),
+                                          usage)
 
                 if exit_code != 0:
                     build_summary.add_exit_code(exit_code)
@@ -678,9 +593,286 @@ class JavaSrcPkg(JavaPkg):
                                           build_stderr_file):
         return None
 
-    def _build(self, build_root_dir, build_summary):
+    def _setup_dependency_mirror(self, build_root_dir, mirror_url):
+        '''Override to get dependencies from run.conf dependency-mirror-url'''
+        logging.info('DEPENDENCY MIRROR not supported for %s',
+                     self._pkg_conf.get('build-sys'))
+
+    def _restore_dependencies(self, build_root_dir):
+        '''Fills the local repositories from the dependency cache, if
+        run.conf dependency-cache-dir is set'''
+
+        self._dependency_cache = DependencyCache.from_conf(self._run_conf)
+
+        if self._run_conf.get('dependency-mirror-url'):
+            self._setup_dependency_mirror(build_root_dir,
+                                          self._run_conf['dependency-mirror-url'])
+
+        if self._dependency_cache is None or not self.get_dependency_repos():
+            return
+
+        with LogTaskStatus('dependency-cache-restore') as status_dot_out:
+            for namespace, repo_dir in self.get_dependency_repos():
+                self._dependency_cache.restore(namespace, repo_dir)
+
+            status_dot_out.update_task_status(0, 'files: {0}'.format(
+                sum(stats['restored'] for stats in self._dependency_cache.stats.values())))
+
+    def _save_dependencies(self, build_summary):
+
+        if self._dependency_cache is None or not self.get_dependency_repos():
+            return
+
+        with LogTaskStatus('dependency-cache-save') as status_dot_out:
+            for namespace, repo_dir in self.get_dependency_repos():
+                self._dependency_cache.save(namespace, repo_dir)
+
+            stats = self._dependency_cache.stats.values()
+            status_dot_out.update_task_status(0, 'hits: {0}, misses: {1}'.format(
+                sum(_stats.get('hits', 0) for _stats in stats),
+                sum(_stats.get('misses', 0) for _stats in stats)))
+
+        build_summary.add_dependency_cache(self._dependency_cache.get_summary())
+        trace.set_attrs({'dependency-cache': self._dependency_cache.get_summary()})
+
+    def _setup_parallel_build(self, build_summary):
+        '''Sets the parallel-build and build-threads parameters if
+        run.conf parallel-build is true, the invoke file of the build
+        system turns them into options (mvn -T, gradle --parallel).
+
+        run.conf parallel-build-threads is the number of threads, auto
+        (the default) is the number of CPUs of the host.'''
+
+        if not utillib.string_to_bool(self._run_conf.get('parallel-build', 'false')):
+            return
+
+        if 'build-threads' not in gencmd.get_param_list(self._build_conf['cmd-invoke-file']):
+            logging.info('PARALLEL BUILD not supported for %s',
+                         self._pkg_conf.get('build-sys'))
+            return
+
+        cpus = os.cpu_count() or 1
+        threads = self._run_conf.get('parallel-build-threads', 'auto')
+
+        try:
+            threads = cpus if threads == 'auto' else max(1, min(int(threads), cpus))
+        except ValueError:
+            logging.warning('Invalid parallel-build-threads: %s', threads)
+            threads = cpus
+
+        self._build_conf['parallel-build'] = 'true'
+        self._build_conf['build-threads'] = str(threads)
+        build_summary.add_parallel_build(threads)
+        logging.info('PARALLEL BUILD: %d threads', threads)
+
+    def _use_build_daemon(self, idle_timeout):
+        '''Override to build with a daemon that stays up idle_timeout
+        seconds after the build, returns the daemon's executable or None'''
+        return None
+
+    def _get_build_daemon_stop_cmd(self):
+        return None
+
+    def _setup_build_daemon(self, build_summary):
+        '''Builds with a daemon if run.conf build-daemon is true, so that
+        the runs on a host after this one reuse a warm JVM.  The daemon is
+        bound to the JDK and JVM options of the build, and exits when it
+        has been idle run.conf build-daemon-idle-timeout seconds (default
+        600), or after the build if run.conf build-daemon-stop is true
+        (the last run of a batch).'''
+
+        self._build_daemon = None
+
+        if not utillib.string_to_bool(self._run_conf.get('build-daemon', 'false')):
+            return
+
+        try:
+            idle_timeout = int(self._run_conf.get('build-daemon-idle-timeout', '600'))
+        except ValueError:
+            logging.warning('Invalid build-daemon-idle-timeout: %s',
+                            self._run_conf['build-daemon-idle-timeout'])
+            idle_timeout = 600
+
+        self._build_daemon = self._use_build_daemon(idle_timeout)
+
+        if self._build_daemon:
+            build_summary.add_build_daemon(self._build_daemon, idle_timeout)
+            logging.info('BUILD DAEMON: %s, idle timeout %ds',
+                         self._build_daemon, idle_timeout)
+        else:
+            logging.info('BUILD DAEMON not supported for %s',
+                         self._pkg_conf.get('build-sys'))
+
+    def _stop_build_daemon(self, pkg_build_dir):
+
+        if not self._build_daemon or \
+           not utillib.string_to_bool(self._run_conf.get('build-daemon-stop', 'false')):
+            return
+
+        with LogTaskStatus('build-daemon-stop') as status_dot_out:
+            stop_cmd = self._get_build_daemon_stop_cmd()
+            logging.info('BUILD DAEMON STOP COMMAND %s', stop_cmd)
+
+            exit_code, _ = utillib.run_cmd(stop_cmd,
+                                           cwd=pkg_build_dir,
+                                           outfile=osp.join(osp.dirname(self._build_conf['stdout-file']),
+                                                            'build_daemon_stop.out'),
+                                           errfile=osp.join(osp.dirname(self._build_conf['stderr-file']),
+                                                            'build_daemon_stop.err'),
+                                           env=self.get_env(pkg_build_dir))
+            status_dot_out.update_task_status(exit_code)
+
+    def _get_output_analyzers(self):
+        '''Analyzers of the build output while the build runs:
+
+        progress reported in status.out every run.conf
+        build-progress-interval seconds (default 0, off);
+
+        fatal patterns, the build system's if run.conf build-fail-fast
+        is true, and the regexes in run.conf build-fatal-patterns (one
+        per line).'''
+
+        analyzers = list()
 
+        try:
+            interval = int(self._run_conf.get('build-progress-interval', '0'))
+        except ValueError:
+            logging.warning('Invalid build-progress-interval: %s',
+                            self._run_conf['build-progress-interval'])
+            interval = 0
+
+        if self.BUILD_PROGRESS and interval > 0:
+            what, pattern = self.BUILD_PROGRESS
+            analyzers.append(output_analyzer.ProgressAnalyzer('build', what,
+                                                              pattern, interval))
+
+        patterns = list()
+
+        if utillib.string_to_bool(self._run_conf.get('build-fail-fast', 'false')):
+            patterns.extend(self.BUILD_FATAL_PATTERNS)
+
+        patterns.extend(line.strip() for line in
+                        self._run_conf.get('build-fatal-patterns', '').splitlines()
+                        if line.strip())
+
+        if patterns:
+            logging.info('BUILD FATAL PATTERNS: %s', patterns)
+            analyzers.append(output_analyzer.FatalPatternAnalyzer(patterns))
+
+        return analyzers
+
+    def _prepare(self, build_root_dir, build_summary):
+        '''Sets up the build, once: before the prefetch, or else
+        before the build'''
+
+        if self._prepared:
+            return
+
+        self._prepared = True
         self._setup(build_root_dir)
+        self._setup_parallel_build(build_summary)
+        self._setup_build_daemon(build_summary)
+        self._restore_dependencies(build_root_dir)
+
+    def _get_pkg_build_dir(self, build_root_dir):
+        return osp.normpath(osp.join(build_root_dir,
+                                     JavaPkg.PKG_ROOT_DIR,
+                                     self._build_conf['package-dir'],
+                                     self._build_conf.get('build-dir', '.')))
+
+    def _setup_prefetch(self, build_root_dir):
+        '''Override to set the parameters of PREFETCH_INVOKE_FILE'''
+        pass
+
+    def _start_prefetch(self, build_root_dir, build_summary):
+        '''If run.conf dependency-prefetch is true, starts downloading the
+        dependencies in the background, while the package is configured.
+        The build runs offline if the download succeeded.'''
+
+        if self.PREFETCH_INVOKE_FILE is None or \
+           not utillib.string_to_bool(self._run_conf.get('dependency-prefetch', 'false')):
+            return
+
+        self._prepare(build_root_dir, build_summary)
+
+        pkg_build_dir = self._get_pkg_build_dir(build_root_dir)
+
+        if not osp.isdir(pkg_build_dir):
+            return
+
+        self._setup_prefetch(build_root_dir)
+
+        # gencmd is not thread safe, the command is made here
+        prefetch_cmd = gencmd.gencmd(osp.join(os.getenv('SCRIPTS_DIR'),
+                                              self.PREFETCH_INVOKE_FILE),
+                                     self._build_conf)
+        prefetch = {
+            'cmd': prefetch_cmd,
+            'cwd': pkg_build_dir,
+            'env': self.get_env(pkg_build_dir),
+            'stdout-file': osp.join(build_root_dir, 'prefetch_stdout.out'),
+            'stderr-file': osp.join(build_root_dir, 'prefetch_stderr.out'),
+            'status-records': list(),
+            'exit-code': None,
+            'usage': dict(),
+        }
+
+        logging.info('DEPENDENCY PREFETCH COMMAND %s', prefetch_cmd)
+
+        def _run_prefetch():
+            # status.out records are written when the prefetch is joined
+            logger.buffer_status(prefetch['status-records'])
+            try:
+                with LogTaskStatus('dependency-prefetch') as status_dot_out:
+                    exit_code, _ = utillib.run_cmd(' '.join(prefetch_cmd),
+                                                   cwd=pkg_build_dir,
+                                                   outfile=prefetch['stdout-file'],
+                                                   errfile=prefetch['stderr-file'],
+                                                   env=prefetch['env'],
+                                                   usage=prefetch['usage'])
+                    prefetch['exit-code'] = exit_code
+                    status_dot_out.update_task_status(exit_code)
+            except Exception as err:
+                logging.exception(err)
+            finally:
+                logger.buffer_status(None)
+
+        prefetch['thread'] = threading.Thread(target=trace.run_in_context(_run_prefetch),
+                                              name='dependency-prefetch')
+        prefetch['thread'].start()
+        self._prefetch = prefetch
+
+    def _finish_prefetch(self, build_root_dir, build_summary):
+
+        if self._prefetch is None:
+            return
+
+        prefetch = self._prefetch
+        self._prefetch = None
+
+        prefetch['thread'].join()
+        logger.flush_status(prefetch['status-records'])
+
+        if prefetch['exit-code'] is None:
+            return
+
+        build_summary.add_command('prefetch-command',
+                                  prefetch['cmd'][0],
+                                  prefetch['cmd'][1:],
+                                  prefetch['exit-code'],
+                                  prefetch['env'],
+                                  osp.relpath(prefetch['cwd'], build_root_dir),
+                                  osp.relpath(prefetch['stdout-file'], build_root_dir),
+                                  osp.relpath(prefetch['stderr-file'], build_root_dir),
+                                  prefetch['usage'])
+
+        if prefetch['exit-code'] == 0:
+            logging.info('DEPENDENCY PREFETCH done, building offline')
+            self._build_conf['offline'] = 'true'
+
+    def _build(self, build_root_dir, build_summary):
+
+        self._prepare(build_root_dir, build_summary)
 
         # 2.1.8, not required
         # if 'build-opt' in self._build_conf:
@@ -702,12 +894,11 @@ class JavaSrcPkg(JavaPkg):
            osp.isfile(self._build_conf['build-monitor-output-file']):
             os.remove(self._build_conf['build-monitor-output-file'])
 
-        with LogTaskStatus('build'):
+        self._finish_prefetch(build_root_dir, build_summary)
+
+        with LogTaskStatus('build') as status_dot_out:
 
-            pkg_build_dir = osp.normpath(osp.join(build_root_dir,
-                                                  JavaPkg.PKG_ROOT_DIR,
-                                                  self._build_conf['package-dir'],
-                                                  self._build_conf.get('build-dir', '.')))
+            pkg_build_dir = self._get_pkg_build_dir(build_root_dir)
 
             if not osp.isdir(pkg_build_dir):
                 LogTaskStatus.log_task('chdir-build-dir', 1, None,
@@ -721,20 +912,47 @@ class JavaSrcPkg(JavaPkg):
             logging.info('BUILD ENVIRONMENT %s', self.get_env(pkg_build_dir))
             logging.info('BUILD COMMAND %s', build_cmd)
 
+            analyzers = self._get_output_analyzers()
+            usage = dict()
+            timeout, cpu_timeout = utillib.get_timeouts(self._run_conf, 'build')
+
             (exit_code, environ) = utillib.run_cmd(' '.join(build_cmd),
                                                    cwd=pkg_build_dir,
                                                    outfile=self._build_conf['stdout-file'],
                                                    errfile=self._build_conf['stderr-file'],
-                                                   env=self.get_env(pkg_build_dir))
+                                                   env=self.get_env(pkg_build_dir),
+                                                   analyzers=analyzers,
+                                                   usage=usage,
+                                                   timeout=timeout,
+                                                   cpu_timeout=cpu_timeout,
+                                                   resource_plan=self._resource_plan)
 
             logging.info('BUILD EXIT CODE %s', exit_code)
+            logging.info('BUILD RESOURCE USAGE %s', usage)
+            LogTaskStatus.log_note('build: {0}'.format(utillib.format_usage(usage)))
+            trace.set_attrs({'usage': usage})
+
+            if 'timeout' in usage:
+                status_dot_out.timeout_task(exit_code, usage['timeout'])
+
+            for analyzer in analyzers:
+                if isinstance(analyzer, output_analyzer.FatalPatternAnalyzer) and \
+                   analyzer.match:
+                    LogTaskStatus.log_task('build-fail-fast', 1, None, analyzer.match)
+            self._stop_build_daemon(pkg_build_dir)
+            self._save_dependencies(build_summary)
+
             build_summary.add_command('build-command', build_cmd[0],
                                       build_cmd[1:], exit_code, environ,
                                       osp.relpath(pkg_build_dir, build_root_dir),
                                       osp.relpath(self._build_conf['stdout-file'],
                                                   build_root_dir),
                                       osp.relpath(self._build_conf['stderr-file'],
-                                                  build_root_dir))
+                                                  build_root_dir),
+                                      usage)
+
+            if self._resource_plan:
+                build_summary.add_resource_plan(self._resource_plan)
 
             build_summary.add_exit_code(exit_code)
 
@@ -764,12 +982,26 @@ class JavaSrcPkg(JavaPkg):
                                  JavaPkg.PKG_ROOT_DIR,
                                  self._pkg_conf) as build_summary:
 
+            self._start_prefetch(build_root_dir, build_summary)
             self._configure(build_root_dir, build_summary)
             return self._build(build_root_dir, build_summary)
 
 
 class JavaMavenPkg(JavaSrcPkg):
 
+    MAVEN_REPO_DIR = '~/.m2/repository'
+
+    PREFETCH_INVOKE_FILE = 'resources/maven-prefetch.txt'
+
+    PREFETCH_GOAL = 'dependency:go-offline'
+
+    BUILD_PROGRESS = ('modules', r'^\[INFO\] Building (?!jar:|war:)')
+
+    BUILD_FATAL_PATTERNS = [
+        r'Cannot access \S+ in offline mode',
+        r'^\[ERROR\] Failed to execute goal on project [^:]+: Could not resolve dependencies',
+    ]
+
     def __init__(self, pkg_conf, input_root_dir, build_root_dir):
         JavaSrcPkg.__init__(self, pkg_conf, input_root_dir, build_root_dir)
 
@@ -836,7 +1068,36 @@ class JavaMavenPkg(JavaSrcPkg):
 
         self._build_conf.update(self._pkg_conf)
 
-        # Install swamp-maven-plugin
+        # Install swamp-maven-plugin, unless it is installed from the same sources
+        plugin_dir = osp.join(res_dir, 'build-monitors/swamp-maven-plugin')
+        repo_dir = osp.expanduser(JavaMavenPkg.MAVEN_REPO_DIR)
+
+        with LogTaskStatus('swamp-maven-plugin-install') as status_dot_out:
+            fingerprint = maven_plugin.get_fingerprint(plugin_dir)
+
+            if maven_plugin.is_installed(plugin_dir, repo_dir, fingerprint):
+                logging.info('MAVEN PLUGIN ALREADY INSTALLED: %s', fingerprint)
+                status_dot_out.update_task_status(0, 'installed {0}'.format(fingerprint[:12]))
+            else:
+                self._maven_install_plugin(plugin_dir)
+                maven_plugin.set_installed(plugin_dir, repo_dir, fingerprint)
+                status_dot_out.update_task_status(0, fingerprint[:12])
+
+        # if len(self._build_conf['build-target'].split()) == 1:
+        #     self._build_conf['swamp-plugin-build-target-property'] = self._build_conf['build-target']
+        # else:
+        #     for build_target in self._build_conf['build-target'].split():
+        #         if build_target in maven_phases:
+        #             self._build_conf['swamp-plugin-build-target-property'] = build_target
+        #             break
+
+        # if 'clean' in self._build_conf['build-target'].split():
+        #     self._build_conf['swamp-plugin-build-clean-property'] = 'true'
+
+        self._build_conf['build-target'] = JavaMavenPkg._modify_build_target(self._build_conf['build-target'])
+
+    def _maven_install_plugin(self, plugin_dir):
+
         install_cmd = [
             'mvn',
             '-Dhttps.protocols=TLSv1.2',
@@ -847,32 +1108,45 @@ class JavaMavenPkg(JavaSrcPkg):
             'install'
         ]
 
-        logging.info('MAVEN PLUGIN INSTALL CWD: %s',
-                     osp.join(res_dir, 'build-monitors/swamp-maven-plugin'))
-
+        logging.info('MAVEN PLUGIN INSTALL CWD: %s', plugin_dir)
         logging.info('MAVEN PLUGIN INSTALL ENVIRONMENT: %s', os.environ)
         logging.info('MAVEN PLUGIN INSTALL COMMAND: %s', install_cmd)
 
-        with LogTaskStatus('swamp-maven-plugin-install'):
-            exit_code, _ = utillib.run_cmd(install_cmd,
-                                           cwd=osp.join(res_dir, 'build-monitors/swamp-maven-plugin'))
-            logging.info('MAVEN PLUGIN INSTALL EXIT CODE: %d', exit_code)
+        exit_code, _ = utillib.run_cmd(install_cmd, cwd=plugin_dir)
+        logging.info('MAVEN PLUGIN INSTALL EXIT CODE: %d', exit_code)
 
-            if exit_code != 0:
-                raise CommandFailedError(install_cmd, exit_code, None, None, None)
-        
-        # if len(self._build_conf['build-target'].split()) == 1:
-        #     self._build_conf['swamp-plugin-build-target-property'] = self._build_conf['build-target']
-        # else:
-        #     for build_target in self._build_conf['build-target'].split():
-        #         if build_target in maven_phases:
-        #             self._build_conf['swamp-plugin-build-target-property'] = build_target
-        #             break
+        if exit_code != 0:
+            raise CommandFailedError(install_cmd, exit_code, None, None, None)
 
-        # if 'clean' in self._build_conf['build-target'].split():
-        #     self._build_conf['swamp-plugin-build-clean-property'] = 'true'
+    def _use_build_daemon(self, idle_timeout):
+        '''mvnd, if it is installed'''
 
-        self._build_conf['build-target'] = JavaMavenPkg._modify_build_target(self._build_conf['build-target'])
+        if self._build_conf['executable'] != 'mvn' or not shutil.which('mvnd'):
+            return None
+
+        java_opts = self.common_java_opts(self.common_java_ver_num())
+
+        self._build_conf['executable'] = 'mvnd'
+        self._build_conf['mvnd-idle-timeout'] = '{0}s'.format(idle_timeout)
+        self._build_conf['mvnd-jvm-args'] = shlex.quote(java_opts.strip())
+        return 'mvnd'
+
+    def _get_build_daemon_stop_cmd(self):
+        return ['mvnd', '--stop']
+
+    def _setup_prefetch(self, build_root_dir):
+        self._build_conf['maven-prefetch-goal'] = JavaMavenPkg.PREFETCH_GOAL
+
+    @classmethod
+    def get_dependency_repos(cls):
+        return [('maven', osp.expanduser(JavaMavenPkg.MAVEN_REPO_DIR))]
+
+    def _setup_dependency_mirror(self, build_root_dir, mirror_url):
+        if 'maven-settings-xml-file' not in self._build_conf:
+            settings_file = osp.join(build_root_dir, 'mirror-settings.xml')
+            dependency_cache.write_maven_mirror_settings(settings_file, mirror_url)
+            self._build_conf['maven-settings-xml-file'] = settings_file
+            logging.info('DEPENDENCY MIRROR: %s', mirror_url)
         
     def get_env(self, pwd):
         new_env = super().get_env(pwd)
@@ -943,10 +1217,12 @@ class JavaAndroidMavenPkg(JavaMavenPkg):
             outfile = osp.join(build_root_dir, 'android_update_stdout.out')
             errfile = osp.join(build_root_dir, 'android_update_stderr.out')
 
+            usage = dict()
             exit_code, environ = utillib.run_cmd(update_cmd,
                                                  outfile=outfile,
                                                  errfile=errfile,
-                                                 cwd=pkg_config_dir)
+                                                 cwd=pkg_config_dir,
+                                                 usage=usage)
 
             logging.info('ANDROID UPDATE ERROR CODE: %d', exit_code)
             logging.info('ANDROID UPDATE ENVIRONMENT: %s', environ)
@@ -956,7 +1232,8 @@ class JavaAndroidMavenPkg(JavaMavenPkg):
                                       exit_code, environ,
                                       osp.relpath(pkg_config_dir, build_root_dir),
                                       osp.relpath(outfile, build_root_dir),
-                                      osp.relpath(errfile, build_root_dir))
+                                      osp.relpath(errfile, build_root_dir),
+                                      usage)
 
             if exit_code != 0:
                 build_summary.add_exit_code(exit_code)
@@ -971,6 +1248,7 @@ class JavaAndroidMavenPkg(JavaMavenPkg):
                                  JavaPkg.PKG_ROOT_DIR,
                                  self._pkg_conf) as build_summary:
 
+            self._start_prefetch(build_root_dir, build_summary)
             self._android_update(build_root_dir, build_summary)
             self._configure(build_root_dir, build_summary)
             return self._build(build_root_dir, build_summary)
@@ -978,6 +1256,17 @@ class JavaAndroidMavenPkg(JavaMavenPkg):
 
 class JavaGradlePkg(JavaSrcPkg):
 
+    PREFETCH_INVOKE_FILE = 'resources/gradle-prefetch.txt'
+
+    PREFETCH_TASK = 'swampResolveDependencies'
+
+    BUILD_PROGRESS = ('compile tasks', r'^> Task \S*:compile\w*Java\b')
+
+    BUILD_FATAL_PATTERNS = [
+        r'No cached version of .+ available for offline mode',
+        r'Could not resolve all (dependencies|files) for configuration',
+    ]
+
     def __init__(self, pkg_conf, input_root_dir, build_root_dir):
         JavaSrcPkg.__init__(self, pkg_conf, input_root_dir, build_root_dir)
 
@@ -992,6 +1281,7 @@ class JavaGradlePkg(JavaSrcPkg):
             'cmd-invoke-file': osp.join(res_dir, 'resources/gradle-invoke.txt'),
             'build-monitor-output-file': osp.join(build_root_dir, 'build_artifacts.xml'),
             'build-target': 'classes',
+            'gradle-daemon': 'false',
             #'build-file' : 'build.gradle',
         }
 
@@ -1003,6 +1293,62 @@ class JavaGradlePkg(JavaSrcPkg):
             self._build_conf['executable'] = './gradlew'
 
         self._build_conf.update(self._pkg_conf)
+        self._setup_build_cache(build_root_dir)
+
+    def _setup_build_cache(self, build_root_dir):
+        '''Incremental builds, if run.conf gradle-build-cache-dir is set:
+        task outputs are reused from a local build cache in that directory
+        instead of rerunning every task.  The build monitor records the
+        JavaCompile tasks restored from the cache too.'''
+
+        self._build_conf['rerun-tasks'] = 'true'
+        cache_dir = self._run_conf.get('gradle-build-cache-dir', '')
+
+        if not cache_dir:
+            return
+
+        os.makedirs(cache_dir, exist_ok=True)
+        init_script = osp.join(build_root_dir, 'build-cache-init.gradle')
+        build_cache.write_gradle_build_cache_init_script(init_script,
+                                                         osp.abspath(cache_dir))
+
+        self._build_conf['rerun-tasks'] = 'false'
+        self._build_conf['gradle-build-cache'] = 'true'
+        self._build_conf['gradle-build-cache-init-script'] = init_script
+        logging.info('GRADLE BUILD CACHE: %s', cache_dir)
+
+    def _use_build_daemon(self, idle_timeout):
+        '''gradle's own daemon, the build JVM options are passed as
+        org.gradle.jvmargs since GRADLE_OPTS only applies to the client'''
+
+        java_opts = self.common_java_opts(self.common_java_ver_num())
+
+        self._build_conf['gradle-daemon'] = 'true'
+        self._build_conf['gradle-daemon-idle-timeout'] = str(idle_timeout * 1000)
+        self._build_conf['gradle-daemon-jvmargs'] = shlex.quote(java_opts.strip())
+        return self._build_conf['executable']
+
+    def _get_build_daemon_stop_cmd(self):
+        return [self._build_conf['executable'], '--stop']
+
+    @classmethod
+    def get_dependency_repos(cls):
+        gradle_user_home = os.getenv('GRADLE_USER_HOME', osp.expanduser('~/.gradle'))
+        return [('gradle-modules', osp.join(gradle_user_home, 'caches/modules-2')),
+                ('gradle-wrapper', osp.join(gradle_user_home, 'wrapper/dists'))]
+
+    def _setup_prefetch(self, build_root_dir):
+        init_script = osp.join(build_root_dir, 'prefetch-init.gradle')
+        dependency_cache.write_gradle_prefetch_init_script(init_script,
+                                                           JavaGradlePkg.PREFETCH_TASK)
+        self._build_conf['gradle-prefetch-init-script'] = init_script
+        self._build_conf['gradle-prefetch-task'] = JavaGradlePkg.PREFETCH_TASK
+
+    def _setup_dependency_mirror(self, build_root_dir, mirror_url):
+        init_script = osp.join(build_root_dir, 'mirror-init.gradle')
+        dependency_cache.write_gradle_mirror_init_script(init_script, mirror_url)
+        self._build_conf['gradle-mirror-init-script'] = init_script
+        logging.info('DEPENDENCY MIRROR: %s', mirror_url)
 
     def get_env(self, pwd):
         new_env = super().get_env(pwd)
@@ -1119,6 +1465,7 @@ class JavaAndroidGradlePkg(JavaGradlePkg):
                                  JavaPkg.PKG_ROOT_DIR,
                                  self._pkg_conf) as build_summary:
 
+            self._start_prefetch(build_root_dir, build_summary)
             self._android_gradle(build_root_dir, build_summary)
             self._configure(build_root_dir, build_summary)
             return self._build(build_root_dir, build_summary)
@@ -1126,6 +1473,12 @@ class JavaAndroidGradlePkg(JavaGradlePkg):
 
 class JavaAntPkg(JavaSrcPkg):
 
+    BUILD_PROGRESS = ('javac runs', r'\[javac\] Compiling \d+ source file')
+
+    BUILD_FATAL_PATTERNS = [
+        r'\[ivy:retrieve\]\s+::\s+UNRESOLVED DEPENDENCIES',
+    ]
+
     def __init__(self, pkg_conf, input_root_dir, build_root_dir):
         JavaSrcPkg.__init__(self, pkg_conf, input_root_dir, build_root_dir)
 
@@ -1146,6 +1499,10 @@ class JavaAntPkg(JavaSrcPkg):
 
         self._build_conf.update(self._pkg_conf)
 
+    @classmethod
+    def get_dependency_repos(cls):
+        return [('ivy', osp.expanduser('~/.ivy2/cache'))]
+
     def get_env(self, pwd):
         new_env = super().get_env(pwd)
 
@@ -1232,10 +1589,12 @@ class JavaAndroidAntPkg(JavaAntPkg):
             outfile = osp.join(build_root_dir, 'android_update_stdout.out')
             errfile = osp.join(build_root_dir, 'android_update_stderr.out')
 
+            usage = dict()
             exit_code, environ = utillib.run_cmd(update_cmd,
                                                  outfile=outfile,
                                                  errfile=errfile,
-                                                 cwd=pkg_config_dir)
+                                                 cwd=pkg_config_dir,
+                                                 usage=usage)
 
             logging.info('ANDROID UPDATE ERROR CODE: %d', exit_code)
             logging.info('ANDROID UPDATE ENVIRONMENT: %s', environ)
@@ -1244,7 +1603,8 @@ class JavaAndroidAntPkg(JavaAntPkg):
                                       update_cmd[1:], exit_code, environ,
                                       osp.relpath(pkg_config_dir, build_root_dir),
                                       osp.relpath(outfile, build_root_dir),
-                                      osp.relpath(errfile, build_root_dir))
+                                      osp.relpath(errfile, build_root_dir),
+                                      usage)
 
             if exit_code != 0:
                 build_summary.add_exit_code(exit_code)
@@ -1259,6 +1619,7 @@ class JavaAndroidAntPkg(JavaAntPkg):
                                  JavaPkg.PKG_ROOT_DIR,
                                  self._pkg_conf) as build_summary:
 
+            self._start_prefetch(build_root_dir, build_summary)
             self._android_update(build_root_dir, build_summary)
             self._configure(build_root_dir, build_summary)
             return self._build(build_root_dir, build_summary)
@@ -1350,9 +1711,15 @@ class JavaAndroidApkPkg(JavaPkg):
             return (0, BuildSummary.FILENAME)
 
 
-def get_pkg_obj(pkg_conf_file, input_root_dir, build_root_dir):
+def read_run_conf(input_root_dir):
+    run_conf_file = osp.join(input_root_dir, 'run.conf')
+    if osp.isfile(run_conf_file):
+        return confreader.read_conf_into_dict(run_conf_file)
+    else:
+        return dict()
 
-    pkg_conf = confreader.read_conf_into_dict(pkg_conf_file)
+
+def setup_pkg_java_home(pkg_conf):
 
     # identify android assessments using the sdk.
     android_builds = {
@@ -1363,27 +1730,8 @@ def get_pkg_obj(pkg_conf_file, input_root_dir, build_root_dir):
         # apk assessment's are their own thing at this point in time
     }
 
-    pkg_classes = {
-        'java-bytecode': JavaByteCodePkg,
-        'no-build': JavaNoBuildPkg,
-        'ant': JavaAntPkg,
-        'ant+ivy': JavaAntPkg,
-        'maven': JavaMavenPkg,
-        'gradle': JavaGradlePkg,
-        'android+ant': JavaAndroidAntPkg,
-        'android+ant+ivy': JavaAndroidAntPkg,
-        'android+maven': JavaAndroidMavenPkg,
-        'android+gradle': JavaAndroidGradlePkg,
-        'android-apk': JavaAndroidApkPkg,
-    }
-
-    # This is a temprory fix
-    # if 'build-sys' not in pkg_conf:
-    #    pkg_conf['build-sys'] = 'java-bytecode'
-
     build_sys = pkg_conf['build-sys'].lower()
 
-
     ## if android sdk needs specific java, it is already setup; the newer SDK
     ## controls what java is needed, it is no longer a platform issue.
     ## Otherwise (normal assessment on android VM, act normally)
@@ -1396,9 +1744,35 @@ def get_pkg_obj(pkg_conf_file, input_root_dir, build_root_dir):
 
     if set_java_home:
         utillib.setup_java_home(pkg_conf.get('package-language-version', 'java-7').lower())
-     
 
 
+PKG_CLASSES = {
+    'java-bytecode': JavaByteCodePkg,
+    'no-build': JavaNoBuildPkg,
+    'ant': JavaAntPkg,
+    'ant+ivy': JavaAntPkg,
+    'maven': JavaMavenPkg,
+    'gradle': JavaGradlePkg,
+    'android+ant': JavaAndroidAntPkg,
+    'android+ant+ivy': JavaAndroidAntPkg,
+    'android+maven': JavaAndroidMavenPkg,
+    'android+gradle': JavaAndroidGradlePkg,
+    'android-apk': JavaAndroidApkPkg,
+}
+
+
+def get_pkg_obj(pkg_conf_file, input_root_dir, build_root_dir):
+
+    pkg_conf = confreader.read_conf_into_dict(pkg_conf_file)
+
+    # This is a temprory fix
+    # if 'build-sys' not in pkg_conf:
+    #    pkg_conf['build-sys'] = 'java-bytecode'
+
+    build_sys = pkg_conf['build-sys'].lower()
+
+    setup_pkg_java_home(pkg_conf)
+
     # set default values for some mandatory items
     # creating a dictionary of default values would be a better solution;
     # the code is already setup to use it
@@ -1407,12 +1781,30 @@ def get_pkg_obj(pkg_conf_file, input_root_dir, build_root_dir):
     if key not in pkg_conf or pkg_conf[key].isspace():
         pkg_conf[key] = default_value
 
-    if build_sys in pkg_classes.keys():
-        return pkg_classes[build_sys](pkg_conf, input_root_dir, build_root_dir)
+    if build_sys in PKG_CLASSES.keys():
+        return PKG_CLASSES[build_sys](pkg_conf, input_root_dir, build_root_dir)
     else:
         raise InvalidBuildSystem(build_sys)
 
 
+def restore_dependencies(pkg_conf, run_conf):
+    '''Fills the local repositories of the build system from the
+    dependency cache, a build restored from the build cache needs them'''
+
+    pkg_class = PKG_CLASSES.get(pkg_conf['build-sys'].lower())
+    dep_cache = DependencyCache.from_conf(run_conf)
+
+    if pkg_class is None or dep_cache is None or not pkg_class.get_dependency_repos():
+        return
+
+    with LogTaskStatus('dependency-cache-restore') as status_dot_out:
+        for namespace, repo_dir in pkg_class.get_dependency_repos():
+            dep_cache.restore(namespace, repo_dir)
+
+        status_dot_out.update_task_status(0, 'files: {0}'.format(
+            sum(stats['restored'] for stats in dep_cache.stats.values())))
+
+
 def build(input_root_dir, output_root_dir, build_root_dir):
 
     ## mark as failed if exception thrown
@@ -1422,13 +1814,37 @@ def build(input_root_dir, output_root_dir, build_root_dir):
     ## The whole problem is that exceptions are used for ERROR handling.
     # exit_code = 99
 
+    build_conf_extras = dict()
+    cache = None
+    cache_key = None
+    cached = None
+
     try:
         if not osp.isdir(build_root_dir):
             os.makedirs(build_root_dir, exist_ok=True)
 
         pkg_conf_file = osp.join(input_root_dir, 'package.conf')
-        pkg = get_pkg_obj(pkg_conf_file, input_root_dir, build_root_dir)
-        exit_code, build_summary_file = pkg.build(build_root_dir)
+
+        run_conf = read_run_conf(input_root_dir)
+        cache = BuildCache.from_conf(run_conf)
+
+        if cache:
+            pkg_conf = confreader.read_conf_into_dict(pkg_conf_file)
+            setup_pkg_java_home(pkg_conf)
+            cache_key = BuildCache.get_key(input_root_dir, pkg_conf, run_conf)
+
+            if cache.has_entry(cache_key):
+                restore_dependencies(pkg_conf, run_conf)
+
+            cached = cache.restore(cache_key, build_root_dir)
+
+        if cached:
+            build_summary_file, build_conf_extras = cached
+            exit_code = 0
+        else:
+            pkg = get_pkg_obj(pkg_conf_file, input_root_dir, build_root_dir)
+            exit_code, build_summary_file = pkg.build(build_root_dir)
+            build_conf_extras = pkg.get_build_conf_extras()
     except (NoBuildHelperError,
             NoSourceFilesFoundError,
             CompilationFailedError,
@@ -1459,11 +1875,19 @@ def build(input_root_dir, output_root_dir, build_root_dir):
                                                 'gztar',
                                                 osp.dirname(build_root_dir),
                                                 osp.basename(build_root_dir))
+            utillib.count_archive(build_archive)
 
             build_conf['build-archive'] = osp.basename(build_archive)
             build_conf['build-dir'] = osp.basename(build_root_dir)
-            build_conf.update(pkg.get_build_conf_extras())
+            build_conf.update(build_conf_extras)
 
             utillib.write_to_file(osp.join(output_root_dir, 'build.conf'), build_conf)
 
+        if cache and not cached and exit_code == 0:
+            try:
+                cache.store(cache_key, build_archive, build_root_dir,
+                            osp.basename(build_summary_file), build_conf_extras)
+            except Exception as err:
+                logging.warning('BUILD CACHE NOT STORED: %s: %s', cache_key, err)
+
     return (exit_code, build_summary_file)
@@ -0,0 +1,298 @@
+import os
+import os.path as osp
+import json
+import shutil
+import fcntl
+import hashlib
+import logging
+import contextlib
+
+
+class DependencyCache():
+    '''Host level cache of the dependencies downloaded by builds.
+
+    Files of a local repository (~/.m2/repository, gradle's
+    caches/modules-2, ~/.ivy2/cache, ...) are stored once, by their
+    sha256, in cache_dir/objects.  An index per repository (namespace)
+    maps paths in the repository to objects.  Before a build the indexed
+    files are put in the repository, after the build the new files are
+    added to the cache.
+
+    Files are copied from the cache, as reflinks (FICLONE) where the file
+    system can, never hard linked: builds rewrite files of the
+    repositories in place (maven-metadata, gradle's caches), that would
+    modify the cache.  The objects are read-only.  A flock on cache_dir/cache.lock makes the cache
+    safe to share between concurrent runs.  When the objects exceed
+    max_size, the least recently used ones are evicted.
+    '''
+
+    LOCK_FILE = 'cache.lock'
+
+    ## files that are not worth caching, or are never reused
+    EXCLUDE_SUFFIXES = ('.lock', '.lck', '.lastUpdated', '.part', '.tmp')
+
+    ## linux/fs.h, a copy-on-write clone of a file
+    FICLONE = 0x40049409
+
+    def __init__(self, cache_dir, max_size):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._objects_dir = osp.join(cache_dir, 'objects')
+        self._index_dir = osp.join(cache_dir, 'index')
+        self._restored = dict()
+        self.stats = dict()
+
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._index_dir, exist_ok=True)
+
+    @classmethod
+    def from_conf(cls, run_conf):
+        '''DependencyCache from run.conf dependency-cache-dir and
+        dependency-cache-max-size (MB, default 10240), None if not enabled'''
+
+        cache_dir = run_conf.get('dependency-cache-dir', '')
+
+        if not cache_dir:
+            return None
+
+        try:
+            max_size = int(run_conf.get('dependency-cache-max-size', '10240'))
+        except ValueError:
+            logging.warning('Invalid dependency-cache-max-size: %s',
+                            run_conf['dependency-cache-max-size'])
+            max_size = 10240
+
+        return DependencyCache(cache_dir, max_size * 1024 * 1024)
+
+    @contextlib.contextmanager
+    def _lock(self, exclusive):
+        with open(osp.join(self.cache_dir, DependencyCache.LOCK_FILE), 'a') as fobj:
+            fcntl.flock(fobj, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(fobj, fcntl.LOCK_UN)
+
+    def _get_object_path(self, digest):
+        return osp.join(self._objects_dir, digest[:2], digest)
+
+    def _get_index_file(self, namespace):
+        return osp.join(self._index_dir, '{0}.json'.format(namespace))
+
+    def _read_index(self, namespace):
+        index_file = self._get_index_file(namespace)
+
+        if osp.isfile(index_file):
+            with open(index_file) as fobj:
+                return json.load(fobj)
+        else:
+            return dict()
+
+    def _write_index(self, namespace, index):
+        index_file = self._get_index_file(namespace)
+
+        with open(index_file + '.tmp', 'w') as fobj:
+            json.dump(index, fobj)
+        os.replace(index_file + '.tmp', index_file)
+
+    @classmethod
+    def _get_digest(cls, filepath):
+        sha256 = hashlib.sha256()
+        with open(filepath, 'rb') as fobj:
+            for chunk in iter(lambda: fobj.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _get_files(self, repo_dir):
+        for dirpath, _, filenames in os.walk(repo_dir):
+            for filename in filenames:
+                if not filename.endswith(DependencyCache.EXCLUDE_SUFFIXES):
+                    filepath = osp.join(dirpath, filename)
+                    if osp.isfile(filepath) and not osp.islink(filepath):
+                        yield osp.relpath(filepath, repo_dir)
+
+    @classmethod
+    def _copy(cls, object_path, filepath):
+        '''Copies object_path to filepath, as a reflink if the file system can'''
+
+        with open(object_path, 'rb') as src, open(filepath, 'wb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), DependencyCache.FICLONE, src.fileno())
+            except OSError:
+                # not supported, or a different file system
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+    def restore(self, namespace, repo_dir):
+        '''Puts the cached files of namespace in repo_dir,
+        files already in repo_dir are left alone'''
+
+        restored = dict()
+
+        with self._lock(exclusive=False):
+            for relpath, digest in self._read_index(namespace).items():
+                filepath = osp.join(repo_dir, relpath)
+                object_path = self._get_object_path(digest)
+
+                if osp.exists(filepath) or not osp.isfile(object_path):
+                    continue
+
+                os.makedirs(osp.dirname(filepath), exist_ok=True)
+                DependencyCache._copy(object_path, filepath)
+
+                # for LRU eviction
+                os.utime(object_path)
+
+                # a file with the same size and mtime at save is unchanged
+                stat = os.stat(filepath)
+                restored[relpath] = (digest, stat.st_size, stat.st_mtime_ns)
+
+        self._restored[namespace] = restored
+        self.stats[namespace] = {'restored': len(restored)}
+        logging.info('DEPENDENCY CACHE RESTORED %s: %d files to %s',
+                     namespace, len(restored), repo_dir)
+
+    def save(self, namespace, repo_dir):
+        '''Adds the files in repo_dir to the cache, counts the restored
+        files still there as hits and the files new to the cache as misses'''
+
+        restored = self._restored.get(namespace, dict())
+        stats = self.stats.setdefault(namespace, {'restored': 0})
+        stats.update({'hits': 0, 'misses': 0, 'miss-bytes': 0})
+
+        if not osp.isdir(repo_dir):
+            return stats
+
+        with self._lock(exclusive=True):
+            index = self._read_index(namespace)
+
+            for relpath in self._get_files(repo_dir):
+                filepath = osp.join(repo_dir, relpath)
+
+                if relpath in restored:
+                    stat = os.stat(filepath)
+                    if restored[relpath][1:] == (stat.st_size, stat.st_mtime_ns):
+                        stats['hits'] += 1
+                        continue
+
+                digest = DependencyCache._get_digest(filepath)
+
+                if relpath in restored and restored[relpath][0] == digest:
+                    stats['hits'] += 1
+                    continue
+
+                object_path = self._get_object_path(digest)
+
+                if not osp.isfile(object_path):
+                    os.makedirs(osp.dirname(object_path), exist_ok=True)
+                    # read-only, if left by a run that did not finish
+                    if osp.exists(object_path + '.tmp'):
+                        os.remove(object_path + '.tmp')
+                    shutil.copyfile(filepath, object_path + '.tmp')
+                    os.chmod(object_path + '.tmp', 0o444)
+                    os.replace(object_path + '.tmp', object_path)
+
+                if index.get(relpath) != digest:
+                    stats['misses'] += 1
+                    stats['miss-bytes'] += os.stat(filepath).st_size
+
+                index[relpath] = digest
+
+            self._write_index(namespace, index)
+            self._evict()
+
+        logging.info('DEPENDENCY CACHE SAVED %s: %s', namespace, stats)
+        return stats
+
+    def _evict(self):
+        '''Removes the least recently used objects until the objects fit
+        in max_size, and the index entries of the removed objects'''
+
+        objects = list()
+        for dirpath, _, filenames in os.walk(self._objects_dir):
+            for filename in filenames:
+                stat = os.stat(osp.join(dirpath, filename))
+                objects.append((stat.st_mtime, stat.st_size, filename))
+
+        total = sum(size for _, size, _ in objects)
+
+        if total <= self.max_size:
+            return
+
+        evicted = set()
+        for _, size, digest in sorted(objects):
+            if total <= self.max_size:
+                break
+            os.remove(self._get_object_path(digest))
+            evicted.add(digest)
+            total -= size
+
+        for index_file in os.listdir(self._index_dir):
+            if index_file.endswith('.json'):
+                namespace = osp.splitext(index_file)[0]
+                index = self._read_index(namespace)
+                self._write_index(namespace,
+                                  {relpath: digest for relpath, digest in index.items()
+                                   if digest not in evicted})
+
+        logging.info('DEPENDENCY CACHE EVICTED: %d objects, %s bytes left',
+                     len(evicted), total)
+
+    def get_summary(self):
+        '''Per namespace statistics, as strings'''
+
+        return {namespace: {key: str(value) for key, value in stats.items()}
+                for namespace, stats in self.stats.items()}
+
+
+def write_maven_mirror_settings(settings_file, mirror_url):
+    '''settings.xml that makes maven get everything from mirror_url,
+    a file:// url works as a stand-in for a remote repository'''
+
+    with open(settings_file, 'w') as fobj:
+        print('''<?xml version="1.0" encoding="UTF-8"?>
+<settings xmlns="http://maven.apache.org/SETTINGS/1.0.0"
+          xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+          xsi:schemaLocation="http://maven.apache.org/SETTINGS/1.0.0 http://maven.apache.org/xsd/settings-1.0.0.xsd">
+  <mirrors>
+    <mirror>
+      <id>java-assess-mirror</id>
+      <url>{0}</url>
+      <mirrorOf>*</mirrorOf>
+    </mirror>
+  </mirrors>
+</settings>'''.format(mirror_url), file=fobj)
+
+
+def write_gradle_mirror_init_script(init_script, mirror_url):
+    '''init script that points the maven repositories of all the projects
+    (and their buildscripts) at mirror_url'''
+
+    with open(init_script, 'w') as fobj:
+        print('''def mirrorUrl = '{0}'
+
+def useMirror = {{ repositories ->
+    repositories.all {{ repo ->
+        if (repo instanceof MavenArtifactRepository) {{
+            repo.url = mirrorUrl
+        }}
+    }}
+}}
+
+allprojects {{
+    useMirror(buildscript.repositories)
+    useMirror(repositories)
+}}'''.format(mirror_url), file=fobj)
+
+
+def write_gradle_prefetch_init_script(init_script, task_name):
+    '''init script with a task_name task in every project that resolves
+    all the resolvable configurations, gradle's go-offline'''
+
+    with open(init_script, 'w') as fobj:
+        print('''allprojects {{
+    task {0} {{
+        doLast {{
+            configurations.findAll {{ it.canBeResolved }}.each {{ it.resolve() }}
+        }}
+    }}
+}}'''.format(task_name), file=fobj)
@@ -0,0 +1,97 @@
+import os
+import os.path as osp
+import hashlib
+import logging
+import xml.etree.ElementTree as ET
+
+
+POM_NS = {'pom': 'http://maven.apache.org/POM/4.0.0'}
+
+## next to the installed jar, the plugin sources it was built from
+FINGERPRINT_SUFFIX = '.swamp-fingerprint'
+
+
+def _get_coordinates(pom_file):
+    '''(groupId, artifactId, version) of the pom'''
+
+    root = ET.parse(pom_file).getroot()
+
+    def _get(tag):
+        elem = root.find('pom:{0}'.format(tag), POM_NS)
+        if elem is None:
+            elem = root.find(tag)
+        if elem is None:
+            elem = root.find('pom:parent/pom:{0}'.format(tag), POM_NS)
+        return elem.text.strip() if elem is not None else None
+
+    return (_get('groupId'), _get('artifactId'), _get('version'))
+
+
+def _get_digest(filepath):
+    sha256 = hashlib.sha256()
+    with open(filepath, 'rb') as fobj:
+        for chunk in iter(lambda: fobj.read(1024 * 1024), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def get_fingerprint(plugin_dir):
+    '''sha256 of the plugin sources, pom.xml and the files in src/'''
+
+    sha256 = hashlib.sha256()
+    filepaths = [osp.join(plugin_dir, 'pom.xml')]
+
+    for dirpath, dirnames, filenames in os.walk(osp.join(plugin_dir, 'src')):
+        dirnames.sort()
+        filepaths.extend(osp.join(dirpath, filename) for filename in sorted(filenames))
+
+    for filepath in filepaths:
+        sha256.update(osp.relpath(filepath, plugin_dir).encode('utf-8'))
+        sha256.update(_get_digest(filepath).encode('utf-8'))
+
+    return sha256.hexdigest()
+
+
+def _get_repo_files(plugin_dir, repo_dir):
+    '''(pom, jar, fingerprint file) of the plugin in the local repository'''
+
+    group_id, artifact_id, version = _get_coordinates(osp.join(plugin_dir, 'pom.xml'))
+    artifact_dir = osp.join(repo_dir, *group_id.split('.'), artifact_id, version)
+    basename = osp.join(artifact_dir, '{0}-{1}'.format(artifact_id, version))
+
+    return (basename + '.pom', basename + '.jar', basename + FINGERPRINT_SUFFIX)
+
+
+def is_installed(plugin_dir, repo_dir, fingerprint):
+    '''True if 'mvn install' of the plugin in plugin_dir, with the
+    sources of fingerprint, put the pom and jar in the local repository
+    repo_dir, and they have not changed since'''
+
+    repo_pom, repo_jar, fingerprint_file = _get_repo_files(plugin_dir, repo_dir)
+
+    if not (osp.isfile(repo_pom) and osp.isfile(repo_jar) and osp.isfile(fingerprint_file)):
+        return False
+
+    with open(fingerprint_file) as fobj:
+        installed = fobj.read().split()
+
+    return installed == [fingerprint,
+                         _get_digest(osp.join(plugin_dir, 'pom.xml')),
+                         _get_digest(repo_pom),
+                         _get_digest(repo_jar)]
+
+
+def set_installed(plugin_dir, repo_dir, fingerprint):
+    '''Records the plugin 'mvn install' just put in repo_dir'''
+
+    repo_pom, repo_jar, fingerprint_file = _get_repo_files(plugin_dir, repo_dir)
+
+    # written then renamed, a concurrent build never reads half of it
+    with open(fingerprint_file + '.tmp', 'w') as fobj:
+        print(fingerprint,
+              _get_digest(osp.join(plugin_dir, 'pom.xml')),
+              _get_digest(repo_pom),
+              _get_digest(repo_jar), file=fobj)
+
+    os.replace(fingerprint_file + '.tmp', fingerprint_file)
+    logging.info('MAVEN PLUGIN INSTALLED: %s %s', repo_jar, fingerprint)
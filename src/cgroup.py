@@ -0,0 +1,232 @@
+import os
+import os.path as osp
+import logging
+import threading
+
+
+## Memory and CPU caps for the builds and the tools, with cgroup v2.
+##
+## Heap sizes from the resource plan assume the JVMs fit in memory, a
+## JVM that grows past its share pushes the VM into swap and slows down
+## everything.  With run.conf cgroup-limits, a command run with a
+## resource plan gets a child group of the cgroup java-assess runs in
+## (it has to be delegated to the user java-assess runs as):
+##
+##   memory.high   the JVM's share of the memory budget, throttled above
+##   memory.max    the share + cgroup-memory-headroom percent (default 25),
+##                 OOM-killed above
+##   memory.swap.max  0, the point is to not swap
+##   cpu.max       the JVM's share of the CPUs, if less than all of them
+##
+## java-assess, and the other processes of its group (the bin/java-assess
+## wrapper), move to a leaf group 'java-assess' so that the controllers
+## can be enabled for the children (no internal processes).  Anything
+## not there (cgroup v1, no delegation, controllers owned by v1, other
+## processes in the group that cannot be moved) turns the caps off with
+## a warning, the commands run as before.
+
+_base_dir = None
+_headroom = None
+_count = 0
+_lock = threading.Lock()
+
+CPU_PERIOD = 100000
+
+
+def _find_cgroup2_mount():
+
+    with open('/proc/self/mounts') as fobj:
+        for line in fobj:
+            fields = line.split()
+            if len(fields) > 2 and fields[2] == 'cgroup2':
+                return fields[1]
+
+    return None
+
+
+def _find_own_cgroup():
+    '''Path of the cgroup v2 group of this process, relative to the mount'''
+
+    with open('/proc/self/cgroup') as fobj:
+        for line in fobj:
+            if line.startswith('0::'):
+                return line.strip()[3:]
+
+    return None
+
+
+def _write(cgroup_dir, filename, value):
+    with open(osp.join(cgroup_dir, filename), 'w') as fobj:
+        fobj.write(str(value))
+
+
+def _move_procs(from_dir, to_dir):
+    '''Moves the processes of from_dir to to_dir, a few times over for
+    processes forked in the meantime'''
+
+    for _ in range(3):
+        with open(osp.join(from_dir, 'cgroup.procs')) as fobj:
+            pids = fobj.read().split()
+
+        if not pids:
+            return
+
+        for pid in pids:
+            try:
+                _write(to_dir, 'cgroup.procs', pid)
+            except ProcessLookupError:
+                # exited
+                pass
+
+
+def configure(run_conf):
+    '''Turns the caps on if run.conf cgroup-limits is true,
+    and cgroup v2 with the memory and cpu controllers is delegated'''
+
+    global _base_dir, _headroom
+
+    if run_conf.get('cgroup-limits', 'false') != 'true':
+        return
+
+    try:
+        headroom = int(run_conf.get('cgroup-memory-headroom', '25'))
+    except ValueError:
+        logging.warning('Invalid cgroup-memory-headroom: %s',
+                        run_conf['cgroup-memory-headroom'])
+        headroom = 25
+
+    try:
+        mount_dir = _find_cgroup2_mount()
+        own_cgroup = _find_own_cgroup()
+
+        if mount_dir is None or own_cgroup is None:
+            raise OSError('cgroup v2 is not mounted')
+
+        base_dir = osp.join(mount_dir, own_cgroup.lstrip('/'))
+
+        with open(osp.join(base_dir, 'cgroup.controllers')) as fobj:
+            controllers = fobj.read().split()
+
+        if 'memory' not in controllers or 'cpu' not in controllers:
+            raise OSError('memory and cpu controllers not available in {0}: {1}'.format(base_dir,
+                                                                                       controllers))
+
+        leaf_dir = osp.join(base_dir, 'java-assess')
+        os.makedirs(leaf_dir, exist_ok=True)
+        _move_procs(base_dir, leaf_dir)
+        _write(base_dir, 'cgroup.subtree_control', '+memory +cpu')
+    except OSError as err:
+        logging.warning('CGROUP LIMITS NOT AVAILABLE: %s', err)
+        return
+
+    _base_dir = base_dir
+    _headroom = headroom
+    logging.info('CGROUP LIMITS: in %s, memory headroom %d%%', base_dir, headroom)
+
+
+def create(label, resource_plan):
+    '''Child group with the caps for a command run with resource_plan,
+    None if the caps are off'''
+
+    global _count
+
+    if _base_dir is None or resource_plan is None:
+        return None
+
+    with _lock:
+        _count += 1
+        cgroup_dir = osp.join(_base_dir, '{0}-{1}'.format(label, _count))
+
+    share = resource_plan.memory_share()
+    cpus = (os.cpu_count() or 1) * max(1, resource_plan.slots) / resource_plan.concurrency
+
+    try:
+        os.mkdir(cgroup_dir)
+        cgroup = Cgroup(cgroup_dir,
+                        share * (100 + _headroom) // 100,
+                        share,
+                        int(cpus * CPU_PERIOD) if cpus < (os.cpu_count() or 1) else None)
+        cgroup.apply()
+    except OSError as err:
+        logging.warning('CGROUP NOT CREATED: %s: %s', cgroup_dir, err)
+        return None
+
+    return cgroup
+
+
+class Cgroup():
+    '''A child group, memory in MB, cpu_quota in microseconds per
+    CPU_PERIOD (None: no CPU cap)'''
+
+    def __init__(self, cgroup_dir, memory_max, memory_high, cpu_quota):
+        self.cgroup_dir = cgroup_dir
+        self.memory_max = memory_max
+        self.memory_high = memory_high
+        self.cpu_quota = cpu_quota
+
+    def apply(self):
+
+        _write(self.cgroup_dir, 'memory.max', self.memory_max * 1024 * 1024)
+        _write(self.cgroup_dir, 'memory.high', self.memory_high * 1024 * 1024)
+
+        if osp.isfile(osp.join(self.cgroup_dir, 'memory.swap.max')):
+            _write(self.cgroup_dir, 'memory.swap.max', 0)
+
+        if self.cpu_quota:
+            _write(self.cgroup_dir, 'cpu.max', self.get_cpu_max())
+
+        logging.info('CGROUP %s: memory.max %dM, memory.high %dM, cpu.max %s',
+                     self.cgroup_dir, self.memory_max, self.memory_high,
+                     self.get_cpu_max())
+
+    def get_cpu_max(self):
+        return '{0} {1}'.format(self.cpu_quota, CPU_PERIOD) if self.cpu_quota else 'max'
+
+    def wrap(self, cmd):
+        '''cmd (a list, or a string for the shell) as a command that puts
+        itself in the group before it runs, its descendants start there'''
+
+        if isinstance(cmd, str):
+            cmd = ['/bin/sh', '-c', cmd]
+
+        return ['/bin/sh', '-c', 'echo $$ > "$0/cgroup.procs" && exec "$@"',
+                self.cgroup_dir] + list(cmd)
+
+    def read_events(self):
+        '''memory.events counters, by name'''
+
+        events = dict()
+        try:
+            with open(osp.join(self.cgroup_dir, 'memory.events')) as fobj:
+                for line in fobj:
+                    name, _, count = line.partition(' ')
+                    events[name] = int(count)
+        except (OSError, ValueError):
+            pass
+
+        return events
+
+    def get_usage(self):
+        '''The caps and the memory.events of the group, for the summaries'''
+
+        events = self.read_events()
+
+        if events.get('oom_kill'):
+            logging.warning('CGROUP OOM KILL: %s: %s', self.cgroup_dir, events)
+
+        return {
+            'memory-max': str(self.memory_max),
+            'memory-high': str(self.memory_high),
+            'cpu-max': self.get_cpu_max(),
+            'oom-kill': str(events.get('oom_kill', 0)),
+            'oom': str(events.get('oom', 0)),
+            'memory-high-events': str(events.get('high', 0)),
+            'memory-max-events': str(events.get('max', 0)),
+        }
+
+    def remove(self):
+        '''Removes the group, kept if processes (a build daemon) are left in it'''
+        try:
+            os.rmdir(self.cgroup_dir)
+        except OSError as err:
+            logging.info('CGROUP KEPT: %s: %s', self.cgroup_dir, err)
@@ -2,10 +2,12 @@ import os
 import os.path as osp
 import glob
 import re
+import time
 import logging
 
 import plyj.parser
 from . import utillib
+from . import metrics
 
 
 class PlyjParsingError(Exception):
@@ -22,6 +24,18 @@ class JavaParser():
     def init(cls):
         cls.java_parser = plyj.parser.Parser(logging.getLogger(''))
 
+    @classmethod
+    def _parse_file(cls, filepath, encoding):
+
+        start = time.monotonic()
+        parse_tree_obj = cls.java_parser.parse_file(filepath, encoding)
+
+        metrics.counter('java_assess_java_parser_parses_total',
+                        'Java files parsed').inc()
+        metrics.histogram('java_assess_java_parser_parse_seconds',
+                          'Time to parse a java file').observe(time.monotonic() - start)
+        return parse_tree_obj
+
     @classmethod
     def get_pkg_name(cls, filepath, encoding):
 
@@ -29,7 +43,7 @@ class JavaParser():
             cls.init()
 
         if (osp.splitext(filepath)[1] == '.java') and osp.isfile(filepath):
-            parse_tree_obj = cls.java_parser.parse_file(filepath, encoding)
+            parse_tree_obj = cls._parse_file(filepath, encoding)
             if hasattr(parse_tree_obj, 'package_declaration'):
                 pkg_dec = parse_tree_obj.package_declaration
                 if pkg_dec:
@@ -44,7 +58,7 @@ class JavaParser():
             cls.init()
 
         if (osp.splitext(filepath)[1] == '.java') and osp.isfile(filepath):
-            parse_tree_obj = cls.java_parser.parse_file(filepath, encoding)
+            parse_tree_obj = cls._parse_file(filepath, encoding)
 
             if parse_tree_obj is None:
                 raise PlyjParsingError('JavaParser fails for %s' % filepath)
@@ -109,6 +123,9 @@ def get_files(dirpath, include, exclude=None):
     if (len(ifiles) > 0) and (exclude is not None):
         efiles = set(_listdir(dirpath, exclude))
         ifiles = ifiles.difference(efiles)
+
+    metrics.counter('java_assess_directory_scanner_files_total',
+                    'Files found by directory scans').inc(len(ifiles))
     return list(ifiles)
 
 
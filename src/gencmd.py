@@ -1,11 +1,13 @@
 import sys
 import os
 import os.path as osp
+import time
 import logging
 
 import ply.lex as lex
 import ply.yacc as yacc
 from . import utillib
+from . import metrics
 
 
 tokens = (
@@ -230,6 +232,7 @@ def process_quotedstring(string_template, symbol_table):
 
 def gencmd(str_or_file, symbol_table):
     '''str_or_file: Can be a file or a string'''
+    start = time.monotonic()
     input_str = _get_string(str_or_file)
     ast = parse_str(input_str)
 
@@ -249,6 +252,11 @@ def gencmd(str_or_file, symbol_table):
             if isinstance(val, list):
                 cmd.extend(val)
 
+        metrics.counter('java_assess_gencmd_renders_total',
+                        'Commands generated from templates').inc()
+        metrics.histogram('java_assess_gencmd_render_seconds',
+                          'Time to generate a command').observe(time.monotonic() - start)
+
         # return [arg.strip() for arg in cmd if arg is not None]
         return cmd
     else:
@@ -0,0 +1,149 @@
+import os.path as osp
+import re
+import logging
+import subprocess
+
+
+## JVM options that depend on the JVM major version.
+##
+## The major version is read from $JAVA_HOME/release, which may not
+## match package-language-version (android SDK java, platform javas).
+## Options picked from the table are checked against the flags the JVM
+## actually has (java -XX:+PrintFlagsFinal), probed once per JDK, so an
+## option an update release does not have is dropped instead of making
+## the JVM refuse to start.
+
+GC_OPTS = {
+    # CMS avoids the parallel collector's GC overhead limit errors on
+    # poorly sized heaps.  Groovy (in gradle) generates a huge number of
+    # classes used only for setup, class unloading lets java drop them.
+    'cms': ['-XX:+UseConcMarkSweepGC', '-XX:+CMSClassUnloadingEnabled'],
+    # Throughput collector; builds and tools are batch jobs.  The GC
+    # overhead limit is what made CMS necessary, turn it off instead.
+    'parallel': ['-XX:+UseParallelGC', '-XX:-UseGCOverheadLimit'],
+    'g1': ['-XX:+UseG1GC'],
+    'default': [],
+}
+
+## (first major version, profile), in increasing order of version
+PROFILES = [
+    (0, {
+        'gc': 'cms',
+        'metaspace-flag': 'MaxPermSize',
+        'container-opts': [],
+    }),
+    (8, {
+        'gc': 'parallel',
+        'metaspace-flag': 'MaxMetaspaceSize',
+        # 8u191 and later
+        'container-opts': ['-XX:+UseContainerSupport'],
+    }),
+]
+
+## java home -> set of flag names, None if it could not be probed
+_jvm_flags = dict()
+
+## (java home, option) already reported as dropped
+_dropped_opts = set()
+
+
+def read_release(java_home):
+    '''$JAVA_HOME/release as a dict, empty if there is none'''
+
+    release = dict()
+
+    if not java_home:
+        return release
+
+    release_file = osp.join(java_home, 'release')
+
+    if osp.isfile(release_file):
+        with open(release_file) as fobj:
+            for line in fobj:
+                matched = re.match(r'^(?P<key>\w+)="?(?P<value>[^"]*)"?$', line.strip())
+                if matched:
+                    release[matched.group('key')] = matched.group('value')
+
+    return release
+
+
+def get_java_home_version(java_home):
+    '''Major version from $JAVA_HOME/release, None if not known'''
+
+    java_version = read_release(java_home).get('JAVA_VERSION')
+
+    if not java_version:
+        return None
+
+    version = java_version.split('.')
+    try:
+        # 1.8.0_292 or 11.0.2
+        if version[0] == '1' and len(version) > 1:
+            return int(version[1])
+        return int(re.match(r'\d+', version[0]).group())
+    except (ValueError, AttributeError):
+        logging.warning('Invalid JAVA_VERSION in %s: %s', java_home, java_version)
+        return None
+
+
+def get_profile(java_ver):
+    '''Profile for the JVM major version'''
+
+    profile = PROFILES[0][1]
+
+    for first_ver, _profile in PROFILES:
+        if java_ver >= first_ver:
+            profile = _profile
+
+    return dict(profile)
+
+
+def get_jvm_flags(java_home):
+    '''Set of -XX flag names the JVM in java_home has, None if the JVM
+    could not be probed.  Probed once per java home'''
+
+    if not java_home:
+        return None
+
+    java_home = osp.realpath(java_home)
+
+    if java_home not in _jvm_flags:
+        java = osp.join(java_home, 'bin', 'java')
+        flags = None
+
+        try:
+            output = subprocess.check_output([java, '-XX:+PrintFlagsFinal', '-version'],
+                                             stderr=subprocess.DEVNULL,
+                                             timeout=120)
+            # '     bool UseG1GC      = false      {product} {default}'
+            flags = set(re.findall(r'^\s*\S+\s+(\w+)\s+:?=',
+                                   output.decode('utf-8', errors='replace'),
+                                   re.MULTILINE))
+            logging.info('JVM FLAGS %s: %d', java_home, len(flags))
+        except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as err:
+            logging.warning('Could not probe JVM flags %s: %s', java, err)
+
+        _jvm_flags[java_home] = flags
+
+    return _jvm_flags[java_home]
+
+
+def validate_opts(opts, java_home):
+    '''Drops -XX options the JVM does not have'''
+
+    flags = get_jvm_flags(java_home)
+
+    if flags is None:
+        return list(opts)
+
+    valid = list()
+    for opt in opts:
+        matched = re.match(r'^-XX:[+-]?(?P<flag>\w+)', opt)
+        if matched and matched.group('flag') not in flags:
+            if (java_home, opt) not in _dropped_opts:
+                logging.warning('JVM %s does not support %s, dropped', java_home, opt)
+                _dropped_opts.add((java_home, opt))
+        else:
+            valid.append(opt)
+
+    return valid
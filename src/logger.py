@@ -3,8 +3,160 @@ import os.path as osp
 import logging
 import logging.handlers
 import sys
+import copy
 import time
+import queue
+import atexit
+import reprlib
+import itertools
 import textwrap
+import contextvars
+import collections.abc
+
+from . import trace
+from . import metrics
+from . import profiling
+
+
+## a context variable, so that the threads a stage starts with
+## trace.run_in_context (tool invocations, output readers) buffer
+## their status records with the stage's
+_status_buffer = contextvars.ContextVar('status-buffer', default=None)
+
+# where init puts status.out, shutdown writes the metrics there
+_output_dir = None
+
+## debug.out and the console are written by a QueueListener thread, the
+## threads that log only queue their records.  status.out is written as
+## the tasks end, in order, by the thread that logs the status.
+_listener = None
+
+
+def _log_status(msg):
+    '''Writes msg to status.out, or holds on to it if the calling
+    context is buffering its status records'''
+
+    records = _status_buffer.get()
+    if records is not None:
+        records.append(msg)
+    else:
+        logging.getLogger('.status-logger').log(60, msg)
+
+
+def buffer_status(records):
+    '''Status records logged in the calling context (the calling thread,
+    and the threads it starts with trace.run_in_context) are appended to
+    the list records, until buffer_status(None) is called'''
+    _status_buffer.set(records)
+
+
+def flush_status(records):
+    '''Writes buffered status records to status.out, or to the buffer
+    of the calling context if it is buffering too'''
+    for msg in records:
+        _log_status(msg)
+
+
+class _ArgShortener(reprlib.Repr):
+    '''Log records as they go in the queue: lists, tuples, sets and
+    dicts with more than max_items items (0: no limit) are logged as
+    their first max_items, messages longer than max_chars (0: no limit)
+    are cut at max_chars'''
+
+    CONTAINERS = (list, tuple, set, frozenset, dict, collections.deque,
+                  collections.abc.Mapping)
+
+    def __init__(self, max_items, max_chars):
+        super().__init__()
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.maxlist = self.maxtuple = self.maxset = self.maxfrozenset = max_items
+        self.maxdeque = self.maxdict = max_items
+        self.maxstring = self.maxother = max_chars or sys.maxsize
+
+    def shorten_str(self, text):
+        if self.max_chars and len(text) > self.max_chars:
+            return '{0}... ({1} more characters)'.format(text[:self.max_chars],
+                                                         len(text) - self.max_chars)
+        return text
+
+    def copy_arg(self, arg):
+        '''A copy of arg, if it is a container, that the caller may change
+        after the call without changing the record.  Nothing is formatted
+        here: a container with more than max_items items is copied up to
+        max_items + 1 items, the listener shows the first max_items'''
+
+        if not isinstance(arg, _ArgShortener.CONTAINERS):
+            return arg
+
+        if isinstance(arg, collections.abc.Mapping):
+            # os.environ as well
+            items = arg.items()
+            make = dict
+        elif isinstance(arg, (set, frozenset)):
+            items = arg
+            make = set
+        else:
+            items = arg
+            make = type(arg) if isinstance(arg, (list, tuple)) else list
+
+        if self.max_items and len(arg) > self.max_items:
+            return _Shortened(make(itertools.islice(items, self.max_items + 1)), len(arg), self)
+
+        return make(items)
+
+
+class _Shortened():
+    '''A container cut to its first items, formatted by the listener'''
+
+    def __init__(self, items, count, shortener):
+        self.items = items
+        self.count = count
+        self.shortener = shortener
+
+    def __str__(self):
+        return '{0} ({1} items)'.format(self.shortener.repr(self.items), self.count)
+
+    __repr__ = __str__
+
+
+_shortener = _ArgShortener(100, 16384)
+
+
+class _QueueHandlerCustom(logging.handlers.QueueHandler):
+    '''Queues records for the listener with copies of their arguments,
+    the listener formats them.  Tracebacks are formatted here, as
+    logging.handlers.QueueHandler does'''
+
+    def prepare(self, record):
+        record = copy.copy(record)
+
+        if isinstance(record.args, collections.abc.Mapping):
+            # logging takes a dict argument for named arguments, that
+            # is what it is only if the message has some
+            if '%(' in str(record.msg):
+                record.args = {key: _shortener.copy_arg(arg) for key, arg in record.args.items()}
+            else:
+                record.args = (_shortener.copy_arg(record.args),)
+        elif record.args:
+            record.args = tuple(_shortener.copy_arg(arg) for arg in record.args)
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+class _QueueListenerCustom(logging.handlers.QueueListener):
+    '''Formats the message of a record once, in the listener thread,
+    cut at log-max-chars, for all the handlers'''
+
+    def prepare(self, record):
+        record.msg = _shortener.shorten_str(record.getMessage())
+        record.args = None
+        return record
 
 
 class StreamHandlerCustom(logging.StreamHandler):
@@ -18,9 +170,9 @@ class StreamHandlerCustom(logging.StreamHandler):
 
 
 class LogTaskStatus():
-    ''' For Logging Task times and status PASS/FAIL/SKIP
+    ''' For Logging Task times and status PASS/FAIL/SKIP/TIMEOUT
     Format:
-    PASS|FAIL|SKIP: <task-name> <task-msg>                                             <time-taken>
+    PASS|FAIL|SKIP|TIMEOUT: <task-name> <task-msg>                                             <time-taken>
       ----------
       <task-msg-indetail-line1>
       <task-msg-indetail-line2>
@@ -37,6 +189,7 @@ class LogTaskStatus():
         self.msg_inline = msg_inline
         self.msg_indetail = msg_indetail
         self.skip = False
+        self.timeout = False
         self.textwrapper = textwrap.TextWrapper(width=64,
                                                 initial_indent='  ',
                                                 subsequent_indent='  ',
@@ -44,15 +197,22 @@ class LogTaskStatus():
 
     def __enter__(self):
         self.start_time = time.time()
+        self._span = trace.Span(self.task).__enter__()
+        self._profile = profiling.profile(self.task)
+        self._profile.__enter__()
         return self
     
     @classmethod
     def status_begin(cls):
-        logging.getLogger('.status-logger').log(60, 'NOTE: begin')
+        _log_status('NOTE: begin')
 
     @classmethod
     def status_end(cls):
-        logging.getLogger('.status-logger').log(60, 'NOTE: end')
+        _log_status('NOTE: end')
+
+    @classmethod
+    def log_note(cls, msg):
+        _log_status('NOTE: {0}'.format(msg))
 
     @classmethod
     def log_task(cls, task, exit_code=0, msg_inline=None, msg_indetail=None):
@@ -62,6 +222,12 @@ class LogTaskStatus():
                                         msg_indetail)
         log_task_status.write_notime()
         
+    @classmethod
+    def log_timeout(cls, task, exit_code, msg_inline=None, msg_indetail=None):
+        log_task_status = LogTaskStatus(task)
+        log_task_status.timeout_task(exit_code, msg_inline, msg_indetail)
+        log_task_status.write_notime()
+
     @classmethod
     def get_status_str_cls(cls,
                            taskname,
@@ -86,12 +252,18 @@ class LogTaskStatus():
                                                                    text_width=59,
                                                                    time_width=13)
 
-    def get_status_str(self, with_time=True):
+    def _get_status(self):
 
         if self.skip:
-            status_str = 'SKIP'
+            return 'SKIP'
+        elif self.timeout:
+            return 'TIMEOUT'
         else:
-            status_str = 'PASS' if(self.exit_code == 0) else 'FAIL'
+            return 'PASS' if(self.exit_code == 0) else 'FAIL'
+
+    def get_status_str(self, with_time=True):
+
+        status_str = self._get_status()
 
         task_str = '{0} ({1})'.format(self.task, self.msg_inline) if self.msg_inline else self.task
 
@@ -128,6 +300,12 @@ class LogTaskStatus():
         if msg_indetail:
             self.msg_indetail = msg_indetail
 
+    def timeout_task(self, exit_code, msg_inline=None, msg_indetail=None):
+        '''The task ran out of time, a failure that is not the tool's (or
+        the build's) doing'''
+        self.timeout = True
+        self.update_task_status(exit_code, msg_inline, msg_indetail)
+
     def update_task_status(self, exit_code, msg_inline=None, msg_indetail=None):
         self.exit_code = exit_code
 
@@ -138,23 +316,22 @@ class LogTaskStatus():
             self.msg_indetail = msg_indetail
 
     def write(self, retry):
-        logging.getLogger('.status-logger').log(60, self.get_status_str())
+        _log_status(self.get_status_str())
 
         if self.msg_indetail:
-            logging.getLogger('.status-logger').log(60,
-                                                    self.get_formatted_msg(self.msg_indetail))
+            _log_status(self.get_formatted_msg(self.msg_indetail))
 
         if retry:
-            logging.getLogger('.status-logger').log(60, 'NOTE: retry')
+            _log_status('NOTE: retry')
     
     def write_notime(self):
-        logging.getLogger('.status-logger').log(60, self.get_status_str(False))
+        _log_status(self.get_status_str(False))
 
         if self.msg_indetail:
-            logging.getLogger('.status-logger').log(60,
-                                                    self.get_formatted_msg(self.msg_indetail))
+            _log_status(self.get_formatted_msg(self.msg_indetail))
 
     def __exit__(self, exception_type, exception, traceback):
+        self._profile.__exit__(exception_type, exception, traceback)
         self.end_time = time.time()
 
         if exception:
@@ -164,9 +341,19 @@ class LogTaskStatus():
 
         self.write(exception and hasattr(exception, 'retry') and exception.retry is True)
 
+        self._span.set_attrs({'status': self._get_status(), 'exit-code': self.exit_code})
+        if self.msg_inline:
+            self._span.set_attr('msg', str(self.msg_inline))
+        self._span.__exit__(exception_type, exception, traceback)
+
 
 def init(output_dir=os.getcwd()):
 
+    global _output_dir
+    _output_dir = output_dir
+
+    global _listener
+
     logging.addLevelName(60, 'STATUS')
 
     debug_file_handler = logging.handlers.WatchedFileHandler(osp.join(output_dir,
@@ -175,13 +362,25 @@ def init(output_dir=os.getcwd()):
         '%(module)s: %(lineno)d: %(levelname)s: %(message)s'))
     debug_file_handler.set_name('debug-file-handler')
     debug_file_handler.setLevel(logging.DEBUG)
-    logging.getLogger('').addHandler(debug_file_handler)
 
     stream_handler = StreamHandlerCustom(sys.stdout)
     stream_handler.setFormatter(logging.Formatter('%(message)s'))
     stream_handler.set_name('stream-handler')
     stream_handler.setLevel(logging.INFO)
-    logging.getLogger('').addHandler(stream_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _QueueHandlerCustom(log_queue)
+    queue_handler.set_name('queue-handler')
+    logging.getLogger('').addHandler(queue_handler)
+
+    _listener = _QueueListenerCustom(log_queue,
+                                     debug_file_handler,
+                                     stream_handler,
+                                     respect_handler_level=True)
+    _listener.start()
+    # before logging.shutdown (atexit is last in, first out), for exits
+    # that do not go through shutdown()
+    atexit.register(_stop_listener)
 
     logging.getLogger('').setLevel(logging.DEBUG)
 
@@ -196,7 +395,53 @@ def init(output_dir=os.getcwd()):
     LogTaskStatus.status_begin()
 
 
+def configure(run_conf):
+    '''Limits on what a log record can hold, from run.conf
+    log-max-items (default 100) and log-max-chars (default 16384)'''
+
+    global _shortener
+
+    try:
+        max_items = int(run_conf.get('log-max-items', '100'))
+        max_chars = int(run_conf.get('log-max-chars', '16384'))
+    except ValueError:
+        logging.warning('Invalid log-max-items or log-max-chars: %s, %s',
+                        run_conf.get('log-max-items'), run_conf.get('log-max-chars'))
+        return
+
+    _shortener = _ArgShortener(max(0, max_items), max(0, max_chars))
+
+
+def _stop_listener():
+    '''Writes out the queued records and stops the listener thread,
+    records logged after that are written as they are logged'''
+
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+
+        root_logger = logging.getLogger('')
+        for handler in list(root_logger.handlers):
+            if handler.get_name() == 'queue-handler':
+                root_logger.removeHandler(handler)
+
+        for handler in _listener.handlers:
+            root_logger.addHandler(handler)
+
+        _listener = None
+
+
 def shutdown():
     LogTaskStatus.status_end()
+    trace.shutdown()
+
+    if _output_dir:
+        try:
+            metrics.write_text_file(_output_dir)
+        except OSError as err:
+            logging.warning('Metrics not written: %s', err)
+
+    _stop_listener()
     logging.shutdown()
 
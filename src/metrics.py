@@ -0,0 +1,180 @@
+import os
+import os.path as osp
+import math
+import threading
+
+
+## Counters, gauges and histograms of a run, updated where the work is
+## done (files scanned, java files parsed, commands generated and run,
+## split chunks, bytes archived).  logger.shutdown writes them to
+## metrics.prom in the output directory, in the Prometheus text format,
+## for the node exporter textfile collector.
+##
+## Metrics are created on first use and live for the process:
+##
+##   metrics.counter('java_assess_files_scanned_total', 'Files found').inc(len(files))
+
+_metrics = dict()
+_lock = threading.Lock()
+
+METRICS_FILE = 'metrics.prom'
+
+DEFAULT_BUCKETS = (0.001, 0.01, 0.1, 1, 10, 60, 300, 1800, math.inf)
+
+
+class _Metric():
+
+    TYPE = None
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help_text = help_text
+        self._lock = threading.Lock()
+
+    def samples(self):
+        '''list of (sample name, labels dict, value)'''
+        raise NotImplementedError()
+
+
+class Counter(_Metric):
+
+    TYPE = 'counter'
+
+    def __init__(self, name, help_text):
+        _Metric.__init__(self, name, help_text)
+        self.value = 0
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self):
+        return [(self.name, {}, self.value)]
+
+
+class Gauge(_Metric):
+
+    TYPE = 'gauge'
+
+    def __init__(self, name, help_text):
+        _Metric.__init__(self, name, help_text)
+        self.value = 0
+
+    def set(self, value):
+        with self._lock:
+            self.value = value
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def set_max(self, value):
+        '''Keeps the highest value set'''
+        with self._lock:
+            self.value = max(self.value, value)
+
+    def samples(self):
+        return [(self.name, {}, self.value)]
+
+
+class Histogram(_Metric):
+
+    TYPE = 'histogram'
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        _Metric.__init__(self, name, help_text)
+        self.buckets = sorted(set(buckets) | {math.inf})
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        with self._lock:
+            self.sum += value
+            self.count += 1
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[index] += 1
+                    break
+
+    def samples(self):
+
+        with self._lock:
+            samples = list()
+            cumulative = 0
+
+            for bound, count in zip(self.buckets, self.counts):
+                cumulative += count
+                samples.append(('{0}_bucket'.format(self.name),
+                                {'le': '+Inf' if bound == math.inf else repr(float(bound))},
+                                cumulative))
+
+            samples.append(('{0}_sum'.format(self.name), {}, self.sum))
+            samples.append(('{0}_count'.format(self.name), {}, self.count))
+            return samples
+
+
+def _get(cls, name, help_text, *args):
+
+    with _lock:
+        if name not in _metrics:
+            _metrics[name] = cls(name, help_text, *args)
+        elif not isinstance(_metrics[name], cls):
+            raise ValueError("Metric '{0}' is a {1}".format(name, _metrics[name].TYPE))
+
+        return _metrics[name]
+
+
+def counter(name, help_text):
+    return _get(Counter, name, help_text)
+
+
+def gauge(name, help_text):
+    return _get(Gauge, name, help_text)
+
+
+def histogram(name, help_text, buckets=DEFAULT_BUCKETS):
+    return _get(Histogram, name, help_text, buckets)
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value) if math.isfinite(value) else ('+Inf' if value > 0 else '-Inf')
+    return str(value)
+
+
+def to_text():
+    '''The metrics in the Prometheus text exposition format'''
+
+    lines = list()
+
+    with _lock:
+        metrics = [_metrics[name] for name in sorted(_metrics)]
+
+    for metric in metrics:
+        lines.append('# HELP {0} {1}'.format(metric.name,
+                                             metric.help_text.replace('\\', r'\\').replace('\n', r'\n')))
+        lines.append('# TYPE {0} {1}'.format(metric.name, metric.TYPE))
+
+        for name, labels, value in metric.samples():
+            if labels:
+                name = '{0}{{{1}}}'.format(name, ','.join('{0}="{1}"'.format(key, labels[key])
+                                                          for key in sorted(labels)))
+            lines.append('{0} {1}'.format(name, _format_value(value)))
+
+    return '\n'.join(lines) + '\n'
+
+
+def write_text_file(output_dir):
+    '''Writes output_dir/metrics.prom, the collector never sees it half written'''
+
+    if not _metrics:
+        return
+
+    metrics_file = osp.join(output_dir, METRICS_FILE)
+    tmp_file = '{0}.{1}.tmp'.format(metrics_file, os.getpid())
+
+    with open(tmp_file, 'w') as fobj:
+        fobj.write(to_text())
+
+    os.replace(tmp_file, metrics_file)
@@ -0,0 +1,83 @@
+import re
+import time
+import logging
+
+from .logger import LogTaskStatus
+
+
+class OutputAnalyzer():
+    '''Looks at the output of a command while it runs.
+
+    utillib.run_cmd(analyzers=[...]) calls feed() with each line the
+    command writes, and the stream it was written to ('stdout' or
+    'stderr').  Calls are serialized, analyzers need no locking.  When
+    feed() returns a reason (a string), the command is ended.  done()
+    is called once the command exited.
+    '''
+
+    def feed(self, stream, line):
+        return None
+
+    def done(self):
+        pass
+
+
+class FatalPatternAnalyzer(OutputAnalyzer):
+    '''Ends the command on the first line that matches one of patterns,
+    the line is kept in match'''
+
+    def __init__(self, patterns):
+        self._regexes = [re.compile(pattern) for pattern in patterns]
+        self.match = None
+
+    def feed(self, stream, line):
+
+        if self.match is not None:
+            return None
+
+        for regex in self._regexes:
+            if regex.search(line):
+                self.match = line.strip()
+                logging.info('FATAL OUTPUT (%s): %s', stream, self.match)
+                return 'fatal output: {0}'.format(self.match)
+
+        return None
+
+
+class ProgressAnalyzer(OutputAnalyzer):
+    '''Counts the lines that match pattern and reports the count in
+    status.out, as a NOTE, at most every interval seconds'''
+
+    def __init__(self, task, what, pattern, interval=30):
+        self._task = task
+        self._what = what
+        self._regex = re.compile(pattern)
+        self._interval = interval
+        self._start = time.monotonic()
+        self._last = self._start
+        self._noted = 0
+        self.count = 0
+
+    def feed(self, stream, line):
+
+        if self._regex.search(line):
+            self.count += 1
+            now = time.monotonic()
+
+            if now - self._last >= self._interval:
+                self._last = now
+                self._note(now)
+
+        return None
+
+    def _note(self, now):
+        self._noted = self.count
+        LogTaskStatus.log_note('{0}: {1} {2} ({3:.0f}s)'.format(self._task,
+                                                              self.count,
+                                                              self._what,
+                                                              now - self._start))
+
+    def done(self):
+        # the final count, if progress was reported and it changed since
+        if self._noted and self.count != self._noted:
+            self._note(time.monotonic())
@@ -0,0 +1,183 @@
+import os
+import os.path as osp
+import time
+import logging
+import threading
+
+
+## run.conf resource-sample-interval (seconds), set by configure()
+_output_dir = None
+_interval = None
+_lock = threading.Lock()
+
+_CLK_TCK = os.sysconf('SC_CLK_TCK')
+_PAGE_SIZE_KB = os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def configure(run_conf, output_dir):
+    '''Turns sampling on for the commands run_cmd runs, if run.conf
+    resource-sample-interval (seconds) is set.  The samples of a command
+    are in output_dir/resource-samples/<command>.csv'''
+
+    global _output_dir, _interval
+
+    try:
+        interval = float(run_conf.get('resource-sample-interval', '0'))
+    except ValueError:
+        logging.warning('Invalid resource-sample-interval: %s',
+                        run_conf['resource-sample-interval'])
+        interval = 0
+
+    if interval > 0 and osp.isdir('/proc'):
+        _output_dir = osp.join(output_dir, 'resource-samples')
+        _interval = interval
+        os.makedirs(_output_dir, exist_ok=True)
+        logging.info('RESOURCE SAMPLING: every %ss in %s', interval, _output_dir)
+
+
+def start(pid, label):
+    '''Starts sampling the process tree of pid, returns the sampler,
+    None if sampling is off'''
+
+    if _interval is None:
+        return None
+
+    sampler = ProcSampler(pid, _get_samples_file(label), _interval)
+    sampler.start()
+    return sampler
+
+
+def _get_samples_file(label):
+
+    with _lock:
+        samples_file = osp.join(_output_dir, '{0}.csv'.format(label))
+        count = 1
+
+        while osp.exists(samples_file):
+            count += 1
+            samples_file = osp.join(_output_dir, '{0}-{1}.csv'.format(label, count))
+
+        # taken, for the commands started after this one
+        open(samples_file, 'w').close()
+        return samples_file
+
+
+def _read_stat(pid):
+    '''(ppid, utime + stime ticks, threads, rss kb,
+    cutime + cstime ticks) from /proc/<pid>/stat'''
+
+    with open('/proc/{0}/stat'.format(pid)) as fobj:
+        stat = fobj.read()
+
+    # comm, in parentheses, may have spaces
+    fields = stat[stat.rindex(')') + 2:].split()
+    return (int(fields[1]),
+            int(fields[11]) + int(fields[12]),
+            int(fields[17]),
+            int(fields[21]) * _PAGE_SIZE_KB,
+            int(fields[13]) + int(fields[14]))
+
+
+def _read_io(pid):
+    '''(read_bytes, write_bytes) from /proc/<pid>/io, (0, 0) if not readable'''
+
+    io = dict()
+    try:
+        with open('/proc/{0}/io'.format(pid)) as fobj:
+            for line in fobj:
+                key, _, value = line.partition(':')
+                io[key] = int(value)
+    except (OSError, ValueError):
+        pass
+
+    return (io.get('read_bytes', 0), io.get('write_bytes', 0))
+
+
+def _get_tree(root_pid):
+    '''stat of root_pid and its descendants, by pid'''
+
+    stats = dict()
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                stats[int(entry)] = _read_stat(entry)
+            except (OSError, ValueError, IndexError):
+                # exited while being read
+                pass
+
+    tree = {root_pid} if root_pid in stats else set()
+    added = True
+    while added:
+        added = False
+        for pid, stat in stats.items():
+            if pid not in tree and stat[0] in tree:
+                tree.add(pid)
+                added = True
+
+    return {pid: stats[pid] for pid in tree}
+
+
+def get_cpu_time(pid):
+    '''CPU seconds used by the process tree of pid, including the
+    descendants that have exited and were waited for.  0 without /proc'''
+
+    if not osp.isdir('/proc'):
+        return 0.0
+
+    return sum(stat[1] + stat[4] for stat in _get_tree(pid).values()) / _CLK_TCK
+
+
+class ProcSampler(threading.Thread):
+    '''Samples CPU%, RSS, threads and read/write bytes of a process and
+    its descendants from /proc every interval seconds, as CSV rows'''
+
+    HEADER = 'elapsed,processes,threads,cpu_percent,rss_kb,read_bytes,write_bytes'
+
+    def __init__(self, pid, samples_file, interval):
+        threading.Thread.__init__(self, name='proc-sampler-{0}'.format(pid), daemon=True)
+        self._pid = pid
+        self._samples_file = samples_file
+        self._interval = interval
+        self._stop_event = threading.Event()
+        self._ticks = dict()
+
+    def _sample(self, elapsed, delta):
+
+        tree = _get_tree(self._pid)
+
+        # CPU time used since the last sample, by processes seen before
+        ticks = {pid: stat[1] for pid, stat in tree.items()}
+        used = sum(ticks[pid] - self._ticks.get(pid, ticks[pid]) for pid in ticks)
+        self._ticks = ticks
+
+        io = [_read_io(pid) for pid in tree]
+
+        return '{0:.3f},{1},{2},{3:.1f},{4},{5},{6}'.format(
+            elapsed,
+            len(tree),
+            sum(stat[2] for stat in tree.values()),
+            100.0 * used / _CLK_TCK / delta if delta > 0 else 0.0,
+            sum(stat[3] for stat in tree.values()),
+            sum(read for read, _ in io),
+            sum(write for _, write in io))
+
+    def run(self):
+
+        start = time.monotonic()
+        last = start
+
+        with open(self._samples_file, 'w') as fobj:
+            print(ProcSampler.HEADER, file=fobj)
+
+            while True:
+                now = time.monotonic()
+                print(self._sample(now - start, now - last), file=fobj)
+                fobj.flush()
+                last = now
+
+                if self._stop_event.wait(self._interval):
+                    break
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
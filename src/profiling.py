@@ -0,0 +1,160 @@
+import os
+import os.path as osp
+import re
+import time
+import cProfile
+import logging
+import threading
+import contextlib
+import tracemalloc
+
+
+## Profiling of java-assess itself, off unless asked for.
+##
+## run.conf, or the environment (which takes precedence):
+##   profile-tasks       JAVA_ASSESS_PROFILE       tasks to profile, the
+##                       LogTaskStatus task names (build, assess, ...) or
+##                       get-build-artifacts, 'all' for every task
+##   profile-mode        JAVA_ASSESS_PROFILE_MODE  cpu, memory or cpu,memory
+##                                                 (default cpu)
+##   profile-top         JAVA_ASSESS_PROFILE_TOP   lines in the allocation
+##                                                 reports (default 25)
+##
+## cpu: cProfile, <output-dir>/profile/<task>.prof (pstats, snakeviz)
+## memory: tracemalloc, <output-dir>/profile/<task>.alloc.txt, the top
+##   allocations made during the task, by line
+##
+## A task that runs more than once adds to its .prof file and appends to
+## its allocation report.  One task at a time is profiled by cProfile,
+## process-wide (profilers share sys.monitoring from Python 3.12): a task
+## that starts while another one is profiled, nested in it or in another
+## thread (stages run in parallel), is only traced for memory.  cProfile
+## sees the thread that runs the task.  The traced peak of a task that
+## starts while another one is traced is that since the other one started.
+## Tasks that start before run.conf is read (all) can only be profiled
+## with the environment variables.
+
+_tasks = frozenset()
+_all_tasks = False
+_cpu = False
+_memory = False
+_top = 25
+_profile_dir = None
+
+_profiles = dict()
+_cpu_task = None
+_tracemalloc_users = 0
+_lock = threading.Lock()
+
+_NULL_PROFILE = contextlib.nullcontext()
+
+
+def configure(run_conf, output_dir):
+
+    global _tasks, _all_tasks, _cpu, _memory, _top, _profile_dir
+
+    tasks = os.environ.get('JAVA_ASSESS_PROFILE', run_conf.get('profile-tasks', ''))
+    modes = os.environ.get('JAVA_ASSESS_PROFILE_MODE', run_conf.get('profile-mode', 'cpu'))
+    top = os.environ.get('JAVA_ASSESS_PROFILE_TOP', run_conf.get('profile-top', '25'))
+
+    tasks = set(re.split(r'[\s,]+', tasks.strip())) - {''}
+    if not tasks:
+        return
+
+    modes = set(re.split(r'[\s,+]+', modes.strip()))
+
+    try:
+        _top = int(top)
+    except ValueError:
+        logging.warning('Invalid profile-top: %s', top)
+
+    _profile_dir = osp.join(output_dir, 'profile')
+    os.makedirs(_profile_dir, exist_ok=True)
+
+    _cpu = 'cpu' in modes
+    _memory = 'memory' in modes
+    _all_tasks = 'all' in tasks
+    _tasks = frozenset(tasks)
+
+    logging.info('PROFILING: tasks %s, cpu %s, memory %s, in %s',
+                 sorted(tasks), _cpu, _memory, _profile_dir)
+
+
+def profile(task):
+    '''Context manager that profiles task if it is one of the tasks to
+    profile, else a shared no-op context manager'''
+
+    if not _all_tasks and task not in _tasks:
+        return _NULL_PROFILE
+
+    return _TaskProfile(task)
+
+
+def _get_filename(task, ext):
+    return osp.join(_profile_dir, '{0}{1}'.format(re.sub(r'[^\w.-]', '_', task), ext))
+
+
+class _TaskProfile():
+
+    def __init__(self, task):
+        self.task = task
+        self._profile = None
+        self._snapshot = None
+        self._own_peak = False
+
+    def __enter__(self):
+
+        global _cpu_task, _tracemalloc_users
+
+        if _cpu:
+            with _lock:
+                if _cpu_task is None:
+                    _cpu_task = self
+                    self._profile = _profiles.setdefault(self.task, cProfile.Profile())
+
+            if self._profile:
+                self._profile.enable()
+
+        if _memory:
+            with _lock:
+                if _tracemalloc_users == 0:
+                    tracemalloc.start()
+                    self._own_peak = True
+                _tracemalloc_users += 1
+            self._snapshot = tracemalloc.take_snapshot()
+
+        self._start = time.monotonic()
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+
+        global _cpu_task, _tracemalloc_users
+
+        if self._profile:
+            self._profile.disable()
+
+            with _lock:
+                self._profile.dump_stats(_get_filename(self.task, '.prof'))
+                _cpu_task = None
+
+        if self._snapshot:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+
+            with _lock:
+                _tracemalloc_users -= 1
+                if _tracemalloc_users == 0:
+                    tracemalloc.stop()
+
+            stats = snapshot.compare_to(self._snapshot, 'lineno')
+
+            with _lock:
+                with open(_get_filename(self.task, '.alloc.txt'), 'a') as fobj:
+                    print('## {0}: {1:.3f}s, traced peak {2} KB{3}, top {4}'.format(
+                        self.task, time.monotonic() - self._start, peak // 1024,
+                        '' if self._own_peak else ' (since an earlier task started)',
+                        _top),
+                        file=fobj)
+                    for stat in stats[:_top]:
+                        print(stat, file=fobj)
+                    print(file=fobj)
@@ -0,0 +1,221 @@
+import re
+import logging
+
+from . import utillib
+from . import jvm_profile
+
+
+## Sizing of the child JVMs (builds and tools) launched by java-assess.
+##
+## Java picks default sizes that are far too small for the SWAMP; a JVM
+## should have most of the VM's memory to complete its task.  The memory
+## given to java is split among the JVMs that run at the same time, and
+## each JVM's share has to hold more than the heap: metaspace, the code
+## cache, GC structures and the thread stacks.  All of that is decided
+## here, in one place, and the decisions are recorded in the summaries.
+## The options that depend on the JVM version are in jvm_profile.
+##
+## Tunable from run.conf (builds) and tool.conf (tools):
+##   memory-budget          MB for all the JVMs   (default: see _memory_for_java)
+##   jvm-native-overhead    MB of non-heap, non-metaspace memory per JVM
+##   jvm-thread-stack       MB per thread stack, -Xss (0 leaves java's default)
+##   jvm-stack-threads      threads expected to use a full stack
+##   metaspace-size         MB, MaxMetaspaceSize (MaxPermSize for java <= 7)
+##   jvm-gc                 cms, parallel, g1 or default (default: profile)
+
+
+class ResourcePlan():
+    '''Sizing for one JVM'''
+
+    def __init__(self, java_ver, java_home, budget, concurrency, slots,
+                 heap, metaspace, thread_stack, gc, initial_heap=None):
+        self.java_ver = java_ver
+        self.java_home = java_home
+        self.budget = budget
+        self.concurrency = concurrency
+        self.slots = slots
+        self.heap = heap
+        self.metaspace = metaspace
+        self.thread_stack = thread_stack
+        self.gc = gc
+        self.initial_heap = initial_heap
+
+    def jvm_opts(self):
+        '''List of JVM options for the plan, except the heap size'''
+
+        profile = jvm_profile.get_profile(self.java_ver)
+        opts = list()
+
+        if self.metaspace:
+            opts.append('-XX:{0}={1}m'.format(profile['metaspace-flag'], self.metaspace))
+
+        if self.thread_stack:
+            opts.append('-Xss{0}m'.format(self.thread_stack))
+
+        opts.extend(jvm_profile.GC_OPTS[self.gc])
+        opts.extend(profile['container-opts'])
+
+        return jvm_profile.validate_opts(opts, self.java_home)
+
+    def memory_share(self):
+        '''MB of the memory budget for the JVM, heap and the rest'''
+        return self.budget * max(1, self.slots) // self.concurrency
+
+    def java_opts(self):
+        '''List of JVM options for the plan'''
+
+        opts = ['-Xmx{0}m'.format(self.heap)]
+
+        if self.initial_heap:
+            opts.append('-Xms{0}m'.format(self.initial_heap))
+
+        return opts + self.jvm_opts()
+
+    def as_dict(self):
+        return {
+            'java-version': str(self.java_ver),
+            'java-home': self.java_home or '',
+            'memory-budget': str(self.budget),
+            'concurrency': str(self.concurrency),
+            'slots': str(self.slots),
+            'max-heap': str(self.heap),
+            'metaspace-size': str(self.metaspace or ''),
+            'thread-stack': str(self.thread_stack or ''),
+            'gc': self.gc,
+            'java-opts': ' '.join(self.java_opts()),
+        }
+
+
+class ResourcePlanner():
+    '''Computes a ResourcePlan for every child JVM.
+
+    conf is run.conf or tool.conf as a dict, budget and overheads are
+    in MB.  A JVM that is one of concurrency JVMs running at the same
+    time gets slots/concurrency of the memory budget.
+    '''
+
+    DEFAULT_NATIVE_OVERHEAD = 128
+    DEFAULT_THREAD_STACK = 128
+    DEFAULT_STACK_THREADS = 2
+
+    def __init__(self, conf=None):
+        self._conf = conf or dict()
+        self._cpu_type = utillib.get_cpu_type()
+        self._sys_mem = utillib.sys_mem_size()
+        self.budget = self._get_int('memory-budget', self._memory_for_java())
+        logging.info('RESOURCE PLAN sys_mem_size %d, memory-budget %d',
+                     self._sys_mem, self.budget)
+
+    @classmethod
+    def java_ver_num(cls, java_version, default=8):
+        '''Number in java-8, java-7 java-8, 11 or None'''
+
+        versions = re.findall(r'\d+', str(java_version or ''))
+        return int(versions[-1]) if versions else default
+
+    def _get_int(self, key, default):
+        try:
+            return int(self._conf.get(key, default))
+        except ValueError:
+            logging.warning('Invalid %s: %s', key, self._conf[key])
+            return default
+
+    def _memory_for_java(self):
+
+        if self._cpu_type == 32:
+            ## linux uses one address space for user+kernel, java on
+            ## 32 bit only gets 3 GB of the 4 GB address space
+            sys_mem = min(self._sys_mem, 3 * 1024)
+            return int(sys_mem * 3 / 4)
+
+        ## Some memory is left for the system, scaling roughly with
+        ## memory (page tables & buffer cache), the rest is given to java.
+        ## As long as the pool isn't pre-allocated, it only limits java.
+        #   2 GB ->  1.3 GB   0.7 GB
+        #   3 GB ->  2   GB   1   GB
+        #   4 GB ->  3.4 GB   0.6 GB
+        #   6 GB ->  5   GB   1   GB
+        #   8 GB ->  7.1 GB   0.9 GB
+        #  10 GB ->  9.2 GB   0.8 GB
+        #  30 GB -> 27   GB   2.7 GB
+        #  60 GB -> 55   GB   5   GB
+        sys_mem = self._sys_mem
+
+        if (sys_mem >= 30 * 1024):
+            return int(sys_mem * 10 / 11)
+        elif (sys_mem >= 10 * 1024):
+            return int(sys_mem * 9 / 10)
+        elif (sys_mem >= 8 * 1024):
+            return int(sys_mem * 7 / 8)
+        elif (sys_mem >= 4 * 1024):
+            return int(sys_mem * 5 / 6)
+        elif (sys_mem >= 3 * 1024):
+            return int(sys_mem * 3 / 4)
+        else:
+            return int(sys_mem * 2 / 3)
+
+    def _get_gc(self, java_ver):
+
+        gc = self._conf.get('jvm-gc', '')
+
+        if gc not in jvm_profile.GC_OPTS:
+            if gc:
+                logging.warning('Invalid jvm-gc: %s', gc)
+            gc = jvm_profile.get_profile(java_ver)['gc']
+
+        return gc
+
+    def overhead(self, per_jvm, thread_stack=False):
+        '''MB of a JVM's share that is not heap'''
+
+        metaspace = self._get_metaspace(per_jvm)
+        native = self._get_int('jvm-native-overhead', self.DEFAULT_NATIVE_OVERHEAD)
+        stacks = 0
+
+        if thread_stack:
+            stacks = self._get_thread_stack() * self._get_int('jvm-stack-threads',
+                                                              self.DEFAULT_STACK_THREADS)
+        return metaspace + native + stacks
+
+    def _get_metaspace(self, per_jvm):
+        # an eighth of the JVM's share, from 128M to 1G
+        return self._get_int('metaspace-size', min(1024, max(128, per_jvm // 8)))
+
+    def _get_thread_stack(self):
+        # The default 64bit java thread stack size is 512k,
+        # that was small for some builds
+        return self._get_int('jvm-thread-stack', self.DEFAULT_THREAD_STACK)
+
+    def max_concurrency(self, min_heap):
+        '''Number of JVMs with a heap of at least min_heap MB that fit in
+        the budget'''
+
+        return self.budget // (min_heap + self.overhead(min_heap))
+
+    def plan(self, java_version, concurrency=1, slots=1, thread_stack=False,
+             java_home=None):
+        '''Plan for a JVM that takes slots of concurrency shares,
+        thread_stack to set -Xss (builds).  The version of the JVM in
+        java_home, if known, takes precedence over java_version'''
+
+        java_ver = jvm_profile.get_java_home_version(java_home) or \
+                   self.java_ver_num(java_version)
+        concurrency = max(1, concurrency)
+        per_jvm = self.budget * max(1, slots) // concurrency
+
+        if self._cpu_type == 32:
+            # too memory sensitive on 32 bit to touch the stack size,
+            # Xms increased from default because most of the tools need
+            # a lot and it made performance better
+            plan = ResourcePlan(java_ver, java_home, self.budget, concurrency, slots,
+                                per_jvm, None, None,
+                                self._get_gc(java_ver), initial_heap=512)
+        else:
+            stack = self._get_thread_stack() if thread_stack else None
+            heap = max(256, per_jvm - self.overhead(per_jvm, thread_stack))
+            plan = ResourcePlan(java_ver, java_home, self.budget, concurrency, slots,
+                                heap, self._get_metaspace(per_jvm), stack,
+                                self._get_gc(java_ver))
+
+        logging.info('RESOURCE PLAN: %s', plan.as_dict())
+        return plan
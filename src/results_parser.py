@@ -36,8 +36,21 @@ def just_parse(input_root_dir, output_root_dir):
                          output_root_dir)
 
 
+# result parser executables already unarchived, keyed by input_dir
+_results_parsers = dict()
+
+
+def setup_results_parser(input_dir):
+    '''Unarchive the result parser, does not depend on the assessment'''
+    _get_results_parser(input_dir)
+    return 0
+
+
 def _get_results_parser(input_dir):
 
+    if input_dir in _results_parsers:
+        return _results_parsers[input_dir]
+
     with LogTaskStatus('resultparser-unarchive'):
 
         parser_dir = osp.join(os.getcwd(), 'result-parser')
@@ -58,6 +71,7 @@ def _get_results_parser(input_dir):
 
         parser_dir = osp.join(parser_dir, parser_attr['result-parser-dir'])
         parser_exe_file = osp.join(parser_dir, parser_attr['result-parser-cmd'])
+        _results_parsers[input_dir] = parser_exe_file
 
         return parser_exe_file
 
@@ -180,11 +194,11 @@ def parse_results(input_dir, assessment_summary_file, results_dir, output_dir):
         exit_code = 1
     finally:
         with LogTaskStatus('parsed-results-archive'):
-            shutil.make_archive(osp.join(output_dir,
-                                         osp.basename(parse_results_dir)),
-                                'gztar',
-                                osp.dirname(parse_results_dir),
-                                osp.basename(parse_results_dir))
+            utillib.count_archive(shutil.make_archive(osp.join(output_dir,
+                                                               osp.basename(parse_results_dir)),
+                                                      'gztar',
+                                                      osp.dirname(parse_results_dir),
+                                                      osp.basename(parse_results_dir)))
 
         fileFound = osp.isfile(parsed_results_data_conf_file)
         if fileFound:
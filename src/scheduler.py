@@ -0,0 +1,168 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+
+from . import logger
+from . import utillib
+from . import trace
+
+
+class Stage():
+
+    def __init__(self, name, func, depends_on):
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on)
+        self.exit_code = None
+        self.exception = None
+        self.skipped = False
+        self.status_records = list()
+
+    @property
+    def done(self):
+        return self.skipped or (self.exit_code is not None) or (self.exception is not None)
+
+    @property
+    def passed(self):
+        return self.exit_code == 0
+
+    @property
+    def timed_out(self):
+        '''The stage ran out of time (see utillib.run_cmd timeout),
+        as opposed to failing'''
+        exit_code = getattr(self.exception, 'errno', self.exit_code)
+        return exit_code == utillib.TIMEOUT_EXIT_CODE
+
+
+class StageScheduler():
+    '''Runs a graph of stages on a pool of worker threads.
+
+    A stage is a callable that returns an exit code.  A stage is started
+    once all the stages it depends on have returned 0, and is skipped if
+    any of them returned non-zero or raised an exception.
+
+    status.out records written by a stage are held back and written in
+    the order the stages were added, so status.out looks the same as a
+    serial run irrespective of the order in which stages finish.  Once a
+    stage fails, records of the stages added after it are dropped, a
+    serial run would not have got that far.
+
+    With max_workers=1 the stages run in the order they were added.
+    '''
+
+    def __init__(self, max_workers=1):
+        self._max_workers = max(1, max_workers)
+        self._stages = list()
+
+    def add_stage(self, name, func, depends_on=None):
+
+        names = [stage.name for stage in self._stages]
+
+        if name in names:
+            raise ValueError("Stage '{0}' already added".format(name))
+
+        for dep in (depends_on or []):
+            if dep not in names:
+                raise ValueError("Stage '{0}' depends on unknown stage '{1}'".format(name, dep))
+
+        self._stages.append(Stage(name, func, depends_on or []))
+
+    def _get_stage(self, name):
+        return next(stage for stage in self._stages if stage.name == name)
+
+    def _run_stage(self, stage):
+
+        logger.buffer_status(stage.status_records)
+        try:
+            logging.debug('STAGE BEGIN: %s', stage.name)
+            with trace.Span('stage', attrs={'stage': stage.name}):
+                return stage.func()
+        finally:
+            logging.debug('STAGE END: %s', stage.name)
+            logger.buffer_status(None)
+
+    def _ready_stages(self, running):
+        '''Marks stages that can never run as skipped,
+        returns stages that can be started now'''
+
+        ready = list()
+
+        for stage in self._stages:
+            if stage.done or stage in running:
+                continue
+
+            deps = [self._get_stage(dep) for dep in stage.depends_on]
+
+            if any(dep.done and not dep.passed for dep in deps):
+                logging.info('STAGE SKIPPED: %s', stage.name)
+                stage.skipped = True
+            elif all(dep.passed for dep in deps):
+                ready.append(stage)
+
+        return ready
+
+    def _flush(self, next_idx):
+        '''Writes status records of finished stages, in the order stages were added'''
+
+        while next_idx < len(self._stages) and self._stages[next_idx].done:
+            stage = self._stages[next_idx]
+
+            if any(not prev.skipped and not prev.passed
+                   for prev in self._stages[:next_idx]):
+                if stage.status_records:
+                    logging.info('STAGE STATUS DROPPED: %s: %s',
+                                 stage.name, stage.status_records)
+            else:
+                logger.flush_status(stage.status_records)
+
+            stage.status_records = list()
+            next_idx += 1
+
+        return next_idx
+
+    def run(self):
+        '''Runs all the stages, returns the exit code of the first stage
+        (in the order added) that did not pass, or 0.
+        If that stage raised an exception, it is re-raised instead'''
+
+        running = dict()
+        flush_idx = 0
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+
+            while True:
+                for stage in self._ready_stages(running.values()):
+                    if len(running) >= self._max_workers:
+                        break
+                    running[executor.submit(trace.run_in_context(self._run_stage),
+                                            stage)] = stage
+
+                # stages skipped above may unblock status records
+                flush_idx = self._flush(flush_idx)
+
+                if not running:
+                    break
+
+                finished, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+
+                for future in finished:
+                    stage = running.pop(future)
+                    try:
+                        exit_code = future.result()
+                        stage.exit_code = 0 if exit_code is None else exit_code
+                    except (BaseException, Exception) as err:
+                        stage.exception = err
+
+                    if stage.timed_out:
+                        logging.info('STAGE TIMED OUT: %s', stage.name)
+
+                flush_idx = self._flush(flush_idx)
+
+        for stage in self._stages:
+            if stage.exception is not None:
+                raise stage.exception
+            elif stage.exit_code not in [None, 0]:
+                return stage.exit_code
+
+        return 0
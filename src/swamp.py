@@ -4,6 +4,7 @@ import logging
 import logging.handlers
 
 from .logger import LogTaskStatus
+from .scheduler import StageScheduler
 from . import confreader
 from . import build
 from .build import build_java
@@ -11,6 +12,11 @@ from .assess import assess
 from . import install_os_dependencies
 from . import results_parser
 from . import utillib
+from . import logger
+from . import proc_sampler
+from . import cgroup
+from . import trace
+from . import profiling
 
 
 def main(input_root_dir,
@@ -27,6 +33,11 @@ def main(input_root_dir,
                 raise utillib.FileNotFoundException('File Not Found: {0}'.format(run_conf_file))
 
             param = confreader.read_conf_into_dict(run_conf_file)
+            logger.configure(param)
+            proc_sampler.configure(param, output_root_dir)
+            cgroup.configure(param)
+            trace.configure(param, output_root_dir)
+            profiling.configure(param, output_root_dir)
 
             if 'goal' not in param:
                 raise KeyError('{0} param not found in {1} file'.format('goal',
@@ -47,17 +58,16 @@ def main(input_root_dir,
                 raise ValueError('Unknown goal {0}, it should be one of {1}'.format(goal,
                                                                                     swamp_goals))
 
-            install_os_dependencies.install(input_root_dir)
-
             if goal in swamp_goals[:5]:
-                check_java_compatibility(goal, input_root_dir)
                 exit_code = _build_assess_parse(goal,
                                                 input_root_dir,
                                                 output_root_dir,
                                                 build_root_dir,
                                                 tool_root_dir,
-                                                results_root_dir)
+                                                results_root_dir,
+                                                param)
             elif goal == swamp_goals[5]:
+                install_os_dependencies.install(input_root_dir)
                 exit_code = results_parser.just_parse(input_root_dir, output_root_dir)
 
         except (BaseException, Exception) as err:
@@ -72,34 +82,92 @@ def main(input_root_dir,
     return exit_code
 
 
+def _get_stage_workers(run_conf):
+    '''Number of stages that can run at the same time,
+    run.conf: stage-workers (1 runs the stages one after another)'''
+
+    try:
+        return max(1, int(run_conf.get('stage-workers', '3')))
+    except ValueError:
+        logging.warning('Invalid stage-workers: %s, running stages serially',
+                        run_conf['stage-workers'])
+        return 1
+
+
 def _build_assess_parse(goal,
                         input_root_dir, output_root_dir,
                         build_root_dir, tool_root_dir,
-                        results_root_dir):
+                        results_root_dir, run_conf):
+    '''Runs the goal as a graph of stages.
+
+    Tool unarchive/install and result parser unarchive do not depend
+    on the package build, and run alongside it.  A stage that fails
+    stops the stages that depend on it, like the serial version did.
+    '''
+
+    summary_files = dict()
+
+    # the build stage changes os.environ (JAVA_HOME, PATH) while the tool
+    # is set up, the tool is installed in the environment of the run
+    environ = dict(os.environ)
 
-    if 'build' in goal:
-        exit_code, build_summary_file = build_java.build(input_root_dir,
-                                                         output_root_dir,
-                                                         build_root_dir)
-    else:
-        exit_code, build_summary_file = build.extract(input_root_dir)
+    def _install_os_dependencies():
+        return install_os_dependencies.install(input_root_dir)
 
-    if (exit_code == 0) and ('assess' in goal):
+    def _check_java_compatibility():
+        check_java_compatibility(goal, input_root_dir)
+        return 0
 
-        build_summary_file = osp.join(build_root_dir, build_summary_file)
-        exit_code, assessment_summary_file = assess.assess(input_root_dir,
+    def _build():
+        if 'build' in goal:
+            exit_code, summary_files['build'] = build_java.build(input_root_dir,
+                                                                 output_root_dir,
+                                                                 build_root_dir)
+        else:
+            exit_code, summary_files['build'] = build.extract(input_root_dir)
+        return exit_code
+
+    def _setup_tool():
+        return assess.setup_tool(input_root_dir, tool_root_dir, environ)
+
+    def _setup_results_parser():
+        return results_parser.setup_results_parser(input_root_dir)
+
+    def _assess():
+        build_summary_file = osp.join(build_root_dir, summary_files['build'])
+        exit_code, summary_files['assess'] = assess.assess(input_root_dir,
                                                            output_root_dir,
                                                            tool_root_dir,
                                                            results_root_dir,
                                                            build_summary_file)
-
-        if (exit_code == 0) and ('parse' in goal):
-            exit_code = results_parser.parse_results(input_root_dir,
-                                                     assessment_summary_file,
-                                                     results_root_dir,
-                                                     output_root_dir)
-
-    return exit_code
+        return exit_code
+
+    def _parse():
+        return results_parser.parse_results(input_root_dir,
+                                            summary_files['assess'],
+                                            results_root_dir,
+                                            output_root_dir)
+
+    scheduler = StageScheduler(_get_stage_workers(run_conf))
+
+    scheduler.add_stage('install-os-dependencies', _install_os_dependencies)
+    scheduler.add_stage('tool-runtime-compatibility', _check_java_compatibility,
+                        ['install-os-dependencies'])
+    scheduler.add_stage('build', _build,
+                        ['install-os-dependencies', 'tool-runtime-compatibility'])
+
+    # Stages are added in the order the serial version ran them,
+    # status.out and the exit code are reported in this order
+    if 'assess' in goal:
+        scheduler.add_stage('tool-setup', _setup_tool,
+                            ['install-os-dependencies', 'tool-runtime-compatibility'])
+        scheduler.add_stage('assess', _assess, ['build', 'tool-setup'])
+
+        if 'parse' in goal:
+            scheduler.add_stage('resultparser-setup', _setup_results_parser)
+            scheduler.add_stage('parse', _parse, ['assess', 'resultparser-setup'])
+
+    return scheduler.run()
 
 
 def check_java_compatibility(goal, input_root_dir):
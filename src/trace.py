@@ -0,0 +1,178 @@
+import os
+import os.path as osp
+import json
+import time
+import logging
+import itertools
+import threading
+import contextvars
+
+
+## Spans of the work java-assess does, for a trace viewer.
+##
+## A span is a task with a start, an end, a parent span and attributes.
+## LogTaskStatus tasks are spans, and so are finer grained units of work
+## like a build artifact and the tool invocations it takes.  The current
+## span is a context variable: the stage scheduler and the assessment
+## runner run their work in a copy of the context of the caller, so the
+## spans nest across threads (all -> assess -> artifact -> invocation).
+##
+## run.conf:
+##   trace         true: finished spans are written to trace.jsonl in the
+##                 output directory, one JSON object per line
+##   trace-chrome  true: also trace.json, in Chrome trace_event format
+##                 (chrome://tracing, Perfetto), written at shutdown
+
+_current = contextvars.ContextVar('trace-span', default=None)
+
+_trace_file = None
+_chrome_file = None
+_lock = threading.Lock()
+_ids = itertools.count(1)
+
+TRACE_FILE = 'trace.jsonl'
+CHROME_FILE = 'trace.json'
+
+
+def configure(run_conf, output_dir):
+    '''Turns the trace on if run.conf trace is true'''
+
+    global _trace_file, _chrome_file
+
+    if run_conf.get('trace', 'false') != 'true':
+        return
+
+    _trace_file = osp.join(output_dir, TRACE_FILE)
+    open(_trace_file, 'w').close()
+
+    if run_conf.get('trace-chrome', 'false') == 'true':
+        _chrome_file = osp.join(output_dir, CHROME_FILE)
+
+    logging.info('TRACE: %s %s', _trace_file, _chrome_file or '')
+
+
+def current_span():
+    '''The span of the calling context, None outside of any span'''
+    return _current.get()
+
+
+def set_attrs(attrs):
+    '''Adds attributes to the current span, if any'''
+
+    span = _current.get()
+    if span is not None:
+        span.set_attrs(attrs)
+
+
+def run_in_context(func):
+    '''func, to run in another thread with the context (current span,
+    status buffer) of the calling thread'''
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(func, *args, **kwargs)
+
+
+class Span():
+    '''A span, a child of parent (the current span by default).
+
+    As a context manager it is the current span while the block runs,
+    and is finished at the end of the block.  Attribute values have to be
+    JSON serializable'''
+
+    def __init__(self, name, parent=None, attrs=None):
+        self.name = name
+        self.parent = parent if parent is not None else _current.get()
+        self.span_id = next(_ids)
+        self.attrs = dict(attrs or {})
+        self.thread = threading.current_thread().name
+        self.start = time.time()
+        self.end = None
+        self.last_child_end = None
+        self._token = None
+
+    def set_attr(self, key, value):
+        self.attrs[key] = value
+
+    def set_attrs(self, attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        _current.reset(self._token)
+
+        if exception is not None:
+            self.attrs['exception'] = '{0}: {1}'.format(type(exception).__name__, exception)
+
+        self.finish()
+
+    def finish(self, end=None):
+        '''Writes the span to the trace, end defaults to now'''
+
+        if self.end is not None:
+            return
+
+        self.end = end or time.time()
+
+        if self.parent is not None:
+            self.parent.last_child_end = max(self.parent.last_child_end or 0, self.end)
+
+        if _trace_file is None:
+            return
+
+        record = {
+            'id': self.span_id,
+            'parent': self.parent.span_id if self.parent else None,
+            'name': self.name,
+            'thread': self.thread,
+            'start': round(self.start, 6),
+            'end': round(self.end, 6),
+            'duration': round(self.end - self.start, 6),
+            'attrs': self.attrs,
+        }
+
+        with _lock:
+            with open(_trace_file, 'a') as fobj:
+                print(json.dumps(record, default=str), file=fobj)
+
+
+def _write_chrome_trace():
+    '''trace.jsonl as Chrome trace_event complete events, a row per thread'''
+
+    events = list()
+    tids = dict()
+
+    with open(_trace_file) as fobj:
+        for line in fobj:
+            record = json.loads(line)
+
+            if record['thread'] not in tids:
+                tids[record['thread']] = len(tids) + 1
+                events.append({'name': 'thread_name', 'ph': 'M',
+                               'pid': os.getpid(), 'tid': tids[record['thread']],
+                               'args': {'name': record['thread']}})
+
+            args = dict(record['attrs'])
+            args.update({'span-id': record['id'], 'parent-id': record['parent']})
+
+            events.append({'name': record['name'],
+                           'cat': 'java-assess',
+                           'ph': 'X',
+                           'ts': int(record['start'] * 1000000),
+                           'dur': int(record['duration'] * 1000000),
+                           'pid': os.getpid(),
+                           'tid': tids[record['thread']],
+                           'args': args})
+
+    with open(_chrome_file, 'w') as fobj:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, fobj)
+
+
+def shutdown():
+
+    if _trace_file and _chrome_file:
+        try:
+            _write_chrome_trace()
+        except (OSError, ValueError) as err:
+            logging.warning('Chrome trace not written: %s', err)
@@ -11,6 +11,14 @@ import shlex
 import uuid
 import pkgutil
 import logging
+import signal
+import threading
+
+from . import proc_sampler
+from . import cgroup
+from . import metrics
+from . import trace
+
 
 class PermissionException(OSError):
     pass
@@ -110,14 +118,251 @@ def unpack_archive(archive, dirpath, createdir=True):
         raise ValueError('Format not supported')
 
 
+def _get_usage(rusage, start, stop):
+    '''Resource usage of a command from its wait4 rusage, and its
+    time.monotonic() start and stop'''
+
+    return {
+        'wall-time': '{0:.6f}'.format(stop - start),
+        'user-time': '{0:.6f}'.format(rusage.ru_utime),
+        'system-time': '{0:.6f}'.format(rusage.ru_stime),
+        'max-rss-kb': str(rusage.ru_maxrss),
+        'major-page-faults': str(rusage.ru_majflt),
+        'block-input': str(rusage.ru_inblock),
+        'block-output': str(rusage.ru_oublock),
+        'voluntary-context-switches': str(rusage.ru_nvcsw),
+        'involuntary-context-switches': str(rusage.ru_nivcsw),
+    }
+
+
+def format_usage(usage):
+    '''One line summary of a usage dict, see run_cmd'''
+
+    return 'wall {0:.1f}s, user {1:.1f}s, sys {2:.1f}s, max-rss {3}MB, ' \
+        'blocks in/out {4}/{5}, major faults {6}'.format(float(usage['wall-time']),
+                                                        float(usage['user-time']),
+                                                        float(usage['system-time']),
+                                                        int(usage['max-rss-kb']) // 1024,
+                                                        usage['block-input'],
+                                                        usage['block-output'],
+                                                        usage['major-page-faults'])
+
+
+def _wait(popen, stop=None, grace_period=10):
+    '''Waits for popen to exit, with wait4 to get the resource usage of
+    the process and of the descendants it waited for, returns the rusage.
+
+    Without stop (no timeout, no output analyzers) this is a blocking
+    wait4.  With stop, wait4 polls, once the threading.Event stop is set
+    the process group of popen gets SIGTERM, and SIGKILL if it is still
+    there after grace_period seconds.
+    '''
+
+    if stop is None:
+        _, status, rusage = os.wait4(popen.pid, 0)
+    else:
+        kill_time = None
+
+        while True:
+            pid, status, rusage = os.wait4(popen.pid, os.WNOHANG)
+
+            if pid:
+                break
+
+            if stop.is_set():
+                try:
+                    if kill_time is None:
+                        os.killpg(popen.pid, signal.SIGTERM)
+                        kill_time = time.monotonic() + grace_period
+                    elif time.monotonic() >= kill_time:
+                        os.killpg(popen.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+            stop.wait(0.1)
+
+    # negative signal number, like subprocess, for a process killed by a signal
+    if os.WIFSIGNALED(status):
+        popen.returncode = -os.WTERMSIG(status)
+    else:
+        popen.returncode = os.WEXITSTATUS(status)
+    return rusage
+
+
+## exit code run_cmd returns for a command that ran out of time, like timeout(1)
+TIMEOUT_EXIT_CODE = 124
+
+
+def get_timeouts(conf, stage):
+    '''(wall-clock, cpu) time limits in seconds for the commands of stage,
+    from conf <stage>-timeout and <stage>-cpu-timeout, None if not set'''
+
+    timeouts = list()
+
+    for key in ['{0}-timeout'.format(stage), '{0}-cpu-timeout'.format(stage)]:
+        try:
+            timeout = float(conf.get(key, '0'))
+        except ValueError:
+            logging.warning('Invalid %s: %s', key, conf[key])
+            timeout = 0
+
+        timeouts.append(timeout if timeout > 0 else None)
+
+    return tuple(timeouts)
+
+
+class _Watchdog(threading.Thread):
+    '''Sets stop once a command has run for timeout seconds, or its
+    process tree has used cpu_timeout seconds of CPU time.  timed_out
+    is then 'wall-clock' or 'cpu' '''
+
+    INTERVAL = 0.5
+
+    def __init__(self, pid, stop, timeout, cpu_timeout):
+        threading.Thread.__init__(self, name='watchdog-{0}'.format(pid), daemon=True)
+        self._pid = pid
+        self._stop_cmd = stop
+        self._timeout = timeout
+        self._cpu_timeout = cpu_timeout
+        self._done = threading.Event()
+        self.timed_out = None
+
+    def run(self):
+
+        start = time.monotonic()
+
+        while not self._done.wait(_Watchdog.INTERVAL):
+            if self._timeout and time.monotonic() - start >= self._timeout:
+                self.timed_out = 'wall-clock'
+            elif self._cpu_timeout and \
+                 proc_sampler.get_cpu_time(self._pid) >= self._cpu_timeout:
+                self.timed_out = 'cpu'
+
+            if self.timed_out:
+                logging.info('COMMAND TIMED OUT: %s, limits: wall-clock %ss, cpu %ss',
+                             self.timed_out, self._timeout, self._cpu_timeout)
+                self._stop_cmd.set()
+                break
+
+    def finish(self):
+        self._done.set()
+        self.join()
+
+
+def _run_cmd_analyzed(popen, out, err, analyzers, stop, grace_period=10):
+    '''Copies stdout and stderr of popen to out and err line by line,
+    and feeds each line to the analyzers (see output_analyzer).  The
+    command, and the processes it started, are ended when an analyzer
+    returns a reason or stop is set.  Returns the rusage of the command.
+
+    A descendant left running after the command exits (a build daemon, a
+    forked JVM) may keep the pipes open: the output is copied for up to
+    grace_period seconds after the exit, what comes after is dropped.'''
+
+    lock = threading.Lock()
+    abandoned = threading.Event()
+
+    def _copy(stream, pipe, fobj):
+        # the bytes as written by the command, text layers are bypassed
+        if hasattr(fobj, 'write'):
+            fobj.flush()
+            fobj = getattr(fobj, 'buffer', fobj)
+        else:
+            fobj = None
+
+        for line in iter(pipe.readline, b''):
+            text = line.decode('utf-8', errors='replace')
+
+            with lock:
+                # out and err may be closed by now
+                if abandoned.is_set():
+                    break
+
+                if fobj is not None:
+                    fobj.write(line)
+
+                for analyzer in analyzers:
+                    reason = analyzer.feed(stream, text)
+                    if reason and not stop.is_set():
+                        logging.info('STOPPING COMMAND: %s', reason)
+                        stop.set()
+
+        pipe.close()
+
+        with lock:
+            if fobj is not None and not abandoned.is_set():
+                fobj.flush()
+
+    # analyzers log status notes, buffered with those of the caller.
+    # daemon threads, a reader still blocked on a pipe does not hold up exit
+    threads = [threading.Thread(target=trace.run_in_context(_copy),
+                                args=('stdout', popen.stdout, out),
+                                daemon=True),
+               threading.Thread(target=trace.run_in_context(_copy),
+                                args=('stderr', popen.stderr, err),
+                                daemon=True)]
+
+    for thread in threads:
+        thread.start()
+
+    rusage = _wait(popen, stop)
+
+    deadline = time.monotonic() + grace_period
+    for thread in threads:
+        thread.join(max(0, deadline - time.monotonic()))
+
+    with lock:
+        if any(thread.is_alive() for thread in threads):
+            logging.info('OUTPUT LEFT OPEN: by a process started by %s, not copied any more',
+                         popen.args)
+            abandoned.set()
+
+        for analyzer in analyzers:
+            analyzer.done()
+
+    return rusage
+
+
+def _get_cmd_label(cmd, outfile):
+    '''Name of the command for its files: its stdout file name if it
+    has one, else its executable'''
+
+    if isinstance(outfile, str):
+        return osp.splitext(osp.basename(outfile))[0]
+    else:
+        executable = cmd.split()[0] if isinstance(cmd, str) else cmd[0]
+        return osp.basename(executable)
+
+
 def run_cmd(cmd,
             outfile=sys.stdout,
             errfile=sys.stderr,
             infile=None,
             cwd='.',
             shell=False,
-            env=None):
-    '''argument cmd should be a list'''
+            env=None,
+            analyzers=None,
+            usage=None,
+            timeout=None,
+            cpu_timeout=None,
+            resource_plan=None):
+    '''argument cmd should be a list
+
+    analyzers: list of output_analyzer.OutputAnalyzer, fed the lines
+    of stdout and stderr while the command runs
+
+    usage: dict, if given it is filled with the resource usage of the
+    command (wall, user and system time, max rss, block I/O, context
+    switches), see format_usage
+
+    timeout, cpu_timeout: seconds of wall-clock time, and of CPU time of
+    the command and its descendants, after which the command is ended.
+    The command then returns TIMEOUT_EXIT_CODE, and usage['timeout'] is
+    'wall-clock' or 'cpu'
+
+    resource_plan: resource_plan.ResourcePlan of the JVM the command runs,
+    with run.conf cgroup-limits the command runs in a cgroup capped to
+    its share, usage['cgroup'] has the caps and the OOM kills (see cgroup)'''
     openfile = lambda filename, mode: \
         open(filename, mode) if(isinstance(filename, str)) else filename
 
@@ -131,15 +376,84 @@ def run_cmd(cmd,
     environ = dict(os.environ) if env is None else env
 
     try:
-        popen = subprocess.Popen(cmd,
-                                 stdout=out,
-                                 stderr=err,
-                                 stdin=inn,
-                                 shell=shell,
-                                 cwd=cwd,
-                                 env=environ)
-        popen.wait()
-        return (popen.returncode, environ)
+        start = time.monotonic()
+
+        cmd_cgroup = cgroup.create(_get_cmd_label(cmd, outfile), resource_plan)
+
+        if cmd_cgroup:
+            cmd = cmd_cgroup.wrap(cmd)
+            shell = False
+
+        # in its own process group, to be able to end all of it
+        stop = threading.Event() if (analyzers or timeout or cpu_timeout) else None
+
+        try:
+            if analyzers:
+                popen = subprocess.Popen(cmd,
+                                         stdout=subprocess.PIPE,
+                                         stderr=subprocess.PIPE,
+                                         stdin=inn,
+                                         shell=shell,
+                                         cwd=cwd,
+                                         env=environ,
+                                         start_new_session=True)
+            else:
+                popen = subprocess.Popen(cmd,
+                                         stdout=out,
+                                         stderr=err,
+                                         stdin=inn,
+                                         shell=shell,
+                                         cwd=cwd,
+                                         env=environ,
+                                         start_new_session=stop is not None)
+        except BaseException:
+            # removed once the command is done otherwise
+            if cmd_cgroup:
+                cmd_cgroup.remove()
+            raise
+
+        sampler = proc_sampler.start(popen.pid, _get_cmd_label(cmd, outfile))
+
+        if timeout or cpu_timeout:
+            watchdog = _Watchdog(popen.pid, stop, timeout, cpu_timeout)
+            watchdog.start()
+        else:
+            watchdog = None
+
+        try:
+            if analyzers:
+                rusage = _run_cmd_analyzed(popen, out, err, analyzers, stop)
+            else:
+                rusage = _wait(popen, stop)
+        finally:
+            if sampler:
+                sampler.stop()
+            if watchdog:
+                watchdog.finish()
+            if cmd_cgroup:
+                cgroup_usage = cmd_cgroup.get_usage()
+                cmd_cgroup.remove()
+
+        exit_code = popen.returncode
+
+        if watchdog and watchdog.timed_out:
+            exit_code = TIMEOUT_EXIT_CODE
+
+        metrics.counter('java_assess_commands_total', 'Commands run').inc()
+        metrics.histogram('java_assess_command_seconds',
+                          'Wall-clock time of the commands run').observe(time.monotonic() - start)
+        if watchdog and watchdog.timed_out:
+            metrics.counter('java_assess_command_timeouts_total',
+                            'Commands ended for running out of time').inc()
+
+        if usage is not None:
+            usage.update(_get_usage(rusage, start, time.monotonic()))
+            if watchdog and watchdog.timed_out:
+                usage['timeout'] = watchdog.timed_out
+            if cmd_cgroup:
+                usage['cgroup'] = cgroup_usage
+
+        return (exit_code, environ)
     except subprocess.CalledProcessError as err:
         return (err.returncode, environ)
     finally:
@@ -810,3 +1124,11 @@ def string_to_bool(s):
     else:
         return False
 
+
+def count_archive(archive):
+    '''Counts an archive written in the metrics, returns archive'''
+
+    metrics.counter('java_assess_archives_total', 'Archives written').inc()
+    metrics.counter('java_assess_archived_bytes_total',
+                    'Bytes of the archives written').inc(osp.getsize(archive))
+    return archive
@@ -0,0 +1,5 @@
+import os.path as osp
+import sys
+
+## ply and plyj, bundled in lib/ as in a release
+sys.path.insert(0, osp.join(osp.dirname(osp.dirname(osp.abspath(__file__))), 'lib'))
@@ -0,0 +1,59 @@
+import time
+import unittest
+
+from src.assess.assess_runner import artifact_id_key
+from src.assess.assess_runner import AssessmentRunner
+
+
+class TestArtifactIdKey(unittest.TestCase):
+
+    def test_numeric_order(self):
+        ids = ['10', '2', '1', '21', '3']
+        self.assertEqual(sorted(ids, key=artifact_id_key), ['1', '2', '3', '10', '21'])
+
+    def test_split_chunks_follow_their_artifact(self):
+        ids = ['10-3', '2', '10', '10-1', '2-10', '2-2', '11']
+        self.assertEqual(sorted(ids, key=artifact_id_key),
+                         ['2', '2-2', '2-10', '10', '10-1', '10-3', '11'])
+
+    def test_oom_retry_chunks(self):
+        ids = ['1-2-1', '1-1', '1-2-2', '1-10']
+        self.assertEqual(sorted(ids, key=artifact_id_key),
+                         ['1-1', '1-2-1', '1-2-2', '1-10'])
+
+    def test_ints_and_strings(self):
+        self.assertEqual(artifact_id_key(7), artifact_id_key('7'))
+        # package-conf and other non numeric ids sort after numbers
+        self.assertLess(artifact_id_key('7'), artifact_id_key('package-conf'))
+
+
+class TestAssessmentRunner(unittest.TestCase):
+
+    def _run(self, workers):
+        # the first submitted finishes last
+        delays = {'1': 0.2, '2': 0.1, '10': 0, '2-1': 0.05}
+
+        with AssessmentRunner(workers) as runner:
+            for build_artifact_id in ['10', '2-1', '1', '2']:
+                runner.submit(build_artifact_id,
+                              lambda _id: time.sleep(delays[_id]) or _id,
+                              build_artifact_id)
+            return runner.results()
+
+    def test_results_in_id_order(self):
+        self.assertEqual(self._run(1), ['1', '2', '2-1', '10'])
+        self.assertEqual(self._run(4), ['1', '2', '2-1', '10'])
+
+    def test_exception_is_raised_by_results(self):
+
+        def _fail():
+            raise ValueError('tool failed')
+
+        with AssessmentRunner(2) as runner:
+            runner.submit('1', _fail)
+            with self.assertRaises(ValueError):
+                runner.results()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import os
+import os.path as osp
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from unittest import mock
+
+from src.build.build_cache import BuildCache
+
+
+class TestBuildCacheKey(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self._write('pkg.zip', 'package')
+        self._write('jdk/release', 'JAVA_VERSION="1.8.0_292"\nIMPLEMENTOR="Oracle"\n')
+
+        self.pkg_conf = {'package-archive': 'pkg.zip',
+                         'package-short-name': 'pkg',
+                         'build-sys': 'maven'}
+        self.run_conf = {'parallel-build': 'true', 'tool-dir': '/tool'}
+
+        env_patcher = mock.patch.dict(os.environ, {'JAVA_HOME': osp.join(self.tmp_dir, 'jdk')})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, relpath, content):
+        filepath = osp.join(self.tmp_dir, relpath)
+        os.makedirs(osp.dirname(filepath), exist_ok=True)
+        with open(filepath, 'w') as fobj:
+            fobj.write(content)
+
+    def _key(self, pkg_conf=None, run_conf=None):
+        return BuildCache.get_key(self.tmp_dir,
+                                  pkg_conf if pkg_conf is not None else self.pkg_conf,
+                                  run_conf if run_conf is not None else self.run_conf)
+
+    def test_stable(self):
+        key = self._key()
+
+        self.assertEqual(self._key(), key)
+        self.assertEqual(self._key(pkg_conf=dict(reversed(list(self.pkg_conf.items())))), key)
+
+    def test_unrelated_run_conf(self):
+        key = self._key()
+
+        self.assertEqual(self._key(run_conf=dict(self.run_conf, **{'tool-dir': '/other'})), key)
+
+    def test_package_archive(self):
+        key = self._key()
+        self._write('pkg.zip', 'package v2')
+
+        self.assertNotEqual(self._key(), key)
+
+    def test_package_conf(self):
+        key = self._key()
+
+        self.assertNotEqual(self._key(pkg_conf=dict(self.pkg_conf, **{'build-sys': 'gradle'})),
+                            key)
+
+    def test_run_conf_keys(self):
+        key = self._key()
+
+        for run_conf_key in BuildCache.RUN_CONF_KEYS:
+            self.assertNotEqual(self._key(run_conf=dict(self.run_conf, **{run_conf_key: 'x'})),
+                                key, run_conf_key)
+
+    def test_java_version(self):
+        key = self._key()
+        self._write('jdk/release', 'JAVA_VERSION="11.0.2"\nIMPLEMENTOR="Oracle"\n')
+
+        self.assertNotEqual(self._key(), key)
+
+
+class TestBuildCacheEntries(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = BuildCache(osp.join(self.tmp_dir, 'cache'))
+        self.dep_jar = osp.join(self.tmp_dir, 'm2', 'dep.jar')
+        self.build_archive = self._build(osp.join(self.tmp_dir, 'build'))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _build(self, build_root_dir):
+        os.makedirs(osp.dirname(self.dep_jar), exist_ok=True)
+        open(self.dep_jar, 'w').close()
+        os.makedirs(osp.join(build_root_dir, 'pkg1'))
+
+        root = ET.Element('build-summary')
+        ET.SubElement(root, 'build-root-dir').text = build_root_dir
+        artifact = ET.SubElement(ET.SubElement(root, 'build-artifacts'), 'java-compile')
+        classpath = ET.SubElement(artifact, 'classpath')
+        ET.SubElement(classpath, 'file').text = 'pkg1/target/classes'
+        ET.SubElement(classpath, 'file').text = self.dep_jar
+        ET.ElementTree(root).write(osp.join(build_root_dir, 'build_summary.xml'))
+
+        return shutil.make_archive(osp.join(self.tmp_dir, 'build'), 'gztar',
+                                   self.tmp_dir, 'build')
+
+    def _store(self, key='key'):
+        self.cache.store(key, self.build_archive, osp.join(self.tmp_dir, 'build'),
+                         'build_summary.xml', {'build-type': 'maven'})
+
+    def test_round_trip(self):
+        self._store()
+        build_root_dir = osp.join(self.tmp_dir, 'build-2')
+
+        self.assertEqual(self.cache.restore('key', build_root_dir),
+                         ('build_summary.xml', {'build-type': 'maven'}))
+
+        root = ET.parse(osp.join(build_root_dir, 'build_summary.xml')).getroot()
+        self.assertEqual(root.findtext('build-root-dir'), build_root_dir)
+
+    def test_miss(self):
+        self.assertIsNone(self.cache.restore('key', osp.join(self.tmp_dir, 'build-2')))
+
+    def test_corrupt_archive(self):
+        self._store()
+        with open(osp.join(self.tmp_dir, 'cache', 'key', BuildCache.ARCHIVE_FILE), 'wb') as fobj:
+            fobj.write(b'truncated')
+        build_root_dir = osp.join(self.tmp_dir, 'build-2')
+
+        self.assertIsNone(self.cache.restore('key', build_root_dir))
+        self.assertFalse(self.cache.has_entry('key'))
+        self.assertEqual(os.listdir(build_root_dir), [])
+
+        # the next successful build replaces the entry
+        self._store()
+        self.assertIsNotNone(self.cache.restore('key', build_root_dir))
+
+    def test_corrupt_entry_file(self):
+        self._store()
+        with open(osp.join(self.tmp_dir, 'cache', 'key', BuildCache.ENTRY_FILE), 'w') as fobj:
+            fobj.write('{"build-root-dir": ')
+
+        self.assertIsNone(self.cache.restore('key', osp.join(self.tmp_dir, 'build-2')))
+        self.assertFalse(self.cache.has_entry('key'))
+        self.assertEqual(os.listdir(osp.join(self.tmp_dir, 'cache')), [])
+
+    def test_missing_external_files(self):
+        self._store()
+        os.remove(self.dep_jar)
+        build_root_dir = osp.join(self.tmp_dir, 'build-2')
+
+        self.assertIsNone(self.cache.restore('key', build_root_dir))
+        self.assertTrue(self.cache.has_entry('key'))
+        self.assertEqual(os.listdir(build_root_dir), [])
+
+
+class TestRewriteBuildSummary(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.build_summary_file = osp.join(self.tmp_dir, 'build_summary.xml')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_whole_paths_only(self):
+        root = ET.Element('build-summary')
+        ET.SubElement(root, 'build-root-dir').text = '/b/build'
+        ET.SubElement(root, 'srcfile').text = '/b/build/pkg/src/A.java'
+        ET.SubElement(root, 'classpath').text = '/b/build/lib/x.jar:/b/build2/y.jar'
+        ET.SubElement(root, 'other').text = '/c/b/build/z.jar'
+        ET.ElementTree(root).write(self.build_summary_file)
+
+        BuildCache._rewrite_build_summary(self.build_summary_file, '/b/build', '/new', 'key')
+
+        root = ET.parse(self.build_summary_file).getroot()
+        self.assertEqual(root.findtext('build-root-dir'), '/new')
+        self.assertEqual(root.findtext('srcfile'), '/new/pkg/src/A.java')
+        self.assertEqual(root.findtext('classpath'), '/new/lib/x.jar:/b/build2/y.jar')
+        self.assertEqual(root.findtext('other'), '/c/b/build/z.jar')
+        self.assertEqual(root.findtext('build-cache/key'), 'key')
+        self.assertEqual(root.findtext('build-cache/restored-from-build-root-dir'), '/b/build')
+
+
+if __name__ == '__main__':
+    unittest.main()
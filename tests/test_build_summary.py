@@ -0,0 +1,81 @@
+import os.path as osp
+import shutil
+import tempfile
+import unittest
+
+from src.build.build_java import BuildSummaryJavaSrc
+
+
+def _compile(tag, _id, destdir, srcfiles):
+    '''a build-artifacts element as the build monitors record it'''
+
+    files = ''.join('<file>{0}</file>'.format(srcfile) for srcfile in srcfiles)
+    return '<{0} id="{1}"><destdir><file>{2}</file></destdir>' \
+           '<srcfile>{3}</srcfile></{0}>'.format(tag, _id, destdir, files)
+
+
+class TestAddBuildArtifacts(unittest.TestCase):
+
+    def setUp(self):
+        self.build_root_dir = tempfile.mkdtemp()
+        self.build_artifacts_file = osp.join(self.build_root_dir, 'build-artifacts.xml')
+
+    def tearDown(self):
+        shutil.rmtree(self.build_root_dir)
+
+    def _get_artifacts(self, *elems):
+
+        with open(self.build_artifacts_file, 'w') as fobj:
+            fobj.write('<build-artifacts>{0}</build-artifacts>'.format(''.join(elems)))
+
+        summary = BuildSummaryJavaSrc(self.build_root_dir, '/pkg', {'package-short-name': 'p'})
+        summary.add_build_artifacts(self.build_artifacts_file, self.build_root_dir)
+
+        return [(elem.get('id'), elem.find('destdir/file').text, elem.tag)
+                for elem in summary._root.find('build-artifacts')]
+
+    def test_ids_follow_destdir_order(self):
+        root = self.build_root_dir
+
+        artifacts = self._get_artifacts(
+            _compile('java-compile', '1', root + '/b/classes', [root + '/b/B.java']),
+            _compile('java-compile', '2', root + '/a/classes', [root + '/a/A.java']),
+            _compile('java-compile', '3', root + '/c/classes', [root + '/c/C.java']))
+
+        self.assertEqual(artifacts, [('1', 'a/classes', 'java-compile'),
+                                     ('2', 'b/classes', 'java-compile'),
+                                     ('3', 'c/classes', 'java-compile')])
+
+    def test_same_in_any_finish_order(self):
+        root = self.build_root_dir
+        elems = [_compile('java-compile', str(_id), '{0}/{1}/classes'.format(root, name),
+                          ['{0}/{1}/X.java'.format(root, name)])
+                 for _id, name in enumerate(['m1', 'm2', 'm3'], 1)]
+
+        self.assertEqual(self._get_artifacts(*elems),
+                         self._get_artifacts(*reversed(elems)))
+
+    def test_duplicates_merged(self):
+        root = self.build_root_dir
+
+        artifacts = self._get_artifacts(
+            _compile('java-compile', '1', root + '/a/classes', [root + '/a/A.java']),
+            _compile('java-compile', '2', root + '/b/classes', [root + '/b/B.java']),
+            # recorded again, by the same compile reported twice
+            _compile('java-compile', '3', root + '/a/classes', [root + '/a/A.java']))
+
+        self.assertEqual(artifacts, [('1', 'a/classes', 'java-compile'),
+                                     ('2', 'b/classes', 'java-compile')])
+
+    def test_different_sources_not_merged(self):
+        root = self.build_root_dir
+
+        artifacts = self._get_artifacts(
+            _compile('java-compile', '1', root + '/a/classes', [root + '/a/Test.java']),
+            _compile('java-compile', '2', root + '/a/classes', [root + '/a/A.java']))
+
+        self.assertEqual([_id for _id, _, _ in artifacts], ['1', '2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
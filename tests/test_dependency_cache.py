@@ -0,0 +1,139 @@
+import os
+import os.path as osp
+import stat
+import shutil
+import tempfile
+import unittest
+
+from src.build.dependency_cache import DependencyCache
+
+
+class TestDependencyCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = osp.join(self.tmp_dir, 'cache')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _repo(self, name, files):
+        repo_dir = osp.join(self.tmp_dir, name)
+        for relpath, content in files.items():
+            os.makedirs(osp.dirname(osp.join(repo_dir, relpath)), exist_ok=True)
+            with open(osp.join(repo_dir, relpath), 'w') as fobj:
+                fobj.write(content)
+        return repo_dir
+
+    def _read(self, filepath):
+        with open(filepath) as fobj:
+            return fobj.read()
+
+    def _objects(self):
+        return sorted(osp.join(dirpath, filename)
+                      for dirpath, _, filenames in os.walk(osp.join(self.cache_dir, 'objects'))
+                      for filename in filenames)
+
+    def test_save_and_restore(self):
+        repo_dir = self._repo('m2-1', {'org/a/a-1.jar': 'jar',
+                                       'org/a/maven-metadata.xml': 'metadata',
+                                       'org/a/a-1.jar.lastUpdated': 'skipped'})
+
+        stats = DependencyCache(self.cache_dir, 1024 * 1024).save('m2', repo_dir)
+        self.assertEqual((stats['hits'], stats['misses']), (0, 2))
+
+        new_repo_dir = osp.join(self.tmp_dir, 'm2-2')
+        cache = DependencyCache(self.cache_dir, 1024 * 1024)
+        cache.restore('m2', new_repo_dir)
+
+        self.assertEqual(self._read(osp.join(new_repo_dir, 'org/a/a-1.jar')), 'jar')
+        self.assertEqual(self._read(osp.join(new_repo_dir, 'org/a/maven-metadata.xml')),
+                         'metadata')
+        self.assertFalse(osp.exists(osp.join(new_repo_dir, 'org/a/a-1.jar.lastUpdated')))
+        self.assertEqual(cache.stats['m2']['restored'], 2)
+
+        stats = cache.save('m2', new_repo_dir)
+        self.assertEqual((stats['hits'], stats['misses']), (2, 0))
+
+    def test_restored_files_are_copies(self):
+        repo_dir = self._repo('m2-1', {'org/a/maven-metadata.xml': 'metadata'})
+        DependencyCache(self.cache_dir, 1024 * 1024).save('m2', repo_dir)
+
+        new_repo_dir = osp.join(self.tmp_dir, 'm2-2')
+        cache = DependencyCache(self.cache_dir, 1024 * 1024)
+        cache.restore('m2', new_repo_dir)
+
+        restored = osp.join(new_repo_dir, 'org/a/maven-metadata.xml')
+        self.assertEqual(os.stat(restored).st_nlink, 1)
+
+        # a build rewrites the file in place
+        with open(restored, 'w') as fobj:
+            fobj.write('rewritten by the build')
+
+        stats = cache.save('m2', new_repo_dir)
+        self.assertEqual((stats['hits'], stats['misses']), (0, 1))
+        self.assertEqual(sorted(self._read(object_path) for object_path in self._objects()),
+                         ['metadata', 'rewritten by the build'])
+
+    def test_objects_read_only(self):
+        repo_dir = self._repo('m2', {'org/a/a-1.jar': 'jar'})
+        DependencyCache(self.cache_dir, 1024 * 1024).save('m2', repo_dir)
+
+        for object_path in self._objects():
+            self.assertFalse(os.stat(object_path).st_mode & (stat.S_IWUSR | stat.S_IWGRP |
+                                                             stat.S_IWOTH))
+
+    def test_files_in_the_repository_kept(self):
+        DependencyCache(self.cache_dir, 1024 * 1024).save('m2', self._repo('m2-1', {'a.pom': 'cached'}))
+        repo_dir = self._repo('m2-2', {'a.pom': 'local'})
+
+        DependencyCache(self.cache_dir, 1024 * 1024).restore('m2', repo_dir)
+
+        self.assertEqual(self._read(osp.join(repo_dir, 'a.pom')), 'local')
+
+    def test_namespaces(self):
+        DependencyCache(self.cache_dir, 1024 * 1024).save('m2', self._repo('m2', {'a.jar': 'a'}))
+
+        gradle_dir = osp.join(self.tmp_dir, 'gradle')
+        DependencyCache(self.cache_dir, 1024 * 1024).restore('gradle', gradle_dir)
+
+        self.assertFalse(osp.exists(osp.join(gradle_dir, 'a.jar')))
+
+    def test_evict_least_recently_used(self):
+        repo_dir = self._repo('m2', {'old.jar': 'o' * 100,
+                                     'used.jar': 'u' * 100,
+                                     'new.jar': 'n' * 100})
+
+        cache = DependencyCache(self.cache_dir, 1024 * 1024)
+        cache.save('m2', repo_dir)
+
+        index = cache._read_index('m2')
+        for relpath, mtime in [('old.jar', 1000), ('used.jar', 3000), ('new.jar', 2000)]:
+            os.utime(cache._get_object_path(index[relpath]), (mtime, mtime))
+
+        cache.max_size = 150
+        cache._evict()
+
+        self.assertEqual(sorted(cache._read_index('m2')), ['used.jar'])
+        self.assertEqual(len(self._objects()), 1)
+
+    def test_restore_marks_objects_used(self):
+        cache = DependencyCache(self.cache_dir, 1024 * 1024)
+        cache.save('m2', self._repo('m2', {'a.jar': 'a'}))
+        object_path = cache._get_object_path(cache._read_index('m2')['a.jar'])
+        os.utime(object_path, (1000, 1000))
+
+        cache.restore('m2', osp.join(self.tmp_dir, 'm2-2'))
+
+        self.assertGreater(os.stat(object_path).st_mtime, 1000)
+
+    def test_from_conf(self):
+        self.assertIsNone(DependencyCache.from_conf({}))
+
+        cache = DependencyCache.from_conf({'dependency-cache-dir': self.cache_dir,
+                                           'dependency-cache-max-size': 'lots'})
+        self.assertEqual(cache.max_size, 10240 * 1024 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import os.path as osp
+import shutil
+import tempfile
+import unittest
+
+from src.build import maven_plugin
+
+
+POM = '''<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <groupId>org.continuousassurance.swamp</groupId>
+  <artifactId>swamp-maven-plugin</artifactId>
+  <version>1.1</version>
+</project>
+'''
+
+
+class TestMavenPlugin(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.plugin_dir = osp.join(self.tmp_dir, 'swamp-maven-plugin')
+        self.repo_dir = osp.join(self.tmp_dir, 'repository')
+
+        self._write(osp.join(self.plugin_dir, 'pom.xml'), POM)
+        self._write(osp.join(self.plugin_dir, 'src/main/java/Mojo.java'), 'class Mojo {}')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, filepath, content):
+        os.makedirs(osp.dirname(filepath), exist_ok=True)
+        with open(filepath, 'w') as fobj:
+            fobj.write(content)
+
+    def _mvn_install(self):
+        artifact_dir = osp.join(self.repo_dir, 'org/continuousassurance/swamp/swamp-maven-plugin/1.1')
+        self._write(osp.join(artifact_dir, 'swamp-maven-plugin-1.1.pom'), POM)
+        self._write(osp.join(artifact_dir, 'swamp-maven-plugin-1.1.jar'), 'jar')
+        return osp.join(artifact_dir, 'swamp-maven-plugin-1.1.jar')
+
+    def test_fingerprint_covers_sources(self):
+        fingerprint = maven_plugin.get_fingerprint(self.plugin_dir)
+
+        self.assertEqual(maven_plugin.get_fingerprint(self.plugin_dir), fingerprint)
+
+        self._write(osp.join(self.plugin_dir, 'src/main/java/Mojo.java'), 'class Mojo { }')
+        self.assertNotEqual(maven_plugin.get_fingerprint(self.plugin_dir), fingerprint)
+
+    def test_installed(self):
+        fingerprint = maven_plugin.get_fingerprint(self.plugin_dir)
+        self.assertFalse(maven_plugin.is_installed(self.plugin_dir, self.repo_dir, fingerprint))
+
+        # installed by maven, not recorded
+        self._mvn_install()
+        self.assertFalse(maven_plugin.is_installed(self.plugin_dir, self.repo_dir, fingerprint))
+
+        maven_plugin.set_installed(self.plugin_dir, self.repo_dir, fingerprint)
+        self.assertTrue(maven_plugin.is_installed(self.plugin_dir, self.repo_dir, fingerprint))
+
+    def test_sources_changed(self):
+        self._mvn_install()
+        maven_plugin.set_installed(self.plugin_dir, self.repo_dir,
+                                   maven_plugin.get_fingerprint(self.plugin_dir))
+
+        self._write(osp.join(self.plugin_dir, 'src/main/java/Mojo.java'), 'class Mojo { }')
+
+        self.assertFalse(maven_plugin.is_installed(self.plugin_dir, self.repo_dir,
+                                                   maven_plugin.get_fingerprint(self.plugin_dir)))
+
+    def test_jar_replaced(self):
+        jar_file = self._mvn_install()
+        fingerprint = maven_plugin.get_fingerprint(self.plugin_dir)
+        maven_plugin.set_installed(self.plugin_dir, self.repo_dir, fingerprint)
+
+        # installed by an older java-assess
+        self._write(jar_file, 'old jar')
+
+        self.assertFalse(maven_plugin.is_installed(self.plugin_dir, self.repo_dir, fingerprint))
+
+
+if __name__ == '__main__':
+    unittest.main()
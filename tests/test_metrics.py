@@ -0,0 +1,84 @@
+import os
+import os.path as osp
+import shutil
+import tempfile
+import unittest
+
+from src import metrics
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        metrics._metrics.clear()
+
+    def tearDown(self):
+        metrics._metrics.clear()
+
+    def test_counter_and_gauge(self):
+        metrics.gauge('java_assess_workers', 'Workers').set(4)
+        metrics.counter('java_assess_files_scanned_total', 'Files found').inc(3)
+        metrics.counter('java_assess_files_scanned_total', 'Files found').inc()
+
+        self.assertEqual(metrics.to_text(),
+                         '# HELP java_assess_files_scanned_total Files found\n'
+                         '# TYPE java_assess_files_scanned_total counter\n'
+                         'java_assess_files_scanned_total 4\n'
+                         '# HELP java_assess_workers Workers\n'
+                         '# TYPE java_assess_workers gauge\n'
+                         'java_assess_workers 4\n')
+
+    def test_histogram(self):
+        histogram = metrics.histogram('java_assess_command_seconds', 'Command run time',
+                                      buckets=(1, 10))
+        for value in (0.5, 5, 5, 20):
+            histogram.observe(value)
+
+        self.assertEqual(metrics.to_text(),
+                         '# HELP java_assess_command_seconds Command run time\n'
+                         '# TYPE java_assess_command_seconds histogram\n'
+                         'java_assess_command_seconds_bucket{le="1.0"} 1\n'
+                         'java_assess_command_seconds_bucket{le="10.0"} 3\n'
+                         'java_assess_command_seconds_bucket{le="+Inf"} 4\n'
+                         'java_assess_command_seconds_sum 30.5\n'
+                         'java_assess_command_seconds_count 4\n')
+
+    def test_get_or_create(self):
+        self.assertIs(metrics.counter('java_assess_runs_total', 'Runs'),
+                      metrics.counter('java_assess_runs_total', 'Runs'))
+
+    def test_type_mismatch(self):
+        metrics.counter('java_assess_runs_total', 'Runs')
+
+        with self.assertRaises(ValueError):
+            metrics.gauge('java_assess_runs_total', 'Runs')
+
+    def test_help_escaped(self):
+        metrics.counter('java_assess_runs_total', 'Runs\nin C:\\out')
+
+        self.assertIn('# HELP java_assess_runs_total Runs\\nin C:\\\\out\n', metrics.to_text())
+
+    def test_gauge_set_max(self):
+        gauge = metrics.gauge('java_assess_peak_workers', 'Peak workers')
+        for value in (2, 5, 3):
+            gauge.set_max(value)
+
+        self.assertEqual(gauge.value, 5)
+
+    def test_write_text_file(self):
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+
+        metrics.write_text_file(output_dir)
+        self.assertEqual(os.listdir(output_dir), [])
+
+        metrics.counter('java_assess_runs_total', 'Runs').inc()
+        metrics.write_text_file(output_dir)
+
+        self.assertEqual(os.listdir(output_dir), [metrics.METRICS_FILE])
+        with open(osp.join(output_dir, metrics.METRICS_FILE)) as fobj:
+            self.assertEqual(fobj.read(), metrics.to_text())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import os.path as osp
+import threading
+import unittest
+import importlib.util
+import importlib.machinery
+from unittest import mock
+
+NO_BUILD_HELPER = osp.join(osp.dirname(osp.dirname(osp.abspath(__file__))),
+                           'resources', 'no_build_helper')
+
+
+def _load_no_build_helper():
+    loader = importlib.machinery.SourceFileLoader('no_build_helper', NO_BUILD_HELPER)
+    spec = importlib.util.spec_from_loader('no_build_helper', loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
+
+
+class FakeCompiler():
+    '''run_cmd of no_build_helper, without javac: files in broken do
+    not compile, a file in needs compiles only with the file it needs'''
+
+    def __init__(self, broken=(), needs=None):
+        self.broken = set(broken)
+        self.needs = needs or dict()
+        self.calls = list()
+        self._lock = threading.Lock()
+
+    def __call__(self, cmd, cwd='.'):
+        srcfiles = [arg for arg in cmd if arg.endswith(('.java', '.c', '.cpp'))]
+
+        with self._lock:
+            self.calls.append(srcfiles)
+
+        failed = [srcfile for srcfile in srcfiles
+                  if srcfile in self.broken or
+                  (srcfile in self.needs and self.needs[srcfile] not in srcfiles)]
+
+        return (1 if failed else 0, 'errors: {0}'.format(failed), dict())
+
+
+class TestNoBuildHelper(unittest.TestCase):
+
+    def setUp(self):
+        self.helper = _load_no_build_helper()
+
+    def _compile(self, srcfiles, compiler, cpus=4):
+        with mock.patch.object(self.helper, 'run_cmd', compiler), \
+             mock.patch.object(self.helper.os, 'cpu_count', lambda: cpus):
+            return self.helper.compile_src_files(srcfiles, '.')
+
+    def test_batches_do_not_depend_on_cpus(self):
+        java_files = ['F{0}.java'.format(index) for index in range(130)]
+
+        batches = self.helper.get_java_batches(java_files)
+
+        self.assertEqual([len(batch) for batch in batches], [64, 64, 2])
+        self.assertEqual(batches[0], java_files[:64])
+
+    def test_same_result_on_any_number_of_cpus(self):
+        srcfiles = ['F{0}.java'.format(index) for index in range(100)]
+        # package-private class of F1 used by F70, in another batch
+        needs = {'F70.java': 'F1.java', 'F3.java': 'F5.java'}
+
+        results = [[(srcfile, errcode) for srcfile, _, errcode, _ in
+                    self._compile(srcfiles, FakeCompiler(needs=needs), cpus)]
+                   for cpus in [1, 3, 16]]
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0], results[2])
+        self.assertEqual([srcfile for srcfile, errcode in results[0] if errcode], ['F70.java'])
+
+    def test_bisect(self):
+        srcfiles = ['F{0}.java'.format(index) for index in range(15)] + ['Bad.java']
+        compiler = FakeCompiler(broken=['Bad.java'])
+
+        results = self._compile(srcfiles, compiler)
+
+        # 16 -> 8 + 8 -> 4 + 4 -> a file at a time
+        self.assertEqual(len(compiler.calls), 1 + 2 + 2 + 4)
+        self.assertEqual([srcfile for srcfile, _, errcode, _ in results if errcode], ['Bad.java'])
+        self.assertEqual([srcfile for srcfile, _, _, _ in results], srcfiles)
+
+    def test_recorded_command_is_the_one_run(self):
+        srcfiles = ['F{0}.java'.format(index) for index in range(7)] + ['Bad.java']
+
+        for srcfile, cmd, errcode, _ in self._compile(srcfiles, FakeCompiler(broken=['Bad.java'])):
+            self.assertIn(srcfile, cmd)
+            self.assertIn('-d', cmd)
+            if errcode:
+                # failed by itself
+                self.assertEqual([arg for arg in cmd if arg.endswith('.java')], [srcfile])
+
+    def test_broken_dependency_stops_splitting(self):
+        srcfiles = ['F{0}.java'.format(index) for index in range(64)]
+        compiler = FakeCompiler(broken=srcfiles)
+
+        results = self._compile(srcfiles, compiler)
+
+        # 64, 32, 16, 8 and 4 file javacs, then every file by itself
+        self.assertEqual(len(compiler.calls), 1 + 2 + 4 + 8 + 16 + 64)
+        self.assertLess(len(compiler.calls), 2 * 64 - 1)
+        self.assertTrue(all(errcode for _, _, errcode, _ in results))
+
+    def test_c_files_one_at_a_time(self):
+        compiler = FakeCompiler()
+
+        results = self._compile(['a.c', 'A.java', 'b.cpp'], compiler)
+
+        self.assertEqual(sorted(compiler.calls), [['A.java'], ['a.c'], ['b.cpp']])
+        self.assertEqual(results[0][1][0], 'gcc')
+        self.assertEqual(results[2][1][0], 'g++')
+
+
+if __name__ == '__main__':
+    unittest.main()
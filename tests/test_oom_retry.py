@@ -0,0 +1,144 @@
+import os
+import os.path as osp
+import shutil
+import tempfile
+import unittest
+
+from src import logger
+from src.assess.assess import JavaSwaTool
+from src.resource_plan import ResourcePlan
+
+
+def _plan(heap):
+    return ResourcePlan(8, None, 4096, 1, 1, heap, 256, None, 'parallel')
+
+
+class TestOutOfMemoryRetry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        tool_invoke = osp.join(self.tmp_dir, 'tool-invoke.txt')
+        with open(tool_invoke, 'w') as fobj:
+            fobj.write('tool\n-d\n<classfile>\n-r\n<assessment-report>\n')
+
+        # only the state _get_retry_artifacts uses
+        self.tool = JavaSwaTool.__new__(JavaSwaTool)
+        self.tool._tool_conf = {
+            'tool-invoke': tool_invoke,
+            'assessment-report-template': 'assessment_report{0}.xml',
+        }
+
+        self.status_records = list()
+        logger.buffer_status(self.status_records)
+
+    def tearDown(self):
+        logger.buffer_status(None)
+        shutil.rmtree(self.tmp_dir)
+
+    def _result(self, build_artifact_id, classfiles, heap, attempts=None):
+
+        build_artifacts = {
+            'build-artifact-id': build_artifact_id,
+            'id': build_artifact_id.split('-')[0],
+            'classfile': classfiles,
+        }
+
+        if attempts is not None:
+            build_artifacts['oom-attempts'] = attempts
+
+        return {
+            'build-artifacts': build_artifacts,
+            'resource-plan': _plan(heap),
+            'exit-code': 1,
+            'out-of-memory': 'java.lang.OutOfMemoryError: Java heap space',
+            'start-ts': '1',
+            'stop-ts': '2',
+        }
+
+    def test_heap_retry_first(self):
+        result = self._result('3', ['A.class', 'B.class'], 1024)
+
+        retry = self.tool._get_retry_artifacts(result, _plan(4096), self.tmp_dir, {})
+
+        self.assertEqual(len(retry), 1)
+        self.assertEqual(retry[0]['build-artifact-id'], '3')
+        self.assertEqual(retry[0]['classfile'], ['A.class', 'B.class'])
+        self.assertEqual([attempt['retry'] for attempt in retry[0]['oom-attempts']], ['heap'])
+        self.assertEqual(retry[0]['oom-attempts'][0]['max-heap'], '1024')
+        self.assertEqual(len(self.status_records), 1)
+
+    def test_split_names(self):
+        files = ['{0}.class'.format(name) for name in 'ABCDE']
+        result = self._result('3', files, 4096)
+
+        retry = self.tool._get_retry_artifacts(result, _plan(4096), self.tmp_dir, {})
+
+        self.assertEqual([new_attrs['build-artifact-id'] for new_attrs in retry], ['3-1', '3-2'])
+        self.assertEqual([new_attrs['classfile'] for new_attrs in retry],
+                         [files[:2], files[2:]])
+        self.assertTrue(all(new_attrs['split-chunk'] for new_attrs in retry))
+        self.assertEqual([new_attrs['assessment-report'] for new_attrs in retry],
+                         [osp.join(self.tmp_dir, 'assessment_report3-1.xml'),
+                          osp.join(self.tmp_dir, 'assessment_report3-2.xml')])
+
+    def test_split_of_a_chunk_after_a_heap_retry(self):
+        heap_attempt = {'build-artifact-id': '3-2', 'retry': 'heap'}
+        result = self._result('3-2', ['A.class', 'B.class', 'C.class'], 1024,
+                              attempts=[heap_attempt])
+        chunk_numbers = {'3': 4}
+
+        retry = self.tool._get_retry_artifacts(result, _plan(4096), self.tmp_dir, chunk_numbers)
+
+        # numbered after the chunks 3-1 .. 3-4 of the first split
+        self.assertEqual([new_attrs['build-artifact-id'] for new_attrs in retry],
+                         ['3-5', '3-6'])
+        self.assertEqual(chunk_numbers, {'3': 6})
+        for new_attrs in retry:
+            self.assertEqual([attempt['retry'] for attempt in new_attrs['oom-attempts']],
+                             ['heap', 'split'])
+
+    def test_superseded_files_renamed(self):
+        result = self._result('3', ['A.class', 'B.class'], 4096)
+        build_artifacts = result['build-artifacts']
+        for key, filename in [('assessment-report', 'assessment_report3.xml'),
+                              ('swa-tool-stdout', 'swa_tool_stdout3.out'),
+                              ('swa-tool-stderr', 'swa_tool_stderr3.out')]:
+            build_artifacts[key] = osp.join(self.tmp_dir, filename)
+            open(build_artifacts[key], 'w').close()
+
+        retry = self.tool._get_retry_artifacts(result, _plan(4096), self.tmp_dir, {})
+
+        self.assertEqual(sorted(os.listdir(self.tmp_dir)),
+                         ['assessment_report3.xml.oom-1',
+                          'swa_tool_stderr3.out.oom-1',
+                          'swa_tool_stdout3.out.oom-1',
+                          'tool-invoke.txt'])
+        self.assertEqual(retry[0]['oom-attempts'][0]['swa-tool-stdout'],
+                         'swa_tool_stdout3.out.oom-1')
+
+    def test_report_on_stdout_renamed_once(self):
+        result = self._result('3', ['A.class', 'B.class'], 4096)
+        build_artifacts = result['build-artifacts']
+        build_artifacts['assessment-report'] = osp.join(self.tmp_dir, 'assessment_report3.xml')
+        build_artifacts['swa-tool-stdout'] = build_artifacts['assessment-report']
+        open(build_artifacts['assessment-report'], 'w').close()
+
+        retry = self.tool._get_retry_artifacts(result, _plan(4096), self.tmp_dir, {})
+
+        self.assertTrue(osp.isfile(osp.join(self.tmp_dir, 'assessment_report3.xml.oom-1')))
+        self.assertEqual(retry[0]['oom-attempts'][0]['swa-tool-stdout'],
+                         'assessment_report3.xml.oom-1')
+
+    def test_chunk_number(self):
+        self.assertEqual(JavaSwaTool._get_chunk_number({'id': '3', 'build-artifact-id': '3-12'}), 12)
+        self.assertEqual(JavaSwaTool._get_chunk_number({'id': '3', 'build-artifact-id': '3'}), 0)
+        self.assertEqual(JavaSwaTool._get_chunk_number({'build-artifact-id': 3}), 0)
+
+    def test_single_file_not_split(self):
+        result = self._result('3', ['A.class'], 4096)
+        self.assertEqual(self.tool._get_retry_artifacts(result, _plan(4096), self.tmp_dir, {}), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os.path as osp
+import shutil
+import tempfile
+import unittest
+
+from src.resource_plan import ResourcePlanner
+
+
+class TestResourcePlanner(unittest.TestCase):
+
+    def _planner(self, **conf):
+        conf.setdefault('memory_budget', 4096)
+        planner = ResourcePlanner({key.replace('_', '-'): str(value)
+                                   for key, value in conf.items()})
+        # the same sizes on any host
+        planner._cpu_type = 64
+        return planner
+
+    def test_one_jvm(self):
+        plan = self._planner().plan('java-8')
+
+        # 4096 - metaspace 512 (an eighth) - native 128
+        self.assertEqual((plan.heap, plan.metaspace, plan.thread_stack), (3456, 512, None))
+        self.assertEqual(plan.java_opts()[0], '-Xmx3456m')
+        self.assertIn('-XX:MaxMetaspaceSize=512m', plan.java_opts())
+
+    def test_concurrent_jvms_share_the_budget(self):
+        plan = self._planner().plan('java-8', concurrency=4)
+
+        # 1024 - metaspace 128 - native 128
+        self.assertEqual((plan.heap, plan.metaspace), (768, 128))
+        self.assertEqual(plan.memory_share(), 1024)
+
+    def test_slots(self):
+        plan = self._planner().plan('java-8', concurrency=4, slots=2)
+
+        self.assertEqual((plan.heap, plan.metaspace), (1664, 256))
+        self.assertEqual(plan.memory_share(), 2048)
+
+    def test_thread_stack(self):
+        plan = self._planner().plan('java-8', thread_stack=True)
+
+        # 2 stacks of 128
+        self.assertEqual((plan.heap, plan.thread_stack), (3200, 128))
+        self.assertIn('-Xss128m', plan.java_opts())
+
+    def test_minimum_heap(self):
+        plan = self._planner(memory_budget=512).plan('java-8', concurrency=4)
+        self.assertEqual(plan.heap, 256)
+
+    def test_conf_overrides(self):
+        plan = self._planner(metaspace_size=300, jvm_native_overhead=96,
+                             jvm_gc='g1').plan('java-11')
+
+        self.assertEqual((plan.heap, plan.metaspace, plan.gc), (3700, 300, 'g1'))
+        self.assertIn('-XX:+UseG1GC', plan.java_opts())
+
+    def test_invalid_conf_uses_defaults(self):
+        plan = self._planner(metaspace_size='big', jvm_gc='zgc').plan('java-8')
+        self.assertEqual((plan.heap, plan.metaspace, plan.gc), (3456, 512, 'parallel'))
+
+    def test_java_version_profile(self):
+        plan = self._planner().plan('java-7')
+
+        self.assertEqual((plan.java_ver, plan.gc), (7, 'cms'))
+        self.assertIn('-XX:MaxPermSize=512m', plan.java_opts())
+
+    def test_java_home_version_wins(self):
+        java_home = tempfile.mkdtemp()
+        try:
+            with open(osp.join(java_home, 'release'), 'w') as fobj:
+                print('JAVA_VERSION="1.7.0_80"', file=fobj)
+
+            plan = self._planner().plan('java-8', java_home=java_home)
+            self.assertEqual(plan.java_ver, 7)
+        finally:
+            shutil.rmtree(java_home)
+
+    def test_32_bit(self):
+        planner = self._planner()
+        planner._cpu_type = 32
+
+        plan = planner.plan('java-8', concurrency=2)
+
+        self.assertEqual((plan.heap, plan.initial_heap, plan.metaspace), (2048, 512, None))
+
+    def test_max_concurrency(self):
+        # 1024 heap + 128 metaspace + 128 native
+        self.assertEqual(self._planner().max_concurrency(1024), 3)
+        self.assertEqual(self._planner(memory_budget=1000).max_concurrency(1024), 0)
+
+    def test_java_ver_num(self):
+        self.assertEqual(ResourcePlanner.java_ver_num('java-7 java-8'), 8)
+        self.assertEqual(ResourcePlanner.java_ver_num('11'), 11)
+        self.assertEqual(ResourcePlanner.java_ver_num(None), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import json
+import os.path as osp
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src import trace
+
+
+class TestSpan(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        trace._trace_file = None
+        trace._chrome_file = None
+        shutil.rmtree(self.tmp_dir)
+
+    def _read_records(self):
+        with open(osp.join(self.tmp_dir, trace.TRACE_FILE)) as fobj:
+            return [json.loads(line) for line in fobj]
+
+    def test_nesting(self):
+        self.assertIsNone(trace.current_span())
+
+        with trace.Span('assess') as assess:
+            with trace.Span('artifact') as artifact:
+                self.assertIs(trace.current_span(), artifact)
+                self.assertIs(artifact.parent, assess)
+            self.assertIs(trace.current_span(), assess)
+
+        self.assertIsNone(trace.current_span())
+        self.assertIsNone(assess.parent)
+
+    def test_run_in_context(self):
+        spans = list()
+
+        with trace.Span('assess') as assess:
+            thread = threading.Thread(target=trace.run_in_context(
+                lambda: spans.append(trace.Span('invocation'))))
+            thread.start()
+            thread.join()
+
+        self.assertIs(spans[0].parent, assess)
+
+    def test_set_attrs(self):
+        trace.set_attrs({'ignored': True})
+
+        with trace.Span('build', attrs={'build-sys': 'maven'}) as span:
+            trace.set_attrs({'build-cache': 'miss'})
+
+        self.assertEqual(span.attrs, {'build-sys': 'maven', 'build-cache': 'miss'})
+
+    def test_exception(self):
+        with self.assertRaises(ValueError):
+            with trace.Span('build') as span:
+                raise ValueError('no build')
+
+        self.assertEqual(span.attrs['exception'], 'ValueError: no build')
+        self.assertIsNotNone(span.end)
+
+    def test_finish(self):
+        parent = trace.Span('assess')
+        child = trace.Span('artifact', parent=parent)
+
+        child.finish(end=100.0)
+        child.finish(end=200.0)
+
+        self.assertEqual(child.end, 100.0)
+        self.assertEqual(parent.last_child_end, 100.0)
+
+    def test_trace_files(self):
+        trace.configure({'trace': 'true', 'trace-chrome': 'true'}, self.tmp_dir)
+
+        with trace.Span('assess') as assess:
+            with trace.Span('artifact', attrs={'build-artifact-id': 1}) as artifact:
+                pass
+
+        records = self._read_records()
+        self.assertEqual([record['name'] for record in records], ['artifact', 'assess'])
+        self.assertEqual(records[0]['id'], artifact.span_id)
+        self.assertEqual(records[0]['parent'], assess.span_id)
+        self.assertEqual(records[0]['attrs'], {'build-artifact-id': 1})
+        self.assertIsNone(records[1]['parent'])
+
+        trace.shutdown()
+
+        with open(osp.join(self.tmp_dir, trace.CHROME_FILE)) as fobj:
+            events = json.load(fobj)['traceEvents']
+
+        complete = [event for event in events if event['ph'] == 'X']
+        self.assertEqual([event['name'] for event in complete], ['artifact', 'assess'])
+        self.assertEqual(complete[0]['args']['parent-id'], assess.span_id)
+        self.assertEqual(len([event for event in events if event['ph'] == 'M']), 1)
+
+    def test_trace_off(self):
+        trace.configure({}, self.tmp_dir)
+
+        with trace.Span('assess'):
+            pass
+        trace.shutdown()
+
+        self.assertFalse(osp.exists(osp.join(self.tmp_dir, trace.TRACE_FILE)))
+
+
+if __name__ == '__main__':
+    unittest.main()
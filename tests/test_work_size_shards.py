@@ -0,0 +1,107 @@
+import os.path as osp
+import shutil
+import tempfile
+import unittest
+
+from src.assess.assess import JavaSwaTool
+
+MB = 1024 * 1024
+
+
+class TestWorkSizeShards(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+        tool_invoke = osp.join(self.tmp_dir, 'tool-invoke.txt')
+        with open(tool_invoke, 'w') as fobj:
+            fobj.write('tool\n-d\n<classfile>\n')
+
+        # only the state _get_work_size_shards uses
+        self.tool = JavaSwaTool.__new__(JavaSwaTool)
+        self.tool._tool_conf = {'tool-invoke': tool_invoke}
+        self.tool._chunk_heap = 256 + 64
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _files(self, sizes):
+        '''files of the sizes, in eighths of a MB'''
+
+        filelist = list()
+        for name, eighths in sizes:
+            filepath = osp.join(self.tmp_dir, name)
+            with open(filepath, 'wb') as fobj:
+                fobj.write(b'\0' * (eighths * MB // 8))
+            filelist.append(filepath)
+
+        return filelist
+
+    def _shards(self, filelist, **conf):
+        self.tool._tool_conf.update({key.replace('_', '-'): str(value)
+                                     for key, value in conf.items()})
+        return self.tool._get_work_size_shards({'build-artifact-id': '1',
+                                                'classfile': filelist})
+
+    def _names(self, shards):
+        return [[osp.basename(_file) for _file in shard] for shard in shards]
+
+    def test_off_without_coefficients(self):
+        filelist = self._files([('A', 8), ('B', 8)])
+        self.assertEqual(self._shards(filelist), (None, None))
+
+    def test_fits_in_one_shard(self):
+        filelist = self._files([('A', 1), ('B', 1)])
+        self.assertEqual(self._shards(filelist, shard_memory_per_mb=64), (None, None))
+
+    def test_balanced_by_size_in_list_order(self):
+        # 64 MB of heap per MB, a chunk has 64 MB over the base: 1.5 MB is 2 shards
+        filelist = self._files([('E', 1), ('A', 4), ('C', 2), ('B', 3), ('D', 2)])
+
+        file_type, shards = self._shards(filelist, shard_memory_per_mb=64)
+
+        self.assertEqual(file_type, 'classfile')
+        self.assertEqual(self._names(shards), [['A', 'D'], ['E', 'C', 'B']])
+
+    def test_balanced_by_count(self):
+        filelist = self._files([('F{0}'.format(index), 0) for index in range(10)])
+
+        _, shards = self._shards(filelist, shard_memory_per_file=10)
+
+        # 100 MB in chunks of 64 MB
+        self.assertEqual(self._names(shards), [['F0', 'F2', 'F4', 'F6', 'F8'],
+                                               ['F1', 'F3', 'F5', 'F7', 'F9']])
+
+    def test_every_file_once(self):
+        filelist = self._files([('F{0}'.format(index), index % 5) for index in range(23)])
+
+        _, shards = self._shards(filelist, shard_memory_per_mb=64, shard_memory_per_file=1)
+
+        self.assertEqual(sorted(_file for shard in shards for _file in shard), sorted(filelist))
+        for shard in shards:
+            self.assertEqual(shard, sorted(shard, key=filelist.index))
+
+    def test_time_limit_adds_shards(self):
+        filelist = self._files([('F{0}'.format(index), 0) for index in range(6)])
+
+        _, shards = self._shards(filelist, shard_memory_per_file=10,
+                                 shard_seconds_per_file=10, shard_max_seconds=20)
+
+        self.assertEqual(len(shards), 3)
+
+    def test_no_more_shards_than_files(self):
+        filelist = self._files([('A', 8), ('B', 8)])
+
+        _, shards = self._shards(filelist, shard_memory_per_mb=1000)
+
+        self.assertEqual(self._names(shards), [['A'], ['B']])
+
+    def test_base_does_not_fit(self):
+        filelist = self._files([('A', 8), ('B', 8)])
+        self.tool._chunk_heap = 200
+
+        self.assertEqual(self._shards(filelist, shard_memory_per_mb=64), (None, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#! /usr/bin/env python3
+
+## Measures the JVM startup savings of a class data sharing archive
+## for a tool invocation, the way java-assess uses it (see
+## src/assess/tool_cds.py): one run dumps the archive, the runs after
+## it map the archive.
+##
+##   benchmark_cds.py --java /usr/lib/jvm/java-17/bin/java --runs 5 \
+##       -- -cp pmd/lib/* net.sourceforge.pmd.PMD -version
+
+import argparse
+import os
+import os.path as osp
+import sys
+import time
+import tempfile
+import subprocess
+import statistics
+
+
+def process_cmd_line_args():
+
+    parser = argparse.ArgumentParser(description='''Compare tool invocation
+                                     times with and without an AppCDS archive''')
+
+    parser.add_argument('--java',
+                        default='java',
+                        help='java executable, java 13 or later')
+
+    parser.add_argument('--runs',
+                        type=int,
+                        default=5,
+                        help='number of runs with and without the archive')
+
+    parser.add_argument('java_args',
+                        nargs=argparse.REMAINDER,
+                        help='arguments of the tool invocation, after --')
+
+    args = parser.parse_args()
+
+    if args.java_args and args.java_args[0] == '--':
+        args.java_args = args.java_args[1:]
+
+    if not args.java_args:
+        parser.error('tool invocation arguments are required')
+
+    return args
+
+
+def run(java, opts, java_args):
+    '''Returns wall clock seconds of the invocation'''
+
+    start = time.monotonic()
+    subprocess.run([java] + opts + java_args,
+                   stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL,
+                   check=False)
+    return time.monotonic() - start
+
+
+def main():
+
+    args = process_cmd_line_args()
+    quiet = '-Xlog:cds*=off'
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = osp.join(tmpdir, 'tool.jsa')
+
+        dump_time = run(args.java, ['-XX:ArchiveClassesAtExit={0}'.format(archive), quiet],
+                        args.java_args)
+
+        if not osp.isfile(archive):
+            print('Archive not created, does {0} support -XX:ArchiveClassesAtExit?'.format(args.java),
+                  file=sys.stderr)
+            return 1
+
+        without_cds = [run(args.java, [], args.java_args) for _ in range(args.runs)]
+        with_cds = [run(args.java, ['-XX:SharedArchiveFile={0}'.format(archive), quiet],
+                        args.java_args) for _ in range(args.runs)]
+
+        archive_size = os.stat(archive).st_size
+
+    without_mean = statistics.mean(without_cds)
+    with_mean = statistics.mean(with_cds)
+
+    print('archive size         {0:10.1f} MB'.format(archive_size / 1024 / 1024))
+    print('dump run             {0:10.3f} s'.format(dump_time))
+    print('without archive      {0:10.3f} s  (min {1:.3f})'.format(without_mean, min(without_cds)))
+    print('with archive         {0:10.3f} s  (min {1:.3f})'.format(with_mean, min(with_cds)))
+    print('saved per invocation {0:10.3f} s  ({1:.1f}%)'.format(without_mean - with_mean,
+                                                              100 * (without_mean - with_mean) / without_mean))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())